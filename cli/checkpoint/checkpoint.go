@@ -3,10 +3,14 @@ package checkpoint
 import (
 	"bufio"
 	"bytes"
+	"errors"
 	"fmt"
+	"io"
 	"os"
 	"os/exec"
+	"time"
 
+	"github.com/apex/log"
 	"github.com/tarantool/tt/cli/cmdcontext"
 )
 
@@ -21,29 +25,120 @@ type Opts struct {
 	Replica    []int
 	ShowSystem bool
 	Recursive  bool
+	// BatchSize is a count of records applied in a single transaction by tt play.
+	BatchSize int
+	// InFlight is a count of requests sent by tt play without waiting for responses.
+	InFlight int
+	// Parallel is a count of connections used by tt play.
+	Parallel int
+	// PartitionBy is a key to distribute records between connections by tt play.
+	PartitionBy string
+	// Index enables sidecar indexes of the files to skip data out of
+	// the --from/--to/--timestamp range.
+	Index bool
+	// Follow makes tt cat print rows appended to the files as they are written.
+	Follow bool
+	// Stats makes tt cat print an aggregated statistics instead of rows.
+	Stats bool
+	// StatsInterval is a duration of time buckets of the statistics.
+	StatsInterval time.Duration
 }
 
 // Cat print the contents of .snap/.xlog files.
 // Returns an error if such occur during reading files.
-func Cat(tntCli cmdcontext.TarantoolCli) error {
-	cmd := exec.Command(tntCli.Executable, "-")
-	cmd.Stderr = os.Stderr
-	cmd.Stdout = os.Stdout
-
-	stdinPipe, err := cmd.StdinPipe()
+func Cat(files []string, opts Opts) error {
+	formatter, ok := catFormatters[opts.Format]
+	if !ok {
+		return fmt.Errorf("unknown output format %q", opts.Format)
+	}
+	filter, err := newRowFilter(opts)
 	if err != nil {
 		return err
 	}
-	stdinPipe.Write([]byte(catFile))
-	stdinPipe.Close()
 
-	if err := cmd.Run(); err != nil {
+	plans, err := planFiles(files, &filter, opts.Index)
+	if err != nil {
 		return fmt.Errorf("result of cat: %w", err)
 	}
 
+	out := bufio.NewWriterSize(os.Stdout, 1<<20)
+	defer out.Flush()
+	for _, file := range files {
+		out.Flush()
+		fmt.Fprintf(os.Stderr, "• Result of cat: the file \"%s\" is processed below •\n", file)
+		plan := plans[file]
+		if plan.skip {
+			continue
+		}
+		printed := false
+		err := processFile(file, plan, &filter, func(row *Row) error {
+			printed = true
+			return formatter(out, row)
+		})
+		if err != nil {
+			return fmt.Errorf("result of cat: %w", err)
+		}
+		if opts.Format == "yaml" && printed {
+			out.WriteString("...\n\n")
+		}
+	}
 	return nil
 }
 
+// processFile passes filtered rows of the planned part of the file to
+// the callback.
+func processFile(fileName string, plan filePlan, filter *rowFilter,
+	process func(row *Row) error) error {
+	file, err := os.Open(fileName)
+	if err != nil {
+		return err
+	}
+	defer file.Close()
+
+	reader, err := NewReader(file)
+	if err != nil {
+		return fmt.Errorf("%q: %w", fileName, err)
+	}
+	defer reader.Close()
+	if plan.start > 0 {
+		if err := reader.SkipTo(plan.start); err != nil {
+			return fmt.Errorf("%q: %w", fileName, err)
+		}
+	}
+
+	var row Row
+	for {
+		if err := reader.Next(&row); err != nil {
+			if errors.Is(err, io.EOF) {
+				return nil
+			}
+			if errors.Is(err, ErrIncompleteTx) {
+				log.Warnf("%q: %s", fileName, err)
+				return nil
+			}
+			return fmt.Errorf("%q: %w", fileName, err)
+		}
+		if plan.stop > 0 && reader.TxOffset() >= plan.stop {
+			return nil
+		}
+
+		result, err := filter.match(&row)
+		if err != nil {
+			return fmt.Errorf("%q: %w", fileName, err)
+		}
+		if result == filterStop {
+			return nil
+		}
+		if result == filterSkip {
+			continue
+		}
+
+		if err := process(&row); err != nil {
+			return fmt.Errorf("%q: %w", fileName, err)
+		}
+	}
+}
+
 // Play is playing the contents of .snap/.xlog files to another Tarantool instance.
 // Returns an error if such occur during playing.
 func Play(tntCli cmdcontext.TarantoolCli) error {
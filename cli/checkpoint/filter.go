@@ -0,0 +1,90 @@
+package checkpoint
+
+import (
+	"fmt"
+	"slices"
+	"strconv"
+
+	"github.com/tarantool/tt/cli/util"
+)
+
+// systemSpaceIDMax is an upper bound of system space ids.
+const systemSpaceIDMax = 512
+
+// filterResult is a verdict of a rows filter.
+type filterResult int
+
+const (
+	// filterSkip means the row must be skipped.
+	filterSkip filterResult = iota
+	// filterAccept means the row must be processed.
+	filterAccept
+	// filterStop means the row and the rest of the file must be skipped.
+	filterStop
+)
+
+// rowFilter selects rows of .snap/.xlog files by the checkpoint command flags.
+type rowFilter struct {
+	from       uint64
+	to         uint64
+	timestamp  float64
+	spaces     []int
+	replicas   []int
+	showSystem bool
+}
+
+// newRowFilter creates a rows filter from the command options.
+func newRowFilter(opts Opts) (rowFilter, error) {
+	timestamp, err := util.StringToTimestamp(opts.Timestamp)
+	if err != nil {
+		return rowFilter{}, fmt.Errorf("failed to parse a timestamp: %s", err)
+	}
+	ts, err := strconv.ParseFloat(timestamp, 64)
+	if err != nil {
+		return rowFilter{}, fmt.Errorf("failed to parse a timestamp: %s", err)
+	}
+	return rowFilter{
+		from:       opts.From,
+		to:         opts.To,
+		timestamp:  ts,
+		spaces:     opts.Space,
+		replicas:   opts.Replica,
+		showSystem: opts.ShowSystem,
+	}, nil
+}
+
+// matchHeader checks the row header fields. The row body is not touched.
+func (f *rowFilter) matchHeader(row *Row) filterResult {
+	if len(f.replicas) == 1 && uint64(f.replicas[0]) == row.ReplicaID &&
+		(row.LSN >= f.to || row.Timestamp >= f.timestamp) {
+		// The rest of rows of the replica have bigger LSNs.
+		return filterStop
+	}
+	if row.LSN < f.from || row.LSN >= f.to || row.Timestamp >= f.timestamp {
+		return filterSkip
+	}
+	if f.replicas != nil && !slices.Contains(f.replicas, int(row.ReplicaID)) {
+		return filterSkip
+	}
+	return filterAccept
+}
+
+// match checks the row. The header is checked first, so the body is looked up
+// only for rows matching the header filters.
+func (f *rowFilter) match(row *Row) (filterResult, error) {
+	if result := f.matchHeader(row); result != filterAccept {
+		return result, nil
+	}
+	spaceID, hasSpace, err := row.SpaceID()
+	if err != nil {
+		return filterSkip, fmt.Errorf("invalid row body: %w", err)
+	}
+	if f.spaces == nil {
+		if hasSpace && spaceID < systemSpaceIDMax && !f.showSystem {
+			return filterSkip, nil
+		}
+	} else if !hasSpace || !slices.Contains(f.spaces, int(spaceID)) {
+		return filterSkip, nil
+	}
+	return filterAccept, nil
+}
@@ -0,0 +1,67 @@
+package checkpoint
+
+import (
+	"math"
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
+
+func TestRowFilter_match(t *testing.T) {
+	userSpaceBody := []byte{0x81, 0x10, 0xcd, 0x02, 0x00}
+	systemSpaceBody := []byte{0x81, 0x10, 0xcd, 0x01, 0x18}
+	defaultOpts := Opts{To: math.MaxUint64}
+
+	tests := []struct {
+		name     string
+		opts     Opts
+		row      Row
+		expected filterResult
+	}{
+		{"user space", defaultOpts,
+			Row{LSN: 1, body: userSpaceBody}, filterAccept},
+		{"system space", defaultOpts,
+			Row{LSN: 1, body: systemSpaceBody}, filterSkip},
+		{"system space shown", Opts{To: math.MaxUint64, ShowSystem: true},
+			Row{LSN: 1, body: systemSpaceBody}, filterAccept},
+		{"no body", defaultOpts,
+			Row{LSN: 1, Type: iprotoNop}, filterAccept},
+		{"from", Opts{From: 5, To: math.MaxUint64},
+			Row{LSN: 4, body: userSpaceBody}, filterSkip},
+		{"to", Opts{To: 5},
+			Row{LSN: 5, body: userSpaceBody}, filterSkip},
+		{"timestamp", Opts{To: math.MaxUint64, Timestamp: "100.5"},
+			Row{LSN: 1, Timestamp: 100.5, body: userSpaceBody}, filterSkip},
+		{"before timestamp", Opts{To: math.MaxUint64, Timestamp: "100.5"},
+			Row{LSN: 1, Timestamp: 100.4, body: userSpaceBody}, filterAccept},
+		{"space", Opts{To: math.MaxUint64, Space: []int{512}},
+			Row{LSN: 1, body: userSpaceBody}, filterAccept},
+		{"other space", Opts{To: math.MaxUint64, Space: []int{513}},
+			Row{LSN: 1, body: userSpaceBody}, filterSkip},
+		{"space without body", Opts{To: math.MaxUint64, Space: []int{512}},
+			Row{LSN: 1}, filterSkip},
+		{"replica", Opts{To: math.MaxUint64, Replica: []int{1, 2}},
+			Row{LSN: 1, ReplicaID: 2, body: userSpaceBody}, filterAccept},
+		{"other replica", Opts{To: math.MaxUint64, Replica: []int{1}},
+			Row{LSN: 1, ReplicaID: 2, body: userSpaceBody}, filterSkip},
+		{"single replica to", Opts{To: 5, Replica: []int{1}},
+			Row{LSN: 5, ReplicaID: 1, body: userSpaceBody}, filterStop},
+		{"many replicas to", Opts{To: 5, Replica: []int{1, 2}},
+			Row{LSN: 5, ReplicaID: 1, body: userSpaceBody}, filterSkip},
+	}
+	for _, tc := range tests {
+		t.Run(tc.name, func(t *testing.T) {
+			filter, err := newRowFilter(tc.opts)
+			require.NoError(t, err)
+			result, err := filter.match(&tc.row)
+			require.NoError(t, err)
+			assert.Equal(t, tc.expected, result)
+		})
+	}
+}
+
+func TestNewRowFilter_invalidTimestamp(t *testing.T) {
+	_, err := newRowFilter(Opts{Timestamp: "abcdef"})
+	assert.ErrorContains(t, err, `failed to parse a timestamp: parsing time "abcdef"`)
+}
@@ -0,0 +1,287 @@
+package checkpoint
+
+import (
+	"bufio"
+	"context"
+	"errors"
+	"fmt"
+	"io"
+	"os"
+	"path/filepath"
+	"sort"
+	"time"
+
+	"github.com/apex/log"
+	"github.com/fsnotify/fsnotify"
+)
+
+// followPollInterval is an interval of checking the followed files in case
+// a file system event is missed.
+const followPollInterval = time.Second
+
+// walFollower reads rows appended to .xlog files of a directory. Only one
+// file is open at a time, so the memory usage does not depend on the amount
+// of followed data.
+type walFollower struct {
+	dir string
+	// name is a base name of the current file.
+	name   string
+	file   *os.File
+	reader *Reader
+	// stopped is set when the filter rejects the rest of rows.
+	stopped bool
+}
+
+// listXlogs returns sorted base names of .xlog files in the directory.
+// The names are zero-padded vclock signatures, so the order is the order of
+// writing.
+func listXlogs(dir string) ([]string, error) {
+	entries, err := os.ReadDir(dir)
+	if err != nil {
+		return nil, err
+	}
+	names := []string{}
+	for _, entry := range entries {
+		if !entry.IsDir() && filepath.Ext(entry.Name()) == ".xlog" {
+			names = append(names, entry.Name())
+		}
+	}
+	sort.Strings(names)
+	return names, nil
+}
+
+// newWalFollower creates a follower of the path. A directory is followed
+// starting from the end of its last .xlog file, a file is followed starting
+// from its end.
+func newWalFollower(path string) (*walFollower, error) {
+	info, err := os.Stat(path)
+	if err != nil {
+		return nil, err
+	}
+	follower := &walFollower{dir: path}
+	name := ""
+	if info.IsDir() {
+		names, err := listXlogs(path)
+		if err != nil {
+			return nil, err
+		}
+		if len(names) > 0 {
+			name = names[len(names)-1]
+		}
+	} else {
+		follower.dir, name = filepath.Dir(path), filepath.Base(path)
+	}
+	if name == "" {
+		return follower, nil
+	}
+
+	if err := follower.open(name); err != nil {
+		return nil, err
+	}
+	// Skip the rows written before.
+	var row Row
+	if err := follower.readRows(func(*Row) error { return nil }, &row); err != nil {
+		follower.close()
+		return nil, err
+	}
+	return follower, nil
+}
+
+// open opens the file of the followed directory.
+func (f *walFollower) open(name string) error {
+	file, err := os.Open(filepath.Join(f.dir, name))
+	if err != nil {
+		return err
+	}
+	reader, err := NewReader(file)
+	if err != nil {
+		file.Close()
+		return fmt.Errorf("%q: %w", file.Name(), err)
+	}
+	f.name, f.file, f.reader = name, file, reader
+	return nil
+}
+
+// close closes the current file.
+func (f *walFollower) close() {
+	if f.reader != nil {
+		f.reader.Close()
+		f.file.Close()
+		f.reader, f.file = nil, nil
+	}
+}
+
+// nextName returns a base name of the .xlog file following the current one
+// or an empty string if there is no such file yet.
+func (f *walFollower) nextName() (string, error) {
+	names, err := listXlogs(f.dir)
+	if err != nil {
+		return "", err
+	}
+	for _, name := range names {
+		if name > f.name {
+			return name, nil
+		}
+	}
+	return "", nil
+}
+
+// readRows passes all complete rows of the current file to the callback.
+// The reader is left at the beginning of the first not written transaction.
+func (f *walFollower) readRows(callback func(*Row) error, row *Row) error {
+	for {
+		err := f.reader.Next(row)
+		if err == nil {
+			if err := callback(row); err != nil {
+				return err
+			}
+			continue
+		}
+		if errors.Is(err, io.EOF) || errors.Is(err, ErrIncompleteTx) {
+			if f.reader.Complete() {
+				return nil
+			}
+			// Drop the partially read transaction to read it again when
+			// it is written completely.
+			return f.reader.SkipTo(f.reader.Offset())
+		}
+		return fmt.Errorf("%q: %w", f.file.Name(), err)
+	}
+}
+
+// poll passes newly written rows to the callback. If checkFiles is set, new
+// files of the directory are looked up and the follower switches to the next
+// file when the current one is closed by tarantool.
+func (f *walFollower) poll(callback func(*Row) error, checkFiles bool) error {
+	var row Row
+	for !f.stopped {
+		if f.reader == nil {
+			if !checkFiles {
+				return nil
+			}
+			name, err := f.nextName()
+			if err != nil || name == "" {
+				return err
+			}
+			if err := f.open(name); err != nil {
+				return err
+			}
+		}
+		if err := f.readRows(callback, &row); err != nil {
+			return err
+		}
+		if !f.reader.Complete() {
+			if !checkFiles {
+				return nil
+			}
+			next, err := f.nextName()
+			if err != nil || next == "" {
+				return err
+			}
+			// Tarantool closes a file before creating the next one, so the
+			// rest of the file is read once more before the switch.
+			if err := f.readRows(callback, &row); err != nil {
+				return err
+			}
+			if !f.reader.Complete() {
+				log.Warnf("%q is not closed properly, switching to %q",
+					f.file.Name(), next)
+			}
+		}
+		f.close()
+	}
+	return nil
+}
+
+// CatFollow prints rows appended to .xlog files of the directories or files
+// until the context is canceled. The directories are watched for new files,
+// so the rotation of .xlog files is followed.
+func CatFollow(ctx context.Context, paths []string, opts Opts) error {
+	formatter, ok := catFormatters[opts.Format]
+	if !ok {
+		return fmt.Errorf("unknown output format %q", opts.Format)
+	}
+	filter, err := newRowFilter(opts)
+	if err != nil {
+		return err
+	}
+
+	watcher, err := fsnotify.NewWatcher()
+	if err != nil {
+		return fmt.Errorf("failed to watch files: %w", err)
+	}
+	defer watcher.Close()
+
+	followers := make([]*walFollower, 0, len(paths))
+	defer func() {
+		for _, follower := range followers {
+			follower.close()
+		}
+	}()
+	for _, path := range paths {
+		follower, err := newWalFollower(path)
+		if err != nil {
+			return fmt.Errorf("failed to follow %q: %w", path, err)
+		}
+		followers = append(followers, follower)
+		if err := watcher.Add(follower.dir); err != nil {
+			return fmt.Errorf("failed to watch %q: %w", follower.dir, err)
+		}
+	}
+
+	out := bufio.NewWriterSize(os.Stdout, 1<<20)
+	defer out.Flush()
+	// current is a follower which rows are printed.
+	var current *walFollower
+	printRow := func(row *Row) error {
+		result, err := filter.match(row)
+		if err != nil {
+			return err
+		}
+		switch result {
+		case filterStop:
+			current.stopped = true
+			return nil
+		case filterSkip:
+			return nil
+		}
+		return formatter(out, row)
+	}
+
+	ticker := time.NewTicker(followPollInterval)
+	defer ticker.Stop()
+	checkFiles := true
+	for {
+		active := 0
+		for _, follower := range followers {
+			current = follower
+			if err := follower.poll(printRow, checkFiles); err != nil {
+				return fmt.Errorf("result of cat: %w", err)
+			}
+			if !follower.stopped {
+				active++
+			}
+		}
+		if err := out.Flush(); err != nil {
+			return err
+		}
+		if active == 0 {
+			return nil
+		}
+
+		// The directories are listed only if a file could be created, writes
+		// to the current files are handled by reading the appended data.
+		checkFiles = false
+		select {
+		case <-ctx.Done():
+			return nil
+		case err := <-watcher.Errors:
+			log.Warnf("Failed to watch WAL files: %s", err)
+			checkFiles = true
+		case event := <-watcher.Events:
+			checkFiles = event.Has(fsnotify.Create) || event.Has(fsnotify.Rename)
+		case <-ticker.C:
+			checkFiles = true
+		}
+	}
+}
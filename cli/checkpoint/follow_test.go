@@ -0,0 +1,91 @@
+package checkpoint
+
+import (
+	"bytes"
+	"os"
+	"path/filepath"
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
+
+func TestWalFollower(t *testing.T) {
+	data, err := os.ReadFile("testdata/test.xlog")
+	require.NoError(t, err)
+	// Find the transaction boundaries.
+	reader, err := NewReader(bytes.NewReader(data))
+	require.NoError(t, err)
+	var row Row
+	require.NoError(t, reader.Next(&row))
+	secondTx := reader.Offset()
+	reader.Close()
+	eof := int64(len(data)) - 4
+
+	dir := t.TempDir()
+	first := filepath.Join(dir, "00000000000000000000.xlog")
+	require.NoError(t, os.WriteFile(first, data[:secondTx], 0644))
+
+	follower, err := newWalFollower(dir)
+	require.NoError(t, err)
+	defer follower.close()
+
+	var lsns []uint64
+	collect := func(row *Row) error {
+		lsns = append(lsns, row.LSN)
+		return nil
+	}
+
+	// The rows written before are skipped.
+	require.NoError(t, follower.poll(collect, true))
+	assert.Empty(t, lsns)
+
+	// An incomplete transaction is not read.
+	file, err := os.OpenFile(first, os.O_APPEND|os.O_WRONLY, 0644)
+	require.NoError(t, err)
+	defer file.Close()
+	_, err = file.Write(data[secondTx : secondTx+10])
+	require.NoError(t, err)
+	require.NoError(t, follower.poll(collect, true))
+	assert.Empty(t, lsns)
+
+	_, err = file.Write(data[secondTx+10 : eof])
+	require.NoError(t, err)
+	require.NoError(t, follower.poll(collect, false))
+	assert.Equal(t, []uint64{2}, lsns)
+
+	// The follower switches to the next file after the rotation.
+	_, err = file.Write(data[eof:])
+	require.NoError(t, err)
+	second := filepath.Join(dir, "00000000000000000002.xlog")
+	require.NoError(t, os.WriteFile(second, data[:eof], 0644))
+	require.NoError(t, follower.poll(collect, false))
+	assert.Equal(t, []uint64{2}, lsns)
+	require.NoError(t, follower.poll(collect, true))
+	assert.Equal(t, []uint64{2, 1, 2}, lsns)
+	assert.Equal(t, "00000000000000000002.xlog", follower.name)
+}
+
+func TestWalFollower_emptyDir(t *testing.T) {
+	data, err := os.ReadFile("testdata/test.xlog")
+	require.NoError(t, err)
+	dir := t.TempDir()
+
+	follower, err := newWalFollower(dir)
+	require.NoError(t, err)
+	defer follower.close()
+
+	var lsns []uint64
+	collect := func(row *Row) error {
+		lsns = append(lsns, row.LSN)
+		return nil
+	}
+	require.NoError(t, follower.poll(collect, true))
+	assert.Empty(t, lsns)
+
+	// The first file is read from the beginning.
+	fileName := filepath.Join(dir, "00000000000000000000.xlog")
+	require.NoError(t, os.WriteFile(fileName, data, 0644))
+	require.NoError(t, follower.poll(collect, true))
+	assert.Equal(t, []uint64{1, 2}, lsns)
+}
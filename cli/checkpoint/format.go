@@ -0,0 +1,481 @@
+package checkpoint
+
+import (
+	"bufio"
+	"encoding/base64"
+	"encoding/binary"
+	"encoding/hex"
+	"fmt"
+	"math"
+	"regexp"
+	"strconv"
+	"strings"
+	"time"
+	"unicode/utf8"
+)
+
+// MsgPack extension types supported by tarantool.
+const (
+	mpExtDecimal  = 1
+	mpExtUUID     = 2
+	mpExtDatetime = 4
+)
+
+// rowFormatter writes a row to the output in some format.
+type rowFormatter func(w *bufio.Writer, row *Row) error
+
+// catFormatters contains the row formatters by the --format flag values.
+var catFormatters = map[string]rowFormatter{
+	"yaml":    writeRowYaml,
+	"json":    writeRowJson,
+	"ndjson":  writeRowJson,
+	"lua":     writeRowLua,
+	"msgpack": writeRowMsgpack,
+}
+
+// hexDigits are used to escape bytes of strings.
+const hexDigits = "0123456789abcdef"
+
+// formatNumber formats a float number the same way as tarantool serializers do.
+func formatNumber(number float64) string {
+	switch {
+	case math.IsNaN(number):
+		return "nan"
+	case math.IsInf(number, 1):
+		return "inf"
+	case math.IsInf(number, -1):
+		return "-inf"
+	}
+	return strconv.FormatFloat(number, 'g', 14, 64)
+}
+
+// formatExt formats a value of the tarantool MsgPack extension type as a string.
+func formatExt(ext mpExt) string {
+	switch ext.Type {
+	case mpExtDecimal:
+		if str, ok := formatDecimal(ext.Data); ok {
+			return str
+		}
+	case mpExtUUID:
+		if len(ext.Data) == 16 {
+			str := hex.EncodeToString(ext.Data)
+			return str[0:8] + "-" + str[8:12] + "-" + str[12:16] + "-" +
+				str[16:20] + "-" + str[20:]
+		}
+	case mpExtDatetime:
+		if len(ext.Data) == 8 || len(ext.Data) == 16 {
+			seconds := int64(binary.LittleEndian.Uint64(ext.Data))
+			var nsec int64
+			var offset int
+			if len(ext.Data) == 16 {
+				nsec = int64(int32(binary.LittleEndian.Uint32(ext.Data[8:])))
+				offset = int(int16(binary.LittleEndian.Uint16(ext.Data[12:])))
+			}
+			t := time.Unix(seconds, nsec).In(time.FixedZone("", offset*60))
+			return t.Format("2006-01-02T15:04:05.999999999-0700")
+		}
+	}
+	return fmt.Sprintf("ext(%d, %s)", ext.Type, hex.EncodeToString(ext.Data))
+}
+
+// formatDecimal formats a decimal encoded as a scale and a packed BCD number.
+func formatDecimal(data []byte) (string, bool) {
+	dec := mpDecoder{buf: data}
+	scaleValue, err := dec.decodeValue()
+	if err != nil {
+		return "", false
+	}
+	var scale int64
+	switch value := scaleValue.(type) {
+	case uint64:
+		scale = int64(value)
+	case int64:
+		scale = value
+	default:
+		return "", false
+	}
+
+	bcd := data[dec.pos:]
+	if len(bcd) == 0 {
+		return "", false
+	}
+	digits := make([]byte, 0, 2*len(bcd))
+	for i, b := range bcd {
+		if i != 0 || b>>4 != 0 {
+			digits = append(digits, '0'+b>>4)
+		}
+		if i != len(bcd)-1 {
+			digits = append(digits, '0'+b&0x0f)
+		}
+	}
+	sign := bcd[len(bcd)-1] & 0x0f
+	number := strings.TrimLeft(string(digits), "0")
+	if scale > 0 {
+		if int64(len(number)) <= scale {
+			number = strings.Repeat("0", int(scale)-len(number)+1) + number
+		}
+		number = number[:len(number)-int(scale)] + "." + number[len(number)-int(scale):]
+	} else if number == "" {
+		number = "0"
+	} else if scale < 0 {
+		number += strings.Repeat("0", int(-scale))
+	}
+	if sign == 0x0b || sign == 0x0d {
+		number = "-" + number
+	}
+	return number, true
+}
+
+// yamlPlainRe matches strings which could be written as plain YAML scalars.
+var yamlPlainRe = regexp.MustCompile(`^[A-Za-z_/][A-Za-z0-9_./\- ]*$`)
+
+// yamlReservedRe matches plain YAML scalars which would be resolved not as strings.
+var yamlReservedRe = regexp.MustCompile(
+	`^(?i:null|~|true|false|yes|no|on|off|y|n|\.nan|\.inf|-\.inf)$`)
+
+// writeYamlString writes a string as a YAML scalar. Strings in a flow context
+// are always quoted.
+func writeYamlString(w *bufio.Writer, str string, flow bool) {
+	switch {
+	case !utf8.ValidString(str):
+		w.WriteString("!!binary ")
+		w.WriteString(base64.StdEncoding.EncodeToString([]byte(str)))
+	case !flow && yamlPlainRe.MatchString(str) && !yamlReservedRe.MatchString(str) &&
+		!strings.HasSuffix(str, " "):
+		w.WriteString(str)
+	case strings.ContainsFunc(str, func(r rune) bool { return r < ' ' || r == 0x7f }):
+		writeJsonString(w, str)
+	default:
+		w.WriteByte('\'')
+		w.WriteString(strings.ReplaceAll(str, "'", "''"))
+		w.WriteByte('\'')
+	}
+}
+
+// writeYamlValue writes a value in the YAML flow style.
+func writeYamlValue(w *bufio.Writer, value any, flow bool) {
+	switch value := value.(type) {
+	case nil:
+		w.WriteString("null")
+	case bool:
+		w.WriteString(strconv.FormatBool(value))
+	case uint64:
+		w.WriteString(strconv.FormatUint(value, 10))
+	case int64:
+		w.WriteString(strconv.FormatInt(value, 10))
+	case float64:
+		w.WriteString(formatNumber(value))
+	case string:
+		writeYamlString(w, value, flow)
+	case mpBinary:
+		w.WriteString("!!binary ")
+		w.WriteString(base64.StdEncoding.EncodeToString(value))
+	case mpExt:
+		w.WriteString(formatExt(value))
+	case []any:
+		w.WriteByte('[')
+		for i, item := range value {
+			if i != 0 {
+				w.WriteString(", ")
+			}
+			writeYamlValue(w, item, true)
+		}
+		w.WriteByte(']')
+	case mpMap:
+		w.WriteByte('{')
+		for i, entry := range value {
+			if i != 0 {
+				w.WriteString(", ")
+			}
+			writeYamlValue(w, entry.Key, true)
+			w.WriteString(": ")
+			writeYamlValue(w, entry.Value, true)
+		}
+		w.WriteByte('}')
+	}
+}
+
+// writeYamlBlock writes a top level record map in the YAML block style.
+func writeYamlBlock(w *bufio.Writer, name string, m mpMap) {
+	w.WriteString(name)
+	w.WriteString(":\n")
+	for _, entry := range m {
+		w.WriteString("  ")
+		writeYamlValue(w, entry.Key, false)
+		w.WriteString(": ")
+		writeYamlValue(w, entry.Value, false)
+		w.WriteByte('\n')
+	}
+}
+
+// writeRowYaml writes a row as a YAML document without the end marker.
+func writeRowYaml(w *bufio.Writer, row *Row) error {
+	header, err := row.Header()
+	if err != nil {
+		return fmt.Errorf("invalid row header: %w", err)
+	}
+	body, err := row.Body()
+	if err != nil {
+		return fmt.Errorf("invalid row body: %w", err)
+	}
+	w.WriteString("---\n")
+	writeYamlBlock(w, "HEADER", header)
+	if len(body) > 0 {
+		writeYamlBlock(w, "BODY", body)
+	}
+	return nil
+}
+
+// writeJsonString writes a string as a JSON string. The string is escaped the
+// same way as encoding/json does, but without intermediate allocations.
+func writeJsonString(w *bufio.Writer, str string) {
+	w.WriteByte('"')
+	start := 0
+	for i := 0; i < len(str); {
+		b := str[i]
+		if b < utf8.RuneSelf {
+			if b >= ' ' && b != '"' && b != '\\' && b != '<' && b != '>' && b != '&' {
+				i++
+				continue
+			}
+			w.WriteString(str[start:i])
+			switch b {
+			case '"', '\\':
+				w.WriteByte('\\')
+				w.WriteByte(b)
+			case '\n':
+				w.WriteString(`\n`)
+			case '\r':
+				w.WriteString(`\r`)
+			case '\t':
+				w.WriteString(`\t`)
+			default:
+				w.WriteString(`\u00`)
+				w.WriteByte(hexDigits[b>>4])
+				w.WriteByte(hexDigits[b&0x0f])
+			}
+			i++
+			start = i
+			continue
+		}
+		r, size := utf8.DecodeRuneInString(str[i:])
+		if r == utf8.RuneError && size == 1 {
+			w.WriteString(str[start:i])
+			w.WriteString(`\ufffd`)
+			i += size
+			start = i
+			continue
+		}
+		if r == '\u2028' || r == '\u2029' {
+			w.WriteString(str[start:i])
+			w.WriteString(`\u202`)
+			w.WriteByte(hexDigits[r&0x0f])
+			i += size
+			start = i
+			continue
+		}
+		i += size
+	}
+	w.WriteString(str[start:])
+	w.WriteByte('"')
+}
+
+// writeJsonValue writes a value as JSON.
+func writeJsonValue(w *bufio.Writer, value any) {
+	switch value := value.(type) {
+	case nil:
+		w.WriteString("null")
+	case bool:
+		w.WriteString(strconv.FormatBool(value))
+	case uint64:
+		w.WriteString(strconv.FormatUint(value, 10))
+	case int64:
+		w.WriteString(strconv.FormatInt(value, 10))
+	case float64:
+		w.WriteString(formatNumber(value))
+	case string:
+		writeJsonString(w, value)
+	case mpBinary:
+		writeJsonString(w, string(value))
+	case mpExt:
+		writeJsonString(w, formatExt(value))
+	case []any:
+		w.WriteByte('[')
+		for i, item := range value {
+			if i != 0 {
+				w.WriteByte(',')
+			}
+			writeJsonValue(w, item)
+		}
+		w.WriteByte(']')
+	case mpMap:
+		w.WriteByte('{')
+		for i, entry := range value {
+			if i != 0 {
+				w.WriteByte(',')
+			}
+			if key, ok := entry.Key.(string); ok {
+				writeJsonString(w, key)
+			} else {
+				w.WriteByte('"')
+				writeJsonValue(w, entry.Key)
+				w.WriteByte('"')
+			}
+			w.WriteByte(':')
+			writeJsonValue(w, entry.Value)
+		}
+		w.WriteByte('}')
+	}
+}
+
+// writeRowJson writes a row as a single line JSON object.
+func writeRowJson(w *bufio.Writer, row *Row) error {
+	header, err := row.Header()
+	if err != nil {
+		return fmt.Errorf("invalid row header: %w", err)
+	}
+	body, err := row.Body()
+	if err != nil {
+		return fmt.Errorf("invalid row body: %w", err)
+	}
+	record := mpMap{{Key: "HEADER", Value: header}}
+	if len(body) > 0 {
+		record = append(record, mpMapEntry{Key: "BODY", Value: body})
+	}
+	writeJsonValue(w, record)
+	w.WriteByte('\n')
+	return nil
+}
+
+// writeRowMsgpack writes a row as a MsgPack map with the raw "HEADER" and
+// "BODY" maps prefixed with its length as a big-endian 32-bit number. Keys of
+// the raw maps are IPROTO keys.
+func writeRowMsgpack(w *bufio.Writer, row *Row) error {
+	const headerKey = "\xa6HEADER"
+	const bodyKey = "\xa4BODY"
+	size := 1 + len(headerKey) + len(row.header)
+	if row.HasBody() {
+		size += len(bodyKey) + len(row.body)
+	}
+	var prefix [4]byte
+	binary.BigEndian.PutUint32(prefix[:], uint32(size))
+	w.Write(prefix[:])
+	if row.HasBody() {
+		w.WriteByte(0x82)
+	} else {
+		w.WriteByte(0x81)
+	}
+	w.WriteString(headerKey)
+	w.Write(row.header)
+	if row.HasBody() {
+		w.WriteString(bodyKey)
+		w.Write(row.body)
+	}
+	return nil
+}
+
+// writeLuaString writes a string as a Lua string with escaped bytes.
+func writeLuaString(w *bufio.Writer, str string) {
+	w.WriteByte('\'')
+	for i := 0; i < len(str); i++ {
+		w.WriteString(`\x`)
+		w.WriteByte(hexDigits[str[i]>>4])
+		w.WriteByte(hexDigits[str[i]&0x0f])
+	}
+	w.WriteByte('\'')
+}
+
+// writeLuaValue writes a value as a Lua value.
+func writeLuaValue(w *bufio.Writer, value any) {
+	switch value := value.(type) {
+	case nil:
+		w.WriteString("nil")
+	case bool:
+		w.WriteString(strconv.FormatBool(value))
+	case uint64:
+		w.WriteString(strconv.FormatUint(value, 10))
+	case int64:
+		w.WriteString(strconv.FormatInt(value, 10))
+	case float64:
+		w.WriteString(formatNumber(value))
+	case string:
+		writeLuaString(w, value)
+	case mpBinary:
+		writeLuaString(w, string(value))
+	case mpExt:
+		writeLuaString(w, formatExt(value))
+	case []any:
+		w.WriteByte('{')
+		for i, item := range value {
+			if i != 0 {
+				w.WriteString(", ")
+			}
+			w.WriteByte('[')
+			w.WriteString(strconv.Itoa(i + 1))
+			w.WriteString("] = ")
+			writeLuaValue(w, item)
+		}
+		w.WriteByte('}')
+	case mpMap:
+		w.WriteByte('{')
+		for i, entry := range value {
+			if i != 0 {
+				w.WriteString(", ")
+			}
+			w.WriteByte('[')
+			writeLuaValue(w, entry.Key)
+			w.WriteString("] = ")
+			writeLuaValue(w, entry.Value)
+		}
+		w.WriteByte('}')
+	}
+}
+
+// mapValue returns a value of the map by the key.
+func (m mpMap) mapValue(key string) any {
+	for _, entry := range m {
+		if entry.Key == key {
+			return entry.Value
+		}
+	}
+	return nil
+}
+
+// writeRowLua writes a data change row as a Lua request to the space.
+// Other rows are ignored.
+func writeRowLua(w *bufio.Writer, row *Row) error {
+	// Ignore both versions of IPROTO_NOP: the one without a
+	// body (new), and the one with empty body (old).
+	if row.Type == iprotoNop || !row.HasBody() {
+		return nil
+	}
+	spaceID, hasSpace, err := row.SpaceID()
+	if err != nil {
+		return fmt.Errorf("invalid row body: %w", err)
+	}
+	if !hasSpace {
+		return nil
+	}
+	body, err := row.Body()
+	if err != nil {
+		return fmt.Errorf("invalid row body: %w", err)
+	}
+
+	fmt.Fprintf(w, "box.space[%d]:%s(", spaceID, strings.ToLower(row.TypeName()))
+	switch row.Type {
+	case iprotoInsert, iprotoReplace:
+		writeLuaValue(w, body.mapValue("tuple"))
+	case iprotoDelete:
+		writeLuaValue(w, body.mapValue("key"))
+	case iprotoUpdate:
+		writeLuaValue(w, body.mapValue("key"))
+		w.WriteString(", ")
+		writeLuaValue(w, body.mapValue("tuple"))
+	case iprotoUpsert:
+		writeLuaValue(w, body.mapValue("tuple"))
+		w.WriteString(", ")
+		writeLuaValue(w, body.mapValue("operations"))
+	}
+	w.WriteString(")\n")
+	return nil
+}
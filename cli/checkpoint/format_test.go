@@ -0,0 +1,163 @@
+package checkpoint
+
+import (
+	"bufio"
+	"bytes"
+	"encoding/binary"
+	"encoding/json"
+	"os"
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
+
+func formatRows(t *testing.T, formatter rowFormatter) string {
+	t.Helper()
+	data, err := os.ReadFile("testdata/test.xlog")
+	require.NoError(t, err)
+	rows, err := readAllRows(t, data)
+	require.NoError(t, err)
+
+	var buf bytes.Buffer
+	w := bufio.NewWriter(&buf)
+	for _, row := range rows {
+		require.NoError(t, formatter(w, &row))
+	}
+	require.NoError(t, w.Flush())
+	return buf.String()
+}
+
+func TestWriteRowYaml(t *testing.T) {
+	expected := `---
+HEADER:
+  type: UPDATE
+  replica_id: 1
+  lsn: 1
+  timestamp: 1650033990.9953
+BODY:
+  space_id: 272
+  index_base: 1
+  key: ['max_id']
+  tuple: [['+', 2, 1]]
+---
+HEADER:
+  type: INSERT
+  replica_id: 1
+  lsn: 2
+  timestamp: 1650033990.997
+BODY:
+  space_id: 280
+  tuple: [512, 1, 'MY_TEST_SPACE', 'memtx', 0, {}, []]
+`
+	assert.Equal(t, expected, formatRows(t, writeRowYaml))
+}
+
+func TestWriteRowJson(t *testing.T) {
+	expected := `{"HEADER":{"type":"UPDATE","replica_id":1,"lsn":1,` +
+		`"timestamp":1650033990.9953},"BODY":{"space_id":272,"index_base":1,` +
+		`"key":["max_id"],"tuple":[["+",2,1]]}}
+{"HEADER":{"type":"INSERT","replica_id":1,"lsn":2,"timestamp":1650033990.997},` +
+		`"BODY":{"space_id":280,"tuple":[512,1,"MY_TEST_SPACE","memtx",0,{},[]]}}
+`
+	assert.Equal(t, expected, formatRows(t, writeRowJson))
+}
+
+func TestWriteRowLua(t *testing.T) {
+	expected := `box.space[272]:update({[1] = '\x6d\x61\x78\x5f\x69\x64'}, ` +
+		`{[1] = {[1] = '\x2b', [2] = 2, [3] = 1}})
+box.space[280]:insert({[1] = 512, [2] = 1, ` +
+		`[3] = '\x4d\x59\x5f\x54\x45\x53\x54\x5f\x53\x50\x41\x43\x45', ` +
+		`[4] = '\x6d\x65\x6d\x74\x78', [5] = 0, [6] = {}, [7] = {}})
+`
+	assert.Equal(t, expected, formatRows(t, writeRowLua))
+}
+
+func TestWriteYamlValue(t *testing.T) {
+	tests := []struct {
+		value    any
+		flow     bool
+		expected string
+	}{
+		{"abc", false, "abc"},
+		{"abc", true, "'abc'"},
+		{"true", false, "'true'"},
+		{"123", false, "'123'"},
+		{"", false, "''"},
+		{"it's", false, "'it''s'"},
+		{"a\nb", false, `"a\nb"`},
+		{"\xff", false, "!!binary /w=="},
+		{mpBinary{0xff}, false, "!!binary /w=="},
+		{nil, false, "null"},
+		{int64(-1), false, "-1"},
+		{1.5, false, "1.5"},
+		{mpMap{{Key: "a", Value: []any{uint64(1), "b"}}}, false, "{'a': [1, 'b']}"},
+	}
+	for _, tc := range tests {
+		var buf bytes.Buffer
+		w := bufio.NewWriter(&buf)
+		writeYamlValue(w, tc.value, tc.flow)
+		require.NoError(t, w.Flush())
+		assert.Equal(t, tc.expected, buf.String())
+	}
+}
+
+func TestFormatExt(t *testing.T) {
+	tests := []struct {
+		ext      mpExt
+		expected string
+	}{
+		{mpExt{Type: mpExtDecimal, Data: []byte{0x02, 0x01, 0x23, 0x4c}}, "12.34"},
+		{mpExt{Type: mpExtDecimal, Data: []byte{0x03, 0x01, 0x2d}}, "-0.012"},
+		{mpExt{Type: mpExtDecimal, Data: []byte{0x00, 0x0c}}, "0"},
+		{mpExt{Type: mpExtUUID, Data: []byte{
+			0x8f, 0xb6, 0x52, 0x42, 0x87, 0x8b, 0x4d, 0xc6,
+			0xa0, 0x7b, 0x44, 0x4a, 0xe3, 0xde, 0xcc, 0x18}},
+			"8fb65242-878b-4dc6-a07b-444ae3decc18"},
+		{mpExt{Type: mpExtDatetime, Data: []byte{0, 0, 0, 0, 0, 0, 0, 0}},
+			"1970-01-01T00:00:00+0000"},
+		{mpExt{Type: 100, Data: []byte{0x01}}, "ext(100, 01)"},
+	}
+	for _, tc := range tests {
+		assert.Equal(t, tc.expected, formatExt(tc.ext))
+	}
+}
+
+func TestWriteJsonString(t *testing.T) {
+	tests := []string{"", "abc", `a"b\c`, "a\nb\r\tc", "\x01\x1f", "<a&b>",
+		"привет", "\xff\xfe", "a b ", "\U0001F600"}
+	for _, str := range tests {
+		var buf bytes.Buffer
+		w := bufio.NewWriter(&buf)
+		writeJsonString(w, str)
+		require.NoError(t, w.Flush())
+		expected, err := json.Marshal(str)
+		require.NoError(t, err)
+		assert.Equal(t, string(expected), buf.String(), "%q", str)
+	}
+}
+
+func TestWriteRowMsgpack(t *testing.T) {
+	output := formatRows(t, writeRowMsgpack)
+	data := []byte(output)
+	for _, lsn := range []uint64{1, 2} {
+		require.GreaterOrEqual(t, len(data), 4)
+		size := int(binary.BigEndian.Uint32(data))
+		require.GreaterOrEqual(t, len(data), 4+size)
+		dec := mpDecoder{buf: data[4 : 4+size]}
+		value, err := dec.decodeValue()
+		require.NoError(t, err)
+		assert.Equal(t, size, dec.pos)
+
+		record, ok := value.(mpMap)
+		require.True(t, ok)
+		require.Len(t, record, 2)
+		assert.Equal(t, "HEADER", record[0].Key)
+		assert.Equal(t, "BODY", record[1].Key)
+		header, ok := record[0].Value.(mpMap)
+		require.True(t, ok)
+		assert.Contains(t, header, mpMapEntry{Key: uint64(iprotoLSN), Value: lsn})
+		data = data[4+size:]
+	}
+	assert.Empty(t, data)
+}
@@ -0,0 +1,354 @@
+package checkpoint
+
+import (
+	"bufio"
+	"encoding/binary"
+	"encoding/json"
+	"errors"
+	"fmt"
+	"io"
+	"math"
+	"os"
+	"path/filepath"
+	"sort"
+
+	"github.com/apex/log"
+)
+
+const (
+	// indexSuffix is a suffix of sidecar index files of .snap/.xlog files.
+	indexSuffix = ".idx"
+	// indexVersion is a version of the index file format.
+	indexVersion = 1
+	// indexStep is a minimal distance in bytes between indexed transactions.
+	indexStep = 64 * 1024
+)
+
+// walIndexEntry describes a transaction boundary of a .snap/.xlog file.
+type walIndexEntry struct {
+	// Offset is a file offset of the transaction.
+	Offset int64 `json:"offset"`
+	// MaxLSNBefore is the maximal LSN of rows preceding the transaction.
+	MaxLSNBefore uint64 `json:"max_lsn_before"`
+	// MinLSNAfter is the minimal LSN of rows starting from the transaction.
+	MinLSNAfter uint64 `json:"min_lsn_after"`
+	// MinTimestampAfter is the minimal timestamp of rows starting from
+	// the transaction.
+	MinTimestampAfter float64 `json:"min_timestamp_after"`
+}
+
+// walIndex is a sparse index of a .snap/.xlog file. It maps LSNs and
+// timestamps of rows to file offsets.
+type walIndex struct {
+	Version int `json:"version"`
+	// Size and ModTime identify the indexed state of the file.
+	Size         int64           `json:"size"`
+	ModTime      int64           `json:"mod_time"`
+	Rows         uint64          `json:"rows"`
+	MinLSN       uint64          `json:"min_lsn"`
+	MaxLSN       uint64          `json:"max_lsn"`
+	MinTimestamp float64         `json:"min_timestamp"`
+	MaxTimestamp float64         `json:"max_timestamp"`
+	Entries      []walIndexEntry `json:"entries"`
+}
+
+// filePlan describes a part of a .snap/.xlog file to read.
+type filePlan struct {
+	// skip is true if the file has no rows matching the filter.
+	skip bool
+	// start is an offset of the first transaction to read. Zero means
+	// the beginning of the file.
+	start int64
+	// stop is an offset of the transaction to stop reading at. Zero means
+	// the end of the file.
+	stop int64
+}
+
+// indexPath returns a path to the sidecar index of the file.
+func indexPath(fileName string) string {
+	return fileName + indexSuffix
+}
+
+// isCompleteFile checks whether the file ends with the EOF marker. Only such
+// files are not modified anymore and could be indexed.
+func isCompleteFile(file *os.File, size int64) bool {
+	if size < 4 {
+		return false
+	}
+	marker := make([]byte, 4)
+	if _, err := file.ReadAt(marker, size-4); err != nil {
+		return false
+	}
+	return binary.BigEndian.Uint32(marker) == eofMarker
+}
+
+// loadIndex loads the sidecar index of the file. Returns nil if there is no
+// index or it is out of date.
+func loadIndex(fileName string, info os.FileInfo) *walIndex {
+	data, err := os.ReadFile(indexPath(fileName))
+	if err != nil {
+		return nil
+	}
+	var index walIndex
+	if err := json.Unmarshal(data, &index); err != nil {
+		log.Debugf("Ignoring invalid index of %q: %s", fileName, err)
+		return nil
+	}
+	if index.Version != indexVersion || index.Size != info.Size() ||
+		index.ModTime != info.ModTime().UnixNano() {
+		return nil
+	}
+	return &index
+}
+
+// saveIndex writes the sidecar index of the file.
+func saveIndex(fileName string, index *walIndex) error {
+	data, err := json.Marshal(index)
+	if err != nil {
+		return err
+	}
+	path := indexPath(fileName)
+	tmpPath := path + ".tmp"
+	if err := os.WriteFile(tmpPath, data, 0644); err != nil {
+		return err
+	}
+	if err := os.Rename(tmpPath, path); err != nil {
+		os.Remove(tmpPath)
+		return err
+	}
+	return nil
+}
+
+// buildIndex reads row headers of the file and builds its index.
+func buildIndex(file *os.File, info os.FileInfo) (*walIndex, error) {
+	reader, err := NewReader(file)
+	if err != nil {
+		return nil, err
+	}
+	defer reader.Close()
+
+	index := walIndex{
+		Version:      indexVersion,
+		Size:         info.Size(),
+		ModTime:      info.ModTime().UnixNano(),
+		MinLSN:       math.MaxUint64,
+		MinTimestamp: math.Inf(1),
+		MaxTimestamp: math.Inf(-1),
+	}
+	// Minimal LSNs and timestamps of rows between neighbour entries.
+	var segmentMinLSN []uint64
+	var segmentMinTimestamp []float64
+	txOffset := int64(-1)
+	var row Row
+	for {
+		if err := reader.Next(&row); err != nil {
+			if errors.Is(err, io.EOF) {
+				break
+			}
+			return nil, err
+		}
+		if reader.TxOffset() != txOffset {
+			txOffset = reader.TxOffset()
+			last := len(index.Entries) - 1
+			if last < 0 || txOffset-index.Entries[last].Offset >= indexStep {
+				maxLSN := uint64(0)
+				if index.Rows > 0 {
+					maxLSN = index.MaxLSN
+				}
+				index.Entries = append(index.Entries, walIndexEntry{
+					Offset:       txOffset,
+					MaxLSNBefore: maxLSN,
+				})
+				segmentMinLSN = append(segmentMinLSN, math.MaxUint64)
+				segmentMinTimestamp = append(segmentMinTimestamp, math.Inf(1))
+			}
+		}
+
+		last := len(index.Entries) - 1
+		segmentMinLSN[last] = min(segmentMinLSN[last], row.LSN)
+		segmentMinTimestamp[last] = min(segmentMinTimestamp[last], row.Timestamp)
+		index.Rows++
+		index.MinLSN = min(index.MinLSN, row.LSN)
+		index.MaxLSN = max(index.MaxLSN, row.LSN)
+		index.MinTimestamp = min(index.MinTimestamp, row.Timestamp)
+		index.MaxTimestamp = max(index.MaxTimestamp, row.Timestamp)
+	}
+	if index.Rows == 0 {
+		index.MinLSN, index.MinTimestamp, index.MaxTimestamp = 0, 0, 0
+	}
+
+	minLSN := uint64(math.MaxUint64)
+	minTimestamp := math.Inf(1)
+	for i := len(index.Entries) - 1; i >= 0; i-- {
+		minLSN = min(minLSN, segmentMinLSN[i])
+		minTimestamp = min(minTimestamp, segmentMinTimestamp[i])
+		index.Entries[i].MinLSNAfter = minLSN
+		index.Entries[i].MinTimestampAfter = minTimestamp
+	}
+	return &index, nil
+}
+
+// getIndex returns the index of the file. A missing or out of date index is
+// built and saved next to the file. Returns nil if the file could not be
+// indexed because it is not complete yet.
+func getIndex(fileName string) (*walIndex, error) {
+	file, err := os.Open(fileName)
+	if err != nil {
+		return nil, err
+	}
+	defer file.Close()
+	info, err := file.Stat()
+	if err != nil {
+		return nil, err
+	}
+	if index := loadIndex(fileName, info); index != nil {
+		return index, nil
+	}
+	if !isCompleteFile(file, info.Size()) {
+		return nil, nil
+	}
+
+	index, err := buildIndex(file, info)
+	if err != nil {
+		return nil, fmt.Errorf("failed to index %q: %w", fileName, err)
+	}
+	if err := saveIndex(fileName, index); err != nil {
+		log.Debugf("Failed to save the index of %q: %s", fileName, err)
+	}
+	return index, nil
+}
+
+// plan returns the part of the indexed file which may contain rows matching
+// the filter.
+func (index *walIndex) plan(filter *rowFilter) filePlan {
+	if index.Rows == 0 || index.MaxLSN < filter.from || index.MinLSN >= filter.to ||
+		index.MinTimestamp >= filter.timestamp {
+		return filePlan{skip: true}
+	}
+
+	var plan filePlan
+	// Rows preceding the last entry with a smaller LSN are all skipped by
+	// the filter.
+	first := sort.Search(len(index.Entries), func(i int) bool {
+		return index.Entries[i].MaxLSNBefore >= filter.from
+	}) - 1
+	if first > 0 {
+		plan.start = index.Entries[first].Offset
+	}
+	// Rows starting from the first entry with bigger LSNs and timestamps
+	// are all skipped by the filter.
+	last := sort.Search(len(index.Entries), func(i int) bool {
+		return index.Entries[i].MinLSNAfter >= filter.to ||
+			index.Entries[i].MinTimestampAfter >= filter.timestamp
+	})
+	if last < len(index.Entries) {
+		plan.stop = index.Entries[last].Offset
+	}
+	return plan
+}
+
+// readFileMeta reads the meta information of a .snap/.xlog file.
+func readFileMeta(fileName string) (FileMeta, error) {
+	file, err := os.Open(fileName)
+	if err != nil {
+		return FileMeta{}, err
+	}
+	defer file.Close()
+
+	r := Reader{reader: bufio.NewReaderSize(file, 4096)}
+	if err := r.readMeta(); err != nil {
+		return FileMeta{}, fmt.Errorf("%q: %w", fileName, err)
+	}
+	return r.meta, nil
+}
+
+// xlogMaxLSNs returns upper bounds of row LSNs of the .xlog files. A bound is
+// known for a file if the next .xlog file of the same instance is in the same
+// directory: its header vclock contains the last LSNs of the file.
+func xlogMaxLSNs(files []string) map[string]uint64 {
+	type xlogFile struct {
+		name      string
+		meta      FileMeta
+		signature uint64
+	}
+	groups := map[string][]xlogFile{}
+	for _, fileName := range files {
+		if filepath.Ext(fileName) != ".xlog" {
+			continue
+		}
+		meta, err := readFileMeta(fileName)
+		if err != nil || meta.FileType != "XLOG" || meta.Instance == "" {
+			continue
+		}
+		var signature uint64
+		for _, lsn := range meta.VClock {
+			signature += lsn
+		}
+		group := filepath.Dir(fileName) + "\x00" + meta.Instance
+		groups[group] = append(groups[group], xlogFile{fileName, meta, signature})
+	}
+
+	bounds := map[string]uint64{}
+	for _, group := range groups {
+		sort.Slice(group, func(i, j int) bool {
+			return group[i].signature < group[j].signature
+		})
+		for i := 0; i+1 < len(group); i++ {
+			var bound uint64
+			for _, lsn := range group[i+1].meta.VClock {
+				bound = max(bound, lsn)
+			}
+			bounds[group[i].name] = bound
+		}
+	}
+	return bounds
+}
+
+// planFiles returns parts of the files which may contain rows matching
+// the filter. Files are skipped by vclocks of the next files. If useIndex is
+// set, sidecar indexes are used to skip files and to seek inside of them.
+func planFiles(files []string, filter *rowFilter, useIndex bool) (map[string]filePlan, error) {
+	plans := make(map[string]filePlan, len(files))
+	var maxLSNs map[string]uint64
+	if filter.from > 0 {
+		maxLSNs = xlogMaxLSNs(files)
+	}
+	for _, fileName := range files {
+		if maxLSN, ok := maxLSNs[fileName]; ok && maxLSN < filter.from {
+			plans[fileName] = filePlan{skip: true}
+			continue
+		}
+		if !useIndex {
+			continue
+		}
+		index, err := getIndex(fileName)
+		if err != nil {
+			return nil, err
+		}
+		if index != nil {
+			plans[fileName] = index.plan(filter)
+		}
+	}
+	return plans, nil
+}
+
+// SelectFiles returns the files which may contain rows matching the options.
+// Files are skipped by vclocks of the next files in the same directory and,
+// if opts.Index is set, by sidecar indexes.
+func SelectFiles(files []string, opts Opts) ([]string, error) {
+	filter, err := newRowFilter(opts)
+	if err != nil {
+		return nil, err
+	}
+	plans, err := planFiles(files, &filter, opts.Index)
+	if err != nil {
+		return nil, err
+	}
+	selected := make([]string, 0, len(files))
+	for _, fileName := range files {
+		if !plans[fileName].skip {
+			selected = append(selected, fileName)
+		}
+	}
+	return selected, nil
+}
@@ -0,0 +1,141 @@
+package checkpoint
+
+import (
+	"bytes"
+	"math"
+	"os"
+	"path/filepath"
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
+
+func copyTestFile(t *testing.T, name string) string {
+	t.Helper()
+	data, err := os.ReadFile(filepath.Join("testdata", name))
+	require.NoError(t, err)
+	fileName := filepath.Join(t.TempDir(), name)
+	require.NoError(t, os.WriteFile(fileName, data, 0644))
+	return fileName
+}
+
+func TestReader_SkipTo(t *testing.T) {
+	data, err := os.ReadFile("testdata/test.xlog")
+	require.NoError(t, err)
+
+	reader, err := NewReader(bytes.NewReader(data))
+	require.NoError(t, err)
+	defer reader.Close()
+	var row Row
+	require.NoError(t, reader.Next(&row))
+	require.NoError(t, reader.Next(&row))
+	require.Equal(t, uint64(2), row.LSN)
+	offset := reader.TxOffset()
+
+	reader, err = NewReader(bytes.NewReader(data))
+	require.NoError(t, err)
+	defer reader.Close()
+	require.NoError(t, reader.SkipTo(offset))
+	require.NoError(t, reader.Next(&row))
+	assert.Equal(t, uint64(2), row.LSN)
+	assert.Equal(t, offset, reader.TxOffset())
+}
+
+func TestGetIndex(t *testing.T) {
+	fileName := copyTestFile(t, "test.xlog")
+
+	index, err := getIndex(fileName)
+	require.NoError(t, err)
+	require.NotNil(t, index)
+	assert.Equal(t, uint64(2), index.Rows)
+	assert.Equal(t, uint64(1), index.MinLSN)
+	assert.Equal(t, uint64(2), index.MaxLSN)
+	assert.InDelta(t, 1650033990.995, index.MinTimestamp, 0.001)
+	require.Len(t, index.Entries, 1)
+	assert.Equal(t, uint64(0), index.Entries[0].MaxLSNBefore)
+	assert.Equal(t, uint64(1), index.Entries[0].MinLSNAfter)
+	assert.FileExists(t, fileName+indexSuffix)
+
+	// The saved index is reused.
+	loaded, err := getIndex(fileName)
+	require.NoError(t, err)
+	assert.Equal(t, index, loaded)
+
+	// The index is not used after the file is changed.
+	data, err := os.ReadFile(fileName)
+	require.NoError(t, err)
+	require.NoError(t, os.WriteFile(fileName, data[:len(data)-4], 0644))
+	index, err = getIndex(fileName)
+	require.NoError(t, err)
+	assert.Nil(t, index)
+}
+
+func TestWalIndex_plan(t *testing.T) {
+	index := walIndex{
+		Rows:         30,
+		MinLSN:       1,
+		MaxLSN:       30,
+		MinTimestamp: 100,
+		MaxTimestamp: 130,
+		Entries: []walIndexEntry{
+			{Offset: 100, MaxLSNBefore: 0, MinLSNAfter: 1, MinTimestampAfter: 100},
+			{Offset: 200, MaxLSNBefore: 10, MinLSNAfter: 11, MinTimestampAfter: 110},
+			{Offset: 300, MaxLSNBefore: 20, MinLSNAfter: 21, MinTimestampAfter: 120},
+		},
+	}
+	tests := []struct {
+		name      string
+		from      uint64
+		to        uint64
+		timestamp float64
+		expected  filePlan
+	}{
+		{"all", 0, math.MaxUint64, math.Inf(1), filePlan{}},
+		{"before", 0, 1, math.Inf(1), filePlan{skip: true}},
+		{"after", 31, math.MaxUint64, math.Inf(1), filePlan{skip: true}},
+		{"timestamp before", 0, math.MaxUint64, 100, filePlan{skip: true}},
+		{"from", 15, math.MaxUint64, math.Inf(1), filePlan{start: 200}},
+		{"from entry", 11, math.MaxUint64, math.Inf(1), filePlan{start: 200}},
+		{"from last", 25, math.MaxUint64, math.Inf(1), filePlan{start: 300}},
+		{"to", 0, 15, math.Inf(1), filePlan{stop: 300}},
+		{"to entry", 0, 11, math.Inf(1), filePlan{stop: 200}},
+		{"timestamp", 0, math.MaxUint64, 115, filePlan{stop: 300}},
+		{"range", 12, 18, math.Inf(1), filePlan{start: 200, stop: 300}},
+	}
+	for _, tc := range tests {
+		t.Run(tc.name, func(t *testing.T) {
+			filter := rowFilter{from: tc.from, to: tc.to, timestamp: tc.timestamp}
+			assert.Equal(t, tc.expected, index.plan(&filter))
+		})
+	}
+}
+
+func TestSelectFiles(t *testing.T) {
+	dir := t.TempDir()
+	writeXlog := func(name, instance, vclock string) string {
+		fileName := filepath.Join(dir, name)
+		meta := "XLOG\n0.13\nInstance: " + instance + "\nVClock: " + vclock + "\n\n"
+		require.NoError(t, os.WriteFile(fileName, []byte(meta), 0644))
+		return fileName
+	}
+	files := []string{
+		writeXlog("00000000000000000000.xlog", "a", "{}"),
+		writeXlog("00000000000000000015.xlog", "a", "{1: 10, 2: 5}"),
+		writeXlog("00000000000000000030.xlog", "a", "{1: 20, 2: 10}"),
+		writeXlog("00000000000000000040.xlog", "b", "{1: 40}"),
+	}
+
+	selected, err := SelectFiles(files, Opts{From: 12, To: math.MaxUint64})
+	require.NoError(t, err)
+	// The first file contains LSNs up to 10 only.
+	assert.Equal(t, files[1:], selected)
+
+	selected, err = SelectFiles(files, Opts{From: 21, To: math.MaxUint64})
+	require.NoError(t, err)
+	assert.Equal(t, files[2:], selected)
+
+	selected, err = SelectFiles(files, Opts{To: math.MaxUint64})
+	require.NoError(t, err)
+	assert.Equal(t, files, selected)
+}
@@ -6,11 +6,25 @@
 -- The --to flag passes through 'TT_CLI_PLAY_TO'.
 -- The --timestamp flag passes through 'TT_CLI_PLAY_TIMESTAMP'.
 -- The --replica flags passes through 'TT_CLI_PLAY_REPLICAS'.
+-- The --batch-size flag passes through 'TT_CLI_PLAY_BATCH_SIZE'.
+-- The --inflight flag passes through 'TT_CLI_PLAY_INFLIGHT'.
+-- The --parallel flag passes through 'TT_CLI_PLAY_PARALLEL'.
+-- The --partition-by flag passes through 'TT_CLI_PLAY_PARTITION_BY'.
 
 local log = require('log')
 local xlog = require('xlog')
 local json = require('json')
 local netbox = require('net.box')
+local fiber = require('fiber')
+local digest = require('digest')
+local msgpack = require('msgpack')
+
+-- Ids of system spaces are less than this value.
+local SYSTEM_SPACE_ID_MAX = 512
+-- Maximum count of records queued for a single connection.
+local WORKER_QUEUE_SIZE = 1024
+-- A marker to wait until a connection applies all queued records.
+local FLUSH = {}
 
 local function find_in_list(id, list)
     if type(list) == 'number' then
@@ -47,14 +61,132 @@ local function filter_xlog(gen, param, state, opts, cb)
     end
 end
 
-local function play(positional_arguments, keyword_arguments, opts)
-    local filter_opts = keyword_arguments
-    local uri = table.remove(positional_arguments, 1)
-    if uri == nil then
-        log.error('Internal error: empty URI is provided')
-        os.exit(1)
+-- Applies a batch of records in a single transaction on the remote instance.
+-- Returns the index of the failed record and the error if any.
+local apply_batch_lua = [[
+local records = ...
+box.begin()
+for i, record in ipairs(records) do
+    local space = box.space[record.space_id]
+    if space == nil then
+        box.rollback()
+        return i, ('no space #%s'):format(record.space_id)
+    end
+    local args = {}
+    table.insert(args, record.key)
+    table.insert(args, record.tuple)
+    table.insert(args, record.operations)
+    local ok, err = pcall(space[record.type], space, unpack(args))
+    if not ok then
+        box.rollback()
+        return i, tostring(err)
+    end
+end
+box.commit()
+]]
+
+local function play_error(lsn, err)
+    log.error('Fatal error: failed to play the record with LSN %s: %s', lsn, err)
+    os.exit(1)
+end
+
+-- Creates a player which sends records to the remote instance. Up to
+-- `inflight` requests are sent without waiting for responses. If
+-- `batch_size` is greater than 1, consecutive records are grouped into
+-- transactions. Returns a function to play a record and a function to
+-- wait for all sent requests.
+local function new_player(remote, batch_size, inflight)
+    local queue, first, last = {}, 1, 0
+    local batch, batch_lsns, batch_engine = {}, {}, nil
+
+    local function wait_oldest()
+        local request = queue[first]
+        queue[first] = nil
+        first = first + 1
+        local res, err = request.future:wait_result()
+        if err ~= nil then
+            play_error(request.lsns[1], err)
+        end
+        if request.is_batch and res[1] ~= nil then
+            play_error(request.lsns[res[1]], res[2])
+        end
+    end
+
+    local function send(future, lsns, is_batch)
+        last = last + 1
+        queue[last] = {future = future, lsns = lsns, is_batch = is_batch}
+        if last - first + 1 >= inflight then
+            wait_oldest()
+        end
+    end
+
+    local function flush_batch()
+        if #batch == 0 then
+            return
+        end
+        send(remote:eval(apply_batch_lua, {batch}, {is_async = true}), batch_lsns, true)
+        batch, batch_lsns, batch_engine = {}, {}, nil
     end
 
+    local function finish()
+        flush_batch()
+        while first <= last do
+            wait_oldest()
+        end
+    end
+
+    local function play_record(record)
+        local sid = record.BODY and record.BODY.space_id
+        if sid == nil then
+            return
+        end
+        local so = remote.space[sid]
+        if so == nil then
+            -- The space may be created by the records in flight or
+            -- by the records played on another connection.
+            finish()
+            pcall(remote.reload_schema, remote)
+            so = remote.space[sid]
+        end
+        if so == nil then
+            log.error('Fatal error: no space #%s, stopping work', sid)
+            os.exit(1)
+        end
+        local op = record.HEADER.type:lower()
+        local lsn = record.HEADER.lsn
+
+        if batch_size <= 1 then
+            local args = {}
+            table.insert(args, record.BODY.key)
+            table.insert(args, record.BODY.tuple)
+            table.insert(args, record.BODY.operations)
+            table.insert(args, {is_async = true})
+            send(so[op](so, unpack(args)), {lsn}, false)
+            return
+        end
+
+        -- Multi-engine transactions are not supported.
+        if batch_engine ~= nil and batch_engine ~= so.engine then
+            flush_batch()
+        end
+        batch_engine = so.engine
+        table.insert(batch, {
+            space_id = sid,
+            type = op,
+            key = record.BODY.key,
+            tuple = record.BODY.tuple,
+            operations = record.BODY.operations,
+        })
+        table.insert(batch_lsns, lsn)
+        if #batch >= batch_size then
+            flush_batch()
+        end
+    end
+
+    return play_record, finish
+end
+
+local function connect(uri, opts)
     local remote = nil
     if opts.transport ~= nil and opts.transport == "ssl" then
         remote = netbox.connect(
@@ -85,30 +217,140 @@ local function play(positional_arguments, keyword_arguments, opts)
         log.error('Fatal error: no connection to the host "%s"', uri)
         os.exit(1)
     end
+    return remote
+end
+
+-- Creates a function which maps a record to a partition from 1 to `count`.
+-- Records of the same partition are played in order. A record which can
+-- not be assigned to a partition safely is mapped to nil.
+local function new_partitioner(remote, partition_by, count)
+    local function bucket(value)
+        return value % count + 1
+    end
+
+    if partition_by == 'replica' then
+        return function(record)
+            return bucket(record.HEADER.replica_id or 0)
+        end
+    elseif partition_by == 'key' then
+        return function(record)
+            local body = record.BODY
+            if body.index_id ~= nil and body.index_id ~= 0 then
+                -- The record refers a tuple by a secondary key.
+                return nil
+            end
+            local key = body.key
+            if key == nil then
+                local space = remote.space[body.space_id]
+                local pk = space ~= nil and space.index[0] or nil
+                if pk == nil or body.tuple == nil then
+                    return nil
+                end
+                key = {}
+                for _, part in ipairs(pk.parts) do
+                    table.insert(key, body.tuple[part.fieldno])
+                end
+            end
+            return bucket(digest.murmur(msgpack.encode(key)))
+        end
+    end
+
+    return function(record)
+        return bucket(record.BODY.space_id)
+    end
+end
+
+-- Starts a fiber which plays records from the returned channel using the
+-- connection. The fiber puts to `acks` after each FLUSH marker.
+local function start_worker(remote, opts, acks)
+    local play_record, finish = new_player(remote, opts['batch-size'], opts.inflight)
+    local records = fiber.channel(WORKER_QUEUE_SIZE)
+    fiber.create(function()
+        local ok, err = pcall(function()
+            while true do
+                local record = records:get()
+                if record == nil then
+                    break
+                elseif record == FLUSH then
+                    finish()
+                    acks:put(true)
+                else
+                    play_record(record)
+                end
+            end
+        end)
+        if not ok then
+            log.error('Fatal error: %s', err)
+            os.exit(1)
+        end
+    end)
+    return records
+end
+
+local function play(positional_arguments, keyword_arguments, opts)
+    local filter_opts = keyword_arguments
+    local uri = table.remove(positional_arguments, 1)
+    if uri == nil then
+        log.error('Internal error: empty URI is provided')
+        os.exit(1)
+    end
+
+    local parallel = filter_opts.parallel
+    local connections = {}
+    for i = 1, parallel do
+        connections[i] = connect(uri, opts)
+    end
+
+    local acks = fiber.channel(parallel)
+    local queues = {}
+    for i, remote in ipairs(connections) do
+        queues[i] = start_worker(remote, filter_opts, acks)
+    end
+
+    local function flush()
+        for _, queue in ipairs(queues) do
+            queue:put(FLUSH)
+        end
+        for _ = 1, #queues do
+            acks:get()
+        end
+    end
+
+    -- Records which can not be partitioned, for example schema changes,
+    -- are played on the first connection when all previous records are
+    -- played. Records following them wait for them in the same way.
+    local partition = new_partitioner(connections[1], filter_opts['partition-by'], parallel)
+    local in_barrier = false
+    local function dispatch(record)
+        local sid = record.BODY and record.BODY.space_id
+        if sid == nil then
+            return
+        end
+        local index = 1
+        if parallel > 1 then
+            index = sid >= SYSTEM_SPACE_ID_MAX and partition(record) or nil
+            if (index == nil) ~= in_barrier then
+                flush()
+                in_barrier = not in_barrier
+            end
+        end
+        queues[index or 1]:put(record)
+    end
+
     for _, file in ipairs(positional_arguments) do
         print(string.format('• Play is processing file "%s" •', file))
         io.stdout:flush()
         local gen, param, state = xlog.pairs(file)
-        filter_xlog(gen, param, state, filter_opts, function(record)
-            local sid = record.BODY and record.BODY.space_id
-            if sid ~= nil then
-                local args, so = {}, remote.space[sid]
-                if so == nil then
-                   log.error('Fatal error: no space #%s, stopping work', sid)
-                   os.exit(1)
-                end
-                table.insert(args, so)
-                table.insert(args, record.BODY.key)
-                table.insert(args, record.BODY.tuple)
-                table.insert(args, record.BODY.operations)
-                so[record.HEADER.type:lower()](unpack(args))
-            end
-        end)
+        filter_xlog(gen, param, state, filter_opts, dispatch)
+        flush()
         print(string.format('• Done with file "%s" •', file))
         io.stdout:flush()
     end
     print('\n• Play result: completed successfully •')
-    remote:close()
+    for i, remote in ipairs(connections) do
+        queues[i]:close()
+        remote:close()
+    end
 end
 
 local function str_to_bool(value)
@@ -172,6 +414,11 @@ local function main()
         end
     end
 
+    keyword_arguments['batch-size'] = tonumber(os.getenv('TT_CLI_PLAY_BATCH_SIZE')) or 1
+    keyword_arguments['inflight'] = tonumber(os.getenv('TT_CLI_PLAY_INFLIGHT')) or 1
+    keyword_arguments['parallel'] = tonumber(os.getenv('TT_CLI_PLAY_PARALLEL')) or 1
+    keyword_arguments['partition-by'] = os.getenv('TT_CLI_PLAY_PARTITION_BY') or 'space'
+
     local opts = {
         user = os.getenv('TT_CLI_PLAY_USERNAME'),
         password = os.getenv('TT_CLI_PLAY_PASSWORD'),
@@ -0,0 +1,373 @@
+package checkpoint
+
+import (
+	"encoding/binary"
+	"errors"
+	"fmt"
+	"math"
+)
+
+// errMsgpackTruncated is returned when a MsgPack value is cut off by the end of the buffer.
+var errMsgpackTruncated = errors.New("truncated msgpack data")
+
+// mpBinary is a decoded MP_BIN value.
+type mpBinary []byte
+
+// mpExt is a decoded MP_EXT value.
+type mpExt struct {
+	// Type is an extension type.
+	Type int8
+	// Data is a raw extension payload.
+	Data []byte
+}
+
+// mpMapEntry is a single key-value pair of a decoded MP_MAP value.
+type mpMapEntry struct {
+	Key   any
+	Value any
+}
+
+// mpMap is a decoded MP_MAP value. It keeps the original order of the keys.
+type mpMap []mpMapEntry
+
+// mpDecoder is a minimal MsgPack decoder working over a byte slice. It allows
+// to skip values without allocations, which is used to look into WAL rows
+// before decoding them completely.
+type mpDecoder struct {
+	buf []byte
+	pos int
+}
+
+// remaining returns a count of not decoded bytes.
+func (d *mpDecoder) remaining() int {
+	return len(d.buf) - d.pos
+}
+
+// peek returns the next byte without consuming it.
+func (d *mpDecoder) peek() (byte, error) {
+	if d.pos >= len(d.buf) {
+		return 0, errMsgpackTruncated
+	}
+	return d.buf[d.pos], nil
+}
+
+// readN consumes next n bytes. The result references the decoder buffer.
+func (d *mpDecoder) readN(n int) ([]byte, error) {
+	if n < 0 || d.remaining() < n {
+		return nil, errMsgpackTruncated
+	}
+	data := d.buf[d.pos : d.pos+n]
+	d.pos += n
+	return data, nil
+}
+
+// readUint consumes next n big-endian bytes as an unsigned integer.
+func (d *mpDecoder) readUint(n int) (uint64, error) {
+	data, err := d.readN(n)
+	if err != nil {
+		return 0, err
+	}
+	switch n {
+	case 1:
+		return uint64(data[0]), nil
+	case 2:
+		return uint64(binary.BigEndian.Uint16(data)), nil
+	case 4:
+		return uint64(binary.BigEndian.Uint32(data)), nil
+	default:
+		return binary.BigEndian.Uint64(data), nil
+	}
+}
+
+// readLen consumes a length of n bytes for a str/bin/array/map/ext value.
+func (d *mpDecoder) readLen(n int) (int, error) {
+	length, err := d.readUint(n)
+	if err != nil {
+		return 0, err
+	}
+	if length > math.MaxInt32 {
+		return 0, fmt.Errorf("too large msgpack length %d", length)
+	}
+	return int(length), nil
+}
+
+// decodeMapLen decodes a header of MP_MAP and returns a count of pairs.
+func (d *mpDecoder) decodeMapLen() (int, error) {
+	code, err := d.peek()
+	if err != nil {
+		return 0, err
+	}
+	d.pos++
+	switch {
+	case code >= 0x80 && code <= 0x8f:
+		return int(code & 0x0f), nil
+	case code == 0xde:
+		return d.readLen(2)
+	case code == 0xdf:
+		return d.readLen(4)
+	}
+	return 0, fmt.Errorf("unexpected msgpack code %#x, expected a map", code)
+}
+
+// decodeUint decodes a non-negative integer.
+func (d *mpDecoder) decodeUint() (uint64, error) {
+	code, err := d.peek()
+	if err != nil {
+		return 0, err
+	}
+	d.pos++
+	switch {
+	case code <= 0x7f:
+		return uint64(code), nil
+	case code >= 0xcc && code <= 0xcf:
+		return d.readUint(1 << (code - 0xcc))
+	case code >= 0xd0 && code <= 0xd3:
+		value, err := d.readInt(1 << (code - 0xd0))
+		if err != nil {
+			return 0, err
+		}
+		if value < 0 {
+			return 0, fmt.Errorf("unexpected negative msgpack integer %d", value)
+		}
+		return uint64(value), nil
+	}
+	return 0, fmt.Errorf("unexpected msgpack code %#x, expected an unsigned integer", code)
+}
+
+// readInt consumes next n big-endian bytes as a signed integer.
+func (d *mpDecoder) readInt(n int) (int64, error) {
+	value, err := d.readUint(n)
+	if err != nil {
+		return 0, err
+	}
+	switch n {
+	case 1:
+		return int64(int8(value)), nil
+	case 2:
+		return int64(int16(value)), nil
+	case 4:
+		return int64(int32(value)), nil
+	default:
+		return int64(value), nil
+	}
+}
+
+// decodeFloat decodes a floating point or an integer number as float64.
+func (d *mpDecoder) decodeFloat() (float64, error) {
+	code, err := d.peek()
+	if err != nil {
+		return 0, err
+	}
+	switch code {
+	case 0xca:
+		d.pos++
+		value, err := d.readUint(4)
+		return float64(math.Float32frombits(uint32(value))), err
+	case 0xcb:
+		d.pos++
+		value, err := d.readUint(8)
+		return math.Float64frombits(value), err
+	}
+	value, err := d.decodeValue()
+	if err != nil {
+		return 0, err
+	}
+	switch number := value.(type) {
+	case uint64:
+		return float64(number), nil
+	case int64:
+		return float64(number), nil
+	}
+	return 0, fmt.Errorf("unexpected msgpack code %#x, expected a number", code)
+}
+
+// decodeValue decodes the next value of any type.
+func (d *mpDecoder) decodeValue() (any, error) {
+	code, err := d.peek()
+	if err != nil {
+		return nil, err
+	}
+	d.pos++
+	switch {
+	case code <= 0x7f:
+		return uint64(code), nil
+	case code >= 0xe0:
+		return int64(int8(code)), nil
+	case code >= 0x80 && code <= 0x8f:
+		return d.decodeMapBody(int(code & 0x0f))
+	case code >= 0x90 && code <= 0x9f:
+		return d.decodeArrayBody(int(code & 0x0f))
+	case code >= 0xa0 && code <= 0xbf:
+		return d.decodeStrBody(int(code & 0x1f))
+	}
+
+	switch code {
+	case 0xc0:
+		return nil, nil
+	case 0xc2:
+		return false, nil
+	case 0xc3:
+		return true, nil
+	case 0xc4, 0xc5, 0xc6:
+		length, err := d.readLen(1 << (code - 0xc4))
+		if err != nil {
+			return nil, err
+		}
+		data, err := d.readN(length)
+		return mpBinary(data), err
+	case 0xc7, 0xc8, 0xc9:
+		length, err := d.readLen(1 << (code - 0xc7))
+		if err != nil {
+			return nil, err
+		}
+		return d.decodeExtBody(length)
+	case 0xca, 0xcb:
+		d.pos--
+		return d.decodeFloat()
+	case 0xcc, 0xcd, 0xce, 0xcf:
+		return d.readUint(1 << (code - 0xcc))
+	case 0xd0, 0xd1, 0xd2, 0xd3:
+		value, err := d.readInt(1 << (code - 0xd0))
+		if err != nil {
+			return nil, err
+		}
+		if value >= 0 {
+			return uint64(value), nil
+		}
+		return value, nil
+	case 0xd4, 0xd5, 0xd6, 0xd7, 0xd8:
+		return d.decodeExtBody(1 << (code - 0xd4))
+	case 0xd9, 0xda, 0xdb:
+		length, err := d.readLen(1 << (code - 0xd9))
+		if err != nil {
+			return nil, err
+		}
+		return d.decodeStrBody(length)
+	case 0xdc, 0xdd:
+		length, err := d.readLen(2 << (code - 0xdc))
+		if err != nil {
+			return nil, err
+		}
+		return d.decodeArrayBody(length)
+	case 0xde, 0xdf:
+		length, err := d.readLen(2 << (code - 0xde))
+		if err != nil {
+			return nil, err
+		}
+		return d.decodeMapBody(length)
+	}
+	return nil, fmt.Errorf("unexpected msgpack code %#x", code)
+}
+
+// decodeStrBody decodes a string payload of the given length.
+func (d *mpDecoder) decodeStrBody(length int) (any, error) {
+	data, err := d.readN(length)
+	if err != nil {
+		return nil, err
+	}
+	return string(data), nil
+}
+
+// decodeArrayBody decodes the given count of array items.
+func (d *mpDecoder) decodeArrayBody(length int) (any, error) {
+	if length > d.remaining() {
+		return nil, errMsgpackTruncated
+	}
+	array := make([]any, 0, length)
+	for i := 0; i < length; i++ {
+		value, err := d.decodeValue()
+		if err != nil {
+			return nil, err
+		}
+		array = append(array, value)
+	}
+	return array, nil
+}
+
+// decodeMapBody decodes the given count of map pairs.
+func (d *mpDecoder) decodeMapBody(length int) (any, error) {
+	if length > d.remaining() {
+		return nil, errMsgpackTruncated
+	}
+	m := make(mpMap, 0, length)
+	for i := 0; i < length; i++ {
+		key, err := d.decodeValue()
+		if err != nil {
+			return nil, err
+		}
+		value, err := d.decodeValue()
+		if err != nil {
+			return nil, err
+		}
+		m = append(m, mpMapEntry{Key: key, Value: value})
+	}
+	return m, nil
+}
+
+// decodeExtBody decodes an extension type and a payload of the given length.
+func (d *mpDecoder) decodeExtBody(length int) (any, error) {
+	extType, err := d.readN(1)
+	if err != nil {
+		return nil, err
+	}
+	data, err := d.readN(length)
+	if err != nil {
+		return nil, err
+	}
+	return mpExt{Type: int8(extType[0]), Data: data}, nil
+}
+
+// skip skips the next value without decoding it.
+func (d *mpDecoder) skip() error {
+	for count := 1; count > 0; count-- {
+		code, err := d.peek()
+		if err != nil {
+			return err
+		}
+		d.pos++
+		length := 0
+		switch {
+		case code <= 0x7f || code >= 0xe0 || code == 0xc0 || code == 0xc2 || code == 0xc3:
+		case code >= 0x80 && code <= 0x8f:
+			count += 2 * int(code&0x0f)
+		case code >= 0x90 && code <= 0x9f:
+			count += int(code & 0x0f)
+		case code >= 0xa0 && code <= 0xbf:
+			length = int(code & 0x1f)
+		case code == 0xc4 || code == 0xc5 || code == 0xc6:
+			length, err = d.readLen(1 << (code - 0xc4))
+		case code == 0xc7 || code == 0xc8 || code == 0xc9:
+			length, err = d.readLen(1 << (code - 0xc7))
+			length++
+		case code == 0xca:
+			length = 4
+		case code == 0xcb:
+			length = 8
+		case code >= 0xcc && code <= 0xcf:
+			length = 1 << (code - 0xcc)
+		case code >= 0xd0 && code <= 0xd3:
+			length = 1 << (code - 0xd0)
+		case code >= 0xd4 && code <= 0xd8:
+			length = 1 + 1<<(code-0xd4)
+		case code == 0xd9 || code == 0xda || code == 0xdb:
+			length, err = d.readLen(1 << (code - 0xd9))
+		case code == 0xdc || code == 0xdd:
+			length, err = d.readLen(2 << (code - 0xdc))
+			count += length
+			length = 0
+		case code == 0xde || code == 0xdf:
+			length, err = d.readLen(2 << (code - 0xde))
+			count += 2 * length
+			length = 0
+		default:
+			return fmt.Errorf("unexpected msgpack code %#x", code)
+		}
+		if err != nil {
+			return err
+		}
+		if _, err = d.readN(length); err != nil {
+			return err
+		}
+	}
+	return nil
+}
@@ -0,0 +1,267 @@
+package checkpoint
+
+import (
+	"encoding/json"
+	"fmt"
+	"math"
+	"os"
+	"runtime"
+	"sort"
+	"sync"
+	"time"
+
+	"gopkg.in/yaml.v2"
+)
+
+// DefaultStatsInterval is a default duration of time buckets of tt cat --stats.
+const DefaultStatsInterval = time.Minute
+
+// opCounter counts rows and their size.
+type opCounter struct {
+	Count uint64 `json:"count" yaml:"count"`
+	Bytes uint64 `json:"bytes" yaml:"bytes"`
+}
+
+// add counts the row.
+func (c *opCounter) add(row *Row) {
+	c.Count++
+	c.Bytes += uint64(row.Size())
+}
+
+// spaceStats contains statistics of rows of a space.
+type spaceStats struct {
+	opCounter `yaml:",inline"`
+	// Ops contains counts of rows by request types.
+	Ops map[string]uint64 `json:"ops" yaml:"ops"`
+}
+
+// replicaStats contains statistics of rows of a replica.
+type replicaStats struct {
+	Count  uint64 `json:"count" yaml:"count"`
+	MinLSN uint64 `json:"min_lsn" yaml:"min_lsn"`
+	MaxLSN uint64 `json:"max_lsn" yaml:"max_lsn"`
+}
+
+// statsBucket contains a count of rows written in a time interval.
+type statsBucket struct {
+	Start     string  `json:"start" yaml:"start"`
+	Count     uint64  `json:"count" yaml:"count"`
+	OpsPerSec float64 `json:"ops_per_sec" yaml:"ops_per_sec"`
+}
+
+// walStats is an aggregated statistics of rows of .snap/.xlog files.
+type walStats struct {
+	Files        int                      `json:"files" yaml:"files"`
+	Rows         uint64                   `json:"rows" yaml:"rows"`
+	Bytes        uint64                   `json:"bytes" yaml:"bytes"`
+	MinTimestamp float64                  `json:"min_timestamp" yaml:"min_timestamp"`
+	MaxTimestamp float64                  `json:"max_timestamp" yaml:"max_timestamp"`
+	Types        map[string]*opCounter    `json:"types" yaml:"types"`
+	Spaces       map[uint64]*spaceStats   `json:"spaces" yaml:"spaces"`
+	Replicas     map[uint64]*replicaStats `json:"replicas" yaml:"replicas"`
+	Buckets      []statsBucket            `json:"buckets" yaml:"buckets"`
+
+	// interval is a duration of time buckets in seconds.
+	interval float64
+	// bucketCounts contains counts of rows by time bucket indexes.
+	bucketCounts map[int64]uint64
+}
+
+// newWalStats creates an empty statistics with the time buckets interval.
+func newWalStats(interval time.Duration) *walStats {
+	return &walStats{
+		MinTimestamp: math.Inf(1),
+		MaxTimestamp: math.Inf(-1),
+		Types:        map[string]*opCounter{},
+		Spaces:       map[uint64]*spaceStats{},
+		Replicas:     map[uint64]*replicaStats{},
+		interval:     interval.Seconds(),
+		bucketCounts: map[int64]uint64{},
+	}
+}
+
+// add counts the row. Only the row header and the space id are decoded.
+func (s *walStats) add(row *Row) error {
+	size := uint64(row.Size())
+	s.Rows++
+	s.Bytes += size
+	s.MinTimestamp = min(s.MinTimestamp, row.Timestamp)
+	s.MaxTimestamp = max(s.MaxTimestamp, row.Timestamp)
+
+	typeName := row.TypeName()
+	counter, ok := s.Types[typeName]
+	if !ok {
+		counter = &opCounter{}
+		s.Types[typeName] = counter
+	}
+	counter.add(row)
+
+	replica, ok := s.Replicas[row.ReplicaID]
+	if !ok {
+		replica = &replicaStats{MinLSN: row.LSN, MaxLSN: row.LSN}
+		s.Replicas[row.ReplicaID] = replica
+	}
+	replica.Count++
+	replica.MinLSN = min(replica.MinLSN, row.LSN)
+	replica.MaxLSN = max(replica.MaxLSN, row.LSN)
+
+	spaceID, hasSpace, err := row.SpaceID()
+	if err != nil {
+		return fmt.Errorf("invalid row body: %w", err)
+	}
+	if hasSpace {
+		space, ok := s.Spaces[spaceID]
+		if !ok {
+			space = &spaceStats{Ops: map[string]uint64{}}
+			s.Spaces[spaceID] = space
+		}
+		space.add(row)
+		space.Ops[typeName]++
+	}
+
+	s.bucketCounts[int64(math.Floor(row.Timestamp/s.interval))]++
+	return nil
+}
+
+// merge adds the other statistics.
+func (s *walStats) merge(other *walStats) {
+	s.Files += other.Files
+	s.Rows += other.Rows
+	s.Bytes += other.Bytes
+	s.MinTimestamp = min(s.MinTimestamp, other.MinTimestamp)
+	s.MaxTimestamp = max(s.MaxTimestamp, other.MaxTimestamp)
+	for typeName, counter := range other.Types {
+		if own, ok := s.Types[typeName]; ok {
+			own.Count += counter.Count
+			own.Bytes += counter.Bytes
+		} else {
+			s.Types[typeName] = counter
+		}
+	}
+	for id, replica := range other.Replicas {
+		if own, ok := s.Replicas[id]; ok {
+			own.Count += replica.Count
+			own.MinLSN = min(own.MinLSN, replica.MinLSN)
+			own.MaxLSN = max(own.MaxLSN, replica.MaxLSN)
+		} else {
+			s.Replicas[id] = replica
+		}
+	}
+	for id, space := range other.Spaces {
+		own, ok := s.Spaces[id]
+		if !ok {
+			s.Spaces[id] = space
+			continue
+		}
+		own.Count += space.Count
+		own.Bytes += space.Bytes
+		for typeName, count := range space.Ops {
+			own.Ops[typeName] += count
+		}
+	}
+	for bucket, count := range other.bucketCounts {
+		s.bucketCounts[bucket] += count
+	}
+}
+
+// finish fills the time buckets list.
+func (s *walStats) finish() {
+	if s.Rows == 0 {
+		s.MinTimestamp, s.MaxTimestamp = 0, 0
+	}
+	buckets := make([]int64, 0, len(s.bucketCounts))
+	for bucket := range s.bucketCounts {
+		buckets = append(buckets, bucket)
+	}
+	sort.Slice(buckets, func(i, j int) bool { return buckets[i] < buckets[j] })
+	s.Buckets = make([]statsBucket, 0, len(buckets))
+	for _, bucket := range buckets {
+		start := float64(bucket) * s.interval
+		count := s.bucketCounts[bucket]
+		s.Buckets = append(s.Buckets, statsBucket{
+			Start: time.Unix(0, int64(start*float64(time.Second))).UTC().
+				Format(time.RFC3339),
+			Count:     count,
+			OpsPerSec: float64(count) / s.interval,
+		})
+	}
+}
+
+// collectStats aggregates statistics of the files. The files are processed in
+// parallel, each into its own statistics, which are merged at the end.
+func collectStats(files []string, plans map[string]filePlan, filter *rowFilter,
+	interval time.Duration) (*walStats, error) {
+	fileStats := make([]*walStats, len(files))
+	fileErrs := make([]error, len(files))
+	indexes := make(chan int)
+	var wg sync.WaitGroup
+	for w := 0; w < min(runtime.NumCPU(), len(files)); w++ {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			for i := range indexes {
+				stats := newWalStats(interval)
+				stats.Files = 1
+				fileErrs[i] = processFile(files[i], plans[files[i]], filter, stats.add)
+				fileStats[i] = stats
+			}
+		}()
+	}
+	for i, file := range files {
+		if !plans[file].skip {
+			indexes <- i
+		}
+	}
+	close(indexes)
+	wg.Wait()
+
+	total := newWalStats(interval)
+	for i, stats := range fileStats {
+		if fileErrs[i] != nil {
+			return nil, fileErrs[i]
+		}
+		if stats != nil {
+			total.merge(stats)
+		}
+	}
+	total.finish()
+	return total, nil
+}
+
+// Stats prints an aggregated statistics of rows of .snap/.xlog files instead
+// of the rows themselves.
+func Stats(files []string, opts Opts) error {
+	if opts.Format != "yaml" && opts.Format != "json" {
+		return fmt.Errorf("unsupported statistics format %q, yaml or json is expected",
+			opts.Format)
+	}
+	if opts.StatsInterval <= 0 {
+		return fmt.Errorf("time buckets interval must be positive")
+	}
+	filter, err := newRowFilter(opts)
+	if err != nil {
+		return err
+	}
+	plans, err := planFiles(files, &filter, opts.Index)
+	if err != nil {
+		return fmt.Errorf("result of cat: %w", err)
+	}
+
+	stats, err := collectStats(files, plans, &filter, opts.StatsInterval)
+	if err != nil {
+		return fmt.Errorf("result of cat: %w", err)
+	}
+
+	var data []byte
+	if opts.Format == "json" {
+		data, err = json.MarshalIndent(stats, "", "  ")
+		data = append(data, '\n')
+	} else {
+		data, err = yaml.Marshal(stats)
+	}
+	if err != nil {
+		return err
+	}
+	_, err = os.Stdout.Write(data)
+	return err
+}
@@ -0,0 +1,61 @@
+package checkpoint
+
+import (
+	"math"
+	"testing"
+	"time"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
+
+func TestCollectStats(t *testing.T) {
+	files := []string{"testdata/test.xlog", copyTestFile(t, "test.xlog")}
+	filter, err := newRowFilter(Opts{To: math.MaxUint64, ShowSystem: true})
+	require.NoError(t, err)
+
+	stats, err := collectStats(files, map[string]filePlan{}, &filter, time.Minute)
+	require.NoError(t, err)
+	assert.Equal(t, 2, stats.Files)
+	assert.Equal(t, uint64(4), stats.Rows)
+	assert.InDelta(t, 1650033990.995, stats.MinTimestamp, 0.001)
+	assert.InDelta(t, 1650033990.997, stats.MaxTimestamp, 0.001)
+
+	require.Contains(t, stats.Types, "UPDATE")
+	require.Contains(t, stats.Types, "INSERT")
+	assert.Equal(t, uint64(2), stats.Types["UPDATE"].Count)
+	assert.Equal(t, uint64(2), stats.Types["INSERT"].Count)
+	assert.Equal(t, stats.Bytes, stats.Types["UPDATE"].Bytes+stats.Types["INSERT"].Bytes)
+
+	require.Contains(t, stats.Spaces, uint64(272))
+	assert.Equal(t, map[string]uint64{"UPDATE": 2}, stats.Spaces[272].Ops)
+	require.Contains(t, stats.Spaces, uint64(280))
+	assert.Equal(t, uint64(2), stats.Spaces[280].Count)
+
+	assert.Equal(t, map[uint64]*replicaStats{1: {Count: 4, MinLSN: 1, MaxLSN: 2}},
+		stats.Replicas)
+	assert.Equal(t, []statsBucket{
+		{Start: "2022-04-15T14:46:00Z", Count: 4, OpsPerSec: 4.0 / 60},
+	}, stats.Buckets)
+}
+
+func TestCollectStats_filter(t *testing.T) {
+	filter, err := newRowFilter(Opts{From: 2, To: math.MaxUint64, ShowSystem: true})
+	require.NoError(t, err)
+
+	stats, err := collectStats([]string{"testdata/test.xlog"},
+		map[string]filePlan{}, &filter, time.Second)
+	require.NoError(t, err)
+	assert.Equal(t, uint64(1), stats.Rows)
+	assert.Nil(t, stats.Types["UPDATE"])
+	assert.Equal(t, map[uint64]*replicaStats{1: {Count: 1, MinLSN: 2, MaxLSN: 2}},
+		stats.Replicas)
+
+	// No statistics for skipped files.
+	stats, err = collectStats([]string{"testdata/test.xlog"},
+		map[string]filePlan{"testdata/test.xlog": {skip: true}}, &filter, time.Second)
+	require.NoError(t, err)
+	assert.Equal(t, 0, stats.Files)
+	assert.Equal(t, uint64(0), stats.Rows)
+	assert.Empty(t, stats.Buckets)
+}
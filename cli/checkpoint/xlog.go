@@ -0,0 +1,520 @@
+package checkpoint
+
+import (
+	"bufio"
+	"encoding/binary"
+	"errors"
+	"fmt"
+	"hash/crc32"
+	"io"
+	"strconv"
+	"strings"
+
+	"github.com/klauspost/compress/zstd"
+)
+
+const (
+	// xlogFixHeaderSize is a size of a fixed header preceding each transaction.
+	xlogFixHeaderSize = 19
+	// xlogTxLenMax is a maximum length of a transaction data.
+	xlogTxLenMax = 2147483648
+
+	// rowMarker starts an uncompressed transaction.
+	rowMarker uint32 = 0xd5ba0bab
+	// zrowMarker starts a zstd compressed transaction.
+	zrowMarker uint32 = 0xd5ba0bba
+	// eofMarker marks the end of a properly closed file.
+	eofMarker uint32 = 0xd510aded
+)
+
+// IPROTO request types which could be met in .snap/.xlog files.
+const (
+	iprotoInsert  = 2
+	iprotoReplace = 3
+	iprotoUpdate  = 4
+	iprotoDelete  = 5
+	iprotoUpsert  = 9
+	iprotoNop     = 12
+)
+
+// IPROTO keys of a row header.
+const (
+	iprotoRequestType = 0x00
+	iprotoReplicaID   = 0x02
+	iprotoLSN         = 0x03
+	iprotoTimestamp   = 0x04
+)
+
+// iprotoSpaceID is an IPROTO key of a space id in a row body.
+const iprotoSpaceID = 0x10
+
+// iprotoTypeNames contains names of request types as they are shown by the
+// tarantool xlog module.
+var iprotoTypeNames = map[uint64]string{
+	1:             "SELECT",
+	iprotoInsert:  "INSERT",
+	iprotoReplace: "REPLACE",
+	iprotoUpdate:  "UPDATE",
+	iprotoDelete:  "DELETE",
+	6:             "CALL_16",
+	7:             "AUTH",
+	8:             "EVAL",
+	iprotoUpsert:  "UPSERT",
+	10:            "CALL",
+	11:            "EXECUTE",
+	iprotoNop:     "NOP",
+	13:            "PREPARE",
+	14:            "BEGIN",
+	15:            "COMMIT",
+	16:            "ROLLBACK",
+	30:            "RAFT",
+	31:            "PROMOTE",
+	32:            "DEMOTE",
+	40:            "CONFIRM",
+	41:            "ROLLBACK",
+}
+
+// iprotoKeyNames contains names of header and body keys as they are shown by
+// the tarantool xlog module.
+var iprotoKeyNames = map[uint64]string{
+	0x00: "type",
+	0x01: "sync",
+	0x02: "replica_id",
+	0x03: "lsn",
+	0x04: "timestamp",
+	0x05: "schema_version",
+	0x06: "server_version",
+	0x07: "group_id",
+	0x08: "tsn",
+	0x09: "flags",
+	0x0a: "stream_id",
+	0x10: "space_id",
+	0x11: "index_id",
+	0x12: "limit",
+	0x13: "offset",
+	0x14: "iterator",
+	0x15: "index_base",
+	0x20: "key",
+	0x21: "tuple",
+	0x22: "function_name",
+	0x23: "user_name",
+	0x24: "instance_uuid",
+	0x25: "replicaset_uuid",
+	0x26: "vclock",
+	0x27: "expr",
+	0x28: "operations",
+	0x29: "ballot",
+	0x2a: "tuple_meta",
+	0x2b: "options",
+	0x30: "data",
+	0x31: "error_24",
+}
+
+// crc32cTable is used to check checksums of transactions.
+var crc32cTable = crc32.MakeTable(crc32.Castagnoli)
+
+// ErrIncompleteTx is returned if a file ends in the middle of a transaction.
+// It is normal for an xlog file which is being written right now.
+var ErrIncompleteTx = errors.New("the file ends with an incomplete transaction")
+
+// VClock is a vector clock: LSNs by replica ids.
+type VClock map[uint64]uint64
+
+// FileMeta contains the text meta information of a .snap/.xlog file.
+type FileMeta struct {
+	// FileType is a type of the file: SNAP, XLOG, etc.
+	FileType string
+	// Version is a version of the file format.
+	Version string
+	// ServerVersion is a version of tarantool which wrote the file.
+	ServerVersion string
+	// Instance is an UUID of the instance which wrote the file.
+	Instance string
+	// VClock is a vclock of the file start.
+	VClock VClock
+	// PrevVClock is a vclock of the previous file start.
+	PrevVClock VClock
+}
+
+// Row is a single record of a .snap/.xlog file. Header and body slices refer
+// to the reader buffers and are valid until the next call of Reader.Next.
+type Row struct {
+	// Type is a request type.
+	Type uint64
+	// ReplicaID is an id of the replica which made the row.
+	ReplicaID uint64
+	// LSN is a log sequence number of the row.
+	LSN uint64
+	// Timestamp is a time of the row in seconds since the epoch.
+	Timestamp float64
+
+	header []byte
+	body   []byte
+}
+
+// TypeName returns the name of the row request type.
+func (row *Row) TypeName() string {
+	if name, ok := iprotoTypeNames[row.Type]; ok {
+		return name
+	}
+	return strconv.FormatUint(row.Type, 10)
+}
+
+// HasBody returns true if the row has a body.
+func (row *Row) HasBody() bool {
+	return len(row.body) > 0
+}
+
+// SpaceID looks up the space id in the row body without decoding the rest of it.
+// The second returned value is false if the row has no space id.
+func (row *Row) SpaceID() (uint64, bool, error) {
+	if len(row.body) == 0 {
+		return 0, false, nil
+	}
+	dec := mpDecoder{buf: row.body}
+	count, err := dec.decodeMapLen()
+	if err != nil {
+		return 0, false, err
+	}
+	for i := 0; i < count; i++ {
+		key, err := dec.decodeUint()
+		if err != nil {
+			return 0, false, err
+		}
+		if key == iprotoSpaceID {
+			spaceID, err := dec.decodeUint()
+			return spaceID, err == nil, err
+		}
+		if err = dec.skip(); err != nil {
+			return 0, false, err
+		}
+	}
+	return 0, false, nil
+}
+
+// Header decodes the row header with named keys.
+func (row *Row) Header() (mpMap, error) {
+	return decodeRowMap(row.header)
+}
+
+// Body decodes the row body with named keys. It returns nil if the row has no body.
+func (row *Row) Body() (mpMap, error) {
+	if len(row.body) == 0 {
+		return nil, nil
+	}
+	return decodeRowMap(row.body)
+}
+
+// Size returns a size of the encoded row in bytes.
+func (row *Row) Size() int {
+	return len(row.header) + len(row.body)
+}
+
+// decodeRowMap decodes a map of a row header or body replacing IPROTO keys
+// with their names.
+func decodeRowMap(data []byte) (mpMap, error) {
+	dec := mpDecoder{buf: data}
+	count, err := dec.decodeMapLen()
+	if err != nil {
+		return nil, err
+	}
+	m := make(mpMap, 0, count)
+	for i := 0; i < count; i++ {
+		key, err := dec.decodeUint()
+		if err != nil {
+			return nil, err
+		}
+		value, err := dec.decodeValue()
+		if err != nil {
+			return nil, err
+		}
+		var name any = key
+		if keyName, ok := iprotoKeyNames[key]; ok {
+			name = keyName
+		}
+		if key == iprotoRequestType {
+			if requestType, ok := value.(uint64); ok {
+				value = (&Row{Type: requestType}).TypeName()
+			}
+		}
+		m = append(m, mpMapEntry{Key: name, Value: value})
+	}
+	return m, nil
+}
+
+// Reader reads rows of a .snap/.xlog file in a streaming manner.
+type Reader struct {
+	source io.Reader
+	reader *bufio.Reader
+	meta   FileMeta
+	zstd   *zstd.Decoder
+	// rawTx is a buffer for transaction data as it is stored in the file.
+	rawTx []byte
+	// plainTx is a buffer for decompressed transaction data.
+	plainTx []byte
+	dec     mpDecoder
+	// offset is a file offset of the next transaction.
+	offset int64
+	// txOffset is a file offset of the current transaction.
+	txOffset int64
+	// complete is true if the EOF marker is read.
+	complete bool
+}
+
+// NewReader creates a reader of .snap/.xlog data. It reads the file meta
+// information immediately.
+func NewReader(reader io.Reader) (*Reader, error) {
+	r := &Reader{source: reader, reader: bufio.NewReaderSize(reader, 1<<20)}
+	if err := r.readMeta(); err != nil {
+		return nil, err
+	}
+	return r, nil
+}
+
+// Meta returns the file meta information.
+func (r *Reader) Meta() FileMeta {
+	return r.meta
+}
+
+// Offset returns the file offset of the next not read transaction.
+func (r *Reader) Offset() int64 {
+	return r.offset
+}
+
+// TxOffset returns the file offset of the transaction of the last read row.
+func (r *Reader) TxOffset() int64 {
+	return r.txOffset
+}
+
+// Complete returns true if the end of file marker is read.
+func (r *Reader) Complete() bool {
+	return r.complete
+}
+
+// SkipTo moves the reader to the transaction starting at the offset. The rest
+// of the current transaction is dropped. The underlying reader must be an
+// io.Seeker.
+func (r *Reader) SkipTo(offset int64) error {
+	seeker, ok := r.source.(io.Seeker)
+	if !ok {
+		return fmt.Errorf("the reader does not support seeking")
+	}
+	if _, err := seeker.Seek(offset, io.SeekStart); err != nil {
+		return err
+	}
+	r.reader.Reset(r.source)
+	r.offset = offset
+	r.dec = mpDecoder{}
+	return nil
+}
+
+// Close releases resources of the reader. It does not close the underlying reader.
+func (r *Reader) Close() {
+	if r.zstd != nil {
+		r.zstd.Close()
+		r.zstd = nil
+	}
+}
+
+// readMeta reads the text meta information ending with an empty line.
+func (r *Reader) readMeta() error {
+	for lineNo := 0; ; lineNo++ {
+		line, err := r.reader.ReadString('\n')
+		r.offset += int64(len(line))
+		if err != nil {
+			if errors.Is(err, io.EOF) {
+				return fmt.Errorf("failed to read the file meta: unexpected end of file")
+			}
+			return fmt.Errorf("failed to read the file meta: %w", err)
+		}
+		line = strings.TrimSuffix(line, "\n")
+		switch {
+		case lineNo == 0:
+			r.meta.FileType = line
+		case lineNo == 1:
+			r.meta.Version = line
+		case line == "":
+			if lineNo < 2 {
+				return fmt.Errorf("failed to read the file meta: unexpected empty line")
+			}
+			return nil
+		default:
+			key, value, found := strings.Cut(line, ":")
+			if !found {
+				return fmt.Errorf("failed to read the file meta: invalid line %q", line)
+			}
+			value = strings.TrimSpace(value)
+			switch key {
+			case "Version":
+				r.meta.ServerVersion = value
+			case "Instance", "Server":
+				r.meta.Instance = value
+			case "VClock":
+				r.meta.VClock, err = ParseVClock(value)
+			case "PrevVClock":
+				r.meta.PrevVClock, err = ParseVClock(value)
+			}
+			if err != nil {
+				return fmt.Errorf("failed to read the file meta: %w", err)
+			}
+		}
+	}
+}
+
+// ParseVClock parses a vclock string like "{1: 10, 2: 5}".
+func ParseVClock(str string) (VClock, error) {
+	str = strings.TrimSpace(str)
+	if !strings.HasPrefix(str, "{") || !strings.HasSuffix(str, "}") {
+		return nil, fmt.Errorf("invalid vclock %q", str)
+	}
+	vclock := VClock{}
+	str = strings.TrimSpace(str[1 : len(str)-1])
+	if str == "" {
+		return vclock, nil
+	}
+	for _, component := range strings.Split(str, ",") {
+		id, lsn, found := strings.Cut(component, ":")
+		if !found {
+			return nil, fmt.Errorf("invalid vclock %q", str)
+		}
+		replicaID, err := strconv.ParseUint(strings.TrimSpace(id), 10, 32)
+		if err != nil {
+			return nil, fmt.Errorf("invalid vclock %q: %w", str, err)
+		}
+		vclock[replicaID], err = strconv.ParseUint(strings.TrimSpace(lsn), 10, 64)
+		if err != nil {
+			return nil, fmt.Errorf("invalid vclock %q: %w", str, err)
+		}
+	}
+	return vclock, nil
+}
+
+// readTx reads the next transaction into the reader buffer. It returns io.EOF
+// at the end of the file.
+func (r *Reader) readTx() error {
+	var fixHeader [xlogFixHeaderSize]byte
+	n, err := io.ReadFull(r.reader, fixHeader[:4])
+	if err != nil {
+		if n == 0 && errors.Is(err, io.EOF) {
+			return io.EOF
+		}
+		return ErrIncompleteTx
+	}
+
+	magic := binary.BigEndian.Uint32(fixHeader[:4])
+	switch magic {
+	case eofMarker:
+		r.complete = true
+		return io.EOF
+	case rowMarker, zrowMarker:
+	default:
+		return fmt.Errorf("invalid transaction magic %#x at offset %d", magic, r.offset)
+	}
+
+	if _, err := io.ReadFull(r.reader, fixHeader[4:]); err != nil {
+		return ErrIncompleteTx
+	}
+	dec := mpDecoder{buf: fixHeader[4:]}
+	length, err := dec.decodeUint()
+	if err == nil && length > xlogTxLenMax {
+		err = fmt.Errorf("too large transaction length %d", length)
+	}
+	if err == nil {
+		// The previous transaction checksum is not used.
+		_, err = dec.decodeUint()
+	}
+	var crc uint64
+	if err == nil {
+		crc, err = dec.decodeUint()
+	}
+	if err != nil {
+		return fmt.Errorf("invalid transaction header at offset %d: %w", r.offset, err)
+	}
+
+	if uint64(cap(r.rawTx)) < length {
+		r.rawTx = make([]byte, length)
+	}
+	r.rawTx = r.rawTx[:length]
+	if _, err := io.ReadFull(r.reader, r.rawTx); err != nil {
+		return ErrIncompleteTx
+	}
+
+	// The checksum is calculated without the initial and final inversions.
+	if ^crc32.Update(^uint32(0), crc32cTable, r.rawTx) != uint32(crc) {
+		return fmt.Errorf("transaction checksum mismatch at offset %d", r.offset)
+	}
+
+	tx := r.rawTx
+	if magic == zrowMarker {
+		if r.zstd == nil {
+			if r.zstd, err = zstd.NewReader(nil, zstd.WithDecoderConcurrency(1)); err != nil {
+				return err
+			}
+		}
+		if r.plainTx, err = r.zstd.DecodeAll(r.rawTx, r.plainTx[:0]); err != nil {
+			return fmt.Errorf("failed to decompress a transaction at offset %d: %w",
+				r.offset, err)
+		}
+		tx = r.plainTx
+	}
+	r.txOffset = r.offset
+	r.offset += xlogFixHeaderSize + int64(length)
+	r.dec = mpDecoder{buf: tx}
+	return nil
+}
+
+// Next reads the next row. It returns io.EOF at the end of the file and
+// ErrIncompleteTx if the file ends in the middle of a transaction.
+func (r *Reader) Next(row *Row) error {
+	for r.dec.remaining() == 0 {
+		if err := r.readTx(); err != nil {
+			return err
+		}
+	}
+
+	*row = Row{}
+	start := r.dec.pos
+	count, err := r.dec.decodeMapLen()
+	if err != nil {
+		return fmt.Errorf("invalid row header: %w", err)
+	}
+	for i := 0; i < count && err == nil; i++ {
+		var key uint64
+		if key, err = r.dec.decodeUint(); err != nil {
+			break
+		}
+		switch key {
+		case iprotoRequestType:
+			row.Type, err = r.dec.decodeUint()
+		case iprotoReplicaID:
+			row.ReplicaID, err = r.dec.decodeUint()
+		case iprotoLSN:
+			row.LSN, err = r.dec.decodeUint()
+		case iprotoTimestamp:
+			row.Timestamp, err = r.dec.decodeFloat()
+		default:
+			err = r.dec.skip()
+		}
+	}
+	if err != nil {
+		return fmt.Errorf("invalid row header: %w", err)
+	}
+	row.header = r.dec.buf[start:r.dec.pos]
+
+	if r.dec.remaining() == 0 {
+		return nil
+	}
+	if row.Type == iprotoNop {
+		// New NOP rows have no body, old ones have an empty body.
+		if code, _ := r.dec.peek(); code == 0x80 {
+			r.dec.pos++
+		}
+		return nil
+	}
+	start = r.dec.pos
+	if err := r.dec.skip(); err != nil {
+		return fmt.Errorf("invalid row body: %w", err)
+	}
+	row.body = r.dec.buf[start:r.dec.pos]
+	return nil
+}
@@ -0,0 +1,174 @@
+package checkpoint
+
+import (
+	"bytes"
+	"errors"
+	"io"
+	"os"
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
+
+func readAllRows(t *testing.T, data []byte) ([]Row, error) {
+	t.Helper()
+	reader, err := NewReader(bytes.NewReader(data))
+	require.NoError(t, err)
+	defer reader.Close()
+
+	rows := []Row{}
+	for {
+		var row Row
+		if err := reader.Next(&row); err != nil {
+			if errors.Is(err, io.EOF) {
+				return rows, nil
+			}
+			return rows, err
+		}
+		// Detach the row from the reader buffers.
+		row.header = bytes.Clone(row.header)
+		row.body = bytes.Clone(row.body)
+		rows = append(rows, row)
+	}
+}
+
+func TestReader_xlog(t *testing.T) {
+	data, err := os.ReadFile("testdata/test.xlog")
+	require.NoError(t, err)
+
+	reader, err := NewReader(bytes.NewReader(data))
+	require.NoError(t, err)
+	assert.Equal(t, "XLOG", reader.Meta().FileType)
+	assert.Equal(t, "0.13", reader.Meta().Version)
+	assert.Equal(t, "2.8.3-0-g01023db", reader.Meta().ServerVersion)
+	assert.Equal(t, VClock{}, reader.Meta().VClock)
+
+	rows, err := readAllRows(t, data)
+	require.NoError(t, err)
+	require.Len(t, rows, 2)
+
+	assert.Equal(t, "UPDATE", rows[0].TypeName())
+	assert.Equal(t, uint64(1), rows[0].ReplicaID)
+	assert.Equal(t, uint64(1), rows[0].LSN)
+	assert.InDelta(t, 1650033990.995, rows[0].Timestamp, 0.001)
+	spaceID, ok, err := rows[0].SpaceID()
+	require.NoError(t, err)
+	assert.True(t, ok)
+	assert.Equal(t, uint64(272), spaceID)
+
+	assert.Equal(t, "INSERT", rows[1].TypeName())
+	assert.Equal(t, uint64(2), rows[1].LSN)
+	body, err := rows[1].Body()
+	require.NoError(t, err)
+	assert.Equal(t, mpMap{
+		{Key: "space_id", Value: uint64(280)},
+		{Key: "tuple", Value: []any{uint64(512), uint64(1), "MY_TEST_SPACE", "memtx",
+			uint64(0), mpMap{}, []any{}}},
+	}, body)
+}
+
+func TestReader_snap(t *testing.T) {
+	data, err := os.ReadFile("testdata/test.snap")
+	require.NoError(t, err)
+
+	rows, err := readAllRows(t, data)
+	require.NoError(t, err)
+	require.NotEmpty(t, rows)
+	lsns := map[uint64]bool{}
+	for _, row := range rows {
+		if row.Type == iprotoInsert {
+			lsns[row.LSN] = true
+		}
+	}
+	assert.True(t, lsns[423])
+	assert.True(t, lsns[512])
+}
+
+func TestReader_checksumMismatch(t *testing.T) {
+	data, err := os.ReadFile("testdata/test.xlog")
+	require.NoError(t, err)
+
+	// Corrupt the last byte of the first transaction.
+	pos := bytes.Index(data, []byte{0xd5, 0xba, 0x0b, 0xab})
+	require.Greater(t, pos, 0)
+	data[pos+xlogFixHeaderSize+10] ^= 0xff
+
+	_, err = readAllRows(t, data)
+	assert.ErrorContains(t, err, "transaction checksum mismatch")
+}
+
+func TestReader_incompleteTx(t *testing.T) {
+	data, err := os.ReadFile("testdata/test.xlog")
+	require.NoError(t, err)
+
+	// Cut the EOF marker and a part of the last transaction.
+	rows, err := readAllRows(t, data[:len(data)-8])
+	assert.ErrorIs(t, err, ErrIncompleteTx)
+	assert.Len(t, rows, 1)
+
+	// A file without the EOF marker is read completely.
+	rows, err = readAllRows(t, data[:len(data)-4])
+	assert.NoError(t, err)
+	assert.Len(t, rows, 2)
+}
+
+func TestNewReader_invalidMeta(t *testing.T) {
+	_, err := NewReader(bytes.NewReader([]byte("XLOG\n0.13\nVersion")))
+	assert.ErrorContains(t, err, "unexpected end of file")
+
+	_, err = NewReader(bytes.NewReader([]byte("XLOG\n0.13\nVClock: 1\n\n")))
+	assert.ErrorContains(t, err, "invalid vclock")
+}
+
+func TestParseVClock(t *testing.T) {
+	tests := []struct {
+		str      string
+		expected VClock
+		errMsg   string
+	}{
+		{"{}", VClock{}, ""},
+		{"{1: 10}", VClock{1: 10}, ""},
+		{"{1: 10, 2: 5}", VClock{1: 10, 2: 5}, ""},
+		{"{1 10}", nil, "invalid vclock"},
+		{"1: 10", nil, "invalid vclock"},
+		{"{a: 10}", nil, "invalid vclock"},
+	}
+	for _, tc := range tests {
+		t.Run(tc.str, func(t *testing.T) {
+			vclock, err := ParseVClock(tc.str)
+			if tc.errMsg != "" {
+				assert.ErrorContains(t, err, tc.errMsg)
+				return
+			}
+			require.NoError(t, err)
+			assert.Equal(t, tc.expected, vclock)
+		})
+	}
+}
+
+func TestMpDecoder_skip(t *testing.T) {
+	tests := [][]byte{
+		{0x01},
+		{0xff},
+		{0xc0},
+		{0xa3, 'a', 'b', 'c'},
+		{0xcd, 0x01, 0x10},
+		{0xcb, 0, 0, 0, 0, 0, 0, 0, 0},
+		{0x92, 0x01, 0xa1, 'a'},
+		{0x81, 0xa1, 'a', 0x91, 0x02},
+		{0xd5, 0x02, 0x01, 0x02},
+		{0xc7, 0x01, 0x02, 0x01},
+		{0xc4, 0x02, 0x01, 0x02},
+	}
+	for _, data := range tests {
+		dec := mpDecoder{buf: append(data, 0x05)}
+		require.NoError(t, dec.skip(), "%x", data)
+		assert.Equal(t, len(data), dec.pos, "%x", data)
+
+		dec = mpDecoder{buf: data[:len(data)-1]}
+		if len(data) > 1 {
+			assert.ErrorIs(t, dec.skip(), errMsgpackTruncated, "%x", data)
+		}
+	}
+}
@@ -1,12 +1,11 @@
 package cmd
 
 import (
-	"encoding/json"
+	"context"
 	"errors"
-	"fmt"
 	"math"
 	"os"
-	"strconv"
+	"os/signal"
 
 	"github.com/apex/log"
 	"github.com/spf13/cobra"
@@ -19,14 +18,18 @@ import (
 // catFlags contains flags for cat command.
 // Initialized with default values at creation.
 var catFlags = checkpoint.Opts{
-	From:       0,
-	To:         math.MaxUint64,
-	Timestamp:  "",
-	Space:      nil,
-	Format:     "yaml",
-	Replica:    nil,
-	ShowSystem: false,
-	Recursive:  false,
+	From:          0,
+	To:            math.MaxUint64,
+	Timestamp:     "",
+	Space:         nil,
+	Format:        "yaml",
+	Replica:       nil,
+	ShowSystem:    false,
+	Recursive:     false,
+	Index:         false,
+	Follow:        false,
+	Stats:         false,
+	StatsInterval: checkpoint.DefaultStatsInterval,
 }
 
 // NewCatCmd creates a new cat command.
@@ -39,7 +42,9 @@ func NewCatCmd() *cobra.Command {
 			"--timestamp 2024-11-13T14:02:36.818700000+00:00\n" +
 			"  tt cat /path/to/file.snap /path/to/file.xlog /path/to/dir/ " +
 			"--timestamp=1731592956.818\n" +
-			"  tt cat --recursive /path/to/dir1 /path/to/dir2",
+			"  tt cat --recursive /path/to/dir1 /path/to/dir2\n" +
+			"  tt cat --follow --space 512 /path/to/wal_dir\n" +
+			"  tt cat --stats --format json /path/to/wal_dir",
 		Args: func(cmd *cobra.Command, args []string) error {
 			if len(args) == 0 {
 				return errors.New("it is required to specify at least one .xlog/.snap file " +
@@ -58,71 +63,50 @@ func NewCatCmd() *cobra.Command {
 	catCmd.Flags().IntSliceVar(&catFlags.Space, "space", catFlags.Space,
 		"Filter the output by space number. May be passed more than once")
 	catCmd.Flags().StringVar(&catFlags.Format, "format", catFlags.Format,
-		"Output format yaml, json or lua")
+		"Output format yaml, json, ndjson, msgpack or lua")
 	catCmd.Flags().IntSliceVar(&catFlags.Replica, "replica", catFlags.Replica,
 		"Filter the output by replica id. May be passed more than once")
 	catCmd.Flags().BoolVar(&catFlags.ShowSystem, "show-system", catFlags.ShowSystem,
 		"Show the contents of system spaces")
 	catCmd.Flags().BoolVarP(&catFlags.Recursive, "recursive", "r", catFlags.Recursive,
 		"Process WAL files in directories recursively")
+	catCmd.Flags().BoolVar(&catFlags.Index, "index", catFlags.Index,
+		"Build and use .idx files next to WAL files to skip data out of the "+
+			"--from/--to/--timestamp range")
+	catCmd.Flags().BoolVarP(&catFlags.Follow, "follow", "f", catFlags.Follow,
+		"Output rows appended to .xlog files of the directories as they are written")
+	catCmd.Flags().BoolVar(&catFlags.Stats, "stats", catFlags.Stats,
+		"Output per space, per replica and per operation type statistics instead of rows")
+	catCmd.Flags().DurationVar(&catFlags.StatsInterval, "stats-interval",
+		catFlags.StatsInterval, "Duration of time buckets of the statistics")
 
 	return catCmd
 }
 
 // internalCatModule is a default cat module.
 func internalCatModule(cmdCtx *cmdcontext.CmdCtx, args []string) error {
-	walFiles, err := util.CollectWalFiles(args, catFlags.Recursive)
-	if err != nil {
-		return util.InternalError(
-			"Internal error: could not collect WAL files: %s",
-			version.GetVersion, err)
+	if catFlags.Follow {
+		if catFlags.Recursive || catFlags.Index || catFlags.Stats {
+			return errors.New("--follow cannot be used with --recursive, --index or --stats")
+		}
+		ctx, stop := signal.NotifyContext(context.Background(), os.Interrupt)
+		defer stop()
+		log.Infof("Following files: %s\n", args)
+		return checkpoint.CatFollow(ctx, args, catFlags)
 	}
 
-	// List of files is passed to lua cat script via environment variable in json format.
-	filesJson, err := json.Marshal(walFiles)
-	if err != nil {
-		return util.InternalError(
-			"Internal error: problem with creating json params with files: %s",
-			version.GetVersion, err)
-	}
-
-	os.Setenv("TT_CLI_CAT_FILES", string(filesJson))
-	os.Setenv("TT_CLI_CAT_SHOW_SYS", strconv.FormatBool(catFlags.ShowSystem))
-	os.Setenv("TT_CLI_CAT_FORMAT", string(catFlags.Format))
-
-	// List of spaces is passed to lua cat script via environment variable in json format.
-	spacesJson, err := json.Marshal(catFlags.Space)
-	if err != nil {
-		return util.InternalError(
-			"Internal error: problem with creating json params with spaces: %s",
-			version.GetVersion, err)
-	}
-	if string(spacesJson) != "null" {
-		os.Setenv("TT_CLI_CAT_SPACES", string(spacesJson))
-	}
-
-	os.Setenv("TT_CLI_CAT_FROM", strconv.FormatUint(catFlags.From, 10))
-	os.Setenv("TT_CLI_CAT_TO", strconv.FormatUint(catFlags.To, 10))
-
-	timestamp, err := util.StringToTimestamp(catFlags.Timestamp)
-	if err != nil {
-		return fmt.Errorf("failed to parse a timestamp: %s", err)
-	}
-	os.Setenv("TT_CLI_CAT_TIMESTAMP", timestamp)
-
-	// List of replicas is passed to lua cat script via environment variable in json format.
-	replicasJson, err := json.Marshal(catFlags.Replica)
+	walFiles, err := util.CollectWalFiles(args, catFlags.Recursive)
 	if err != nil {
 		return util.InternalError(
-			"Internal error: problem with creating json params with replicas: %s",
+			"Internal error: could not collect WAL files: %s",
 			version.GetVersion, err)
 	}
-	if string(replicasJson) != "null" {
-		os.Setenv("TT_CLI_CAT_REPLICAS", string(replicasJson))
-	}
 
 	log.Infof("Running cat with files: %s\n", args)
-	if err := checkpoint.Cat(cmdCtx.Cli.TarantoolCli); err != nil {
+	if catFlags.Stats {
+		return checkpoint.Stats(walFiles, catFlags)
+	}
+	if err := checkpoint.Cat(walFiles, catFlags); err != nil {
 		return err
 	}
 
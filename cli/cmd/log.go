@@ -4,9 +4,11 @@ import (
 	"context"
 	"errors"
 	"fmt"
+	"math"
 	"os"
 	"os/signal"
 	"sync"
+	"time"
 
 	"github.com/spf13/cobra"
 	"github.com/tarantool/tt/cli/cmd/internal"
@@ -16,8 +18,14 @@ import (
 )
 
 var logOpts struct {
-	nLines int  // How many lines to print.
-	follow bool // Follow logs output.
+	nLines    int    // How many lines to print.
+	nLinesSet bool   // Lines count is set explicitly.
+	follow    bool   // Follow logs output.
+	merge     bool   // Merge logs of instances by timestamps.
+	grep      string // Regular expression to match lines.
+	level     string // The least severe level of printed messages.
+	since     string // Time of the first printed message.
+	until     string // Time of the last printed message.
 }
 
 // NewLogCmd creates log command.
@@ -25,7 +33,10 @@ func NewLogCmd() *cobra.Command {
 	var logCmd = &cobra.Command{
 		Use:   "log [<APP_NAME> | <APP_NAME:INSTANCE_NAME>] [flags]",
 		Short: `Get logs of instance(s)`,
-		Run:   RunModuleFunc(internalLogModule),
+		Run: func(cmd *cobra.Command, args []string) {
+			logOpts.nLinesSet = cmd.Flags().Changed("lines")
+			RunModuleFunc(internalLogModule)(cmd, args)
+		},
 		ValidArgsFunction: func(
 			cmd *cobra.Command,
 			args []string,
@@ -38,9 +49,22 @@ func NewLogCmd() *cobra.Command {
 	}
 
 	logCmd.Flags().IntVarP(&logOpts.nLines, "lines", "n", 10,
-		"Count of last lines to output")
+		"Count of last lines to output. All lines are printed by default if --since or "+
+			"--until is set")
 	logCmd.Flags().BoolVarP(&logOpts.follow, "follow", "f", false,
 		"Output appended data as the log file grows")
+	logCmd.Flags().BoolVar(&logOpts.merge, "merge", false,
+		"Merge logs of instances into a single timeline by timestamps of lines")
+	logCmd.Flags().StringVar(&logOpts.grep, "grep", "",
+		"Output only lines matching the regular expression")
+	logCmd.Flags().StringVar(&logOpts.level, "level", "",
+		"Output only messages of the level or more severe: "+
+			"fatal, syserror, error, crit, warn, info, verbose, debug")
+	logCmd.Flags().StringVar(&logOpts.since, "since", "",
+		`Output messages written since the time: "2006-01-02 15:04:05", RFC 3339 `+
+			`timestamp or a duration ago like "2h"`)
+	logCmd.Flags().StringVar(&logOpts.until, "until", "",
+		"Output messages written until the time, see --since for formats")
 
 	return logCmd
 }
@@ -59,7 +83,7 @@ func printLines(ctx context.Context, in <-chan string) error {
 	}
 }
 
-func follow(instances []running.InstanceCtx, n int) error {
+func follow(instances []running.InstanceCtx, n int, filter *tail.Filter) error {
 	ctx, stop := signal.NotifyContext(context.Background(), os.Interrupt)
 	defer stop()
 
@@ -73,7 +97,7 @@ func follow(instances []running.InstanceCtx, n int) error {
 	for _, inst := range instances {
 		if err := tail.Follow(ctx, logLines,
 			tail.NewLogFormatter(running.GetAppInstanceName(inst)+": ", color),
-			inst.Log, n, &wg); err != nil {
+			inst.Log, n, filter, &wg); err != nil {
 			if errors.Is(err, os.ErrNotExist) {
 				continue
 			}
@@ -94,7 +118,68 @@ func follow(instances []running.InstanceCtx, n int) error {
 	return nil
 }
 
-func printLastN(instances []running.InstanceCtx, n int) error {
+// noFormat returns a log line as is. Merged lines are formatted after the merge.
+func noFormat(str string) string {
+	return str
+}
+
+func followMerged(instances []running.InstanceCtx, n int, filter *tail.Filter) error {
+	ctx, stop := signal.NotifyContext(context.Background(), os.Interrupt)
+	defer stop()
+
+	nextColor := tail.DefaultColorPicker()
+	streams := make([]tail.LogStream, 0, len(instances))
+	for _, inst := range instances {
+		const logLinesChannelCapacity = 64
+		logLines := make(chan string, logLinesChannelCapacity)
+		var wg sync.WaitGroup
+		if err := tail.Follow(ctx, logLines, noFormat, inst.Log, n, filter, &wg); err != nil {
+			if errors.Is(err, os.ErrNotExist) {
+				continue
+			}
+			stop()
+			return fmt.Errorf("cannot read log file %q: %s", inst.Log, err)
+		}
+		go func() {
+			wg.Wait()
+			close(logLines)
+		}()
+		streams = append(streams, tail.LogStream{
+			Lines:     logLines,
+			Formatter: tail.NewLogFormatter(running.GetAppInstanceName(inst)+": ", nextColor()),
+		})
+	}
+
+	if len(streams) > 0 {
+		return printLines(ctx, tail.MergeFollow(ctx, streams, tail.DefaultReorderWindow))
+	}
+	return nil
+}
+
+func printLastNMerged(instances []running.InstanceCtx, n int, filter *tail.Filter) error {
+	ctx, stop := signal.NotifyContext(context.Background(), os.Interrupt)
+	defer stop()
+
+	nextColor := tail.DefaultColorPicker()
+	streams := make([]tail.LogStream, 0, len(instances))
+	for _, inst := range instances {
+		logLines, err := tail.TailN(ctx, noFormat, inst.Log, n, filter)
+		if err != nil {
+			if errors.Is(err, os.ErrNotExist) {
+				continue
+			}
+			stop()
+			return fmt.Errorf("cannot read log file %q: %s", inst.Log, err)
+		}
+		streams = append(streams, tail.LogStream{
+			Lines:     logLines,
+			Formatter: tail.NewLogFormatter(running.GetAppInstanceName(inst)+": ", nextColor()),
+		})
+	}
+	return printLines(ctx, tail.MergeN(ctx, streams))
+}
+
+func printLastN(instances []running.InstanceCtx, n int, filter *tail.Filter) error {
 	ctx, stop := signal.NotifyContext(context.Background(), os.Interrupt)
 	defer stop()
 
@@ -102,7 +187,8 @@ func printLastN(instances []running.InstanceCtx, n int) error {
 	color := nextColor()
 	for _, inst := range instances {
 		logLines, err := tail.TailN(ctx,
-			tail.NewLogFormatter(running.GetAppInstanceName(inst)+": ", color), inst.Log, n)
+			tail.NewLogFormatter(running.GetAppInstanceName(inst)+": ", color), inst.Log, n,
+			filter)
 		if err != nil {
 			if errors.Is(err, os.ErrNotExist) {
 				continue
@@ -118,6 +204,24 @@ func printLastN(instances []running.InstanceCtx, n int) error {
 	return nil
 }
 
+// newLogFilter creates a filter of log lines from the command options.
+func newLogFilter() (*tail.Filter, error) {
+	opts := tail.FilterOpts{Grep: logOpts.grep, Level: logOpts.level}
+	now := time.Now()
+	var err error
+	if logOpts.since != "" {
+		if opts.Since, err = tail.ParseTime(logOpts.since, now); err != nil {
+			return nil, fmt.Errorf("--since: %w", err)
+		}
+	}
+	if logOpts.until != "" {
+		if opts.Until, err = tail.ParseTime(logOpts.until, now); err != nil {
+			return nil, fmt.Errorf("--until: %w", err)
+		}
+	}
+	return tail.NewFilter(opts)
+}
+
 // internalLogModule is a default log module.
 func internalLogModule(cmdCtx *cmdcontext.CmdCtx, args []string) error {
 	if !isConfigExist(cmdCtx) {
@@ -131,9 +235,25 @@ func internalLogModule(cmdCtx *cmdcontext.CmdCtx, args []string) error {
 		return err
 	}
 
+	filter, err := newLogFilter()
+	if err != nil {
+		return err
+	}
+	nLines := logOpts.nLines
+	if !logOpts.nLinesSet && (logOpts.since != "" || logOpts.until != "") {
+		nLines = math.MaxInt
+	}
+
+	if logOpts.merge {
+		if logOpts.follow {
+			return followMerged(runningCtx.Instances, nLines, filter)
+		}
+		return printLastNMerged(runningCtx.Instances, nLines, filter)
+	}
+
 	if logOpts.follow {
-		return follow(runningCtx.Instances, logOpts.nLines)
+		return follow(runningCtx.Instances, nLines, filter)
 	}
 
-	return printLastN(runningCtx.Instances, logOpts.nLines)
+	return printLastN(runningCtx.Instances, nLines, filter)
 }
@@ -6,7 +6,9 @@ import (
 	"fmt"
 	"math"
 	"os"
+	"slices"
 	"strconv"
+	"strings"
 
 	"github.com/apex/log"
 	"github.com/spf13/cobra"
@@ -21,15 +23,23 @@ import (
 // playFlags contains flags for play command.
 // Initialized with default values at creation.
 var playFlags = checkpoint.Opts{
-	From:       0,
-	To:         math.MaxUint64,
-	Timestamp:  "",
-	Space:      nil,
-	Replica:    nil,
-	ShowSystem: false,
-	Recursive:  false,
+	From:        0,
+	To:          math.MaxUint64,
+	Timestamp:   "",
+	Space:       nil,
+	Replica:     nil,
+	ShowSystem:  false,
+	Recursive:   false,
+	BatchSize:   1,
+	InFlight:    1,
+	Parallel:    1,
+	PartitionBy: "space",
+	Index:       false,
 }
 
+// playPartitionKeys contains supported values of the --partition-by flag.
+var playPartitionKeys = []string{"space", "key", "replica"}
+
 var (
 	// playUsername contains username flag.
 	playUsername string
@@ -84,6 +94,21 @@ func NewPlayCmd() *cobra.Command {
 		"Show the contents of system spaces")
 	playCmd.Flags().BoolVarP(&playFlags.Recursive, "recursive", "r", playFlags.Recursive,
 		"Process WAL files in directories recursively")
+	playCmd.Flags().BoolVar(&playFlags.Index, "index", playFlags.Index,
+		"Build and use .idx files next to WAL files to skip files out of the "+
+			"--from/--to/--timestamp range")
+	playCmd.Flags().IntVar(&playFlags.BatchSize, "batch-size", playFlags.BatchSize,
+		"Apply records in transactions of the given size. "+
+			"A transaction is split if records belong to spaces of different engines")
+	playCmd.Flags().IntVar(&playFlags.InFlight, "inflight", playFlags.InFlight,
+		"Maximum count of requests sent without waiting for responses. "+
+			"Records following a failed one may be already applied if it is greater than 1")
+	playCmd.Flags().IntVar(&playFlags.Parallel, "parallel", playFlags.Parallel,
+		"Count of connections to play records in parallel")
+	playCmd.Flags().StringVar(&playFlags.PartitionBy, "partition-by", playFlags.PartitionBy,
+		"Key to distribute records between parallel connections: space, key or replica. "+
+			"Records with the same key are played in order. "+
+			"The replica key is safe only if replicas change different data")
 
 	return playCmd
 }
@@ -94,6 +119,19 @@ func playValidateArgs(cmd *cobra.Command, args []string) error {
 		return errors.New("it is required to specify an URI and at least one .xlog/.snap file " +
 			"or directory")
 	}
+	if playFlags.BatchSize < 1 {
+		return errors.New("the batch size must be positive")
+	}
+	if playFlags.InFlight < 1 {
+		return errors.New("the count of requests in flight must be positive")
+	}
+	if playFlags.Parallel < 1 {
+		return errors.New("the count of parallel connections must be positive")
+	}
+	if !slices.Contains(playPartitionKeys, playFlags.PartitionBy) {
+		return fmt.Errorf("unknown partition key %q, expected one of: %s",
+			playFlags.PartitionBy, strings.Join(playPartitionKeys, ", "))
+	}
 	return nil
 }
 
@@ -144,6 +182,10 @@ func internalPlayModule(cmdCtx *cmdcontext.CmdCtx, args []string) error {
 			"Internal error: could not collect WAL files: %s",
 			version.GetVersion, err)
 	}
+	walFiles, err = checkpoint.SelectFiles(walFiles, playFlags)
+	if err != nil {
+		return err
+	}
 
 	// Re-create args with the URI in the first index, and all founded files after.
 	uriAndWalFiles := append([]string{args[0]}, walFiles...)
@@ -214,6 +256,11 @@ func internalPlayModule(cmdCtx *cmdcontext.CmdCtx, args []string) error {
 		os.Setenv("TT_CLI_PLAY_REPLICAS", string(replicasJson))
 	}
 
+	os.Setenv("TT_CLI_PLAY_BATCH_SIZE", strconv.Itoa(playFlags.BatchSize))
+	os.Setenv("TT_CLI_PLAY_INFLIGHT", strconv.Itoa(playFlags.InFlight))
+	os.Setenv("TT_CLI_PLAY_PARALLEL", strconv.Itoa(playFlags.Parallel))
+	os.Setenv("TT_CLI_PLAY_PARTITION_BY", playFlags.PartitionBy)
+
 	log.Infof("Running play with URI=%s and files: %s\n", args[0], args[1:])
 	if err := checkpoint.Play(cmdCtx.Cli.TarantoolCli); err != nil {
 		return err
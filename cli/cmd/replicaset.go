@@ -5,6 +5,7 @@ import (
 	"fmt"
 	"regexp"
 	"strings"
+	"time"
 
 	"github.com/spf13/cobra"
 
@@ -45,9 +46,12 @@ var (
 	replicasetInstanceName             string
 	replicasetIsGlobal                 bool
 	rebootstrapConfirmed               bool
+	replicasetTopologyCacheTTL         int
+	replicasetReloadAffectedOnly       bool
 
 	chosenReplicasetAliases []string
 	lsnTimeout              int
+	upgradeParallel         int
 
 	replicasetUriHelp = "  The URI can be specified in the following formats:\n" +
 		"  * [tcp://][username:password@][host:port]\n" +
@@ -74,6 +78,9 @@ func newUpgradeCmd() *cobra.Command {
 	cmd.Flags().IntVarP(&lsnTimeout, "timeout", "t", 5,
 		"timeout for waiting the LSN synchronization (in seconds)")
 
+	cmd.Flags().IntVar(&upgradeParallel, "parallel", 1,
+		"maximum count of replicasets upgraded concurrently")
+
 	addOrchestratorFlags(cmd)
 	addTarantoolConnectFlags(cmd)
 	return cmd
@@ -132,6 +139,7 @@ func newStatusCmd() *cobra.Command {
 
 	addOrchestratorFlags(cmd)
 	addTarantoolConnectFlags(cmd)
+	addTopologyCacheFlags(cmd)
 	return cmd
 }
 
@@ -314,6 +322,8 @@ func newRolesAddCmd() *cobra.Command {
 			"  * cartridge: force inconsistency")
 	cmd.Flags().IntVarP(&replicasetTimeout, "timeout", "",
 		replicasetcmd.DefaultTimeout, "adding timeout")
+	cmd.Flags().BoolVar(&replicasetReloadAffectedOnly, "reload-affected-only", false,
+		"reload the centralized config only on instances of affected replicasets")
 	integrity.RegisterWithIntegrityFlag(cmd.Flags(), &replicasetIntegrityPrivateKey)
 
 	return cmd
@@ -347,6 +357,8 @@ func newRolesRemoveCmd() *cobra.Command {
 			"  * cartridge: force inconsistency")
 	cmd.Flags().IntVarP(&replicasetTimeout, "timeout", "",
 		replicasetcmd.DefaultTimeout, "adding timeout")
+	cmd.Flags().BoolVar(&replicasetReloadAffectedOnly, "reload-affected-only", false,
+		"reload the centralized config only on instances of affected replicasets")
 	integrity.RegisterWithIntegrityFlag(cmd.Flags(), &replicasetIntegrityPrivateKey)
 
 	return cmd
@@ -400,6 +412,21 @@ func addTarantoolConnectFlags(cmd *cobra.Command) {
 		`colon-separated (:) list of SSL cipher suites for the URI case`)
 }
 
+// addTopologyCacheFlags adds flags to configure the on-disk topology cache.
+func addTopologyCacheFlags(cmd *cobra.Command) {
+	cmd.Flags().IntVar(&replicasetTopologyCacheTTL, "topology-cache-ttl", 0,
+		"time to live of the application topology cache in the run directory "+
+			"(in seconds), the cache is disabled if it is 0")
+}
+
+// getTopologyCacheTTL returns a validated TTL of the topology cache.
+func getTopologyCacheTTL() (time.Duration, error) {
+	if replicasetTopologyCacheTTL < 0 {
+		return 0, errors.New("the topology cache TTL must not be negative")
+	}
+	return time.Duration(replicasetTopologyCacheTTL) * time.Second, nil
+}
+
 // replicasetCtx describes a context for the replicaset command.
 type replicasetCtx struct {
 	// IsApplication is true when an application was specified.
@@ -507,6 +534,7 @@ func replicasetFillCtx(cmdCtx *cmdcontext.CmdCtx, ctx *replicasetCtx, target str
 		if err != nil {
 			return fmt.Errorf("unable to establish connection: %s", err)
 		}
+		ctx.Conn = connector.NewScriptCacheConnector(ctx.Conn)
 	}
 
 	return nil
@@ -514,6 +542,10 @@ func replicasetFillCtx(cmdCtx *cmdcontext.CmdCtx, ctx *replicasetCtx, target str
 
 // internalReplicasetUpgradeModule is a "upgrade" command for the replicaset module.
 func internalReplicasetUpgradeModule(cmdCtx *cmdcontext.CmdCtx, args []string) error {
+	if upgradeParallel < 1 {
+		return errors.New("the count of parallel upgrades must be positive")
+	}
+
 	var ctx replicasetCtx
 	if err := replicasetFillCtx(cmdCtx, &ctx, args[0], false, running.ConfigLoadAll); err != nil {
 		return err
@@ -541,6 +573,7 @@ func internalReplicasetUpgradeModule(cmdCtx *cmdcontext.CmdCtx, args []string) e
 	}, replicasetcmd.UpgradeOpts{
 		ChosenReplicasetAliases: chosenReplicasetAliases,
 		LsnTimeout:              lsnTimeout,
+		Parallel:                upgradeParallel,
 	}, connOpts)
 }
 
@@ -644,6 +677,11 @@ func internalReplicasetDemoteModule(cmdCtx *cmdcontext.CmdCtx, args []string) er
 
 // internalReplicasetStatusModule is a "status" command for the replicaset module.
 func internalReplicasetStatusModule(cmdCtx *cmdcontext.CmdCtx, args []string) error {
+	topologyCacheTTL, err := getTopologyCacheTTL()
+	if err != nil {
+		return err
+	}
+
 	var ctx replicasetCtx
 	if err := replicasetFillCtx(cmdCtx, &ctx, args[0], false, running.ConfigLoadSkip); err != nil {
 		return err
@@ -652,10 +690,11 @@ func internalReplicasetStatusModule(cmdCtx *cmdcontext.CmdCtx, args []string) er
 		defer ctx.Conn.Close()
 	}
 	return replicasetcmd.Status(replicasetcmd.DiscoveryCtx{
-		IsApplication: ctx.IsApplication,
-		RunningCtx:    ctx.RunningCtx,
-		Conn:          ctx.Conn,
-		Orchestrator:  ctx.Orchestrator,
+		IsApplication:    ctx.IsApplication,
+		RunningCtx:       ctx.RunningCtx,
+		Conn:             ctx.Conn,
+		Orchestrator:     ctx.Orchestrator,
+		TopologyCacheTTL: topologyCacheTTL,
 	})
 }
 
@@ -807,19 +846,20 @@ func internalReplicasetRolesAddModule(cmdCtx *cmdcontext.CmdCtx, args []string)
 	}
 
 	return replicasetcmd.RolesChange(replicasetcmd.RolesChangeCtx{
-		InstName:       ctx.InstName,
-		GroupName:      replicasetGroupName,
-		ReplicasetName: replicasetReplicasetName,
-		IsGlobal:       replicasetIsGlobal,
-		RoleName:       args[1],
-		Collectors:     collectors,
-		Publishers:     publishers,
-		IsApplication:  ctx.IsApplication,
-		Conn:           ctx.Conn,
-		RunningCtx:     ctx.RunningCtx,
-		Orchestrator:   ctx.Orchestrator,
-		Force:          replicasetForce,
-		Timeout:        replicasetTimeout,
+		InstName:           ctx.InstName,
+		GroupName:          replicasetGroupName,
+		ReplicasetName:     replicasetReplicasetName,
+		IsGlobal:           replicasetIsGlobal,
+		RoleName:           args[1],
+		Collectors:         collectors,
+		Publishers:         publishers,
+		IsApplication:      ctx.IsApplication,
+		Conn:               ctx.Conn,
+		RunningCtx:         ctx.RunningCtx,
+		Orchestrator:       ctx.Orchestrator,
+		Force:              replicasetForce,
+		Timeout:            replicasetTimeout,
+		ReloadAffectedOnly: replicasetReloadAffectedOnly,
 	}, replicaset.RolesAdder{})
 }
 
@@ -850,18 +890,19 @@ func internalReplicasetRolesRemoveModule(cmdCtx *cmdcontext.CmdCtx, args []strin
 	}
 
 	return replicasetcmd.RolesChange(replicasetcmd.RolesChangeCtx{
-		InstName:       ctx.InstName,
-		GroupName:      replicasetGroupName,
-		ReplicasetName: replicasetReplicasetName,
-		IsGlobal:       replicasetIsGlobal,
-		RoleName:       args[1],
-		Collectors:     collectors,
-		Publishers:     publishers,
-		IsApplication:  ctx.IsApplication,
-		Conn:           ctx.Conn,
-		RunningCtx:     ctx.RunningCtx,
-		Orchestrator:   ctx.Orchestrator,
-		Force:          replicasetForce,
-		Timeout:        replicasetTimeout,
+		InstName:           ctx.InstName,
+		GroupName:          replicasetGroupName,
+		ReplicasetName:     replicasetReplicasetName,
+		IsGlobal:           replicasetIsGlobal,
+		RoleName:           args[1],
+		Collectors:         collectors,
+		Publishers:         publishers,
+		IsApplication:      ctx.IsApplication,
+		Conn:               ctx.Conn,
+		RunningCtx:         ctx.RunningCtx,
+		Orchestrator:       ctx.Orchestrator,
+		Force:              replicasetForce,
+		Timeout:            replicasetTimeout,
+		ReloadAffectedOnly: replicasetReloadAffectedOnly,
 	}, replicaset.RolesRemover{})
 }
@@ -1,6 +1,12 @@
 package cmd
 
 import (
+	"context"
+	"fmt"
+	"os"
+	"os/signal"
+	"time"
+
 	"github.com/spf13/cobra"
 	"github.com/tarantool/tt/cli/cmd/internal"
 	"github.com/tarantool/tt/cli/cmdcontext"
@@ -10,6 +16,15 @@ import (
 
 var opts status.StatusOpts
 
+// statusTimeout is a timeout in seconds to get a state of an instance.
+var statusTimeout int
+
+// statusWatch is set to refresh the status periodically.
+var statusWatch bool
+
+// statusInterval is an interval in seconds between refreshes of the status.
+var statusInterval int
+
 // NewStatusCmd creates status command.
 func NewStatusCmd() *cobra.Command {
 	var statusCmd = &cobra.Command{
@@ -44,6 +59,16 @@ Columns:
 
 	statusCmd.Flags().BoolVarP(&opts.Pretty, "pretty", "p", false, "pretty-print table")
 	statusCmd.Flags().BoolVarP(&opts.Details, "details", "d", false, "print detailed alerts.")
+	statusCmd.Flags().IntVarP(&statusTimeout, "timeout", "t",
+		int(status.DefaultTimeout/time.Second),
+		"timeout in seconds to get a state of an instance")
+	statusCmd.Flags().StringVar(&opts.Format, "format", "table",
+		"output format: table, json or prometheus")
+	statusCmd.Flags().BoolVarP(&statusWatch, "watch", "w", false,
+		"refresh the status periodically keeping connections to instances open")
+	statusCmd.Flags().IntVar(&statusInterval, "interval",
+		int(status.DefaultWatchInterval/time.Second),
+		"interval in seconds between refreshes of the status in the watch mode")
 
 	return statusCmd
 }
@@ -60,6 +85,19 @@ func internalStatusModule(cmdCtx *cmdcontext.CmdCtx, args []string) error {
 		return err
 	}
 
+	if statusTimeout <= 0 {
+		return fmt.Errorf("timeout must be positive")
+	}
+	opts.Timeout = time.Duration(statusTimeout) * time.Second
+	if statusWatch {
+		if statusInterval <= 0 {
+			return fmt.Errorf("interval must be positive")
+		}
+		ctx, stop := signal.NotifyContext(context.Background(), os.Interrupt)
+		defer stop()
+		return status.Watch(ctx, runningCtx, opts,
+			time.Duration(statusInterval)*time.Second)
+	}
 	err = status.Status(runningCtx, opts)
 	return err
 }
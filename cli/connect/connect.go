@@ -98,6 +98,7 @@ func Eval(connectCtx ConnectCtx, connOpts connector.ConnectOpts, args []string)
 	if err != nil {
 		return nil, fmt.Errorf("unable to establish connection: %s", err)
 	}
+	conn = connector.NewScriptCacheConnector(conn)
 	defer conn.Close()
 
 	evalArgs := []interface{}{command, connectCtx.Language == SQLLanguage}
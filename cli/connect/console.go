@@ -114,6 +114,9 @@ func NewConsole(connOpts connector.ConnectOpts, connectCtx ConnectCtx, title str
 	if err != nil {
 		return nil, fmt.Errorf("failed to connect: %s", err)
 	}
+	// The eval function body is sent on each command, it is cached by
+	// the instance.
+	console.conn = connector.NewScriptCacheConnector(console.conn)
 
 	// Change a language.
 	if connectCtx.Language != DefaultLanguage {
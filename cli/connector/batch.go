@@ -0,0 +1,42 @@
+package connector
+
+// EvalRequest is an eval request of a batch.
+type EvalRequest struct {
+	// Expr is Lua expression to evaluate.
+	Expr string
+	// Args are arguments of the expression.
+	Args []interface{}
+	// Opts are options of the request.
+	Opts RequestOpts
+}
+
+// EvalResult is a result of an eval request of a batch.
+type EvalResult struct {
+	// Data is the data returned by the expression.
+	Data []interface{}
+	// Err is an error of the request.
+	Err error
+}
+
+// EvalBatch evaluates the requests and returns their results in the same
+// order. If the evaler supports asynchronous requests, all the requests are
+// sent before waiting for responses, otherwise they are evaluated one by one.
+func EvalBatch(evaler Evaler, requests []EvalRequest) []EvalResult {
+	results := make([]EvalResult, len(requests))
+	asyncEvaler, ok := evaler.(AsyncEvaler)
+	if !ok {
+		for i, req := range requests {
+			results[i].Data, results[i].Err = evaler.Eval(req.Expr, req.Args, req.Opts)
+		}
+		return results
+	}
+
+	futures := make([]EvalFuture, len(requests))
+	for i, req := range requests {
+		futures[i] = asyncEvaler.EvalAsync(req.Expr, req.Args, req.Opts)
+	}
+	for i, future := range futures {
+		results[i].Data, results[i].Err = future.Get()
+	}
+	return results
+}
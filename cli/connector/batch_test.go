@@ -0,0 +1,72 @@
+package connector_test
+
+import (
+	"errors"
+	"testing"
+	"time"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+	"github.com/tarantool/go-tarantool"
+
+	. "github.com/tarantool/tt/cli/connector"
+)
+
+// evalerStub returns arguments of requests or an error for nil arguments.
+type evalerStub struct {
+	calls int
+}
+
+func (evaler *evalerStub) Eval(expr string, args []any, opts RequestOpts) ([]any, error) {
+	evaler.calls++
+	if args == nil {
+		return nil, errors.New("no arguments")
+	}
+	return args, nil
+}
+
+func TestEvalBatch_sync(t *testing.T) {
+	evaler := &evalerStub{}
+	results := EvalBatch(evaler, []EvalRequest{
+		{Expr: "return ...", Args: []any{1}},
+		{Expr: "return ..."},
+		{Expr: "return ...", Args: []any{3}},
+	})
+
+	assert.Equal(t, 3, evaler.calls)
+	assert.Equal(t, []EvalResult{
+		{Data: []any{1}},
+		{Err: errors.New("no arguments")},
+		{Data: []any{3}},
+	}, results)
+}
+
+func TestEvalBatch_async(t *testing.T) {
+	stub := &binaryFutureStub{}
+	conn := NewBinaryConnector(stub)
+	done := make(chan []EvalResult)
+	go func() {
+		done <- EvalBatch(conn, []EvalRequest{
+			{Expr: "return 1"},
+			{Expr: "return 2"},
+		})
+	}()
+
+	// Both requests are sent before waiting for the responses.
+	require.Eventually(t, func() bool {
+		select {
+		case <-done:
+			t.Fatal("the batch is completed before responses")
+		default:
+		}
+		return len(stub.sent()) == 2
+	}, time.Second, 10*time.Millisecond)
+	futures := stub.sent()
+	futures[1].SetResponse(&tarantool.Response{Data: []any{2}})
+	futures[0].SetError(errors.New("any error"))
+
+	assert.Equal(t, []EvalResult{
+		{Err: errors.New("any error")},
+		{Data: []any{2}},
+	}, <-done)
+}
@@ -26,23 +26,22 @@ func NewBinaryConnector(conn tarantool.Connector) *BinaryConnector {
 	}
 }
 
-// Eval sends an eval request.
-func (conn *BinaryConnector) Eval(expr string, args []interface{},
-	opts RequestOpts) ([]interface{}, error) {
-	// Create a request.
-	evalReq := tarantool.NewEvalRequest(expr).Args(args)
-	if opts.ReadTimeout != 0 {
-		ctx := context.Background()
-		ctx, cancel := context.WithTimeout(ctx, opts.ReadTimeout)
-		defer cancel()
+// binaryEvalFuture is a result of an eval request sent via IPROTO.
+type binaryEvalFuture struct {
+	future *tarantool.Future
+	opts   RequestOpts
+	// cancel releases the context of the request timeout.
+	cancel context.CancelFunc
+}
 
-		evalReq = evalReq.Context(ctx)
-	}
+// Get waits for the result of the request. Pushed messages are passed to
+// the push callback of the request options.
+func (fut *binaryEvalFuture) Get() ([]interface{}, error) {
+	defer fut.cancel()
+	opts := fut.opts
 
-	// Execute the request.
 	var err error
 	var response *tarantool.Response
-	future := conn.conn.Do(evalReq)
 	if opts.PushCallback != nil {
 		var timeout time.Duration
 		if opts.ReadTimeout != 0 {
@@ -50,7 +49,7 @@ func (conn *BinaryConnector) Eval(expr string, args []interface{},
 		} else {
 			timeout = time.Duration(math.MaxInt64)
 		}
-		for it := future.GetIterator().WithTimeout(timeout); it.Next(); {
+		for it := fut.future.GetIterator().WithTimeout(timeout); it.Next(); {
 			if err := it.Err(); err != nil {
 				return nil, replaceContextDone(err)
 			}
@@ -62,11 +61,11 @@ func (conn *BinaryConnector) Eval(expr string, args []interface{},
 		}
 	}
 
-	// Get responseonse.
+	// Get response.
 	if opts.ResData != nil {
-		err = future.GetTyped(opts.ResData)
+		err = fut.future.GetTyped(opts.ResData)
 	} else {
-		response, err = future.Get()
+		response, err = fut.future.Get()
 	}
 
 	if err != nil {
@@ -80,6 +79,34 @@ func (conn *BinaryConnector) Eval(expr string, args []interface{},
 	return response.Data, nil
 }
 
+// EvalAsync sends an eval request without waiting for the response. Requests
+// are pipelined over the connection. The read timeout is counted from
+// the sending of the request.
+func (conn *BinaryConnector) EvalAsync(expr string, args []interface{},
+	opts RequestOpts) EvalFuture {
+	// Create a request.
+	evalReq := tarantool.NewEvalRequest(expr).Args(args)
+	cancel := context.CancelFunc(func() {})
+	if opts.ReadTimeout != 0 {
+		var ctx context.Context
+		ctx, cancel = context.WithTimeout(context.Background(), opts.ReadTimeout)
+		evalReq = evalReq.Context(ctx)
+	}
+
+	// Execute the request.
+	return &binaryEvalFuture{
+		future: conn.conn.Do(evalReq),
+		opts:   opts,
+		cancel: cancel,
+	}
+}
+
+// Eval sends an eval request.
+func (conn *BinaryConnector) Eval(expr string, args []interface{},
+	opts RequestOpts) ([]interface{}, error) {
+	return conn.EvalAsync(expr, args, opts).Get()
+}
+
 // Close closes the tarantool.Connector created from.
 func (conn *BinaryConnector) Close() error {
 	if conn.conn != nil {
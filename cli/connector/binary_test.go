@@ -2,9 +2,11 @@ package connector_test
 
 import (
 	"errors"
+	"sync"
 	"testing"
 
 	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
 	"github.com/tarantool/go-tarantool"
 
 	. "github.com/tarantool/tt/cli/connector"
@@ -21,6 +23,27 @@ func (conn *binaryConnectorStub) Close() error {
 	return conn.err
 }
 
+// binaryFutureStub returns futures for requests to complete them in tests.
+type binaryFutureStub struct {
+	tarantool.Connector
+	mutex   sync.Mutex
+	futures []*tarantool.Future
+}
+
+func (conn *binaryFutureStub) Do(req tarantool.Request) *tarantool.Future {
+	conn.mutex.Lock()
+	defer conn.mutex.Unlock()
+	future := tarantool.NewFuture()
+	conn.futures = append(conn.futures, future)
+	return future
+}
+
+func (conn *binaryFutureStub) sent() []*tarantool.Future {
+	conn.mutex.Lock()
+	defer conn.mutex.Unlock()
+	return append([]*tarantool.Future{}, conn.futures...)
+}
+
 func TestNewBinaryConnector_implementsEvaler(t *testing.T) {
 	var _ Evaler = NewBinaryConnector(nil)
 }
@@ -29,6 +52,10 @@ func TestNewBinaryConnector_implementsConnector(t *testing.T) {
 	var _ Connector = NewBinaryConnector(nil)
 }
 
+func TestNewBinaryConnector_implementsAsyncEvaler(t *testing.T) {
+	var _ AsyncEvaler = NewBinaryConnector(nil)
+}
+
 func TestBinaryConnector_Close(t *testing.T) {
 	stub := &binaryConnectorStub{}
 	conn := NewBinaryConnector(stub)
@@ -53,3 +80,54 @@ func TestBinaryConnector_Close_nil(t *testing.T) {
 
 	assert.NoError(t, conn.Close())
 }
+
+func TestBinaryConnector_EvalAsync(t *testing.T) {
+	stub := &binaryFutureStub{}
+	conn := NewBinaryConnector(stub)
+
+	futures := []EvalFuture{}
+	for i := 0; i < 3; i++ {
+		futures = append(futures, conn.EvalAsync("return ...", []any{i}, RequestOpts{}))
+	}
+	// All the requests are sent before waiting for responses.
+	require.Len(t, stub.futures, 3)
+	for i := len(stub.futures) - 1; i >= 0; i-- {
+		stub.futures[i].SetResponse(&tarantool.Response{Data: []any{i}})
+	}
+
+	for i, future := range futures {
+		data, err := future.Get()
+		require.NoError(t, err)
+		assert.Equal(t, []any{i}, data)
+	}
+}
+
+func TestBinaryConnector_EvalAsync_push(t *testing.T) {
+	stub := &binaryFutureStub{}
+	conn := NewBinaryConnector(stub)
+
+	pushed := []any{}
+	future := conn.EvalAsync("return", []any{}, RequestOpts{
+		PushCallback: func(data any) { pushed = append(pushed, data) },
+	})
+	require.Len(t, stub.futures, 1)
+	stub.futures[0].AppendPush(&tarantool.Response{Code: tarantool.PushCode, Data: []any{"foo"}})
+	stub.futures[0].SetResponse(&tarantool.Response{Data: []any{"bar"}})
+
+	data, err := future.Get()
+	require.NoError(t, err)
+	assert.Equal(t, []any{"bar"}, data)
+	assert.Equal(t, []any{"foo"}, pushed)
+}
+
+func TestBinaryConnector_EvalAsync_error(t *testing.T) {
+	stub := &binaryFutureStub{}
+	conn := NewBinaryConnector(stub)
+
+	future := conn.EvalAsync("return", []any{}, RequestOpts{})
+	require.Len(t, stub.futures, 1)
+	stub.futures[0].SetError(errors.New("any error"))
+
+	_, err := future.Get()
+	assert.EqualError(t, err, "any error")
+}
@@ -7,6 +7,7 @@ import (
 	"os"
 	"path/filepath"
 	"runtime"
+	"sync"
 	"time"
 
 	"github.com/tarantool/go-tarantool"
@@ -18,6 +19,12 @@ const (
 	maxSocketPathMac         = 106
 )
 
+// workDirMutex protects the working directory of the process. It is locked
+// exclusively by connections changing the working directory to shorten
+// a socket path and shared by connections resolving a relative socket path
+// against the working directory.
+var workDirMutex sync.RWMutex
+
 // RequestOpts describes the parameters of a request to be executed.
 type RequestOpts struct {
 	// PushCallback is the cb that will be called when a "push" message is received.
@@ -34,6 +41,20 @@ type Evaler interface {
 	Eval(expr string, args []interface{}, opts RequestOpts) ([]interface{}, error)
 }
 
+// EvalFuture is a result of an asynchronous eval request.
+type EvalFuture interface {
+	// Get waits for the result of the request. It must be called once for
+	// each request to release its resources.
+	Get() ([]interface{}, error)
+}
+
+// AsyncEvaler is an interface that wraps EvalAsync method.
+type AsyncEvaler interface {
+	// EvalAsync passes Lua expression for evaluation without waiting for
+	// the result.
+	EvalAsync(expr string, args []interface{}, opts RequestOpts) EvalFuture
+}
+
 // Connector is an interface that wraps all method required for a
 // connector.
 type Connector interface {
@@ -41,33 +62,47 @@ type Connector interface {
 	Close() error
 }
 
+// absSocketPath returns an absolute path of the relative socket path. The
+// working directory is read under the lock because it could be changed
+// temporarily by a concurrent connection.
+func absSocketPath(path string) (string, error) {
+	workDirMutex.RLock()
+	defer workDirMutex.RUnlock()
+	return filepath.Abs(path)
+}
+
 // Connect connects to the tarantool instance according to options.
 func Connect(opts ConnectOpts) (Connector, error) {
-	// It became common that address is longer than 108 symbols(sun_path limit).
-	// To reduce length of address we use relative path
-	// with chdir into a directory of socket.
-	// e.g foo/bar/123.sock -> ./123.sock
-	workDir, err := os.Getwd()
-	if err != nil {
-		return nil, err
-	}
-
 	maxSocketPath := maxSocketPathLinux
 	if runtime.GOOS == "darwin" {
 		maxSocketPath = maxSocketPathMac
 	}
 
-	if _, err := os.Stat(opts.Address); err == nil {
-		os.Chdir(filepath.Dir(opts.Address))
-		opts.Address = "./" + filepath.Base(opts.Address)
-		if len(opts.Address)+1 > maxSocketPath {
-			return nil, fmt.Errorf("socket name is longer than %d symbols: %s",
-				maxSocketPath-3, filepath.Base(opts.Address))
+	address := opts.Address
+	if opts.Network == UnixNetwork && !filepath.IsAbs(address) {
+		var err error
+		if address, err = absSocketPath(address); err != nil {
+			return nil, err
+		}
+	}
+	// It became common that address is longer than 108 symbols(sun_path limit).
+	// Such address is shortened for each dial, see dialShortSocket.
+	dial := func(dialAddress func(address string) error) error {
+		return dialAddress(address)
+	}
+	if _, err := os.Stat(address); err == nil && len(address)+1 > maxSocketPath {
+		dial = func(dialAddress func(address string) error) error {
+			return dialShortSocket(address, maxSocketPath, dialAddress)
 		}
-		defer os.Chdir(workDir)
 	}
+
 	// Connect to specified address.
-	greetingConn, err := net.Dial(opts.Network, opts.Address)
+	var greetingConn net.Conn
+	err := dial(func(address string) error {
+		var err error
+		greetingConn, err = net.Dial(opts.Network, address)
+		return err
+	})
 	if err != nil {
 		return nil, fmt.Errorf("failed to dial: %s", err)
 	}
@@ -85,6 +120,7 @@ func Connect(opts ConnectOpts) (Connector, error) {
 			protocol = BinaryProtocol
 			transport = "ssl"
 		} else {
+			greetingConn.Close()
 			return nil, fmt.Errorf("failed to get protocol: %s", err)
 		}
 	} else if ssl {
@@ -104,13 +140,18 @@ func Connect(opts ConnectOpts) (Connector, error) {
 	case BinaryProtocol:
 		greetingConn.Close()
 
-		addr := fmt.Sprintf("%s://%s", opts.Network, opts.Address)
-		conn, err := tarantool.Connect(addr, tarantool.Opts{
-			User:       opts.Username,
-			Pass:       opts.Password,
-			Transport:  transport,
-			Ssl:        tarantool.SslOpts(opts.Ssl),
-			SkipSchema: true, // We don't need a schema for eval requests.
+		var conn *tarantool.Connection
+		err := dial(func(address string) error {
+			var err error
+			addr := fmt.Sprintf("%s://%s", opts.Network, address)
+			conn, err = tarantool.Connect(addr, tarantool.Opts{
+				User:       opts.Username,
+				Pass:       opts.Password,
+				Transport:  transport,
+				Ssl:        tarantool.SslOpts(opts.Ssl),
+				SkipSchema: true, // We don't need a schema for eval requests.
+			})
+			return err
 		})
 		if err != nil {
 			return nil, err
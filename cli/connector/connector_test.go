@@ -0,0 +1,157 @@
+package connector_test
+
+import (
+	"fmt"
+	"net"
+	"os"
+	"path/filepath"
+	"strings"
+	"sync"
+	"testing"
+	"time"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+
+	. "github.com/tarantool/tt/cli/connector"
+)
+
+// startTextGreeter starts a server sending a text console greeting to each
+// connection on the unix socket.
+func startTextGreeter(t *testing.T, path string) {
+	t.Helper()
+	startListener(t, path, func(conn net.Conn) {
+		greeting := fmt.Sprintf("%-63s\n%-63s\n", "Tarantool 3.0.0 (Lua console)", "")
+		conn.Write([]byte(greeting))
+		conn.Close()
+	})
+}
+
+// startListener starts a server calling handle for each connection on
+// the unix socket. The socket is created in the working directory.
+func startListener(t *testing.T, path string, handle func(conn net.Conn)) {
+	t.Helper()
+	listener, err := net.Listen("unix", path)
+	require.NoError(t, err)
+	t.Cleanup(func() { listener.Close() })
+
+	go func() {
+		for {
+			conn, err := listener.Accept()
+			if err != nil {
+				return
+			}
+			handle(conn)
+		}
+	}()
+}
+
+// makeLongDir creates a directory with a path exceeding the sun_path limit
+// for sockets.
+func makeLongDir(t *testing.T, name string) string {
+	t.Helper()
+	dir := filepath.Join(t.TempDir(), strings.Repeat("d", 60), strings.Repeat(name, 60))
+	require.NoError(t, os.MkdirAll(dir, 0755))
+	return dir
+}
+
+// listenInDir calls listen in the directory, so a socket with a long path
+// could be created.
+func listenInDir(t *testing.T, dir string, listen func()) {
+	t.Helper()
+	workDir, err := os.Getwd()
+	require.NoError(t, err)
+	require.NoError(t, os.Chdir(dir))
+	defer os.Chdir(workDir)
+	listen()
+}
+
+func TestConnect_concurrent_workDir(t *testing.T) {
+	workDir, err := os.Getwd()
+	require.NoError(t, err)
+	tmpDir := t.TempDir()
+	require.NoError(t, os.Chdir(tmpDir))
+	t.Cleanup(func() { os.Chdir(workDir) })
+
+	// A socket with a path exceeding the sun_path limit.
+	longDir := makeLongDir(t, "d")
+	longPath := filepath.Join(longDir, "long.sock")
+	listenInDir(t, longDir, func() { startTextGreeter(t, "long.sock") })
+	// A socket with a path relative to the working directory.
+	startTextGreeter(t, "short.sock")
+
+	var wg sync.WaitGroup
+	errs := make(chan error, 200)
+	for i := 0; i < 100; i++ {
+		for _, address := range []string{longPath, "short.sock"} {
+			wg.Add(1)
+			go func(address string) {
+				defer wg.Done()
+				conn, err := Connect(ConnectOpts{Network: UnixNetwork, Address: address})
+				if err != nil {
+					errs <- err
+					return
+				}
+				conn.Close()
+			}(address)
+		}
+	}
+	wg.Wait()
+	close(errs)
+	for err := range errs {
+		assert.NoError(t, err)
+	}
+
+	cwd, err := os.Getwd()
+	require.NoError(t, err)
+	assert.Equal(t, tmpDir, cwd)
+}
+
+func TestConnect_long_hungGreeting(t *testing.T) {
+	// An instance accepts connections but never sends a greeting.
+	hungDir := makeLongDir(t, "h")
+	hung := make(chan net.Conn, 1)
+	listenInDir(t, hungDir, func() {
+		startListener(t, "hung.sock", func(conn net.Conn) { hung <- conn })
+	})
+	defer func() {
+		(<-hung).Close()
+	}()
+
+	healthy := []string{}
+	for _, name := range []string{"a", "b", "c"} {
+		dir := makeLongDir(t, name)
+		listenInDir(t, dir, func() { startTextGreeter(t, "healthy.sock") })
+		healthy = append(healthy, filepath.Join(dir, "healthy.sock"))
+	}
+
+	hungDone := make(chan error, 1)
+	go func() {
+		_, err := Connect(ConnectOpts{
+			Network: UnixNetwork,
+			Address: filepath.Join(hungDir, "hung.sock"),
+		})
+		hungDone <- err
+	}()
+	// Wait until the hung connection is accepted.
+	hungConn := <-hung
+	hung <- hungConn
+
+	// Healthy instances are connected without waiting for the greeting of
+	// the hung one.
+	start := time.Now()
+	var wg sync.WaitGroup
+	for _, path := range healthy {
+		wg.Add(1)
+		go func(path string) {
+			defer wg.Done()
+			conn, err := Connect(ConnectOpts{Network: UnixNetwork, Address: path})
+			if assert.NoError(t, err) {
+				conn.Close()
+			}
+		}(path)
+	}
+	wg.Wait()
+	assert.Less(t, time.Since(start), time.Second)
+	assert.ErrorContains(t, <-hungDone, "failed to get protocol")
+}
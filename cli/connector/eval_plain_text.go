@@ -8,6 +8,7 @@ import (
 	"fmt"
 	"io"
 	"net"
+	"slices"
 	"strings"
 	"time"
 
@@ -206,76 +207,78 @@ func readFromPlainTextConn(conn net.Conn, opts EvalPlainTextOpts) ([]byte, error
 	return dataBytes, nil
 }
 
+// plainTextReadSize is a size of a buffer to read a response.
+const plainTextReadSize = 16 * 1024
+
+// isPortionPrefix returns true if the data is a prefix of the end of YAML
+// output or a prefix of a push tag, so it can not be a complete data portion.
+func isPortionPrefix(data []byte) bool {
+	for _, prefix := range []string{endOfYAMLOutput, tagPushPrefixYAML, tagPushPrefixLua} {
+		if len(data) <= len(prefix) && prefix[:len(data)] == string(data) {
+			return true
+		}
+	}
+	return false
+}
+
+// portionEnd returns a length of the first complete data portion of the data
+// or -1 if the portion is not complete. Only the data after the offset is
+// scanned for the end of the portion. A YAML document or a YAML push ends with
+// "\n...\n", any other output ends with ";".
+func portionEnd(data []byte, offset int) int {
+	hasYAMLOutputPrefix := bytes.HasPrefix(data, []byte(startOfYamlOutput)) ||
+		bytes.HasPrefix(data, []byte(tagPushPrefixYAML))
+	for offset < len(data) {
+		i := bytes.IndexAny(data[offset:], ";\n")
+		if i < 0 {
+			break
+		}
+		end := offset + i + 1
+		offset = end
+		if isPortionPrefix(data[:end]) {
+			continue
+		}
+		if data[end-1] == ';' ||
+			hasYAMLOutputPrefix && bytes.HasSuffix(data[:end], []byte(endOfYAMLOutput)) {
+			return end
+		}
+	}
+	return -1
+}
+
+// readDataPortionFromPlainTextConn reads a data portion: a response or
+// a pushed value. The data is scanned once in large blocks, bytes after the
+// portion are kept in the buffer for the next call.
 func readDataPortionFromPlainTextConn(conn net.Conn, buffer *bytes.Buffer,
 	readTimeout time.Duration) ([]byte, error) {
-	tmp := make([]byte, 256)
-	data := make([]byte, 0)
-
 	if readTimeout > 0 {
 		conn.SetReadDeadline(time.Now().Add(readTimeout))
 	} else {
 		conn.SetReadDeadline(time.Time{})
 	}
 
-	hasYAMLOutputPrefix := false
+	// Bytes left from the previous data portion are processed first.
+	data := make([]byte, buffer.Len(), max(buffer.Len(), plainTextReadSize))
+	copy(data, buffer.Bytes())
+	buffer.Reset()
 
+	scanned := 0
 	for {
-		// We have to read from socket in medium parts (not in small parts, like 1 byte),
-		// this greatly speeds up reading and responsiveness.
-		//
-		// But, due to the peculiarities of `box.session.push()`, we have to process the
-		// data byte by byte - we use HasPrefix and HasSufix merhods.
-		//
-		// In addition, when reading in portion (more than 1 byte), we need
-		// to save the read data (for this we use the bytes.Buffer), since we can read it,
-		// but not process them in this function call (see examples above).
-		// This structure allows us to save this data and process it in the next function call.
-		//
-
-		if buffer.Len() == 0 {
-			if n, err := conn.Read(tmp); err != nil && err != io.EOF {
-				return nil, fmt.Errorf("failed to read: %s", err)
-			} else if n == 0 || err == io.EOF {
-				return nil, io.EOF
-			} else {
-				buffer.Write(tmp[:n])
-			}
-		}
-
-		nextByte, err := buffer.ReadByte()
-		if err != nil {
-			return nil, fmt.Errorf("failed to get byte from buffer: %s", err)
-		}
-
-		data = append(data, nextByte)
-		dataString := string(data)
-
-		if strings.HasPrefix(endOfYAMLOutput, dataString) ||
-			strings.HasPrefix(tagPushPrefixYAML, dataString) ||
-			strings.HasPrefix(tagPushPrefixLua, dataString) {
-			continue
+		if end := portionEnd(data, scanned); end >= 0 {
+			buffer.Write(data[end:])
+			return data[:end], nil
 		}
-
-		if !hasYAMLOutputPrefix &&
-			strings.HasPrefix(dataString, startOfYamlOutput) ||
-			strings.HasPrefix(dataString, tagPushPrefixYAML) {
-			hasYAMLOutputPrefix = true
-		}
-
-		if hasYAMLOutputPrefix && strings.HasSuffix(dataString, endOfYAMLOutput) {
-			break
-		}
-
-		if strings.HasSuffix(dataString, endOfLuaOutput) {
-			break
+		scanned = len(data)
+
+		data = slices.Grow(data, plainTextReadSize)
+		n, err := conn.Read(data[len(data):cap(data)])
+		if err != nil && err != io.EOF {
+			return nil, fmt.Errorf("failed to read: %s", err)
+		} else if n == 0 || err == io.EOF {
+			return nil, io.EOF
 		}
+		data = data[:len(data)+n]
 	}
-
-	if len(data) == 0 {
-		return nil, fmt.Errorf("connection was closed")
-	}
-
-	return data, nil
 }
 
 func pushTagIsReceived(dataPortion string) bool {
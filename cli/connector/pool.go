@@ -2,75 +2,412 @@ package connector
 
 import (
 	"errors"
+	"slices"
+	"sync"
+	"time"
+)
+
+const (
+	// DefaultPoolMaxConnections is a default maximum count of connections
+	// to an instance in a pool.
+	DefaultPoolMaxConnections = 4
+	// DefaultPoolIdleTimeout is a default time after which an unused
+	// connection of a pool is closed.
+	DefaultPoolIdleTimeout = time.Minute
+	// DefaultPoolHealthCheckInterval is a default interval of health checks
+	// of a pool.
+	DefaultPoolHealthCheckInterval = 10 * time.Second
+	// poolRetryInterval is a time during which an instance is not connected
+	// after a failed connection if other instances are available.
+	poolRetryInterval = time.Second
+	// poolPingTimeout is a timeout of a ping request of a health check.
+	poolPingTimeout = time.Second
+	// poolPingExpr is an expression evaluated by a ping request.
+	poolPingExpr = "return true"
 )
 
 var (
 	errFailedToConnect = errors.New("failed to connect to any instance")
+	errPoolClosed      = errors.New("the connection pool is closed")
 )
 
-// Pool is a very simple connection pool. It uses a one active connection
-// and switches to another on an error.
+// PoolOpts describes options of a connection pool.
+type PoolOpts struct {
+	// MaxConnections is a maximum count of connections to an instance.
+	// DefaultPoolMaxConnections is used if it is not positive.
+	MaxConnections int
+	// IdleTimeout is a time after which an unused connection is closed.
+	// Unused connections are not closed if it is not positive.
+	IdleTimeout time.Duration
+	// HealthCheckInterval is an interval of health checks. Connections
+	// unused during the interval are pinged, broken ones are closed, and
+	// instances failed recently are connected again. Health checks are
+	// disabled if it is not positive.
+	HealthCheckInterval time.Duration
+}
+
+// poolConn is an idle connection of a pool.
+type poolConn struct {
+	conn     Connector
+	lastUsed time.Time
+}
+
+// poolInstance contains connections to an instance of a pool.
+type poolInstance struct {
+	opts ConnectOpts
+	// idle connections ordered by the time of the last usage.
+	idle []poolConn
+	// busy is a count of connections in use or being connected.
+	busy int
+	// downUntil is a time until the instance is not connected after
+	// a failure.
+	downUntil time.Time
+}
+
+// Pool is a connection pool. It keeps several connections to each instance,
+// a connection is used by a single request at a time, so the pool can be used
+// from many goroutines concurrently. A request is sent to the least loaded
+// instance and is retried on other instances on errors. Broken connections are
+// closed, unused connections are closed after the idle timeout. Unused
+// connections and failed instances are checked periodically in background.
 type Pool struct {
-	opts         []ConnectOpts
-	current      Connector
-	currentIndex int
+	opts      PoolOpts
+	mutex     sync.Mutex
+	released  *sync.Cond
+	instances []*poolInstance
+	// next is an index of an instance to start the selection from, so equally
+	// loaded instances are selected in a round-robin manner.
+	next   int
+	closed bool
+	done   chan struct{}
 }
 
-// ConnectPool creates a connection pool object. It makes sure that it can
-// connect to at least one instance.
+// ConnectPool creates a connection pool object with default options. It makes
+// sure that it can connect to at least one instance.
 func ConnectPool(opts []ConnectOpts) (*Pool, error) {
-	// Protects from external modifications of the data in the slice.
-	cpy := make([]ConnectOpts, len(opts))
-	copy(cpy, opts)
+	return ConnectPoolWithOpts(opts, PoolOpts{
+		IdleTimeout:         DefaultPoolIdleTimeout,
+		HealthCheckInterval: DefaultPoolHealthCheckInterval,
+	})
+}
+
+// ConnectPoolWithOpts creates a connection pool object. It makes sure that it
+// can connect to at least one instance.
+func ConnectPoolWithOpts(opts []ConnectOpts, poolOpts PoolOpts) (*Pool, error) {
+	if poolOpts.MaxConnections <= 0 {
+		poolOpts.MaxConnections = DefaultPoolMaxConnections
+	}
+	pool := &Pool{
+		opts:      poolOpts,
+		instances: make([]*poolInstance, 0, len(opts)),
+		done:      make(chan struct{}),
+	}
+	pool.released = sync.NewCond(&pool.mutex)
+	for _, opt := range opts {
+		pool.instances = append(pool.instances, &poolInstance{opts: opt})
+	}
 
-	for i, opt := range cpy {
-		conn, err := Connect(opt)
+	connected := false
+	for i, instance := range pool.instances {
+		conn, err := Connect(instance.opts)
 		if err == nil {
-			return &Pool{
-				opts:         cpy,
-				current:      conn,
-				currentIndex: i,
-			}, nil
+			instance.idle = append(instance.idle, poolConn{conn: conn, lastUsed: time.Now()})
+			pool.next = i
+			connected = true
+			break
 		}
+		instance.downUntil = time.Now().Add(poolRetryInterval)
+	}
+	if !connected {
+		return nil, errFailedToConnect
+	}
+
+	var interval time.Duration
+	if poolOpts.IdleTimeout > 0 {
+		interval = poolOpts.IdleTimeout / 2
+	}
+	if poolOpts.HealthCheckInterval > 0 &&
+		(interval == 0 || poolOpts.HealthCheckInterval < interval) {
+		interval = poolOpts.HealthCheckInterval
+	}
+	if interval > 0 {
+		go pool.maintain(interval)
+	}
+	return pool, nil
+}
+
+// maintain evicts unused connections and checks the health of the pool
+// periodically until the pool is closed.
+func (pool *Pool) maintain(interval time.Duration) {
+	ticker := time.NewTicker(interval)
+	defer ticker.Stop()
+	for {
+		select {
+		case <-pool.done:
+			return
+		case now := <-ticker.C:
+			if pool.opts.IdleTimeout > 0 {
+				pool.evictIdle(now)
+			}
+			if pool.opts.HealthCheckInterval > 0 {
+				pool.checkHealth(now)
+			}
+		}
+	}
+}
+
+// evictIdle closes connections unused for the idle timeout.
+func (pool *Pool) evictIdle(now time.Time) {
+	pool.mutex.Lock()
+	expired := []Connector{}
+	for _, instance := range pool.instances {
+		// Connections are ordered by the time of the last usage.
+		i := 0
+		for i < len(instance.idle) &&
+			now.Sub(instance.idle[i].lastUsed) >= pool.opts.IdleTimeout {
+			expired = append(expired, instance.idle[i].conn)
+			i++
+		}
+		instance.idle = instance.idle[i:]
+	}
+	pool.mutex.Unlock()
+	for _, conn := range expired {
+		conn.Close()
+	}
+}
+
+// checkHealth pings connections unused for the health check interval and
+// connects to instances failed recently. Checked connections are taken from
+// the pool until the check is finished, broken ones are closed.
+func (pool *Pool) checkHealth(now time.Time) {
+	pool.mutex.Lock()
+	if pool.closed {
+		pool.mutex.Unlock()
+		return
+	}
+	var wg sync.WaitGroup
+	for i, instance := range pool.instances {
+		// Connections are ordered by the time of the last usage.
+		j := 0
+		for j < len(instance.idle) &&
+			now.Sub(instance.idle[j].lastUsed) >= pool.opts.HealthCheckInterval {
+			idle := instance.idle[j]
+			wg.Add(1)
+			go func(i int, idle poolConn) {
+				defer wg.Done()
+				pool.ping(i, idle)
+			}(i, idle)
+			j++
+		}
+		instance.idle = instance.idle[j:]
+		instance.busy += j
+
+		if !instance.downUntil.IsZero() && instance.busy == 0 && len(instance.idle) == 0 {
+			instance.busy++
+			wg.Add(1)
+			go func(i int, opts ConnectOpts) {
+				defer wg.Done()
+				conn, err := Connect(opts)
+				if err != nil {
+					pool.fail(i)
+					return
+				}
+				pool.release(i, conn)
+			}(i, instance.opts)
+		}
+	}
+	pool.mutex.Unlock()
+	wg.Wait()
+}
+
+// ping checks the connection taken from the pool and returns it back
+// without changing the time of the last usage.
+func (pool *Pool) ping(i int, idle poolConn) {
+	opts := RequestOpts{ReadTimeout: poolPingTimeout}
+	if _, err := idle.conn.Eval(poolPingExpr, []any{}, opts); err != nil {
+		idle.conn.Close()
+		pool.fail(i)
+		return
 	}
-	return nil, errFailedToConnect
+	pool.put(i, idle)
 }
 
-// Eval executes the expression on each connectable instance until
-// success.
+// load returns a load of the instance to compare instances lexicographically:
+// whether it is failed recently or has no free connections, a count of
+// connections in use and whether it has no idle connections.
+func (pool *Pool) load(instance *poolInstance, now time.Time) [3]int {
+	load := [3]int{0, instance.busy, 0}
+	if now.Before(instance.downUntil) {
+		load[0] = 2
+	} else if !pool.hasFree(instance) {
+		load[0] = 1
+	}
+	if len(instance.idle) == 0 {
+		load[2] = 1
+	}
+	return load
+}
+
+// hasFree returns true if a connection to the instance can be used.
+func (pool *Pool) hasFree(instance *poolInstance) bool {
+	return len(instance.idle) > 0 || instance.busy < pool.opts.MaxConnections
+}
+
+// selectInstance returns an index of the least loaded instance not tried yet.
+// Instances with idle connections are preferred to avoid new connections,
+// instances failed recently are selected only if there are no other ones.
+func (pool *Pool) selectInstance(tried []bool, now time.Time) int {
+	selected := -1
+	var selectedLoad [3]int
+	for j := range pool.instances {
+		i := (pool.next + j) % len(pool.instances)
+		if tried[i] {
+			continue
+		}
+		load := pool.load(pool.instances[i], now)
+		less := selected < 0
+		for k := 0; !less && k < len(load) && load[k] <= selectedLoad[k]; k++ {
+			less = load[k] < selectedLoad[k]
+		}
+		if less {
+			selected = i
+			selectedLoad = load
+		}
+	}
+	pool.next = (selected + 1) % len(pool.instances)
+	return selected
+}
+
+// acquire returns a connection to the least loaded instance not tried yet.
+// It waits for a free connection if all the instances are fully loaded.
+func (pool *Pool) acquire(tried []bool) (int, Connector, error) {
+	pool.mutex.Lock()
+	for {
+		if pool.closed {
+			pool.mutex.Unlock()
+			return -1, nil, errPoolClosed
+		}
+		i := pool.selectInstance(tried, time.Now())
+		instance := pool.instances[i]
+		if !pool.hasFree(instance) {
+			pool.released.Wait()
+			continue
+		}
+		instance.busy++
+		if last := len(instance.idle) - 1; last >= 0 {
+			conn := instance.idle[last].conn
+			instance.idle = instance.idle[:last]
+			pool.mutex.Unlock()
+			return i, conn, nil
+		}
+		pool.mutex.Unlock()
+
+		conn, err := Connect(instance.opts)
+		if err != nil {
+			pool.fail(i)
+		}
+		return i, conn, err
+	}
+}
+
+// release returns the connection to the pool. A nil connection is released
+// if the connection is broken.
+func (pool *Pool) release(i int, conn Connector) {
+	if conn == nil {
+		pool.put(i, poolConn{})
+		return
+	}
+	pool.put(i, poolConn{conn: conn, lastUsed: time.Now()})
+}
+
+// fail releases a broken connection and marks the instance as failed.
+func (pool *Pool) fail(i int) {
+	pool.mutex.Lock()
+	pool.instances[i].downUntil = time.Now().Add(poolRetryInterval)
+	pool.mutex.Unlock()
+	pool.release(i, nil)
+}
+
+// put returns the connection to the idle ones keeping them ordered by
+// the time of the last usage. A connection with a nil conn is released if
+// the connection is broken.
+func (pool *Pool) put(i int, idle poolConn) {
+	conn := idle.conn
+	pool.mutex.Lock()
+	instance := pool.instances[i]
+	instance.busy--
+	if conn != nil && !pool.closed {
+		j := len(instance.idle)
+		for j > 0 && instance.idle[j-1].lastUsed.After(idle.lastUsed) {
+			j--
+		}
+		instance.idle = slices.Insert(instance.idle, j, idle)
+		instance.downUntil = time.Time{}
+		conn = nil
+	}
+	pool.released.Broadcast()
+	pool.mutex.Unlock()
+	if conn != nil {
+		conn.Close()
+	}
+}
+
+// Eval executes the expression on the least loaded instance. It is retried
+// on each connectable instance until success.
 func (pool *Pool) Eval(expr string, args []any, opts RequestOpts) ([]any, error) {
+	tried := make([]bool, len(pool.instances))
 	var err error
-	for i := 0; i < len(pool.opts); i++ {
-		if pool.current == nil {
-			conn, err := Connect(pool.opts[pool.currentIndex])
-			if err != nil {
-				pool.currentIndex = (pool.currentIndex + 1) % len(pool.opts)
-				continue
-			}
-			pool.current = conn
+	for range pool.instances {
+		i, conn, connErr := pool.acquire(tried)
+		if errors.Is(connErr, errPoolClosed) {
+			return nil, connErr
+		}
+		tried[i] = true
+		if connErr != nil {
+			continue
 		}
 
 		var ret []any
-		ret, err = pool.current.Eval(expr, args, opts)
+		ret, err = conn.Eval(expr, args, opts)
 		if err == nil {
+			pool.release(i, conn)
 			return ret, nil
 		}
 
-		pool.current.Close()
-		pool.current = nil
-		pool.currentIndex = (pool.currentIndex + 1) % len(pool.opts)
+		conn.Close()
+		pool.release(i, nil)
 	}
 
 	if err == nil {
 		err = errFailedToConnect
-	} // Else it contains a last error from pool.current.Eval().
+	} // Else it contains a last error from Eval().
 	return nil, err
 }
 
-// Close closes the pool.
+// Close closes the pool. Connections in use are closed when released.
 func (pool *Pool) Close() error {
-	if pool.current != nil {
-		return pool.current.Close()
+	pool.mutex.Lock()
+	if pool.closed {
+		pool.mutex.Unlock()
+		return nil
+	}
+	pool.closed = true
+	close(pool.done)
+	conns := []Connector{}
+	for _, instance := range pool.instances {
+		for _, idle := range instance.idle {
+			conns = append(conns, idle.conn)
+		}
+		instance.idle = nil
+	}
+	pool.released.Broadcast()
+	pool.mutex.Unlock()
+
+	var err error
+	for _, conn := range conns {
+		if closeErr := conn.Close(); err == nil {
+			err = closeErr
+		}
 	}
-	return nil
+	return err
 }
@@ -1,13 +1,128 @@
 package connector_test
 
 import (
+	"bufio"
+	"fmt"
+	"net"
+	"path/filepath"
+	"sync"
 	"testing"
+	"time"
 
 	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
 
 	"github.com/tarantool/tt/cli/connector"
 )
 
+// consoleServer is a fake Tarantool Lua console. It returns an empty result
+// for each request after a delay or an error if fail is set.
+type consoleServer struct {
+	listener net.Listener
+	delay    time.Duration
+
+	mutex     sync.Mutex
+	fail      bool
+	active    int
+	maxActive int
+	conns     int
+	open      int
+	requests  int
+}
+
+func startConsoleServer(t *testing.T, delay time.Duration) *consoleServer {
+	t.Helper()
+	return startConsoleServerAt(t, filepath.Join(t.TempDir(), "console.sock"), delay)
+}
+
+func startConsoleServerAt(t *testing.T, path string, delay time.Duration) *consoleServer {
+	t.Helper()
+	listener, err := net.Listen("unix", path)
+	require.NoError(t, err)
+	server := &consoleServer{listener: listener, delay: delay}
+	t.Cleanup(func() { listener.Close() })
+	go func() {
+		for {
+			conn, err := listener.Accept()
+			if err != nil {
+				return
+			}
+			go server.serve(conn)
+		}
+	}()
+	return server
+}
+
+func (server *consoleServer) opts() connector.ConnectOpts {
+	return connector.ConnectOpts{
+		Network: connector.UnixNetwork,
+		Address: server.listener.Addr().String(),
+	}
+}
+
+func (server *consoleServer) setFail(fail bool) {
+	server.mutex.Lock()
+	defer server.mutex.Unlock()
+	server.fail = fail
+}
+
+func (server *consoleServer) stats() (maxActive, conns, open int) {
+	server.mutex.Lock()
+	defer server.mutex.Unlock()
+	return server.maxActive, server.conns, server.open
+}
+
+func (server *consoleServer) requestCount() int {
+	server.mutex.Lock()
+	defer server.mutex.Unlock()
+	return server.requests
+}
+
+func (server *consoleServer) serve(conn net.Conn) {
+	defer conn.Close()
+	server.mutex.Lock()
+	server.conns++
+	server.open++
+	server.mutex.Unlock()
+	defer func() {
+		server.mutex.Lock()
+		server.open--
+		server.mutex.Unlock()
+	}()
+
+	greeting := fmt.Sprintf("%-63s\n%-63s\n", "Tarantool 2.11.0 (Lua console)",
+		"type 'help' for interactive help")
+	if _, err := conn.Write([]byte(greeting)); err != nil {
+		return
+	}
+	reader := bufio.NewReader(conn)
+	for {
+		if _, err := reader.ReadString('\n'); err != nil {
+			return
+		}
+		server.mutex.Lock()
+		server.active++
+		server.requests++
+		server.maxActive = max(server.maxActive, server.active)
+		fail := server.fail
+		server.mutex.Unlock()
+
+		time.Sleep(server.delay)
+		// An empty MsgPack array encoded with base64.
+		response := "---\n- data_enc: kA==\n...\n"
+		if fail {
+			response = "---\n- error: eval failed\n...\n"
+		}
+
+		server.mutex.Lock()
+		server.active--
+		server.mutex.Unlock()
+		if _, err := conn.Write([]byte(response)); err != nil {
+			return
+		}
+	}
+}
+
 func TestConnectPool_failed_to_connect(t *testing.T) {
 	cases := []struct {
 		Name string
@@ -32,3 +147,151 @@ func TestConnectPool_failed_to_connect(t *testing.T) {
 		})
 	}
 }
+
+func TestPool_Eval_concurrent(t *testing.T) {
+	server := startConsoleServer(t, 50*time.Millisecond)
+	pool, err := connector.ConnectPoolWithOpts([]connector.ConnectOpts{server.opts()},
+		connector.PoolOpts{MaxConnections: 3})
+	require.NoError(t, err)
+	defer pool.Close()
+
+	var wg sync.WaitGroup
+	for i := 0; i < 9; i++ {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			ret, err := pool.Eval("return", []any{}, connector.RequestOpts{})
+			assert.NoError(t, err)
+			assert.Equal(t, []any{}, ret)
+		}()
+	}
+	wg.Wait()
+
+	maxActive, conns, _ := server.stats()
+	assert.Equal(t, 3, maxActive)
+	assert.Equal(t, 3, conns)
+}
+
+func TestPool_Eval_leastLoaded(t *testing.T) {
+	servers := []*consoleServer{
+		startConsoleServer(t, 100*time.Millisecond),
+		startConsoleServer(t, 100*time.Millisecond),
+	}
+	pool, err := connector.ConnectPoolWithOpts(
+		[]connector.ConnectOpts{servers[0].opts(), servers[1].opts()},
+		connector.PoolOpts{MaxConnections: 1})
+	require.NoError(t, err)
+	defer pool.Close()
+
+	var wg sync.WaitGroup
+	for i := 0; i < 2; i++ {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			_, err := pool.Eval("return", []any{}, connector.RequestOpts{})
+			assert.NoError(t, err)
+		}()
+	}
+	wg.Wait()
+
+	for _, server := range servers {
+		maxActive, conns, _ := server.stats()
+		assert.Equal(t, 1, maxActive)
+		assert.Equal(t, 1, conns)
+	}
+}
+
+func TestPool_Eval_failover(t *testing.T) {
+	servers := []*consoleServer{startConsoleServer(t, 0), startConsoleServer(t, 0)}
+	pool, err := connector.ConnectPool(
+		[]connector.ConnectOpts{servers[0].opts(), servers[1].opts()})
+	require.NoError(t, err)
+	defer pool.Close()
+
+	servers[0].setFail(true)
+	ret, err := pool.Eval("return", []any{}, connector.RequestOpts{})
+	require.NoError(t, err)
+	assert.Equal(t, []any{}, ret)
+	// The broken connection is closed.
+	require.Eventually(t, func() bool {
+		_, _, open := servers[0].stats()
+		return open == 0
+	}, time.Second, 10*time.Millisecond)
+
+	servers[1].setFail(true)
+	_, err = pool.Eval("return", []any{}, connector.RequestOpts{})
+	assert.EqualError(t, err, "eval failed")
+}
+
+func TestPool_idleTimeout(t *testing.T) {
+	server := startConsoleServer(t, 0)
+	pool, err := connector.ConnectPoolWithOpts([]connector.ConnectOpts{server.opts()},
+		connector.PoolOpts{IdleTimeout: 100 * time.Millisecond})
+	require.NoError(t, err)
+	defer pool.Close()
+
+	require.Eventually(t, func() bool {
+		_, _, open := server.stats()
+		return open == 0
+	}, time.Second, 10*time.Millisecond)
+
+	_, err = pool.Eval("return", []any{}, connector.RequestOpts{})
+	assert.NoError(t, err)
+	_, conns, _ := server.stats()
+	assert.Equal(t, 2, conns)
+}
+
+func TestPool_Close(t *testing.T) {
+	server := startConsoleServer(t, 0)
+	pool, err := connector.ConnectPool([]connector.ConnectOpts{server.opts()})
+	require.NoError(t, err)
+
+	assert.NoError(t, pool.Close())
+	_, err = pool.Eval("return", []any{}, connector.RequestOpts{})
+	assert.EqualError(t, err, "the connection pool is closed")
+	require.Eventually(t, func() bool {
+		_, _, open := server.stats()
+		return open == 0
+	}, time.Second, 10*time.Millisecond)
+}
+
+func TestPool_healthCheck_ping(t *testing.T) {
+	server := startConsoleServer(t, 0)
+	pool, err := connector.ConnectPoolWithOpts([]connector.ConnectOpts{server.opts()},
+		connector.PoolOpts{HealthCheckInterval: 50 * time.Millisecond})
+	require.NoError(t, err)
+	defer pool.Close()
+
+	// An unused connection is pinged and kept.
+	require.Eventually(t, func() bool {
+		return server.requestCount() >= 2
+	}, time.Second, 10*time.Millisecond)
+	_, conns, open := server.stats()
+	assert.Equal(t, 1, conns)
+	assert.Equal(t, 1, open)
+
+	// A broken connection is closed.
+	server.setFail(true)
+	require.Eventually(t, func() bool {
+		_, _, open := server.stats()
+		return open == 0
+	}, time.Second, 10*time.Millisecond)
+}
+
+func TestPool_healthCheck_reconnect(t *testing.T) {
+	path := filepath.Join(t.TempDir(), "console.sock")
+	server := startConsoleServer(t, 0)
+	pool, err := connector.ConnectPoolWithOpts([]connector.ConnectOpts{
+		{Network: connector.UnixNetwork, Address: path},
+		server.opts(),
+	}, connector.PoolOpts{HealthCheckInterval: 50 * time.Millisecond})
+	require.NoError(t, err)
+	defer pool.Close()
+
+	// The failed instance is connected in background after it is started.
+	restarted := startConsoleServerAt(t, path, 0)
+	require.Eventually(t, func() bool {
+		_, _, open := restarted.stats()
+		return open == 1
+	}, time.Second, 10*time.Millisecond)
+}
@@ -0,0 +1,145 @@
+package connector
+
+import (
+	"crypto/sha256"
+	"encoding/hex"
+	"fmt"
+	"strings"
+)
+
+const (
+	// scriptCacheMinSize is a minimal size of an expression to cache it on
+	// an instance. Smaller expressions are evaluated as is.
+	scriptCacheMinSize = 1024
+	// scriptCacheMissMsg is an error message of a call of an expression
+	// missing in the cache.
+	scriptCacheMissMsg = "tt script cache miss"
+)
+
+// callCachedScriptTmpl calls a function from the cache of an instance by
+// a digest of its expression.
+const callCachedScriptTmpl = `local cache = rawget(_G, '__tt_script_cache')
+local func = cache ~= nil and cache['%s'] or nil
+if func == nil then
+    error('` + scriptCacheMissMsg + `', 0)
+end
+return func(...)`
+
+// cacheScriptTmpl stores an expression as a function in the cache of
+// an instance and calls it.
+const cacheScriptTmpl = `local cache = rawget(_G, '__tt_script_cache')
+if cache == nil then
+    cache = {}
+    rawset(_G, '__tt_script_cache', cache)
+end
+local func = function(...)
+%s
+end
+cache['%s'] = func
+return func(...)`
+
+// ScriptCacheConnector is a connector that stores large expressions on
+// an instance as functions and calls them by digests of the expressions.
+// An expression is sent completely only if it is missing in the cache of
+// the instance, so it is parsed once by the instance and is not resent on
+// each call. The cache of the instance is shared by all connections.
+type ScriptCacheConnector struct {
+	conn Connector
+}
+
+// NewScriptCacheConnector creates a new ScriptCacheConnector object. The object
+// will close the connector argument in Close() call.
+func NewScriptCacheConnector(conn Connector) *ScriptCacheConnector {
+	return &ScriptCacheConnector{
+		conn: conn,
+	}
+}
+
+// scriptDigest returns a digest of the expression to identify it in a cache.
+func scriptDigest(expr string) string {
+	digest := sha256.Sum256([]byte(expr))
+	return hex.EncodeToString(digest[:])
+}
+
+// isScriptCacheMiss returns true if the error is caused by a call of
+// an expression missing in the cache.
+func isScriptCacheMiss(err error) bool {
+	return err != nil && strings.Contains(err.Error(), scriptCacheMissMsg)
+}
+
+// Eval sends an eval request. Large expressions are called from the cache
+// of the instance.
+func (conn *ScriptCacheConnector) Eval(expr string, args []interface{},
+	opts RequestOpts) ([]interface{}, error) {
+	if len(expr) < scriptCacheMinSize {
+		return conn.conn.Eval(expr, args, opts)
+	}
+
+	digest := scriptDigest(expr)
+	ret, err := conn.conn.Eval(fmt.Sprintf(callCachedScriptTmpl, digest), args, opts)
+	if !isScriptCacheMiss(err) {
+		return ret, err
+	}
+	return conn.conn.Eval(fmt.Sprintf(cacheScriptTmpl, expr, digest), args, opts)
+}
+
+// scriptCacheFuture is a result of an asynchronous call of an expression
+// from the cache of an instance.
+type scriptCacheFuture struct {
+	future EvalFuture
+	// miss evaluates the expression if it is missing in the cache.
+	miss func() ([]interface{}, error)
+}
+
+// Get waits for the result of the request. The expression is sent
+// completely if it is missing in the cache.
+func (fut *scriptCacheFuture) Get() ([]interface{}, error) {
+	ret, err := fut.future.Get()
+	if !isScriptCacheMiss(err) {
+		return ret, err
+	}
+	return fut.miss()
+}
+
+// syncEvalFuture is a result of a request evaluated synchronously.
+type syncEvalFuture struct {
+	data []interface{}
+	err  error
+}
+
+// Get returns the result of the request.
+func (fut *syncEvalFuture) Get() ([]interface{}, error) {
+	return fut.data, fut.err
+}
+
+// EvalAsync sends an eval request without waiting for the response if
+// the connector supports asynchronous requests, otherwise the request is
+// evaluated synchronously. Large expressions are called from the cache of
+// the instance.
+func (conn *ScriptCacheConnector) EvalAsync(expr string, args []interface{},
+	opts RequestOpts) EvalFuture {
+	asyncConn, ok := conn.conn.(AsyncEvaler)
+	if !ok {
+		data, err := conn.Eval(expr, args, opts)
+		return &syncEvalFuture{data: data, err: err}
+	}
+	if len(expr) < scriptCacheMinSize {
+		return asyncConn.EvalAsync(expr, args, opts)
+	}
+
+	digest := scriptDigest(expr)
+	return &scriptCacheFuture{
+		future: asyncConn.EvalAsync(fmt.Sprintf(callCachedScriptTmpl, digest), args, opts),
+		miss: func() ([]interface{}, error) {
+			return conn.conn.Eval(fmt.Sprintf(cacheScriptTmpl, expr, digest), args, opts)
+		},
+	}
+}
+
+// Close closes the connector created from.
+func (conn *ScriptCacheConnector) Close() error {
+	if conn.conn != nil {
+		return conn.conn.Close()
+	}
+	return nil
+}
@@ -0,0 +1,177 @@
+package connector_test
+
+import (
+	"errors"
+	"regexp"
+	"strings"
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+
+	. "github.com/tarantool/tt/cli/connector"
+)
+
+var (
+	callCachedRe = regexp.MustCompile(`cache\['([0-9a-f]+)'\] or nil`)
+	cacheRe      = regexp.MustCompile(`cache\['([0-9a-f]+)'\] = func`)
+)
+
+// scriptCacheStub emulates a cache of scripts on an instance.
+type scriptCacheStub struct {
+	cache map[string]string
+	exprs []string
+}
+
+func (conn *scriptCacheStub) Eval(expr string, args []any, opts RequestOpts) ([]any, error) {
+	conn.exprs = append(conn.exprs, expr)
+	if match := callCachedRe.FindStringSubmatch(expr); match != nil {
+		body, ok := conn.cache[match[1]]
+		if !ok {
+			return nil, errors.New("tt script cache miss")
+		}
+		return []any{body}, nil
+	}
+	if match := cacheRe.FindStringSubmatch(expr); match != nil {
+		conn.cache[match[1]] = expr
+		return []any{expr}, nil
+	}
+	return []any{expr}, nil
+}
+
+func (conn *scriptCacheStub) Close() error {
+	return nil
+}
+
+// asyncScriptCacheStub emulates a cache of scripts on an instance and
+// counts asynchronous requests.
+type asyncScriptCacheStub struct {
+	scriptCacheStub
+	async int
+}
+
+// evalFutureStub is a result of a request.
+type evalFutureStub struct {
+	data []any
+	err  error
+}
+
+func (fut *evalFutureStub) Get() ([]any, error) {
+	return fut.data, fut.err
+}
+
+func (conn *asyncScriptCacheStub) EvalAsync(expr string, args []any,
+	opts RequestOpts) EvalFuture {
+	conn.async++
+	data, err := conn.Eval(expr, args, opts)
+	return &evalFutureStub{data: data, err: err}
+}
+
+func TestNewScriptCacheConnector_implementsConnector(t *testing.T) {
+	var _ Connector = NewScriptCacheConnector(nil)
+}
+
+func TestNewScriptCacheConnector_implementsAsyncEvaler(t *testing.T) {
+	var _ AsyncEvaler = NewScriptCacheConnector(nil)
+}
+
+func TestScriptCacheConnector_Eval_small(t *testing.T) {
+	stub := &scriptCacheStub{cache: map[string]string{}}
+	conn := NewScriptCacheConnector(stub)
+
+	ret, err := conn.Eval("return ...", []any{}, RequestOpts{})
+	require.NoError(t, err)
+	assert.Equal(t, []any{"return ..."}, ret)
+	assert.Equal(t, []string{"return ..."}, stub.exprs)
+}
+
+func TestScriptCacheConnector_Eval_cached(t *testing.T) {
+	stub := &scriptCacheStub{cache: map[string]string{}}
+	expr := strings.Repeat("local _ = 1\n", 200) + "return ..."
+
+	// The script is cached by the first connection.
+	conn := NewScriptCacheConnector(stub)
+	_, err := conn.Eval(expr, []any{}, RequestOpts{})
+	require.NoError(t, err)
+	require.Len(t, stub.exprs, 2)
+	assert.NotContains(t, stub.exprs[0], expr)
+	assert.Contains(t, stub.exprs[1], expr)
+	require.Len(t, stub.cache, 1)
+
+	// The script is called by a digest by other connections.
+	stub.exprs = nil
+	conn = NewScriptCacheConnector(stub)
+	_, err = conn.Eval(expr, []any{}, RequestOpts{})
+	require.NoError(t, err)
+	require.Len(t, stub.exprs, 1)
+	assert.Less(t, len(stub.exprs[0]), len(expr))
+}
+
+// errorEvalerStub fails all requests.
+type errorEvalerStub struct {
+	calls int
+}
+
+func (conn *errorEvalerStub) Eval(expr string, args []any, opts RequestOpts) ([]any, error) {
+	conn.calls++
+	return nil, errors.New("any error")
+}
+
+func (conn *errorEvalerStub) Close() error {
+	return nil
+}
+
+func TestScriptCacheConnector_Eval_error(t *testing.T) {
+	stub := &errorEvalerStub{}
+	conn := NewScriptCacheConnector(stub)
+
+	_, err := conn.Eval(strings.Repeat(" ", 2048), []any{}, RequestOpts{})
+	assert.EqualError(t, err, "any error")
+	assert.Equal(t, 1, stub.calls)
+}
+
+func TestScriptCacheConnector_EvalAsync(t *testing.T) {
+	stub := &asyncScriptCacheStub{scriptCacheStub: scriptCacheStub{cache: map[string]string{}}}
+	conn := NewScriptCacheConnector(stub)
+	cached := strings.Repeat("local _ = 1\n", 200) + "return 1"
+	missed := strings.Repeat("local _ = 1\n", 200) + "return 2"
+	_, err := conn.Eval(cached, []any{}, RequestOpts{})
+	require.NoError(t, err)
+
+	stub.exprs = nil
+	results := EvalBatch(conn, []EvalRequest{
+		{Expr: "return ...", Args: []any{}},
+		{Expr: cached, Args: []any{}},
+		{Expr: missed, Args: []any{}},
+	})
+	for _, result := range results {
+		require.NoError(t, result.Err)
+	}
+	assert.Equal(t, []any{"return ..."}, results[0].Data)
+	assert.Contains(t, results[1].Data[0], cached)
+	assert.Contains(t, results[2].Data[0], missed)
+
+	// All the requests are sent asynchronously, the missed expression is
+	// sent completely after the miss.
+	assert.Equal(t, 3, stub.async)
+	require.Len(t, stub.exprs, 4)
+	assert.NotContains(t, stub.exprs[1], cached)
+	assert.NotContains(t, stub.exprs[2], missed)
+	assert.Contains(t, stub.exprs[3], missed)
+	assert.Len(t, stub.cache, 2)
+}
+
+func TestScriptCacheConnector_EvalAsync_sync(t *testing.T) {
+	stub := &scriptCacheStub{cache: map[string]string{}}
+	conn := NewScriptCacheConnector(stub)
+	expr := strings.Repeat("local _ = 1\n", 200) + "return ..."
+
+	ret, err := conn.EvalAsync(expr, []any{}, RequestOpts{}).Get()
+	require.NoError(t, err)
+	assert.Contains(t, ret[0], expr)
+	assert.Len(t, stub.exprs, 2)
+
+	_, err = NewScriptCacheConnector(&errorEvalerStub{}).EvalAsync(
+		"return", []any{}, RequestOpts{}).Get()
+	assert.EqualError(t, err, "any error")
+}
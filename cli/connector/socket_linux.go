@@ -0,0 +1,29 @@
+//go:build linux
+
+package connector
+
+import (
+	"fmt"
+	"path/filepath"
+
+	"golang.org/x/sys/unix"
+)
+
+// dialShortSocket calls dial with a short path of the socket. The socket is
+// addressed relative to a descriptor of its directory, so the working
+// directory of the process is not changed and connections are not serialized.
+func dialShortSocket(path string, maxSocketPath int, dial func(address string) error) error {
+	fd, err := unix.Open(filepath.Dir(path), unix.O_PATH|unix.O_DIRECTORY|unix.O_CLOEXEC, 0)
+	if err != nil {
+		return err
+	}
+	defer unix.Close(fd)
+
+	dir := fmt.Sprintf("/proc/self/fd/%d", fd)
+	name := filepath.Base(path)
+	if len(dir)+len(name)+2 > maxSocketPath {
+		return fmt.Errorf("socket name is longer than %d symbols: %s",
+			maxSocketPath-len(dir)-2, name)
+	}
+	return dial(dir + "/" + name)
+}
@@ -0,0 +1,33 @@
+//go:build !linux
+
+package connector
+
+import (
+	"fmt"
+	"os"
+	"path/filepath"
+)
+
+// dialShortSocket calls dial with a short path of the socket. The path is
+// relative to the directory of the socket, so the working directory of
+// the process is changed while dialing. Such dials are serialized.
+// e.g foo/bar/123.sock -> ./123.sock
+func dialShortSocket(path string, maxSocketPath int, dial func(address string) error) error {
+	name := filepath.Base(path)
+	if len(name)+3 > maxSocketPath {
+		return fmt.Errorf("socket name is longer than %d symbols: %s",
+			maxSocketPath-3, name)
+	}
+
+	workDirMutex.Lock()
+	defer workDirMutex.Unlock()
+	workDir, err := os.Getwd()
+	if err != nil {
+		return err
+	}
+	if err := os.Chdir(filepath.Dir(path)); err != nil {
+		return err
+	}
+	defer os.Chdir(workDir)
+	return dial("./" + name)
+}
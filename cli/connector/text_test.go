@@ -1,11 +1,16 @@
 package connector_test
 
 import (
+	"bufio"
+	"encoding/base64"
 	"errors"
 	"net"
+	"strings"
 	"testing"
 
 	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+	"github.com/vmihailenco/msgpack/v5"
 
 	. "github.com/tarantool/tt/cli/connector"
 )
@@ -53,3 +58,83 @@ func TestTextConnector_Close_nil(t *testing.T) {
 
 	assert.NoError(t, conn.Close())
 }
+
+// evalTextResponse sends the response to an eval request over a text
+// connection in small chunks and returns the result of the request.
+func evalTextResponse(t *testing.T, response string, opts RequestOpts) ([]any, error) {
+	t.Helper()
+	client, server := net.Pipe()
+	defer server.Close()
+	go func() {
+		if _, err := bufio.NewReader(server).ReadString('\n'); err != nil {
+			return
+		}
+		for len(response) > 0 {
+			n := min(len(response), 7)
+			if _, err := server.Write([]byte(response[:n])); err != nil {
+				return
+			}
+			response = response[n:]
+		}
+	}()
+	conn := NewTextConnector(client)
+	defer conn.Close()
+	return conn.Eval("return ...", []any{}, opts)
+}
+
+// encodeTextResult encodes the result of an eval request as a text console does.
+func encodeTextResult(t *testing.T, result []any) string {
+	t.Helper()
+	data, err := msgpack.Marshal(result)
+	require.NoError(t, err)
+	return base64.StdEncoding.EncodeToString(data)
+}
+
+func TestTextConnector_Eval_largeResponse(t *testing.T) {
+	value := strings.Repeat("data;\n...\n", 10000)
+	response := "---\n- data_enc: " + encodeTextResult(t, []any{value}) + "\n...\n"
+
+	ret, err := evalTextResponse(t, response, RequestOpts{})
+	require.NoError(t, err)
+	assert.Equal(t, []any{value}, ret)
+}
+
+func TestTextConnector_Eval_push(t *testing.T) {
+	tests := []struct {
+		name     string
+		response string
+		pushed   []any
+	}{
+		{
+			name: "yaml",
+			response: "%TAG !push! tag:tarantool.io/push,2018\n--- foo\n...\n" +
+				"---\n- data_enc: " + encodeTextResult(t, []any{"bar"}) + "\n...\n",
+			pushed: []any{"foo"},
+		},
+		{
+			name: "lua",
+			response: "-- Push\n'foo';" +
+				`{data_enc = "` + encodeTextResult(t, []any{"bar"}) + `"};`,
+			pushed: []any{"'foo'"},
+		},
+	}
+	for _, tc := range tests {
+		t.Run(tc.name, func(t *testing.T) {
+			pushed := []any{}
+			ret, err := evalTextResponse(t, tc.response, RequestOpts{
+				PushCallback: func(data any) { pushed = append(pushed, data) },
+			})
+			require.NoError(t, err)
+			assert.Equal(t, []any{"bar"}, ret)
+			assert.Equal(t, tc.pushed, pushed)
+		})
+	}
+}
+
+func TestTextConnector_Eval_error(t *testing.T) {
+	_, err := evalTextResponse(t, "---\n- error: foo\n...\n", RequestOpts{})
+	assert.EqualError(t, err, "foo")
+
+	_, err = evalTextResponse(t, `"foo";`, RequestOpts{})
+	assert.EqualError(t, err, "foo")
+}
@@ -29,6 +29,9 @@ var (
 	//go:embed lua/cartridge/get_topology_replicasets_body.lua
 	cartridgeGetTopologyReplicasetsBody string
 
+	//go:embed lua/cartridge/get_topology_config_body.lua
+	cartridgeGetTopologyConfigBody string
+
 	//go:embed lua/cartridge/get_instance_info_body.lua
 	cartridgeGetInstanceInfoBody string
 
@@ -259,13 +262,15 @@ func (c *CartridgeApplication) discovery() (Replicasets, error) {
 	}
 
 	replicasets = getCartridgeReplicasets(topology)
-	err = EvalForeachAlive(c.runningCtx.Instances, InstanceEvalFunc(
-		func(ictx running.InstanceCtx, evaler connector.Evaler) (bool, error) {
-			var err error
-			replicasets, err = updateCartridgeInstance(evaler, &ictx, replicasets)
-			return false, err
+	infos, err := EvalForeachAliveParallel(c.runningCtx.Instances,
+		func(ictx running.InstanceCtx, evaler connector.Evaler) (cartridgeInstanceInfo, error) {
+			uuid, rw, err := getCartridgeInstanceInfo(evaler)
+			return cartridgeInstanceInfo{uuid: uuid, rw: rw, ictx: ictx}, err
 		},
-	))
+	)
+	for _, info := range infos {
+		replicasets = setCartridgeInstanceInfo(info.uuid, info.rw, &info.ictx, replicasets)
+	}
 
 	return recalculateMasters(replicasets), err
 }
@@ -303,7 +308,9 @@ loop:
 		return fmt.Errorf("target instance should be online")
 	}
 
-	return cartridgePromote(MakeInstanceEvalFunc(targetInstance.InstanceCtx),
+	conns := newConnCache()
+	defer conns.close()
+	return cartridgePromote(makeInstanceEvalFunc(conns, targetInstance.InstanceCtx),
 		inst, ctx.Force, ctx.Timeout)
 }
 
@@ -505,44 +512,58 @@ func (c *CartridgeApplication) bootstrapReplicasets(evaler connector.Evaler, dis
 	if err != nil {
 		return fmt.Errorf("failed to get cartridge major version: %w", err)
 	}
-	if majorVer < 2 && discovered.State != StateBootstrapped {
-		if len(replicasetsCfg) == 0 {
-			return fmt.Errorf("empty replicasets config")
-		}
-		for rname, cfg := range replicasetsCfg {
-			// Create first replicaset with single instance, since in the old Cartridge
-			// bootstrapping cluster from scratch should be performed
-			// on a single-server replicaset only.
-			if len(cfg.Instances) == 0 {
-				return fmt.Errorf("replicaset %q is empty", rname)
-			}
-			instances := cfg.Instances
-			initialReplicasetCfg := cfg
-			initialReplicasetCfg.Instances, cfg.Instances = instances[:1], instances[1:]
-
-			initialCfg := map[string]cartridgeReplicasetConfig{}
-			initialCfg[rname] = initialReplicasetCfg
-			if len(cfg.Instances) == 0 {
-				// There are no more instances to bootstrap.
-				delete(replicasetsCfg, rname)
-			} else {
-				replicasetsCfg[rname] = cfg
-			}
+	initial := majorVer < 2 && discovered.State != StateBootstrapped
+	if initial && len(replicasetsCfg) == 0 {
+		return fmt.Errorf("empty replicasets config")
+	}
 
-			if err := updateCartridgeReplicasets(evaler, discovered, initialCfg,
-				instancesCfg, timeout); err != nil {
-				return err
-			}
-			break
+	var topologyCfg cartridgeTopologyConfig
+	if discovered.State == StateBootstrapped {
+		if topologyCfg, err = getCartridgeTopologyConfig(evaler); err != nil {
+			return fmt.Errorf("failed to get topology config: %w", err)
 		}
 	}
-
-	if err := updateCartridgeReplicasets(evaler, discovered, replicasetsCfg,
-		instancesCfg, timeout); err != nil {
+	editOpts, err := planCartridgeReplicasets(discovered, topologyCfg, replicasetsCfg,
+		instancesCfg)
+	if err != nil {
 		return err
 	}
+	if len(editOpts) == 0 {
+		log.Info("Replicasets are up to date")
+		return nil
+	}
 
-	return err
+	if initial {
+		// Create first replicaset with single instance, since in the old Cartridge
+		// bootstrapping cluster from scratch should be performed
+		// on a single-server replicaset only.
+		first := editOpts[0]
+		if len(first.JoinServers) == 0 {
+			return fmt.Errorf("replicaset %q is empty", *first.Alias)
+		}
+		initialOpts := first
+		initialOpts.JoinServers = first.JoinServers[:1]
+		initialOpts.FailoverPriority = first.FailoverPriority[:1]
+		if err := cartridgeEditReplicasets(evaler,
+			[]cartridgeEditReplicasetsOpts{initialOpts}, timeout); err != nil {
+			return err
+		}
+
+		if len(first.JoinServers) == 1 {
+			// There are no more instances to bootstrap.
+			editOpts = editOpts[1:]
+		} else {
+			first.JoinServers = first.JoinServers[1:]
+			first.FailoverPriority = first.FailoverPriority[1:]
+			editOpts[0] = first
+		}
+		if len(editOpts) == 0 {
+			return nil
+		}
+	}
+
+	// All the changes are applied by a single topology edit.
+	return cartridgeEditReplicasets(evaler, editOpts, timeout)
 }
 
 // getCartridgeJoinServersOpts returns opts to join new servers.
@@ -569,57 +590,6 @@ func getCartridgeJoinServersOpts(instancesCfg map[string]cartridgeInstanceConfig
 	return opts, nil
 }
 
-// updateCartridgeReplicasets updates replicasets using the config.
-// If some instance was not discovered, creates it.
-func updateCartridgeReplicasets(evaler connector.Evaler, discovered Replicasets,
-	replicasetCfg map[string]cartridgeReplicasetConfig,
-	instancesCfg map[string]cartridgeInstanceConfig,
-	timeout int) error {
-	instanceUUID := map[string]string{}
-	replicasetUUID := map[string]string{}
-	for _, replicaset := range discovered.Replicasets {
-		replicasetUUID[replicaset.Alias] = replicaset.UUID
-		for _, instance := range replicaset.Instances {
-			instanceUUID[instance.Alias] = instance.UUID
-		}
-	}
-
-	var editOpts []cartridgeEditReplicasetsOpts
-	for rname, rcfg := range replicasetCfg {
-		replicasetName := rname
-		opts := cartridgeEditReplicasetsOpts{
-			Alias:       &replicasetName,
-			Roles:       rcfg.Roles,
-			AllRW:       rcfg.AllRW,
-			Weight:      rcfg.Weight,
-			VshardGroup: rcfg.VShardGroup,
-		}
-		if uuid, found := replicasetUUID[replicasetName]; found {
-			// Link opts to the existing replicaset.
-			// admin_edit_topology() recognizes replicasets by UUID.
-			opts.UUID = &uuid
-		}
-		var err error
-		opts.JoinServers, err = getCartridgeJoinServersOpts(instancesCfg,
-			rcfg.Instances, instanceUUID)
-		if err != nil {
-			return err
-		}
-		var failoverPriority []string
-		for _, inst := range rcfg.Instances {
-			uuid, ok := instanceUUID[inst]
-			if !ok {
-				return fmt.Errorf("instance %q uuid not found", inst)
-			}
-			failoverPriority = append(failoverPriority, uuid)
-		}
-		opts.FailoverPriority = failoverPriority
-		editOpts = append(editOpts, opts)
-	}
-
-	return cartridgeEditReplicasets(evaler, editOpts, timeout)
-}
-
 // Expel expels an instance from a Cartridge replicasets.
 func (c *CartridgeApplication) Expel(ctx ExpelCtx) error {
 	replicasets, err := c.Discovery(UseCache)
@@ -787,6 +757,14 @@ func getCartridgeInstanceInfo(
 	return info[0].UUID, info[0].RW, nil
 }
 
+// cartridgeInstanceInfo is an additional information about a running
+// instance.
+type cartridgeInstanceInfo struct {
+	uuid string
+	rw   bool
+	ictx running.InstanceCtx
+}
+
 // updateCartridgeInstance receives and updates an additional instance
 // information about the instance in the replicasets.
 func updateCartridgeInstance(evaler connector.Evaler,
@@ -795,6 +773,13 @@ func updateCartridgeInstance(evaler connector.Evaler,
 	if err != nil {
 		return replicasets, err
 	}
+	return setCartridgeInstanceInfo(uuid, rw, ictx, replicasets), nil
+}
+
+// setCartridgeInstanceInfo updates an additional instance information about
+// the instance in the replicasets.
+func setCartridgeInstanceInfo(uuid string, rw bool,
+	ictx *running.InstanceCtx, replicasets Replicasets) Replicasets {
 	for _, replicaset := range replicasets.Replicasets {
 		for i, _ := range replicaset.Instances {
 			if replicaset.Instances[i].UUID == uuid {
@@ -810,7 +795,7 @@ func updateCartridgeInstance(evaler connector.Evaler,
 			}
 		}
 	}
-	return replicasets, nil
+	return replicasets
 }
 
 // getCartridgeVersion returns the version of the cartridge.
@@ -0,0 +1,147 @@
+package replicaset
+
+import (
+	"fmt"
+	"slices"
+
+	"github.com/apex/log"
+	"github.com/mitchellh/mapstructure"
+
+	"github.com/tarantool/tt/cli/connector"
+)
+
+// cartridgeTopologyConfig describes replicasets in the clusterwide topology
+// config of the Cartridge application.
+type cartridgeTopologyConfig struct {
+	// Replicasets is a map of replicasets by UUID.
+	Replicasets map[string]cartridgeTopologyReplicaset
+}
+
+// cartridgeTopologyReplicaset describes a replicaset in the clusterwide
+// topology config of the Cartridge application.
+type cartridgeTopologyReplicaset struct {
+	Alias            string
+	Roles            []string
+	AllRW            bool `mapstructure:"all_rw"`
+	Weight           *float64
+	VshardGroup      *string  `mapstructure:"vshard_group"`
+	FailoverPriority []string `mapstructure:"failover_priority"`
+}
+
+// getCartridgeTopologyConfig returns the clusterwide topology config of
+// the Cartridge application.
+func getCartridgeTopologyConfig(evaler connector.Evaler) (cartridgeTopologyConfig, error) {
+	var topologyCfg cartridgeTopologyConfig
+	args := []any{}
+	opts := connector.RequestOpts{}
+	data, err := evaler.Eval(cartridgeGetTopologyConfigBody, args, opts)
+	if err != nil {
+		return topologyCfg, err
+	}
+	if len(data) != 1 {
+		return topologyCfg, fmt.Errorf("unexpected response: %v", data)
+	}
+	if err := mapstructure.Decode(data[0], &topologyCfg); err != nil {
+		return topologyCfg, fmt.Errorf("failed to parse a response: %w", err)
+	}
+	return topologyCfg, nil
+}
+
+// isCartridgeReplicasetChanged returns true if the edit options change
+// the replicaset in the topology config.
+func isCartridgeReplicasetChanged(opts cartridgeEditReplicasetsOpts,
+	replicaset cartridgeTopologyReplicaset) bool {
+	if len(opts.JoinServers) > 0 {
+		return true
+	}
+	if opts.Roles != nil {
+		roles := slices.Clone(opts.Roles)
+		slices.Sort(roles)
+		if !slices.Equal(slices.Compact(roles), replicaset.Roles) {
+			return true
+		}
+	}
+	if opts.AllRW != nil && *opts.AllRW != replicaset.AllRW {
+		return true
+	}
+	if opts.Weight != nil &&
+		(replicaset.Weight == nil || *opts.Weight != *replicaset.Weight) {
+		return true
+	}
+	if opts.VshardGroup != nil &&
+		(replicaset.VshardGroup == nil || *opts.VshardGroup != *replicaset.VshardGroup) {
+		return true
+	}
+	// The failover priority is kept if the configured one is its prefix.
+	priority := replicaset.FailoverPriority
+	return len(opts.FailoverPriority) > len(priority) ||
+		!slices.Equal(opts.FailoverPriority, priority[:len(opts.FailoverPriority)])
+}
+
+// planCartridgeReplicasets returns options to edit replicasets according to
+// the config. If some instance was not discovered, creates it. Replicasets
+// that already match the config are skipped, so the topology is edited only
+// if it differs from the config.
+func planCartridgeReplicasets(discovered Replicasets, topologyCfg cartridgeTopologyConfig,
+	replicasetCfg map[string]cartridgeReplicasetConfig,
+	instancesCfg map[string]cartridgeInstanceConfig) ([]cartridgeEditReplicasetsOpts, error) {
+	instanceUUID := map[string]string{}
+	replicasetUUID := map[string]string{}
+	for _, replicaset := range discovered.Replicasets {
+		replicasetUUID[replicaset.Alias] = replicaset.UUID
+		for _, instance := range replicaset.Instances {
+			instanceUUID[instance.Alias] = instance.UUID
+		}
+	}
+
+	// Sort replicasets to get the same plan for the same config.
+	replicasetNames := make([]string, 0, len(replicasetCfg))
+	for rname := range replicasetCfg {
+		replicasetNames = append(replicasetNames, rname)
+	}
+	slices.Sort(replicasetNames)
+
+	editOpts := []cartridgeEditReplicasetsOpts{}
+	for _, rname := range replicasetNames {
+		rcfg := replicasetCfg[rname]
+		replicasetName := rname
+		opts := cartridgeEditReplicasetsOpts{
+			Alias:       &replicasetName,
+			Roles:       rcfg.Roles,
+			AllRW:       rcfg.AllRW,
+			Weight:      rcfg.Weight,
+			VshardGroup: rcfg.VShardGroup,
+		}
+		uuid, found := replicasetUUID[replicasetName]
+		if found {
+			// Link opts to the existing replicaset.
+			// admin_edit_topology() recognizes replicasets by UUID.
+			opts.UUID = &uuid
+		}
+		var err error
+		opts.JoinServers, err = getCartridgeJoinServersOpts(instancesCfg,
+			rcfg.Instances, instanceUUID)
+		if err != nil {
+			return nil, err
+		}
+		var failoverPriority []string
+		for _, inst := range rcfg.Instances {
+			uuid, ok := instanceUUID[inst]
+			if !ok {
+				return nil, fmt.Errorf("instance %q uuid not found", inst)
+			}
+			failoverPriority = append(failoverPriority, uuid)
+		}
+		opts.FailoverPriority = failoverPriority
+
+		if found {
+			replicaset, ok := topologyCfg.Replicasets[uuid]
+			if ok && !isCartridgeReplicasetChanged(opts, replicaset) {
+				log.Debugf("Replicaset %q is up to date", replicasetName)
+				continue
+			}
+		}
+		editOpts = append(editOpts, opts)
+	}
+	return editOpts, nil
+}
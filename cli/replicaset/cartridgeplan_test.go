@@ -0,0 +1,235 @@
+package replicaset
+
+import (
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+
+	"github.com/tarantool/tt/cli/connector"
+)
+
+func newString(value string) *string {
+	return &value
+}
+
+func newFloat(value float64) *float64 {
+	return &value
+}
+
+var (
+	planInstancesCfg = map[string]cartridgeInstanceConfig{
+		"router":    {URI: "localhost:3301"},
+		"storage-1": {URI: "localhost:3302"},
+		"storage-2": {URI: "localhost:3303"},
+	}
+	planReplicasetsCfg = map[string]cartridgeReplicasetConfig{
+		"s": {
+			Instances: []string{"storage-1", "storage-2"},
+			Roles:     []string{"vshard-storage"},
+			Weight:    newFloat(1),
+		},
+		"r": {
+			Instances: []string{"router"},
+			Roles:     []string{"vshard-router", "app.roles.api"},
+		},
+	}
+	planDiscovered = Replicasets{
+		State: StateBootstrapped,
+		Replicasets: []Replicaset{
+			{
+				UUID:  "r-uuid",
+				Alias: "r",
+				Instances: []Instance{
+					{Alias: "router", UUID: "router-uuid"},
+				},
+			},
+			{
+				UUID:  "s-uuid",
+				Alias: "s",
+				Instances: []Instance{
+					{Alias: "storage-1", UUID: "storage-1-uuid"},
+					{Alias: "storage-2", UUID: "storage-2-uuid"},
+				},
+			},
+		},
+	}
+)
+
+func planTopologyCfg() cartridgeTopologyConfig {
+	return cartridgeTopologyConfig{
+		Replicasets: map[string]cartridgeTopologyReplicaset{
+			"r-uuid": {
+				Alias:            "r",
+				Roles:            []string{"app.roles.api", "vshard-router"},
+				FailoverPriority: []string{"router-uuid"},
+			},
+			"s-uuid": {
+				Alias:            "s",
+				Roles:            []string{"vshard-storage"},
+				Weight:           newFloat(1),
+				FailoverPriority: []string{"storage-1-uuid", "storage-2-uuid"},
+			},
+		},
+	}
+}
+
+func TestPlanCartridgeReplicasets_new(t *testing.T) {
+	editOpts, err := planCartridgeReplicasets(Replicasets{}, cartridgeTopologyConfig{},
+		planReplicasetsCfg, planInstancesCfg)
+	require.NoError(t, err)
+	require.Len(t, editOpts, 2)
+
+	// Replicasets are sorted by names.
+	assert.Equal(t, "r", *editOpts[0].Alias)
+	assert.Nil(t, editOpts[0].UUID)
+	require.Len(t, editOpts[0].JoinServers, 1)
+	assert.Equal(t, "localhost:3301", editOpts[0].JoinServers[0].URI)
+	assert.Equal(t, []string{*editOpts[0].JoinServers[0].UUID}, editOpts[0].FailoverPriority)
+
+	assert.Equal(t, "s", *editOpts[1].Alias)
+	require.Len(t, editOpts[1].JoinServers, 2)
+	assert.Equal(t, []string{
+		*editOpts[1].JoinServers[0].UUID,
+		*editOpts[1].JoinServers[1].UUID,
+	}, editOpts[1].FailoverPriority)
+}
+
+func TestPlanCartridgeReplicasets_up_to_date(t *testing.T) {
+	editOpts, err := planCartridgeReplicasets(planDiscovered, planTopologyCfg(),
+		planReplicasetsCfg, planInstancesCfg)
+	require.NoError(t, err)
+	assert.Empty(t, editOpts)
+}
+
+func TestPlanCartridgeReplicasets_changed(t *testing.T) {
+	cases := []struct {
+		name   string
+		change func(cfg *cartridgeTopologyConfig)
+	}{
+		{
+			name: "roles",
+			change: func(cfg *cartridgeTopologyConfig) {
+				replicaset := cfg.Replicasets["s-uuid"]
+				replicaset.Roles = []string{"vshard-storage", "metrics"}
+				cfg.Replicasets["s-uuid"] = replicaset
+			},
+		},
+		{
+			name: "weight",
+			change: func(cfg *cartridgeTopologyConfig) {
+				replicaset := cfg.Replicasets["s-uuid"]
+				replicaset.Weight = newFloat(0)
+				cfg.Replicasets["s-uuid"] = replicaset
+			},
+		},
+		{
+			name: "failover_priority",
+			change: func(cfg *cartridgeTopologyConfig) {
+				replicaset := cfg.Replicasets["s-uuid"]
+				replicaset.FailoverPriority = []string{"storage-2-uuid", "storage-1-uuid"}
+				cfg.Replicasets["s-uuid"] = replicaset
+			},
+		},
+		{
+			name: "missed",
+			change: func(cfg *cartridgeTopologyConfig) {
+				delete(cfg.Replicasets, "s-uuid")
+			},
+		},
+	}
+
+	for _, tc := range cases {
+		t.Run(tc.name, func(t *testing.T) {
+			topologyCfg := planTopologyCfg()
+			tc.change(&topologyCfg)
+			editOpts, err := planCartridgeReplicasets(planDiscovered, topologyCfg,
+				planReplicasetsCfg, planInstancesCfg)
+			require.NoError(t, err)
+			require.Len(t, editOpts, 1)
+			assert.Equal(t, "s-uuid", *editOpts[0].UUID)
+			assert.Empty(t, editOpts[0].JoinServers)
+			assert.Equal(t, []string{"storage-1-uuid", "storage-2-uuid"},
+				editOpts[0].FailoverPriority)
+		})
+	}
+}
+
+func TestPlanCartridgeReplicasets_join(t *testing.T) {
+	discovered := Replicasets{
+		State: StateBootstrapped,
+		Replicasets: []Replicaset{
+			planDiscovered.Replicasets[0],
+			{
+				UUID:      "s-uuid",
+				Alias:     "s",
+				Instances: planDiscovered.Replicasets[1].Instances[:1],
+			},
+		},
+	}
+	topologyCfg := planTopologyCfg()
+	replicaset := topologyCfg.Replicasets["s-uuid"]
+	replicaset.FailoverPriority = []string{"storage-1-uuid"}
+	topologyCfg.Replicasets["s-uuid"] = replicaset
+
+	editOpts, err := planCartridgeReplicasets(discovered, topologyCfg,
+		planReplicasetsCfg, planInstancesCfg)
+	require.NoError(t, err)
+	require.Len(t, editOpts, 1)
+	assert.Equal(t, "s-uuid", *editOpts[0].UUID)
+	require.Len(t, editOpts[0].JoinServers, 1)
+	assert.Equal(t, "localhost:3303", editOpts[0].JoinServers[0].URI)
+	assert.Equal(t, []string{"storage-1-uuid", *editOpts[0].JoinServers[0].UUID},
+		editOpts[0].FailoverPriority)
+}
+
+func TestPlanCartridgeReplicasets_priority_prefix(t *testing.T) {
+	replicasetsCfg := map[string]cartridgeReplicasetConfig{
+		"s": {Instances: []string{"storage-1"}},
+	}
+	editOpts, err := planCartridgeReplicasets(planDiscovered, planTopologyCfg(),
+		replicasetsCfg, planInstancesCfg)
+	require.NoError(t, err)
+	assert.Empty(t, editOpts)
+}
+
+func TestPlanCartridgeReplicasets_error(t *testing.T) {
+	replicasetsCfg := map[string]cartridgeReplicasetConfig{
+		"s": {Instances: []string{"unknown"}},
+	}
+	_, err := planCartridgeReplicasets(Replicasets{}, cartridgeTopologyConfig{},
+		replicasetsCfg, planInstancesCfg)
+	assert.EqualError(t, err, `instance "unknown" not found in the instance config`)
+}
+
+func TestGetCartridgeTopologyConfig(t *testing.T) {
+	evaler := EvalFunc(func(_ string, _ []any, _ connector.RequestOpts) ([]any, error) {
+		return []any{map[any]any{
+			"replicasets": map[any]any{
+				"s-uuid": map[any]any{
+					"alias":             "s",
+					"roles":             []any{"vshard-storage"},
+					"all_rw":            true,
+					"weight":            int8(2),
+					"vshard_group":      "hot",
+					"failover_priority": []any{"storage-1-uuid"},
+				},
+			},
+		}}, nil
+	})
+
+	topologyCfg, err := getCartridgeTopologyConfig(evaler)
+	require.NoError(t, err)
+	assert.Equal(t, cartridgeTopologyConfig{
+		Replicasets: map[string]cartridgeTopologyReplicaset{
+			"s-uuid": {
+				Alias:            "s",
+				Roles:            []string{"vshard-storage"},
+				AllRW:            true,
+				Weight:           newFloat(2),
+				VshardGroup:      newString("hot"),
+				FailoverPriority: []string{"storage-1-uuid"},
+			},
+		},
+	}, topologyCfg)
+}
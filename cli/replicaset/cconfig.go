@@ -5,6 +5,7 @@ import (
 	"errors"
 	"fmt"
 	"strings"
+	"time"
 
 	"github.com/apex/log"
 	"github.com/mitchellh/mapstructure"
@@ -29,6 +30,11 @@ var (
 	cconfigGetShardingRolesBody = "return require('config'):get().sharding.roles"
 )
 
+// cconfigReloadTimeout is a timeout of the cluster config reload on
+// an instance. It does not depend on the command timeout, because the reload
+// could take a long time.
+var cconfigReloadTimeout = time.Minute
+
 // cconfigTopology used to export topology information from a Tarantool
 // instance with the centralized config orchestrator.
 type cconfigTopology struct {
@@ -168,13 +174,11 @@ func NewCConfigApplication(
 // discovery returns a replicasets topology for an application with
 // the centralized config orchestrator.
 func (c *CConfigApplication) discovery() (Replicasets, error) {
-	var topologies []cconfigTopology
-
-	err := EvalForeachAlive(c.runningCtx.Instances, InstanceEvalFunc(
-		func(ictx running.InstanceCtx, evaler connector.Evaler) (bool, error) {
+	topologies, err := EvalForeachAliveParallel(c.runningCtx.Instances,
+		func(ictx running.InstanceCtx, evaler connector.Evaler) (cconfigTopology, error) {
 			topology, err := getCConfigInstanceTopology(evaler)
 			if err != nil {
-				return true, err
+				return topology, err
 			}
 			for i, _ := range topology.Instances {
 				if topology.Instances[i].UUID == topology.InstanceUUID {
@@ -182,10 +186,8 @@ func (c *CConfigApplication) discovery() (Replicasets, error) {
 					topology.Instances[i].InstanceCtxFound = true
 				}
 			}
-
-			topologies = append(topologies, topology)
-			return false, nil
-		}))
+			return topology, nil
+		})
 	if err != nil {
 		return Replicasets{}, err
 	}
@@ -239,7 +241,7 @@ func (c *CConfigApplication) Expel(ctx ExpelCtx) error {
 	isConfigPublished, err := c.expel(targetInstance.InstanceCtx, ctx.InstName)
 	// Check the config was published.
 	if isConfigPublished {
-		err = errors.Join(err, reloadCConfig(instances))
+		err = errors.Join(err, reloadCConfig(directConnector{}, instances))
 	}
 	return err
 }
@@ -379,10 +381,12 @@ func (c *CConfigApplication) Promote(ctx PromoteCtx) error {
 		log.Warn(msg)
 	}
 
-	isConfigPublished, err := c.promote(targetInstance, ctx)
+	conns := newConnCache()
+	defer conns.close()
+	isConfigPublished, err := c.promote(conns, targetInstance, ctx)
 	// Check the config was published.
 	if isConfigPublished {
-		err = errors.Join(err, reloadCConfig(instances))
+		err = errors.Join(err, reloadCConfig(conns, instances))
 	}
 	return err
 }
@@ -418,10 +422,12 @@ func (c *CConfigApplication) Demote(ctx DemoteCtx) error {
 		log.Warn(msg)
 	}
 
-	isConfigPublished, err := c.demote(targetInstance, targetReplicaset, ctx)
+	conns := newConnCache()
+	defer conns.close()
+	isConfigPublished, err := c.demote(conns, targetInstance, targetReplicaset, ctx)
 	// Check the config was published.
 	if isConfigPublished {
-		err = errors.Join(err, reloadCConfig(instances))
+		err = errors.Join(err, reloadCConfig(conns, instances))
 	}
 	return err
 }
@@ -479,6 +485,19 @@ func (c *CConfigApplication) RolesChange(ctx RolesChangeCtx,
 	if err != nil {
 		return fmt.Errorf("failed to get replicasets: %w", err)
 	}
+	if len(c.runningCtx.Instances) == 0 {
+		return fmt.Errorf("there are no running instances")
+	}
+	clusterCfgPath := c.runningCtx.Instances[0].ClusterConfigPath
+	clusterCfg, err := cluster.GetClusterConfig(
+		libcluster.NewCollectorFactory(c.collectors), clusterCfgPath)
+	if err != nil {
+		return fmt.Errorf("failed to get cluster config: %w", err)
+	}
+	paths, err := getCConfigRolesPath(clusterCfg, ctx)
+	if err != nil {
+		return err
+	}
 
 	var (
 		instances []running.InstanceCtx
@@ -501,7 +520,12 @@ func (c *CConfigApplication) RolesChange(ctx RolesChangeCtx,
 			instances = append(instances, inst.InstanceCtx)
 		}
 	} else {
+		affected, onlyAffected := getCConfigAffectedReplicasets(clusterCfg, paths)
+		onlyAffected = onlyAffected && ctx.ReloadAffectedOnly
 		for _, r := range c.replicasets.Replicasets {
+			if onlyAffected && !affected[r.Alias] {
+				continue
+			}
 			for _, i := range r.Instances {
 				if !i.InstanceCtxFound {
 					unfound = append(unfound, i.Alias)
@@ -519,9 +543,10 @@ func (c *CConfigApplication) RolesChange(ctx RolesChangeCtx,
 		log.Warn(msg)
 	}
 
-	isConfigPublished, err := c.rolesChange(ctx, changeRoleAction)
+	isConfigPublished, err := c.rolesChange(clusterCfgPath, clusterCfg, paths, ctx,
+		changeRoleAction)
 	if isConfigPublished {
-		err = errors.Join(err, reloadCConfig(instances))
+		err = errors.Join(err, reloadCConfig(directConnector{}, instances))
 	}
 	return err
 }
@@ -572,22 +597,36 @@ func cconfigGetShardingRoles(evaler connector.Evaler) ([]string, error) {
 	return ret, nil
 }
 
-// reloadCConfig reloads a cluster config on the several instances.
-func reloadCConfig(instances []running.InstanceCtx) error {
-	errored := []string{}
-	eval := func(instance running.InstanceCtx, evaler connector.Evaler) (bool, error) {
+// reloadCConfig reloads a cluster config on the several instances
+// concurrently. The reload is tried on all the instances even if it fails on
+// some of them.
+func reloadCConfig(conns instanceConnector, instances []running.InstanceCtx) error {
+	if len(instances) == 0 {
+		return fmt.Errorf("failed to reload instances configuration" +
+			", please try to do it manually with `require('config'):reload()`" +
+			": no instances to connect")
+	}
+	reload := func(_ running.InstanceCtx, evaler connector.Evaler) (struct{}, error) {
 		args := []any{}
-		opts := connector.RequestOpts{}
+		opts := connector.RequestOpts{ReadTimeout: cconfigReloadTimeout}
 		_, err := evaler.Eval("require('config'):reload()", args, opts)
-		if err != nil {
-			fmt.Println(err)
-			errored = append(errored, instance.InstName)
-		}
-		return false, nil
+		return struct{}{}, err
 	}
-	if err := EvalForeach(instances, InstanceEvalFunc(eval)); err != nil {
-		return fmt.Errorf("failed to reload instances configuration"+
-			", please try to do it manually with `require('config'):reload()`: %w", err)
+	// The connection is released with an error of the reload, so a connection
+	// with a late response is not reused.
+	results := evalInstancesParallel(conns, instances, reload, false, false)
+	errored := []string{}
+	for i, result := range results {
+		if result.err == nil {
+			continue
+		}
+		if !result.connected {
+			return fmt.Errorf("failed to reload instances configuration"+
+				", please try to do it manually with `require('config'):reload()`: %w",
+				result.err)
+		}
+		fmt.Println(result.err)
+		errored = append(errored, instances[i].InstName)
 	}
 	if len(errored) > 0 {
 		return fmt.Errorf("failed to reload instance configuration for: %s, "+
@@ -599,7 +638,7 @@ func reloadCConfig(instances []running.InstanceCtx) error {
 
 // promote promotes an instance in the application and returns true
 // if the instance config was published.
-func (c *CConfigApplication) promote(instance Instance,
+func (c *CConfigApplication) promote(conns instanceConnector, instance Instance,
 	ctx PromoteCtx) (wasConfigPublished bool, err error) {
 	cluterCfgPath := instance.InstanceCtx.ClusterConfigPath
 	clusterCfg, err := cluster.GetClusterConfig(
@@ -617,7 +656,7 @@ func (c *CConfigApplication) promote(instance Instance,
 		eval := func(_ running.InstanceCtx, evaler connector.Evaler) (bool, error) {
 			return true, cconfigPromoteElection(evaler, ctx.Timeout)
 		}
-		err := EvalAny([]running.InstanceCtx{instance.InstanceCtx}, InstanceEvalFunc(eval))
+		err := evalAny(conns, []running.InstanceCtx{instance.InstanceCtx}, InstanceEvalFunc(eval))
 		return false, err
 	}
 
@@ -637,7 +676,7 @@ func (c *CConfigApplication) promote(instance Instance,
 
 // demote demotes an instance in the application and returns true
 // if the instance config was published.
-func (c *CConfigApplication) demote(instance Instance,
+func (c *CConfigApplication) demote(conns instanceConnector, instance Instance,
 	replicaset Replicaset, ctx DemoteCtx) (wasConfigPublished bool, err error) {
 	cluterCfgPath := instance.InstanceCtx.ClusterConfigPath
 	clusterCfg, err := cluster.GetClusterConfig(libcluster.NewCollectorFactory(c.collectors),
@@ -664,7 +703,7 @@ func (c *CConfigApplication) demote(instance Instance,
 			return false,
 				fmt.Errorf("an instance must be the leader of the replicaset to demote it")
 		}
-		return c.demoteElection(instance.InstanceCtx, cconfigInstance, ctx.Timeout)
+		return c.demoteElection(conns, instance.InstanceCtx, cconfigInstance, ctx.Timeout)
 	}
 
 	err = patchLocalCConfig(
@@ -712,7 +751,8 @@ func (c *CConfigApplication) expel(instance running.InstanceCtx, name string) (b
 
 // demoteElection demotes an instance in the replicaset with "election" failover.
 // https://github.com/tarantool/tarantool/issues/9855
-func (c *CConfigApplication) demoteElection(instanceCtx running.InstanceCtx,
+func (c *CConfigApplication) demoteElection(conns instanceConnector,
+	instanceCtx running.InstanceCtx,
 	cconfigInstance cconfigInstance, timeout int) (wasConfigPublished bool, err error) {
 	// Set election_mode: "voter" on the target instance.
 	err = patchLocalCConfig(
@@ -728,7 +768,7 @@ func (c *CConfigApplication) demoteElection(instanceCtx running.InstanceCtx,
 	}
 
 	wasConfigPublished = true
-	if err = reloadCConfig([]running.InstanceCtx{instanceCtx}); err != nil {
+	if err = reloadCConfig(conns, []running.InstanceCtx{instanceCtx}); err != nil {
 		return
 	}
 	// Wait until an other instance is not elected.
@@ -736,7 +776,7 @@ func (c *CConfigApplication) demoteElection(instanceCtx running.InstanceCtx,
 		evaler connector.Evaler) (bool, error) {
 		return true, waitRO(evaler, timeout)
 	}
-	err = EvalAny([]running.InstanceCtx{instanceCtx}, InstanceEvalFunc(evalWaitRo))
+	err = evalAny(conns, []running.InstanceCtx{instanceCtx}, InstanceEvalFunc(evalWaitRo))
 	if err != nil {
 		return
 	}
@@ -752,23 +792,9 @@ func (c *CConfigApplication) demoteElection(instanceCtx running.InstanceCtx,
 	return
 }
 
-func (c *CConfigApplication) rolesChange(ctx RolesChangeCtx,
+func (c *CConfigApplication) rolesChange(clusterCfgPath string,
+	clusterCfg libcluster.ClusterConfig, paths []path, ctx RolesChangeCtx,
 	action RolesChangerAction) (bool, error) {
-	if len(c.runningCtx.Instances) == 0 {
-		return false, fmt.Errorf("there are no running instances")
-	}
-	clusterCfgPath := c.runningCtx.Instances[0].ClusterConfigPath
-	clusterCfg, err := cluster.GetClusterConfig(
-		libcluster.NewCollectorFactory(c.collectors), clusterCfgPath)
-	if err != nil {
-		return false, fmt.Errorf("failed to get cluster config: %w", err)
-	}
-
-	paths, err := getCConfigRolesPath(clusterCfg, ctx)
-	if err != nil {
-		return false, err
-	}
-
 	pRoleTarget := make([]patchRoleTarget, 0, len(paths))
 	for _, path := range paths {
 		value, err := clusterCfg.RawConfig.Get(path.path)
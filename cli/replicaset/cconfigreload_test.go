@@ -0,0 +1,155 @@
+package replicaset
+
+import (
+	"testing"
+	"time"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+
+	"github.com/tarantool/tt/cli/running"
+	libcluster "github.com/tarantool/tt/lib/cluster"
+)
+
+func TestReloadCConfig_parallel(t *testing.T) {
+	const (
+		count = 4
+		delay = 200 * time.Millisecond
+	)
+	instances := []running.InstanceCtx{}
+	for i := 0; i < count; i++ {
+		server := startConsoleServer(t)
+		server.setDelay(delay)
+		instances = append(instances, server.instance())
+	}
+
+	start := time.Now()
+	require.NoError(t, reloadCConfig(directConnector{}, instances))
+	assert.Less(t, time.Since(start), count*delay)
+}
+
+func TestReloadCConfig_connect_error(t *testing.T) {
+	instances := []running.InstanceCtx{
+		startConsoleServer(t).instance(),
+		{AppName: "app", InstName: "unreachable", ConsoleSocket: "unreachable.sock"},
+	}
+	err := reloadCConfig(directConnector{}, instances)
+	assert.ErrorContains(t, err, "failed to reload instances configuration")
+	assert.ErrorContains(t, err, "failed to connect to 'app:unreachable'")
+}
+
+func TestReloadCConfig_failed(t *testing.T) {
+	servers := []*consoleServer{startConsoleServer(t), startConsoleServer(t)}
+	servers[1].setFail(true)
+	instances := []running.InstanceCtx{servers[0].instance(), servers[1].instance()}
+	instances[1].InstName = "failed"
+	conns := newConnCache()
+	defer conns.close()
+
+	err := reloadCConfig(conns, instances)
+	assert.ErrorContains(t, err, "failed to reload instance configuration for: failed")
+	// The connection of the failed instance is not reused.
+	assert.Len(t, conns.conns, 1)
+	require.Eventually(t, func() bool {
+		_, open := servers[1].stats()
+		return open == 0
+	}, time.Second, 10*time.Millisecond)
+}
+
+func TestReloadCConfig_timeout(t *testing.T) {
+	reloadTimeout := cconfigReloadTimeout
+	cconfigReloadTimeout = 100 * time.Millisecond
+	t.Cleanup(func() { cconfigReloadTimeout = reloadTimeout })
+
+	server := startConsoleServer(t)
+	server.setDelay(300 * time.Millisecond)
+	instances := []running.InstanceCtx{server.instance()}
+	conns := newConnCache()
+	defer conns.close()
+
+	err := reloadCConfig(conns, instances)
+	assert.ErrorContains(t, err, "failed to reload instance configuration for: inst")
+
+	// A late response to the timed out reload is not read by the next one.
+	server.setDelay(0)
+	server.setFail(true)
+	err = reloadCConfig(conns, instances)
+	assert.ErrorContains(t, err, "failed to reload instance configuration for: inst")
+	connected, _ := server.stats()
+	assert.Equal(t, 2, connected)
+}
+
+func TestGetCConfigAffectedReplicasets(t *testing.T) {
+	clusterCfg := libcluster.ClusterConfig{
+		Groups: map[string]libcluster.GroupConfig{
+			"routers": {
+				Replicasets: map[string]libcluster.ReplicasetConfig{
+					"r-001": {},
+				},
+			},
+			"storages": {
+				Replicasets: map[string]libcluster.ReplicasetConfig{
+					"s-001": {},
+					"s-002": {},
+				},
+			},
+		},
+	}
+
+	cases := []struct {
+		name     string
+		paths    [][]string
+		affected map[string]bool
+		only     bool
+	}{
+		{
+			name:  "global",
+			paths: [][]string{{"roles"}},
+		},
+		{
+			name:     "group",
+			paths:    [][]string{{"groups", "storages", "roles"}},
+			affected: map[string]bool{"s-001": true, "s-002": true},
+			only:     true,
+		},
+		{
+			name: "replicaset",
+			paths: [][]string{
+				{"groups", "storages", "replicasets", "s-002", "roles"},
+			},
+			affected: map[string]bool{"s-002": true},
+			only:     true,
+		},
+		{
+			name: "instance_and_replicaset",
+			paths: [][]string{
+				{"groups", "routers", "replicasets", "r-001", "instances", "r", "roles"},
+				{"groups", "storages", "replicasets", "s-001", "roles"},
+			},
+			affected: map[string]bool{"r-001": true, "s-001": true},
+			only:     true,
+		},
+		{
+			name: "group_and_global",
+			paths: [][]string{
+				{"groups", "routers", "roles"},
+				{"roles"},
+			},
+		},
+		{
+			name:  "unknown_group",
+			paths: [][]string{{"groups", "unknown", "roles"}},
+		},
+	}
+	for _, tc := range cases {
+		t.Run(tc.name, func(t *testing.T) {
+			paths := []path{}
+			for _, p := range tc.paths {
+				paths = append(paths, path{path: p, depth: len(p) - 1})
+			}
+			affected, only := getCConfigAffectedReplicasets(clusterCfg, paths)
+			assert.Equal(t, tc.only, only)
+			assert.Equal(t, tc.affected, affected)
+		})
+	}
+}
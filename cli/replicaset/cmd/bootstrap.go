@@ -51,6 +51,7 @@ func Bootstrap(ctx BootstapCtx) error {
 	if err != nil {
 		return err
 	}
+	defer invalidateTopologyCache(ctx.RunningCtx)
 
 	err = orchestrator.Bootstrap(replicaset.BootstrapCtx{
 		ReplicasetsFile: ctx.ReplicasetsFile,
@@ -2,7 +2,9 @@ package replicasetcmd
 
 import (
 	"fmt"
+	"time"
 
+	"github.com/apex/log"
 	"github.com/tarantool/tt/cli/connector"
 	"github.com/tarantool/tt/cli/replicaset"
 	"github.com/tarantool/tt/cli/running"
@@ -48,6 +50,28 @@ func makeApplicationOrchestrator(
 	return orchestrator, err
 }
 
+// topologyCacher is an orchestrator with an on-disk topology cache.
+type topologyCacher interface {
+	UseTopologyCache(runningCtx running.RunningCtx, ttl time.Duration)
+}
+
+// enableTopologyCache enables the on-disk topology cache of the application
+// orchestrator if the TTL is positive.
+func enableTopologyCache(orchestrator replicasetOrchestrator,
+	runningCtx running.RunningCtx, ttl time.Duration) {
+	if cacher, ok := orchestrator.(topologyCacher); ok && ttl > 0 {
+		cacher.UseTopologyCache(runningCtx, ttl)
+	}
+}
+
+// invalidateTopologyCache removes the on-disk topology cache of
+// the application after changes of the topology.
+func invalidateTopologyCache(runningCtx running.RunningCtx) {
+	if err := replicaset.RemoveTopologyCache(runningCtx); err != nil {
+		log.Warn(err.Error())
+	}
+}
+
 // makeInstanceOrchestrator creates an orchestrator for the single instance.
 func makeInstanceOrchestrator(orchestratorType replicaset.Orchestrator,
 	conn connector.Connector) (replicasetOrchestrator, error) {
@@ -43,6 +43,7 @@ func Demote(ctx DemoteCtx) error {
 	if err != nil {
 		return err
 	}
+	defer invalidateTopologyCache(ctx.RunningCtx)
 
 	log.Info("Discovery application...")
 	fmt.Println()
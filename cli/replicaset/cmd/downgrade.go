@@ -110,23 +110,5 @@ func downgradeReplicaset(replicaset replicaset.Replicaset, lsnTimeout int, versi
 	}
 
 	// Downgrade replica instances.
-	masterLSN := downgradeInfo.LSN
-	masterIID := downgradeInfo.IID
-
-	for _, replica := range replicas {
-		fullReplicaName := running.GetAppInstanceName(replica.run)
-		err := waitLSN(replica.conn, masterIID, masterLSN, lsnTimeout)
-		if err != nil {
-			return fmt.Errorf("can't ensure that downgrade operations performed on "+
-				"%s are replicated to %s to perform snapshotting on it: error "+
-				"waiting LSN %d in vclock component %d: %w",
-				running.GetAppInstanceName(master.run), fullReplicaName,
-				masterLSN, masterIID, err)
-		}
-		err = snapshot(&replica)
-		if err != nil {
-			return err
-		}
-	}
-	return nil
+	return syncReplicas(master, replicas, downgradeInfo, lsnTimeout, "downgrade")
 }
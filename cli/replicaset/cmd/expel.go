@@ -43,6 +43,7 @@ func Expel(expelCtx ExpelCtx) error {
 	if err != nil {
 		return err
 	}
+	defer invalidateTopologyCache(expelCtx.RunningCtx)
 
 	log.Info("Discovery application...")
 	fmt.Println("")
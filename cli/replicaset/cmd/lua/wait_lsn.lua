@@ -0,0 +1,18 @@
+local iid, lsn, timeout = ...
+local fiber = require('fiber')
+
+local deadline = fiber.clock() + timeout
+local delay = 0.001
+while true do
+    local current = box.info.vclock[iid] or 0
+    if current >= lsn then
+        return current
+    end
+    local now = fiber.clock()
+    if now >= deadline then
+        error(string.format('current LSN %s is behind required master LSN %s',
+            current, lsn), 0)
+    end
+    fiber.sleep(math.min(delay, deadline - now))
+    delay = math.min(delay * 2, 0.1)
+end
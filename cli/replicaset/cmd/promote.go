@@ -47,6 +47,7 @@ func Promote(ctx PromoteCtx) error {
 			orchestratorType, ctx.RunningCtx, ctx.Collectors, ctx.Publishers); err != nil {
 			return err
 		}
+		defer invalidateTopologyCache(ctx.RunningCtx)
 	} else {
 		if orchestrator, err = makeInstanceOrchestrator(orchestratorType, ctx.Conn); err != nil {
 			return err
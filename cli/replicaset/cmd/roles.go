@@ -40,6 +40,9 @@ type RolesChangeCtx struct {
 	// Timeout describes a timeout in seconds.
 	// We keep int as it can be passed to the target instance.
 	Timeout int
+	// ReloadAffectedOnly is true if the config should be reloaded only on
+	// instances of replicasets affected by the change.
+	ReloadAffectedOnly bool
 }
 
 // RolesChange adds/removes role with provided path target to config.
@@ -62,6 +65,7 @@ func RolesChange(ctx RolesChangeCtx, changeRoleAction replicaset.RolesChangerAct
 			orchestratorType, ctx.RunningCtx, ctx.Collectors, ctx.Publishers); err != nil {
 			return err
 		}
+		defer invalidateTopologyCache(ctx.RunningCtx)
 	} else {
 		if orchestrator, err = makeInstanceOrchestrator(orchestratorType, ctx.Conn); err != nil {
 			return err
@@ -113,13 +117,14 @@ func RolesChange(ctx RolesChangeCtx, changeRoleAction replicaset.RolesChangerAct
 	}
 
 	err = orchestrator.RolesChange(replicaset.RolesChangeCtx{
-		InstName:       ctx.InstName,
-		GroupName:      ctx.GroupName,
-		ReplicasetName: ctx.ReplicasetName,
-		IsGlobal:       ctx.IsGlobal,
-		RoleName:       ctx.RoleName,
-		Force:          ctx.Force,
-		Timeout:        ctx.Timeout,
+		InstName:           ctx.InstName,
+		GroupName:          ctx.GroupName,
+		ReplicasetName:     ctx.ReplicasetName,
+		IsGlobal:           ctx.IsGlobal,
+		RoleName:           ctx.RoleName,
+		Force:              ctx.Force,
+		Timeout:            ctx.Timeout,
+		ReloadAffectedOnly: ctx.ReloadAffectedOnly,
 	}, changeRoleAction)
 	if err == nil {
 		log.Info("Done.")
@@ -4,6 +4,7 @@ import (
 	"fmt"
 	"sort"
 	"strings"
+	"time"
 
 	"github.com/tarantool/tt/cli/connector"
 	"github.com/tarantool/tt/cli/replicaset"
@@ -20,6 +21,9 @@ type DiscoveryCtx struct {
 	Conn connector.Connector
 	// Orchestrator is a forced orchestrator choice.
 	Orchestrator replicaset.Orchestrator
+	// TopologyCacheTTL is a TTL of the on-disk topology cache of
+	// the application. The cache is disabled if it is not positive.
+	TopologyCacheTTL time.Duration
 }
 
 // getReplicasets discovers and returns the list of replicasets.
@@ -33,6 +37,9 @@ func getReplicasets(ctx DiscoveryCtx) (replicaset.Replicasets, error) {
 	if ctx.IsApplication {
 		orchestrator, err = makeApplicationOrchestrator(orchestratorType,
 			ctx.RunningCtx, nil, nil)
+		if err == nil {
+			enableTopologyCache(orchestrator, ctx.RunningCtx, ctx.TopologyCacheTTL)
+		}
 	} else {
 		orchestrator, err = makeInstanceOrchestrator(orchestratorType, ctx.Conn)
 	}
@@ -41,7 +48,7 @@ func getReplicasets(ctx DiscoveryCtx) (replicaset.Replicasets, error) {
 		return replicaset.Replicasets{}, err
 	}
 
-	return orchestrator.Discovery(replicaset.SkipCache)
+	return orchestrator.Discovery(replicaset.UseCache)
 }
 
 // Status shows a replicaset status.
@@ -4,7 +4,7 @@ import (
 	_ "embed"
 	"errors"
 	"fmt"
-	"time"
+	"sync"
 
 	"github.com/mitchellh/mapstructure"
 	"github.com/tarantool/tt/cli/connector"
@@ -18,6 +18,9 @@ type UpgradeOpts struct {
 	ChosenReplicasetAliases []string
 	// Timeout period (in seconds) for waiting on LSN synchronization.
 	LsnTimeout int
+	// Parallel is a maximum count of replicasets upgraded concurrently.
+	// Replicasets are upgraded one by one if it is not positive.
+	Parallel int
 }
 
 type instanceMeta struct {
@@ -28,6 +31,9 @@ type instanceMeta struct {
 //go:embed lua/upgrade.lua
 var upgradeMasterLua string
 
+//go:embed lua/wait_lsn.lua
+var waitLSNLua string
+
 type syncInfo struct {
 	LSN uint64  `mapstructure:"lsn"`
 	IID uint32  `mapstructure:"iid"`
@@ -75,20 +81,47 @@ func Upgrade(discoveryCtx DiscoveryCtx, opts UpgradeOpts, connOpts connector.Con
 		return err
 	}
 
-	return internalUpgrade(replicasetsToUpgrade, opts.LsnTimeout, connOpts)
+	return internalUpgrade(replicasetsToUpgrade, opts.LsnTimeout, opts.Parallel, connOpts)
 }
 
-func internalUpgrade(replicasets []replicaset.Replicaset, lsnTimeout int,
+// internalUpgrade upgrades up to parallel replicasets concurrently. A failed
+// replicaset does not stop upgrading of others, errors of all failed
+// replicasets are returned. Results are printed in the order of replicasets.
+func internalUpgrade(replicasets []replicaset.Replicaset, lsnTimeout int, parallel int,
 	connOpts connector.ConnectOpts) error {
-	for _, replicaset := range replicasets {
-		err := upgradeReplicaset(replicaset, lsnTimeout, connOpts)
-		if err != nil {
-			fmt.Printf("• %s: error\n", replicaset.Alias)
-			return fmt.Errorf("replicaset %s: %w", replicaset.Alias, err)
-		}
-		fmt.Printf("• %s: ok\n", replicaset.Alias)
+	parallel = max(parallel, 1)
+	errs := make([]error, len(replicasets))
+	done := make([]bool, len(replicasets))
+	printed := 0
+	var (
+		wg    sync.WaitGroup
+		mutex sync.Mutex
+	)
+	sem := make(chan struct{}, parallel)
+	for i := range replicasets {
+		sem <- struct{}{}
+		wg.Add(1)
+		go func(i int) {
+			defer wg.Done()
+			err := upgradeReplicaset(replicasets[i], lsnTimeout, connOpts)
+			<-sem
+
+			mutex.Lock()
+			defer mutex.Unlock()
+			errs[i], done[i] = err, true
+			for ; printed < len(replicasets) && done[printed]; printed++ {
+				alias := replicasets[printed].Alias
+				if errs[printed] != nil {
+					fmt.Printf("• %s: error\n", alias)
+					errs[printed] = fmt.Errorf("replicaset %s: %w", alias, errs[printed])
+				} else {
+					fmt.Printf("• %s: ok\n", alias)
+				}
+			}
+		}(i)
 	}
-	return nil
+	wg.Wait()
+	return errors.Join(errs...)
 }
 
 func closeConnectors(master *instanceMeta, replicas []instanceMeta) {
@@ -180,37 +213,13 @@ func collectRWROInfo(replset replicaset.Replicaset,
 	return master, replicas, nil
 }
 
+// waitLSN waits until the vclock component of the master on the instance
+// reaches the master LSN. The instance checks the vclock itself with
+// an exponential backoff, so it returns as soon as the LSN is replicated.
 func waitLSN(conn connector.Connector, masterIID uint32, masterLSN uint64, lsnTimeout int) error {
-	var lastError error
-	query := fmt.Sprintf("return box.info.vclock[%d]", masterIID)
-
-	deadline := time.Now().Add(time.Duration(lsnTimeout) * time.Second)
-	for {
-		res, err := conn.Eval(query, []any{}, connector.RequestOpts{})
-		if err != nil {
-			lastError = fmt.Errorf("failed to evaluate LSN query: %w", err)
-		} else if len(res) == 0 {
-			lastError = errors.New("empty result from LSN query")
-		} else {
-			var lsn uint64
-			if err := mapstructure.Decode(res[0], &lsn); err != nil {
-				lastError = fmt.Errorf("failed to decode LSN: %w", err)
-			} else if lsn >= masterLSN {
-				return nil
-			} else {
-				lastError = fmt.Errorf("current LSN %d is behind required "+
-					"master LSN %d", lsn, masterLSN)
-			}
-		}
-
-		if time.Now().After(deadline) {
-			break
-		}
-
-		time.Sleep(1 * time.Second)
-	}
-
-	return lastError
+	_, err := conn.Eval(waitLSNLua, []any{masterIID, masterLSN, lsnTimeout},
+		connector.RequestOpts{})
+	return err
 }
 
 func upgradeMaster(master *instanceMeta) (syncInfo, error) {
@@ -271,23 +280,33 @@ func upgradeReplicaset(replicaset replicaset.Replicaset, lsnTimeout int,
 	}
 
 	// Upgrade replica instances.
-	masterLSN := upgradeInfo.LSN
-	masterIID := upgradeInfo.IID
+	return syncReplicas(master, replicas, upgradeInfo, lsnTimeout, "upgrade")
+}
 
-	for _, replica := range replicas {
-		fullReplicaName := running.GetAppInstanceName(replica.run)
-		err := waitLSN(replica.conn, masterIID, masterLSN, lsnTimeout)
-		if err != nil {
-			return fmt.Errorf("can't ensure that upgrade operations performed on %s "+
-				"are replicated to %s to perform snapshotting on it: error "+
-				"waiting LSN %d in vclock component %d: %w",
-				running.GetAppInstanceName(master.run), fullReplicaName,
-				masterLSN, masterIID, err)
-		}
-		err = snapshot(&replica)
-		if err != nil {
-			return err
-		}
+// syncReplicas concurrently waits until the operation performed on the master
+// is replicated to the replicas and makes snapshots on them. Errors of all
+// replicas are returned.
+func syncReplicas(master *instanceMeta, replicas []instanceMeta, info syncInfo,
+	lsnTimeout int, operation string) error {
+	errs := make([]error, len(replicas))
+	var wg sync.WaitGroup
+	for i := range replicas {
+		wg.Add(1)
+		go func(i int) {
+			defer wg.Done()
+			replica := &replicas[i]
+			err := waitLSN(replica.conn, info.IID, info.LSN, lsnTimeout)
+			if err != nil {
+				errs[i] = fmt.Errorf("can't ensure that %s operations performed on %s "+
+					"are replicated to %s to perform snapshotting on it: error "+
+					"waiting LSN %d in vclock component %d: %w",
+					operation, running.GetAppInstanceName(master.run),
+					running.GetAppInstanceName(replica.run), info.LSN, info.IID, err)
+				return
+			}
+			errs[i] = snapshot(replica)
+		}(i)
 	}
-	return nil
+	wg.Wait()
+	return errors.Join(errs...)
 }
@@ -271,6 +271,33 @@ func getCConfigRolesPath(clusterConfig libcluster.ClusterConfig,
 	return paths, nil
 }
 
+// getCConfigAffectedReplicasets returns names of replicasets affected by
+// changes of the config paths. It returns false if the paths affect all
+// replicasets.
+func getCConfigAffectedReplicasets(clusterConfig libcluster.ClusterConfig,
+	paths []path) (map[string]bool, bool) {
+	affected := map[string]bool{}
+	for _, p := range paths {
+		if len(p.path) < 3 || p.path[0] != "groups" {
+			// The global scope.
+			return nil, false
+		}
+		if len(p.path) >= 5 && p.path[2] == "replicasets" {
+			// A replicaset or an instance scope.
+			affected[p.path[3]] = true
+			continue
+		}
+		group, ok := clusterConfig.Groups[p.path[1]]
+		if !ok {
+			return nil, false
+		}
+		for name := range group.Replicasets {
+			affected[name] = true
+		}
+	}
+	return affected, true
+}
+
 // getCConfigPromotePath returns a path and it's minimum interesting depth
 // to patch the config for instance promoting.
 // For example, if we have the path "/groups/g/replicasets/r/leader" then
@@ -0,0 +1,100 @@
+package replicaset
+
+import (
+	"sync"
+
+	"github.com/tarantool/tt/cli/connector"
+	"github.com/tarantool/tt/cli/running"
+)
+
+// instanceConnector connects to instances for an iteration over them.
+type instanceConnector interface {
+	// connect returns a connection to the instance.
+	connect(instance running.InstanceCtx) (connector.Connector, error)
+	// release is called after the connection usage with an error of
+	// the usage.
+	release(instance running.InstanceCtx, conn connector.Connector, err error)
+}
+
+// directConnector opens a new connection for each usage.
+type directConnector struct{}
+
+// connect opens a new connection to the instance.
+func (directConnector) connect(instance running.InstanceCtx) (connector.Connector, error) {
+	return connector.Connect(connector.ConnectOpts{
+		Network: "unix",
+		Address: instance.ConsoleSocket,
+	})
+}
+
+// release closes the connection.
+func (directConnector) release(_ running.InstanceCtx, conn connector.Connector, _ error) {
+	conn.Close()
+}
+
+// connCache keeps connections to instances to reuse them by several requests
+// within a command. Connections are identified by console sockets of
+// the instances. A connection is used by a single goroutine at a time, so
+// an instance must not be evaluated concurrently with itself.
+type connCache struct {
+	mutex sync.Mutex
+	conns map[string]connector.Connector
+}
+
+// newConnCache creates a new connCache object. It must be closed at the end
+// of the command.
+func newConnCache() *connCache {
+	return &connCache{
+		conns: map[string]connector.Connector{},
+	}
+}
+
+// connect returns a cached connection to the instance or opens a new one.
+func (cache *connCache) connect(instance running.InstanceCtx) (connector.Connector, error) {
+	cache.mutex.Lock()
+	conn, ok := cache.conns[instance.ConsoleSocket]
+	cache.mutex.Unlock()
+	if ok {
+		return conn, nil
+	}
+
+	conn, err := directConnector{}.connect(instance)
+	if err != nil {
+		return nil, err
+	}
+	cache.mutex.Lock()
+	// The instance could be connected concurrently. The connection is not
+	// cached then and is closed on release.
+	if _, ok := cache.conns[instance.ConsoleSocket]; !ok {
+		cache.conns[instance.ConsoleSocket] = conn
+	}
+	cache.mutex.Unlock()
+	return conn, nil
+}
+
+// release keeps the cached connection for further requests. The connection
+// is closed on an error because it could be broken, a connection missing in
+// the cache is closed too.
+func (cache *connCache) release(instance running.InstanceCtx,
+	conn connector.Connector, err error) {
+	cache.mutex.Lock()
+	cached := cache.conns[instance.ConsoleSocket] == conn
+	if cached && err != nil {
+		delete(cache.conns, instance.ConsoleSocket)
+	}
+	cache.mutex.Unlock()
+	if !cached || err != nil {
+		conn.Close()
+	}
+}
+
+// close closes all cached connections.
+func (cache *connCache) close() {
+	cache.mutex.Lock()
+	conns := cache.conns
+	cache.conns = map[string]connector.Connector{}
+	cache.mutex.Unlock()
+	for _, conn := range conns {
+		conn.Close()
+	}
+}
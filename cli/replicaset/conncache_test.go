@@ -0,0 +1,212 @@
+package replicaset
+
+import (
+	"bufio"
+	"fmt"
+	"net"
+	"path/filepath"
+	"strings"
+	"sync"
+	"testing"
+	"time"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+
+	"github.com/tarantool/tt/cli/connector"
+	"github.com/tarantool/tt/cli/running"
+)
+
+// consoleServer is a fake Tarantool Lua console. It returns a result encoded
+// with base64 for each request after the delay or an error if the request
+// contains "fail" or fail is set.
+type consoleServer struct {
+	listener net.Listener
+
+	mutex   sync.Mutex
+	conns   int
+	open    int
+	dataEnc string
+	delay   time.Duration
+	fail    bool
+}
+
+func startConsoleServer(t *testing.T) *consoleServer {
+	t.Helper()
+	listener, err := net.Listen("unix", filepath.Join(t.TempDir(), "console.sock"))
+	require.NoError(t, err)
+	// An empty MsgPack array encoded with base64.
+	server := &consoleServer{listener: listener, dataEnc: "kA=="}
+	t.Cleanup(func() { listener.Close() })
+	go func() {
+		for {
+			conn, err := listener.Accept()
+			if err != nil {
+				return
+			}
+			server.mutex.Lock()
+			server.conns++
+			server.open++
+			server.mutex.Unlock()
+			go server.serve(conn)
+		}
+	}()
+	return server
+}
+
+func (server *consoleServer) instance() running.InstanceCtx {
+	return running.InstanceCtx{
+		AppName:       "app",
+		InstName:      "inst",
+		ConsoleSocket: server.listener.Addr().String(),
+	}
+}
+
+func (server *consoleServer) stats() (conns, open int) {
+	server.mutex.Lock()
+	defer server.mutex.Unlock()
+	return server.conns, server.open
+}
+
+func (server *consoleServer) setDataEnc(dataEnc string) {
+	server.mutex.Lock()
+	defer server.mutex.Unlock()
+	server.dataEnc = dataEnc
+}
+
+func (server *consoleServer) setDelay(delay time.Duration) {
+	server.mutex.Lock()
+	defer server.mutex.Unlock()
+	server.delay = delay
+}
+
+func (server *consoleServer) setFail(fail bool) {
+	server.mutex.Lock()
+	defer server.mutex.Unlock()
+	server.fail = fail
+}
+
+func (server *consoleServer) serve(conn net.Conn) {
+	defer func() {
+		conn.Close()
+		server.mutex.Lock()
+		server.open--
+		server.mutex.Unlock()
+	}()
+
+	greeting := fmt.Sprintf("%-63s\n%-63s\n", "Tarantool 3.0.0 (Lua console)",
+		"type 'help' for interactive help")
+	if _, err := conn.Write([]byte(greeting)); err != nil {
+		return
+	}
+	reader := bufio.NewReader(conn)
+	for {
+		request, err := reader.ReadString('\n')
+		if err != nil {
+			return
+		}
+		server.mutex.Lock()
+		response := "---\n- data_enc: " + server.dataEnc + "\n...\n"
+		delay := server.delay
+		fail := server.fail
+		server.mutex.Unlock()
+		time.Sleep(delay)
+		if fail || strings.Contains(request, "fail") {
+			response = "---\n- error: eval failed\n...\n"
+		}
+		if _, err := conn.Write([]byte(response)); err != nil {
+			return
+		}
+	}
+}
+
+func evalTimes(t *testing.T, evaler connector.Evaler, n int) {
+	t.Helper()
+	for i := 0; i < n; i++ {
+		_, err := evaler.Eval("return", []any{}, connector.RequestOpts{})
+		require.NoError(t, err)
+	}
+}
+
+func TestConnCache_reuse(t *testing.T) {
+	server := startConsoleServer(t)
+	conns := newConnCache()
+
+	evalTimes(t, makeInstanceEvalFunc(conns, server.instance()), 3)
+	evalTimes(t, makeInstanceEvalFunc(conns, server.instance()), 2)
+	connected, _ := server.stats()
+	assert.Equal(t, 1, connected)
+
+	conns.close()
+	require.Eventually(t, func() bool {
+		_, open := server.stats()
+		return open == 0
+	}, time.Second, 10*time.Millisecond)
+}
+
+func TestConnCache_reconnect_after_error(t *testing.T) {
+	server := startConsoleServer(t)
+	conns := newConnCache()
+	defer conns.close()
+
+	evaler := makeInstanceEvalFunc(conns, server.instance())
+	evalTimes(t, evaler, 1)
+	_, err := evaler.Eval("fail", []any{}, connector.RequestOpts{})
+	require.ErrorContains(t, err, "eval failed")
+	evalTimes(t, evaler, 1)
+
+	connected, _ := server.stats()
+	assert.Equal(t, 2, connected)
+}
+
+func TestConnCache_evalAny(t *testing.T) {
+	server := startConsoleServer(t)
+	conns := newConnCache()
+	defer conns.close()
+
+	instances := []running.InstanceCtx{server.instance()}
+	for i := 0; i < 3; i++ {
+		err := evalAny(conns, instances, InstanceEvalFunc(
+			func(_ running.InstanceCtx, evaler connector.Evaler) (bool, error) {
+				_, err := evaler.Eval("return", []any{}, connector.RequestOpts{})
+				return false, err
+			}))
+		require.NoError(t, err)
+	}
+
+	connected, _ := server.stats()
+	assert.Equal(t, 1, connected)
+}
+
+func TestConnCache_concurrent(t *testing.T) {
+	server := startConsoleServer(t)
+	conns := newConnCache()
+
+	// Instances sharing a console socket are connected concurrently.
+	instances := []running.InstanceCtx{}
+	for i := 0; i < 8; i++ {
+		instances = append(instances, server.instance())
+	}
+	_, err := evalForeachParallel(conns, instances,
+		func(_ running.InstanceCtx, evaler connector.Evaler) (bool, error) {
+			_, err := evaler.Eval("return", []any{}, connector.RequestOpts{})
+			return true, err
+		}, false)
+	require.NoError(t, err)
+	assert.Len(t, conns.conns, 1)
+
+	// Only the cached connection is kept open, so all are closed.
+	conns.close()
+	require.Eventually(t, func() bool {
+		_, open := server.stats()
+		return open == 0
+	}, time.Second, 10*time.Millisecond)
+}
+
+func TestDirectConnector(t *testing.T) {
+	server := startConsoleServer(t)
+
+	evalTimes(t, MakeInstanceEvalFunc(server.instance()), 3)
+	connected, _ := server.stats()
+	assert.Equal(t, 3, connected)
+}
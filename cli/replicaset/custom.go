@@ -117,13 +117,11 @@ func NewCustomApplication(runningCtx running.RunningCtx) *CustomApplication {
 // discovery returns a replicasets configuration for an application with
 // a custom orchestrator.
 func (c *CustomApplication) discovery() (Replicasets, error) {
-	var topologies []customTopology
-
-	err := EvalForeachAlive(c.runningCtx.Instances, InstanceEvalFunc(
-		func(ictx running.InstanceCtx, evaler connector.Evaler) (bool, error) {
+	topologies, err := EvalForeachAliveParallel(c.runningCtx.Instances,
+		func(ictx running.InstanceCtx, evaler connector.Evaler) (customTopology, error) {
 			topology, err := getCustomInstanceTopology(ictx.InstName, evaler)
 			if err != nil {
-				return true, err
+				return topology, err
 			}
 			for i, _ := range topology.Instances {
 				if topology.Instances[i].UUID == topology.InstanceUUID {
@@ -131,10 +129,8 @@ func (c *CustomApplication) discovery() (Replicasets, error) {
 					topology.Instances[i].InstanceCtxFound = true
 				}
 			}
-
-			topologies = append(topologies, topology)
-			return false, nil
-		}))
+			return topology, nil
+		})
 	if err != nil {
 		return Replicasets{}, err
 	}
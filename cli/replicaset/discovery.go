@@ -25,14 +25,23 @@ type cachedDiscoverer struct {
 	discoverer
 	cached      bool
 	replicasets Replicasets
+	// topologyCache is an optional on-disk cache of the discovery results.
+	topologyCache *topologyCache
 }
 
 // Discovery discovers via underlying type.
-// If behavior is UseCache and there is a cached result, returns it.
+// If behavior is UseCache and there is a cached result, returns it. The
+// on-disk topology cache is tried after the in-memory one if it is enabled.
 func (c *cachedDiscoverer) Discovery(behavior CacheBehavior) (Replicasets, error) {
 	if behavior == UseCache && c.cached {
 		return c.replicasets, nil
 	}
+	if behavior == UseCache {
+		if replicasets, ok := c.loadTopologyCache(); ok {
+			c.replicasets, c.cached = replicasets, true
+			return c.replicasets, nil
+		}
+	}
 	c.cached = false
 	var err error
 	c.replicasets, err = c.discovery()
@@ -40,6 +49,7 @@ func (c *cachedDiscoverer) Discovery(behavior CacheBehavior) (Replicasets, error
 		return c.replicasets, err
 	}
 	c.cached = true
+	c.storeTopologyCache(c.replicasets)
 	return c.replicasets, nil
 }
 
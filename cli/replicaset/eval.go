@@ -2,6 +2,7 @@ package replicaset
 
 import (
 	"fmt"
+	"sync"
 
 	"github.com/apex/log"
 
@@ -19,6 +20,12 @@ func (evaler EvalFunc) Eval(expr string, args []any, opts connector.RequestOpts)
 
 // MakeInstanceEvalFunc makes a function to eval an expression on the specified instance.
 func MakeInstanceEvalFunc(instance running.InstanceCtx) EvalFunc {
+	return makeInstanceEvalFunc(directConnector{}, instance)
+}
+
+// makeInstanceEvalFunc makes a function to eval an expression on the specified
+// instance connected by conns.
+func makeInstanceEvalFunc(conns instanceConnector, instance running.InstanceCtx) EvalFunc {
 	return func(expr string, args []any, opts connector.RequestOpts) ([]any, error) {
 		var resp []any
 		instEvaler := func(instance running.InstanceCtx, evaler connector.Evaler) (bool, error) {
@@ -26,8 +33,8 @@ func MakeInstanceEvalFunc(instance running.InstanceCtx) EvalFunc {
 			resp, err = evaler.Eval(expr, args, opts)
 			return true, err
 		}
-		err := EvalForeach(
-			[]running.InstanceCtx{instance}, InstanceEvalFunc(instEvaler))
+		err := evalForeach(conns,
+			[]running.InstanceCtx{instance}, InstanceEvalFunc(instEvaler), false)
 		if err != nil {
 			return nil, err
 		}
@@ -53,22 +60,28 @@ func (fun InstanceEvalFunc) Eval(instance running.InstanceCtx,
 
 // EvalForeach calls evaler for each instance.
 func EvalForeach(instances []running.InstanceCtx, ievaler InstanceEvaler) error {
-	return evalForeach(instances, ievaler, false)
+	return evalForeach(directConnector{}, instances, ievaler, false)
 }
 
 // EvalForeachAlive calls evaler for each connectable instance.
 func EvalForeachAlive(instances []running.InstanceCtx, ievaler InstanceEvaler) error {
-	return evalForeach(instances, ievaler, true)
+	return evalForeach(directConnector{}, instances, ievaler, true)
 }
 
 // EvalAny calls evaler once for one connectable instance.
 func EvalAny(instances []running.InstanceCtx, ievaler InstanceEvaler) error {
-	return EvalForeachAlive(instances, InstanceEvalFunc(
+	return evalAny(directConnector{}, instances, ievaler)
+}
+
+// evalAny calls evaler once for one instance connectable by conns.
+func evalAny(conns instanceConnector, instances []running.InstanceCtx,
+	ievaler InstanceEvaler) error {
+	return evalForeach(conns, instances, InstanceEvalFunc(
 		func(instance running.InstanceCtx, evaler connector.Evaler) (bool, error) {
 			_, err := ievaler.Eval(instance, evaler)
 			// Always return true to stop execution on the first instance.
 			return true, err
-		}))
+		}), true)
 }
 
 // EvalForeachAliveDiscovered calls evaler for only connectable instances among discovered.
@@ -77,9 +90,135 @@ func EvalForeachAliveDiscovered(instances []running.InstanceCtx,
 	return EvalForeachAlive(filterDiscovered(instances, discovered), ievaler)
 }
 
+// maxParallelEvals is a maximum count of instances evaluated concurrently.
+const maxParallelEvals = 32
+
+// InstanceCollectFunc evaluates on an instance and returns a result. It is
+// called concurrently for different instances, so it must not modify a shared
+// state without synchronization.
+type InstanceCollectFunc[T any] func(instance running.InstanceCtx,
+	evaler connector.Evaler) (T, error)
+
+// EvalForeachParallel calls collect for each instance concurrently and returns
+// results in the order of the instances. Unlike EvalForeach, it could not be
+// stopped early and the order of calls is not defined, so it should be used
+// only for independent requests to the instances.
+func EvalForeachParallel[T any](instances []running.InstanceCtx,
+	collect InstanceCollectFunc[T]) ([]T, error) {
+	return evalForeachParallel(directConnector{}, instances, collect, false)
+}
+
+// EvalForeachAliveParallel calls collect for each connectable instance
+// concurrently and returns results in the order of the instances. Unlike
+// EvalForeachAlive, it could not be stopped early and the order of calls is
+// not defined, so it should be used only for independent requests to
+// the instances.
+func EvalForeachAliveParallel[T any](instances []running.InstanceCtx,
+	collect InstanceCollectFunc[T]) ([]T, error) {
+	return evalForeachParallel(directConnector{}, instances, collect, true)
+}
+
+// evalInstance connects to the instance and calls collect with the connection.
+// It returns false without an error if the instance is not connectable and
+// connection errors are skipped.
+func evalInstance[T any](conns instanceConnector, instance running.InstanceCtx,
+	collect InstanceCollectFunc[T], skipConnectError bool) (T, bool, error) {
+	var ret T
+	conn, err := conns.connect(instance)
+	if err != nil {
+		if !skipConnectError {
+			return ret, false, fmt.Errorf("failed to connect to '%s:%s': %w",
+				instance.AppName, instance.InstName, err)
+		}
+		log.Debugf("failed to connect to '%s:%s': %s",
+			instance.AppName, instance.InstName, err)
+		return ret, false, nil
+	}
+	ret, err = collect(instance, connector.NewScriptCacheConnector(conn))
+	conns.release(instance, conn, err)
+	return ret, true, err
+}
+
+// evalForeachParallel is an internal implementation of concurrent iteration
+// over instances. The instances are evaluated by a bounded pool of workers in
+// the order of the instances. After a failure the remaining instances are not
+// evaluated and the error of the first failed instance is returned, so
+// the result does not depend on the scheduling.
+func evalForeachParallel[T any](conns instanceConnector, instances []running.InstanceCtx,
+	collect InstanceCollectFunc[T], skipConnectError bool) ([]T, error) {
+	if len(instances) == 0 {
+		return nil, fmt.Errorf("no instances to connect")
+	}
+
+	results := evalInstancesParallel(conns, instances, collect, skipConnectError, true)
+	rets := make([]T, 0, len(instances))
+	for _, result := range results {
+		if result.err != nil {
+			return nil, result.err
+		}
+		if result.connected {
+			rets = append(rets, result.ret)
+		}
+	}
+	if len(rets) == 0 {
+		return nil, fmt.Errorf("failed to connect to any instance")
+	}
+	return rets, nil
+}
+
+// instanceResult is a result of an evaluation on an instance.
+type instanceResult[T any] struct {
+	ret       T
+	connected bool
+	err       error
+}
+
+// evalInstancesParallel evaluates the instances by a bounded pool of workers
+// in the order of the instances and returns results of all the instances.
+// If stopOnError is set, the remaining instances are not evaluated after
+// a failure.
+func evalInstancesParallel[T any](conns instanceConnector, instances []running.InstanceCtx,
+	collect InstanceCollectFunc[T], skipConnectError, stopOnError bool) []instanceResult[T] {
+	results := make([]instanceResult[T], len(instances))
+	var (
+		wg     sync.WaitGroup
+		mutex  sync.Mutex
+		failed bool
+	)
+	indexes := make(chan int)
+	for w := 0; w < min(maxParallelEvals, len(instances)); w++ {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			for i := range indexes {
+				result := &results[i]
+				result.ret, result.connected, result.err = evalInstance(conns,
+					instances[i], collect, skipConnectError)
+				if result.err != nil {
+					mutex.Lock()
+					failed = true
+					mutex.Unlock()
+				}
+			}
+		}()
+	}
+	for i := range instances {
+		mutex.Lock()
+		stop := failed && stopOnError
+		mutex.Unlock()
+		if stop {
+			break
+		}
+		indexes <- i
+	}
+	close(indexes)
+	wg.Wait()
+	return results
+}
+
 // evalForeach is an internal implementation of iteration over instances with
 // an evaler object.
-func evalForeach(instances []running.InstanceCtx,
+func evalForeach(conns instanceConnector, instances []running.InstanceCtx,
 	ievaler InstanceEvaler, skipConnectError bool) error {
 	if len(instances) == 0 {
 		return fmt.Errorf("no instances to connect")
@@ -87,10 +226,7 @@ func evalForeach(instances []running.InstanceCtx,
 
 	connected := 0
 	for _, instance := range instances {
-		conn, err := connector.Connect(connector.ConnectOpts{
-			Network: "unix",
-			Address: instance.ConsoleSocket,
-		})
+		conn, err := conns.connect(instance)
 		if err != nil {
 			if !skipConnectError {
 				return fmt.Errorf("failed to connect to '%s:%s': %w",
@@ -103,8 +239,8 @@ func evalForeach(instances []running.InstanceCtx,
 		}
 
 		connected++
-		done, err := ievaler.Eval(instance, conn)
-		conn.Close()
+		done, err := ievaler.Eval(instance, connector.NewScriptCacheConnector(conn))
+		conns.release(instance, conn, err)
 
 		if err != nil {
 			return err
@@ -544,6 +544,120 @@ func TestEvalAny_error(t *testing.T) {
 	}
 }
 
+func collectAppName(instance running.InstanceCtx, evaler connector.Evaler) (string, error) {
+	data, err := evaler.Eval("return box.cfg.listen", []any{}, connector.RequestOpts{})
+	if err != nil {
+		return "", err
+	}
+	if len(data) != 1 || data[0] != "127.0.0.1:3015" {
+		return "", fmt.Errorf("unexpected response: %v", data)
+	}
+	return instance.AppName, nil
+}
+
+func TestEvalForeachAliveParallel(t *testing.T) {
+	instances := []running.InstanceCtx{}
+	expected := []string{}
+	for i := 0; i < 100; i++ {
+		name := fmt.Sprintf("app%d", i)
+		if i%3 == 0 {
+			instances = append(instances, running.InstanceCtx{ConsoleSocket: "unreachetable"})
+		}
+		instances = append(instances, running.InstanceCtx{
+			AppName:       name,
+			ConsoleSocket: console,
+		})
+		expected = append(expected, name)
+	}
+
+	names, err := replicaset.EvalForeachAliveParallel(instances, collectAppName)
+	require.NoError(t, err)
+	assert.Equal(t, expected, names)
+}
+
+func TestEvalForeachParallel(t *testing.T) {
+	instances := []running.InstanceCtx{
+		running.InstanceCtx{AppName: "foo", ConsoleSocket: console},
+		running.InstanceCtx{AppName: "bar", ConsoleSocket: console},
+	}
+
+	names, err := replicaset.EvalForeachParallel(instances, collectAppName)
+	require.NoError(t, err)
+	assert.Equal(t, []string{"foo", "bar"}, names)
+}
+
+func TestEvalForeachParallel_returns_first_error(t *testing.T) {
+	instances := []running.InstanceCtx{}
+	for i := 0; i < 10; i++ {
+		instances = append(instances, running.InstanceCtx{
+			AppName:       fmt.Sprintf("app%d", i),
+			ConsoleSocket: console,
+		})
+	}
+
+	for i := 0; i < 10; i++ {
+		_, err := replicaset.EvalForeachParallel(instances,
+			func(instance running.InstanceCtx, evaler connector.Evaler) (string, error) {
+				if instance.AppName == "app3" || instance.AppName == "app7" {
+					return "", fmt.Errorf("%s failed", instance.AppName)
+				}
+				return collectAppName(instance, evaler)
+			})
+		require.EqualError(t, err, "app3 failed")
+	}
+}
+
+func TestEvalForeachParallel_error(t *testing.T) {
+	cases := []struct {
+		Name      string
+		Instances []running.InstanceCtx
+		Expected  string
+	}{
+		{"no_instances", []running.InstanceCtx{}, "no instances to connect"},
+		{
+			"no_connection",
+			[]running.InstanceCtx{
+				running.InstanceCtx{AppName: "foo", ConsoleSocket: console},
+				running.InstanceCtx{AppName: "bar", InstName: "baz",
+					ConsoleSocket: "unreachetable"},
+			},
+			"failed to connect to 'bar:baz'",
+		},
+	}
+
+	for _, tc := range cases {
+		t.Run(tc.Name, func(t *testing.T) {
+			_, err := replicaset.EvalForeachParallel(tc.Instances, collectAppName)
+			require.ErrorContains(t, err, tc.Expected)
+		})
+	}
+}
+
+func TestEvalForeachAliveParallel_error(t *testing.T) {
+	cases := []struct {
+		Name      string
+		Instances []running.InstanceCtx
+		Expected  string
+	}{
+		{"no_instances", []running.InstanceCtx{}, "no instances to connect"},
+		{
+			"no_connections",
+			[]running.InstanceCtx{
+				running.InstanceCtx{ConsoleSocket: "unreachetable1"},
+				running.InstanceCtx{ConsoleSocket: "unreachetable2"},
+			},
+			"failed to connect to any instance",
+		},
+	}
+
+	for _, tc := range cases {
+		t.Run(tc.Name, func(t *testing.T) {
+			_, err := replicaset.EvalForeachAliveParallel(tc.Instances, collectAppName)
+			require.EqualError(t, err, tc.Expected)
+		})
+	}
+}
+
 func runTestMain(m *testing.M) int {
 	inst, err := test_helpers.StartTarantool(test_helpers.StartOpts{
 		InitScript:   "testdata/config.lua",
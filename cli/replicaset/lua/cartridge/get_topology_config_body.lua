@@ -0,0 +1,32 @@
+local confapplier = require('cartridge.confapplier')
+
+local topology = confapplier.get_readonly('topology') or {}
+local replicasets = setmetatable({}, {__serialize = 'map'})
+
+for uuid, replicaset in pairs(topology.replicasets or {}) do
+    local roles = {}
+    for role, enabled in pairs(replicaset.roles or {}) do
+        if enabled then
+            table.insert(roles, role)
+        end
+    end
+    table.sort(roles)
+
+    local priority = replicaset.master or {}
+    if type(priority) == 'string' then
+        priority = {priority}
+    end
+
+    replicasets[uuid] = {
+        alias = replicaset.alias,
+        roles = roles,
+        all_rw = replicaset.all_rw or false,
+        weight = replicaset.weight,
+        vshard_group = replicaset.vshard_group,
+        failover_priority = priority,
+    }
+end
+
+return {
+    replicasets = replicasets,
+}
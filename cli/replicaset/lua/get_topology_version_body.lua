@@ -0,0 +1,50 @@
+local digest = require('digest')
+
+local function canonical(value)
+    if type(value) ~= 'table' then
+        return tostring(value)
+    end
+    local keys = {}
+    for key in pairs(value) do
+        table.insert(keys, key)
+    end
+    table.sort(keys, function(a, b) return tostring(a) < tostring(b) end)
+    local items = {}
+    for _, key in ipairs(keys) do
+        table.insert(items, tostring(key) .. '=' .. canonical(value[key]))
+    end
+    return '{' .. table.concat(items, ',') .. '}'
+end
+
+local box_info = box.info()
+local state = {
+    uuid = box_info.uuid,
+    ro = box_info.ro,
+    replicaset = (box_info.replicaset or box_info.cluster or {}).uuid,
+    peers = {},
+}
+for _, instance in pairs(box_info.replication) do
+    state.peers[instance.uuid] = {
+        name = instance.name,
+        upstream = instance.upstream ~= nil and instance.upstream.status or nil,
+        downstream = instance.downstream ~= nil and instance.downstream.status or nil,
+    }
+end
+if box_info.election ~= nil then
+    state.leader = box_info.election.leader
+end
+
+local ok, config = pcall(function() return require('config'):get() end)
+if ok then
+    state.config = config
+end
+if package.loaded['cartridge'] ~= nil then
+    local ok, topology = pcall(function()
+        return require('cartridge.confapplier').get_readonly('topology')
+    end)
+    if ok then
+        state.topology = topology
+    end
+end
+
+return digest.sha256_hex(canonical(state))
@@ -95,6 +95,11 @@ func Rebootstrap(cmdCtx cmdcontext.CmdCtx, cliOpts config.CliOpts, rbCtx Reboots
 	if err = cleanDataFiles(instCtx); err != nil {
 		return fmt.Errorf("failed to remove instance's artifacts: %s", err)
 	}
+	if err = RemoveTopologyCache(running.RunningCtx{
+		Instances: apps[rbCtx.AppName],
+	}); err != nil {
+		log.Warn(err.Error())
+	}
 
 	// TODO: need to support integrity check continuation on this start.
 	// tarantool/tt-ee#203
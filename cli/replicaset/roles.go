@@ -77,6 +77,9 @@ type RolesChangeCtx struct {
 	// Timeout is a timeout for promoting waitings in seconds.
 	// Keep int, because it can be passed to the target instance.
 	Timeout int
+	// ReloadAffectedOnly is true if the config should be reloaded only on
+	// instances of replicasets affected by the change.
+	ReloadAffectedOnly bool
 }
 
 // RolesChanger is an interface for adding/removing roles for a replicaset.
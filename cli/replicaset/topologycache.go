@@ -0,0 +1,299 @@
+package replicaset
+
+import (
+	"crypto/sha256"
+	_ "embed"
+	"encoding/hex"
+	"encoding/json"
+	"errors"
+	"fmt"
+	"io/fs"
+	"os"
+	"path/filepath"
+	"time"
+
+	"github.com/apex/log"
+
+	"github.com/tarantool/tt/cli/connector"
+	"github.com/tarantool/tt/cli/running"
+)
+
+//go:embed lua/get_topology_version_body.lua
+var getTopologyVersionBody string
+
+// topologyCacheInstance is an instance stored in the topology cache. The
+// instance context is stored as a name of the running instance.
+type topologyCacheInstance struct {
+	Instance
+	InstanceCtx string
+}
+
+// topologyCacheReplicaset is a replicaset stored in the topology cache.
+type topologyCacheReplicaset struct {
+	Replicaset
+	Instances []topologyCacheInstance
+}
+
+// topologyCacheEntry is a content of a topology cache file.
+type topologyCacheEntry struct {
+	// Key is a checksum of running instances and their configuration.
+	Key string
+	// Version is a version of the topology reported by an instance.
+	Version string
+	// Created is a time of the discovery.
+	Created time.Time
+	// State is a state of the replicasets.
+	State State
+	// Orchestrator is an orchestrator of the replicasets.
+	Orchestrator Orchestrator
+	// Replicasets is a list of replicasets.
+	Replicasets []topologyCacheReplicaset
+}
+
+// topologyCache is an on-disk cache of a discovered topology of an
+// application. It allows to skip the discovery of all instances in
+// back-to-back status commands. A cached topology is used until the TTL
+// expires if running instances and their configuration files are not changed
+// and the topology version reported by an instance is the same. The version
+// covers the replication state of the instance peers, so a stopped or
+// disconnected peer invalidates the cache.
+type topologyCache struct {
+	path      string
+	ttl       time.Duration
+	instances []running.InstanceCtx
+}
+
+// topologyCachePath returns a path of the topology cache file of
+// the application in the run directory.
+func topologyCachePath(instances []running.InstanceCtx) string {
+	if len(instances) == 0 || instances[0].RunDir == "" {
+		return ""
+	}
+	instance := instances[0]
+	dir := instance.RunDir
+	if !instance.SingleApp {
+		// The run directory is an instance directory inside the application one.
+		dir = filepath.Dir(dir)
+	}
+	return filepath.Join(dir, instance.AppName+".topology.json")
+}
+
+// RemoveTopologyCache removes the topology cache of the application. It must
+// be called after changes of the topology.
+func RemoveTopologyCache(runningCtx running.RunningCtx) error {
+	path := topologyCachePath(runningCtx.Instances)
+	if path == "" {
+		return nil
+	}
+	if err := os.Remove(path); err != nil && !errors.Is(err, fs.ErrNotExist) {
+		return fmt.Errorf("failed to remove the topology cache: %w", err)
+	}
+	return nil
+}
+
+// topologyCacheKey returns a checksum of the running instances and their
+// cluster configuration files.
+func topologyCacheKey(instances []running.InstanceCtx) (string, error) {
+	hash := sha256.New()
+	hashed := map[string]bool{}
+	for _, instance := range instances {
+		fmt.Fprintf(hash, "%s\x00%s\x00%s\x00%s\x00", instance.AppName, instance.InstName,
+			instance.ConsoleSocket, instance.ClusterConfigPath)
+		path := instance.ClusterConfigPath
+		if path == "" || hashed[path] {
+			continue
+		}
+		hashed[path] = true
+		data, err := os.ReadFile(path)
+		if err != nil {
+			return "", err
+		}
+		digest := sha256.Sum256(data)
+		hash.Write(digest[:])
+	}
+	return hex.EncodeToString(hash.Sum(nil)), nil
+}
+
+// version returns a version of the topology reported by an instance.
+func (cache *topologyCache) version() (string, error) {
+	var version string
+	err := EvalAny(cache.instances, InstanceEvalFunc(
+		func(_ running.InstanceCtx, evaler connector.Evaler) (bool, error) {
+			args := []any{}
+			opts := connector.RequestOpts{}
+			data, err := evaler.Eval(getTopologyVersionBody, args, opts)
+			if err != nil {
+				return true, err
+			}
+			if len(data) != 1 {
+				return true, fmt.Errorf("unexpected response length: %d", len(data))
+			}
+			var ok bool
+			if version, ok = data[0].(string); !ok {
+				return true, fmt.Errorf("unexpected version type: %T", data[0])
+			}
+			return true, nil
+		}))
+	return version, err
+}
+
+// load returns the cached topology if it is valid.
+func (cache *topologyCache) load() (Replicasets, error) {
+	data, err := os.ReadFile(cache.path)
+	if err != nil {
+		return Replicasets{}, err
+	}
+	var entry topologyCacheEntry
+	if err := json.Unmarshal(data, &entry); err != nil {
+		return Replicasets{}, err
+	}
+	if age := time.Since(entry.Created); age < 0 || age >= cache.ttl {
+		return Replicasets{}, fmt.Errorf("the cache is expired")
+	}
+	key, err := topologyCacheKey(cache.instances)
+	if err != nil {
+		return Replicasets{}, err
+	}
+	if entry.Key != key {
+		return Replicasets{}, fmt.Errorf("instances or their configuration are changed")
+	}
+	version, err := cache.version()
+	if err != nil {
+		return Replicasets{}, err
+	}
+	if entry.Version != version {
+		return Replicasets{}, fmt.Errorf("the topology version is changed")
+	}
+
+	instances := map[string]running.InstanceCtx{}
+	for _, instance := range cache.instances {
+		instances[running.GetAppInstanceName(instance)] = instance
+	}
+	replicasets := Replicasets{
+		State:        entry.State,
+		Orchestrator: entry.Orchestrator,
+		Replicasets:  make([]Replicaset, 0, len(entry.Replicasets)),
+	}
+	for _, cached := range entry.Replicasets {
+		replicaset := cached.Replicaset
+		replicaset.Instances = make([]Instance, 0, len(cached.Instances))
+		for _, cachedInstance := range cached.Instances {
+			instance := cachedInstance.Instance
+			if cachedInstance.InstanceCtx != "" {
+				instanceCtx, ok := instances[cachedInstance.InstanceCtx]
+				if !ok {
+					return Replicasets{}, fmt.Errorf("instance %q is not found",
+						cachedInstance.InstanceCtx)
+				}
+				instance.InstanceCtx = instanceCtx
+				instance.InstanceCtxFound = true
+			}
+			replicaset.Instances = append(replicaset.Instances, instance)
+		}
+		replicasets.Replicasets = append(replicasets.Replicasets, replicaset)
+	}
+	return replicasets, nil
+}
+
+// store stores the topology into the cache.
+func (cache *topologyCache) store(replicasets Replicasets) error {
+	created := time.Now()
+	key, err := topologyCacheKey(cache.instances)
+	if err != nil {
+		return err
+	}
+	version, err := cache.version()
+	if err != nil {
+		return err
+	}
+
+	entry := topologyCacheEntry{
+		Key:          key,
+		Version:      version,
+		Created:      created,
+		State:        replicasets.State,
+		Orchestrator: replicasets.Orchestrator,
+		Replicasets:  make([]topologyCacheReplicaset, 0, len(replicasets.Replicasets)),
+	}
+	for _, replicaset := range replicasets.Replicasets {
+		cached := topologyCacheReplicaset{
+			Replicaset: replicaset,
+			Instances:  make([]topologyCacheInstance, 0, len(replicaset.Instances)),
+		}
+		cached.Replicaset.Instances = nil
+		for _, instance := range replicaset.Instances {
+			cachedInstance := topologyCacheInstance{Instance: instance}
+			if instance.InstanceCtxFound {
+				cachedInstance.InstanceCtx = running.GetAppInstanceName(instance.InstanceCtx)
+			}
+			cachedInstance.Instance.InstanceCtx = running.InstanceCtx{}
+			cachedInstance.Instance.InstanceCtxFound = false
+			cached.Instances = append(cached.Instances, cachedInstance)
+		}
+		entry.Replicasets = append(entry.Replicasets, cached)
+	}
+
+	data, err := json.Marshal(entry)
+	if err != nil {
+		return err
+	}
+	// Write to a temporary file and rename it, so concurrent commands never
+	// read a partially written cache.
+	tmp, err := os.CreateTemp(filepath.Dir(cache.path), filepath.Base(cache.path)+".*")
+	if err != nil {
+		return err
+	}
+	_, err = tmp.Write(data)
+	if closeErr := tmp.Close(); err == nil {
+		err = closeErr
+	}
+	if err == nil {
+		err = os.Rename(tmp.Name(), cache.path)
+	}
+	if err != nil {
+		os.Remove(tmp.Name())
+	}
+	return err
+}
+
+// UseTopologyCache enables the on-disk topology cache with the TTL for
+// the application. A discovery with UseCache behavior returns the cached
+// topology if it is valid, any discovered topology is stored to the cache.
+func (c *cachedDiscoverer) UseTopologyCache(runningCtx running.RunningCtx,
+	ttl time.Duration) {
+	path := topologyCachePath(runningCtx.Instances)
+	if path == "" || ttl <= 0 {
+		c.topologyCache = nil
+		return
+	}
+	c.topologyCache = &topologyCache{
+		path:      path,
+		ttl:       ttl,
+		instances: runningCtx.Instances,
+	}
+}
+
+// loadTopologyCache loads the topology from the on-disk cache if it is
+// enabled and valid.
+func (c *cachedDiscoverer) loadTopologyCache() (Replicasets, bool) {
+	if c.topologyCache == nil {
+		return Replicasets{}, false
+	}
+	replicasets, err := c.topologyCache.load()
+	if err != nil {
+		log.Debugf("The topology cache is not used: %s", err)
+		return Replicasets{}, false
+	}
+	return replicasets, true
+}
+
+// storeTopologyCache stores the topology to the on-disk cache if it is
+// enabled.
+func (c *cachedDiscoverer) storeTopologyCache(replicasets Replicasets) {
+	if c.topologyCache == nil {
+		return
+	}
+	if err := c.topologyCache.store(replicasets); err != nil {
+		log.Debugf("Failed to store the topology cache: %s", err)
+	}
+}
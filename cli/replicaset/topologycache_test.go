@@ -0,0 +1,195 @@
+package replicaset
+
+import (
+	"os"
+	"path/filepath"
+	"testing"
+	"time"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+
+	"github.com/tarantool/tt/cli/running"
+)
+
+const (
+	// MsgPack arrays with a version string encoded with base64.
+	topologyVersion1Enc = "kaJ2MQ=="
+	topologyVersion2Enc = "kaJ2Mg=="
+)
+
+// countingDiscoverer returns the same replicasets and counts discoveries.
+type countingDiscoverer struct {
+	replicasets Replicasets
+	count       int
+}
+
+func (d *countingDiscoverer) discovery() (Replicasets, error) {
+	d.count++
+	return d.replicasets, nil
+}
+
+func startTopologyCacheServer(t *testing.T) (*consoleServer, running.RunningCtx) {
+	t.Helper()
+	server := startConsoleServer(t)
+	server.setDataEnc(topologyVersion1Enc)
+
+	appDir := t.TempDir()
+	configPath := filepath.Join(appDir, "config.yaml")
+	require.NoError(t, os.WriteFile(configPath, []byte("groups: {}"), 0644))
+	instance := server.instance()
+	instance.RunDir = filepath.Join(appDir, "var", "run", instance.InstName)
+	instance.ClusterConfigPath = configPath
+	return server, running.RunningCtx{Instances: []running.InstanceCtx{instance}}
+}
+
+func topologyCacheReplicasets(instance running.InstanceCtx) Replicasets {
+	return Replicasets{
+		State:        StateBootstrapped,
+		Orchestrator: OrchestratorCentralizedConfig,
+		Replicasets: []Replicaset{
+			{
+				UUID:   "rs-uuid",
+				Alias:  "rs",
+				Roles:  []string{"router"},
+				Master: MasterSingle,
+				Instances: []Instance{
+					{
+						Alias:            instance.InstName,
+						UUID:             "inst-uuid",
+						URI:              "localhost:3301",
+						Mode:             ModeRW,
+						InstanceCtx:      instance,
+						InstanceCtxFound: true,
+					},
+					{
+						Alias: "remote",
+						UUID:  "remote-uuid",
+						URI:   "localhost:3302",
+						Mode:  ModeRead,
+					},
+				},
+			},
+		},
+	}
+}
+
+func TestTopologyCachePath(t *testing.T) {
+	cases := []struct {
+		instance running.InstanceCtx
+		expected string
+	}{
+		{running.InstanceCtx{}, ""},
+		{
+			running.InstanceCtx{AppName: "app", RunDir: "/app/var/run/inst"},
+			"/app/var/run/app.topology.json",
+		},
+		{
+			running.InstanceCtx{AppName: "app", RunDir: "/run", SingleApp: true},
+			"/run/app.topology.json",
+		},
+	}
+	for _, tc := range cases {
+		instances := []running.InstanceCtx{tc.instance}
+		assert.Equal(t, tc.expected, topologyCachePath(instances))
+	}
+}
+
+func TestTopologyCache_store_load(t *testing.T) {
+	_, runningCtx := startTopologyCacheServer(t)
+	replicasets := topologyCacheReplicasets(runningCtx.Instances[0])
+
+	discoverer := &cachedDiscoverer{}
+	discoverer.UseTopologyCache(runningCtx, time.Minute)
+	cache := discoverer.topologyCache
+	require.NotNil(t, cache)
+
+	require.NoError(t, os.MkdirAll(filepath.Dir(cache.path), 0755))
+	require.NoError(t, cache.store(replicasets))
+	loaded, err := cache.load()
+	require.NoError(t, err)
+	assert.Equal(t, replicasets, loaded)
+
+	require.NoError(t, RemoveTopologyCache(runningCtx))
+	assert.NoFileExists(t, cache.path)
+	require.NoError(t, RemoveTopologyCache(runningCtx))
+}
+
+func TestTopologyCache_load_invalid(t *testing.T) {
+	cases := []struct {
+		name     string
+		change   func(server *consoleServer, runningCtx running.RunningCtx, cache *topologyCache)
+		errorMsg string
+	}{
+		{
+			name: "expired",
+			change: func(_ *consoleServer, _ running.RunningCtx, cache *topologyCache) {
+				cache.ttl = 0
+			},
+			errorMsg: "the cache is expired",
+		},
+		{
+			name: "config_changed",
+			change: func(_ *consoleServer, runningCtx running.RunningCtx, _ *topologyCache) {
+				require.NoError(t, os.WriteFile(runningCtx.Instances[0].ClusterConfigPath,
+					[]byte("groups: {g: {}}"), 0644))
+			},
+			errorMsg: "instances or their configuration are changed",
+		},
+		{
+			name: "version_changed",
+			change: func(server *consoleServer, _ running.RunningCtx, _ *topologyCache) {
+				server.setDataEnc(topologyVersion2Enc)
+			},
+			errorMsg: "the topology version is changed",
+		},
+	}
+
+	for _, tc := range cases {
+		t.Run(tc.name, func(t *testing.T) {
+			server, runningCtx := startTopologyCacheServer(t)
+			discoverer := &cachedDiscoverer{}
+			discoverer.UseTopologyCache(runningCtx, time.Minute)
+			cache := discoverer.topologyCache
+
+			require.NoError(t, os.MkdirAll(filepath.Dir(cache.path), 0755))
+			require.NoError(t, cache.store(topologyCacheReplicasets(runningCtx.Instances[0])))
+			tc.change(server, runningCtx, cache)
+			_, err := cache.load()
+			assert.ErrorContains(t, err, tc.errorMsg)
+		})
+	}
+}
+
+func TestCachedDiscoverer_topologyCache(t *testing.T) {
+	_, runningCtx := startTopologyCacheServer(t)
+	replicasets := topologyCacheReplicasets(runningCtx.Instances[0])
+	require.NoError(t, os.MkdirAll(filepath.Dir(runningCtx.Instances[0].RunDir), 0755))
+
+	first := &countingDiscoverer{replicasets: replicasets}
+	discoverer := &cachedDiscoverer{discoverer: first}
+	discoverer.UseTopologyCache(runningCtx, time.Minute)
+	_, err := discoverer.Discovery(UseCache)
+	require.NoError(t, err)
+	assert.Equal(t, 1, first.count)
+
+	// A next command uses the topology from the disk.
+	second := &countingDiscoverer{replicasets: replicasets}
+	discoverer = &cachedDiscoverer{discoverer: second}
+	discoverer.UseTopologyCache(runningCtx, time.Minute)
+	discovered, err := discoverer.Discovery(UseCache)
+	require.NoError(t, err)
+	assert.Equal(t, replicasets, discovered)
+	assert.Equal(t, 0, second.count)
+
+	_, err = discoverer.Discovery(SkipCache)
+	require.NoError(t, err)
+	assert.Equal(t, 1, second.count)
+
+	// The cache is not used if it is disabled.
+	third := &countingDiscoverer{replicasets: replicasets}
+	discoverer = &cachedDiscoverer{discoverer: third}
+	_, err = discoverer.Discovery(UseCache)
+	require.NoError(t, err)
+	assert.Equal(t, 1, third.count)
+}
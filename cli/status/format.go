@@ -0,0 +1,128 @@
+package status
+
+import (
+	"encoding/json"
+	"fmt"
+	"strings"
+)
+
+// reportFormatter returns the report in some format.
+type reportFormatter func(r *report, opts StatusOpts) (string, error)
+
+// reportFormatters contains the report formatters by the --format flag values.
+var reportFormatters = map[string]reportFormatter{
+	"table":      (*report).renderTable,
+	"json":       (*report).renderJson,
+	"prometheus": (*report).renderPrometheus,
+}
+
+// formatter returns the report formatter of the output format.
+func (opts StatusOpts) formatter() (reportFormatter, error) {
+	format := opts.Format
+	if format == "" {
+		format = "table"
+	}
+	formatter, ok := reportFormatters[format]
+	if !ok {
+		return nil, fmt.Errorf("unknown output format %q", format)
+	}
+	return formatter, nil
+}
+
+// renderJson returns the report as a JSON array of instance statuses sorted
+// by instance names.
+func (r *report) renderJson(StatusOpts) (string, error) {
+	data, err := json.MarshalIndent(r.sorted(), "", "  ")
+	if err != nil {
+		return "", err
+	}
+	return string(data) + "\n", nil
+}
+
+// labelEscaper escapes label values of the Prometheus text format.
+var labelEscaper = strings.NewReplacer(`\`, `\\`, `"`, `\"`, "\n", `\n`)
+
+// metricWriter writes metric families in the Prometheus text format.
+type metricWriter struct {
+	strings.Builder
+}
+
+// family writes a header of a gauge metric family.
+func (w *metricWriter) family(name, help string) {
+	fmt.Fprintf(w, "# HELP %s %s\n# TYPE %s gauge\n", name, help, name)
+}
+
+// sample writes a sample of the metric. Labels are pairs of names and values.
+func (w *metricWriter) sample(name string, value int, labels ...string) {
+	w.WriteString(name)
+	w.WriteString("{")
+	for i := 0; i+1 < len(labels); i += 2 {
+		if i > 0 {
+			w.WriteString(",")
+		}
+		fmt.Fprintf(w, `%s="%s"`, labels[i], labelEscaper.Replace(labels[i+1]))
+	}
+	fmt.Fprintf(w, "} %d\n", value)
+}
+
+// renderPrometheus returns the report in the Prometheus text exposition
+// format.
+func (r *report) renderPrometheus(StatusOpts) (string, error) {
+	statuses := r.sorted()
+	w := metricWriter{}
+
+	w.family("tt_instance_running", "Whether the instance process is running.")
+	for _, status := range statuses {
+		running := 0
+		if status.running() {
+			running = 1
+		}
+		w.sample("tt_instance_running", running, "instance", status.Instance)
+	}
+
+	w.family("tt_instance_pid", "PID of the instance watchdog process.")
+	for _, status := range statuses {
+		if status.running() {
+			w.sample("tt_instance_pid", status.PID, "instance", status.Instance)
+		}
+	}
+
+	w.family("tt_instance_read_only", "Whether the instance is in read-only mode.")
+	for _, status := range statuses {
+		if status.Mode != "" {
+			readOnly := 0
+			if status.Mode == "RO" {
+				readOnly = 1
+			}
+			w.sample("tt_instance_read_only", readOnly, "instance", status.Instance)
+		}
+	}
+
+	w.family("tt_instance_info", "State of the instance in labels.")
+	for _, status := range statuses {
+		w.sample("tt_instance_info", 1, "instance", status.Instance,
+			"status", status.Status, "mode", status.Mode, "config", status.Config,
+			"box", status.Box, "upstream", status.Upstream)
+	}
+
+	w.family("tt_instance_alerts", "Count of alerts of the instance by types.")
+	for _, status := range statuses {
+		counts := map[string]int{}
+		for _, alert := range status.Alerts {
+			counts[alert.Type]++
+		}
+		for _, alertType := range []string{"error", "warning"} {
+			w.sample("tt_instance_alerts", counts[alertType], "instance", status.Instance,
+				"type", alertType)
+		}
+	}
+
+	w.family("tt_instance_alert", "Alert of the instance.")
+	for _, status := range statuses {
+		for _, alert := range status.Alerts {
+			w.sample("tt_instance_alert", 1, "instance", status.Instance,
+				"source", alert.Source, "type", alert.Type, "message", alert.Message)
+		}
+	}
+	return w.String(), nil
+}
@@ -0,0 +1,128 @@
+package status
+
+import (
+	"errors"
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+	"github.com/tarantool/tt/cli/process_utils"
+	"github.com/tarantool/tt/cli/running"
+)
+
+func newTestReport() *report {
+	procRunning := process_utils.ProcStateRunning
+	procRunning.PID = 42
+	name := "app:master"
+	runs := []running.InstanceCtx{
+		{AppName: "app", InstName: "replica"},
+		{AppName: "app", InstName: "master", ConsoleSocket: "master.sock"},
+		{AppName: "app", InstName: "stopped"},
+	}
+	results := []probeResult{
+		{procStatus: procRunning, state: &instanceState{
+			ReadOnly:   "RO",
+			BoxStatus:  "running",
+			ConfigInfo: configInfo{Status: "ready"},
+			UUID:       "replica-uuid",
+			ReplicationInfo: []replicationInfo{{
+				UUID: "master-uuid",
+				Name: &name,
+				Upstream: upstream{
+					Status:  "disconnected",
+					Message: `connection "refused"`,
+				},
+			}},
+		}},
+		{procStatus: procRunning, connectErr: errors.New("failed to dial")},
+		{procStatus: process_utils.ProcStateStopped, connectErr: errors.New("failed to dial")},
+	}
+	return newReport(runs, results)
+}
+
+func TestReport_renderJson(t *testing.T) {
+	out, err := newTestReport().renderJson(StatusOpts{})
+	require.NoError(t, err)
+	assert.JSONEq(t, `[
+		{
+			"instance": "app:master",
+			"status": "RUNNING",
+			"pid": 42,
+			"alerts": [{
+				"type": "error",
+				"message": "Error while connecting to instance app:master via socket master.sock: `+
+		`failed to dial"
+			}]
+		},
+		{
+			"instance": "app:replica",
+			"status": "RUNNING",
+			"pid": 42,
+			"mode": "RO",
+			"config": "ready",
+			"box": "running",
+			"upstream": "disconnected",
+			"alerts": [{
+				"source": "upstream",
+				"type": "warning",
+				"message": "replication from instance with name \"app:master\" is in `+
+		`\"disconnected\" status: \"connection \\\"refused\\\"\""
+			}]
+		},
+		{
+			"instance": "app:stopped",
+			"status": "NOT RUNNING",
+			"alerts": []
+		}
+	]`, out)
+}
+
+func TestReport_renderPrometheus(t *testing.T) {
+	out, err := newTestReport().renderPrometheus(StatusOpts{})
+	require.NoError(t, err)
+	assert.Equal(t, `# HELP tt_instance_running Whether the instance process is running.
+# TYPE tt_instance_running gauge
+tt_instance_running{instance="app:master"} 1
+tt_instance_running{instance="app:replica"} 1
+tt_instance_running{instance="app:stopped"} 0
+# HELP tt_instance_pid PID of the instance watchdog process.
+# TYPE tt_instance_pid gauge
+tt_instance_pid{instance="app:master"} 42
+tt_instance_pid{instance="app:replica"} 42
+# HELP tt_instance_read_only Whether the instance is in read-only mode.
+# TYPE tt_instance_read_only gauge
+tt_instance_read_only{instance="app:replica"} 1
+# HELP tt_instance_info State of the instance in labels.
+# TYPE tt_instance_info gauge
+tt_instance_info{instance="app:master",status="RUNNING",mode="",config="",box="",upstream=""} 1
+tt_instance_info{instance="app:replica",status="RUNNING",mode="RO",config="ready",`+
+		`box="running",upstream="disconnected"} 1
+tt_instance_info{instance="app:stopped",status="NOT RUNNING",mode="",config="",box="",`+
+		`upstream=""} 1
+# HELP tt_instance_alerts Count of alerts of the instance by types.
+# TYPE tt_instance_alerts gauge
+tt_instance_alerts{instance="app:master",type="error"} 1
+tt_instance_alerts{instance="app:master",type="warning"} 0
+tt_instance_alerts{instance="app:replica",type="error"} 0
+tt_instance_alerts{instance="app:replica",type="warning"} 1
+tt_instance_alerts{instance="app:stopped",type="error"} 0
+tt_instance_alerts{instance="app:stopped",type="warning"} 0
+# HELP tt_instance_alert Alert of the instance.
+# TYPE tt_instance_alert gauge
+tt_instance_alert{instance="app:master",source="",type="error",`+
+		`message="Error while connecting to instance app:master via socket master.sock: `+
+		`failed to dial"} 1
+tt_instance_alert{instance="app:replica",source="upstream",type="warning",`+
+		`message="replication from instance with name \"app:master\" is in `+
+		`\"disconnected\" status: \"connection \\\"refused\\\"\""} 1
+`, out)
+}
+
+func TestStatusOpts_formatter(t *testing.T) {
+	for _, format := range []string{"", "table", "json", "prometheus"} {
+		_, err := StatusOpts{Format: format}.formatter()
+		assert.NoError(t, err, format)
+	}
+	_, err := StatusOpts{Format: "yaml"}.formatter()
+	assert.EqualError(t, err, `unknown output format "yaml"`)
+}
@@ -0,0 +1,179 @@
+package status
+
+import (
+	"fmt"
+	"sync"
+	"time"
+
+	"github.com/mitchellh/mapstructure"
+	"github.com/tarantool/tt/cli/connector"
+	"github.com/tarantool/tt/cli/process_utils"
+	"github.com/tarantool/tt/cli/running"
+)
+
+const (
+	// DefaultTimeout is a default timeout to get a state of an instance.
+	DefaultTimeout = 5 * time.Second
+	// maxProbeWorkers is a maximum count of instances probed concurrently.
+	maxProbeWorkers = 32
+)
+
+// probeResult is a result of probing an instance.
+type probeResult struct {
+	procStatus process_utils.ProcessState
+	// state is the state of the running instance, if received.
+	state *instanceState
+	// connectErr is an error of connection to the instance.
+	connectErr error
+	// alert is an error message of getting the state of the connected
+	// instance.
+	alert string
+}
+
+// instanceProbe gets states of an instance. The connection to the instance is
+// kept open between probes and is reopened on the next probe after a failure.
+type instanceProbe struct {
+	run    *running.InstanceCtx
+	script string
+	// conn is the connection to the instance. It is used only by an evaluating
+	// goroutine.
+	conn connector.Connector
+	// pending receives a result of the evaluating goroutine. It is nil if no
+	// evaluation is in progress.
+	pending chan probeResult
+}
+
+// eval evaluates the state script on the instance. The instance is connected
+// if there is no open connection. The connection is closed on errors.
+func (p *instanceProbe) eval(timeout time.Duration) probeResult {
+	fullInstanceName := running.GetAppInstanceName(*p.run)
+	if p.conn == nil {
+		conn, err := connector.Connect(connector.ConnectOpts{
+			Network: "unix",
+			Address: p.run.ConsoleSocket,
+		})
+		if err != nil {
+			return probeResult{connectErr: err}
+		}
+		p.conn = connector.NewScriptCacheConnector(conn)
+	}
+
+	res, err := p.conn.Eval(p.script, []any{}, connector.RequestOpts{ReadTimeout: timeout})
+	if err != nil {
+		p.conn.Close()
+		p.conn = nil
+		return probeResult{alert: fmt.Sprintf("Error while executing Lua script on instance %s: %v",
+			fullInstanceName, err)}
+	}
+	if len(res) == 0 {
+		return probeResult{alert: fmt.Sprintf("No data returned from Lua script on instance %s",
+			fullInstanceName)}
+	}
+
+	var state instanceState
+	if err = mapstructure.Decode(res[0], &state); err != nil {
+		return probeResult{alert: fmt.Sprintf("Error while decoding data from instance %s: %v",
+			fullInstanceName, err)}
+	}
+	return probeResult{state: &state}
+}
+
+// probe gets the process status and the state of the instance. It waits for
+// the state not longer than the timeout. An evaluation that is not finished in
+// time is waited for by the next probe instead of starting a new one.
+func (p *instanceProbe) probe(timeout time.Duration) probeResult {
+	procStatus := running.Status(p.run)
+
+	if p.pending != nil {
+		select {
+		case <-p.pending:
+			// The result of the timed out evaluation is outdated.
+			p.pending = nil
+		default:
+		}
+	}
+	if p.pending == nil {
+		p.pending = make(chan probeResult, 1)
+		go func(done chan<- probeResult) {
+			done <- p.eval(timeout)
+		}(p.pending)
+	}
+	timer := time.NewTimer(timeout)
+	defer timer.Stop()
+
+	var result probeResult
+	select {
+	case result = <-p.pending:
+		p.pending = nil
+	case <-timer.C:
+		result.alert = fmt.Sprintf("Timeout while getting state of instance %s: "+
+			"no response in %s", running.GetAppInstanceName(*p.run), timeout)
+	}
+	result.procStatus = procStatus
+	return result
+}
+
+// close closes the connection to the instance. If an evaluation is in
+// progress, the connection is closed when it is finished.
+func (p *instanceProbe) close() {
+	closeConn := func() {
+		if p.conn != nil {
+			p.conn.Close()
+			p.conn = nil
+		}
+	}
+	if p.pending == nil {
+		closeConn()
+		return
+	}
+	go func(done <-chan probeResult) {
+		<-done
+		closeConn()
+	}(p.pending)
+	p.pending = nil
+}
+
+// prober probes a set of instances concurrently.
+type prober struct {
+	probes []*instanceProbe
+}
+
+// newProber creates a prober of the instances.
+func newProber(instances []running.InstanceCtx) *prober {
+	script := filterComments(instanceInfoLuaScript)
+	probes := make([]*instanceProbe, 0, len(instances))
+	for i := range instances {
+		probes = append(probes, &instanceProbe{run: &instances[i], script: script})
+	}
+	return &prober{probes: probes}
+}
+
+// probe probes the instances concurrently. Results are ordered as
+// the instances.
+func (p *prober) probe(timeout time.Duration) []probeResult {
+	results := make([]probeResult, len(p.probes))
+	indexes := make(chan int)
+	var wg sync.WaitGroup
+	for w := 0; w < min(maxProbeWorkers, len(p.probes)); w++ {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			for i := range indexes {
+				results[i] = p.probes[i].probe(timeout)
+			}
+		}()
+	}
+	for i := range p.probes {
+		indexes <- i
+	}
+	close(indexes)
+	wg.Wait()
+	return results
+}
+
+// close closes connections to the instances.
+func (p *prober) close() {
+	for _, probe := range p.probes {
+		probe.close()
+	}
+}
@@ -0,0 +1,69 @@
+package status
+
+import (
+	"fmt"
+	"net"
+	"path/filepath"
+	"testing"
+	"time"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+	"github.com/tarantool/tt/cli/running"
+)
+
+func TestProber(t *testing.T) {
+	dir := t.TempDir()
+	// The instance accepts connections, but does not respond.
+	hungSocket := filepath.Join(dir, "hung.sock")
+	listener, err := net.Listen("unix", hungSocket)
+	require.NoError(t, err)
+	defer listener.Close()
+	go func() {
+		conns := []net.Conn{}
+		defer func() {
+			for _, conn := range conns {
+				conn.Close()
+			}
+		}()
+		for {
+			conn, err := listener.Accept()
+			if err != nil {
+				return
+			}
+			conns = append(conns, conn)
+		}
+	}()
+
+	instances := []running.InstanceCtx{{
+		AppName:       "app",
+		InstName:      "missing",
+		ConsoleSocket: filepath.Join(dir, "missing.sock"),
+	}}
+	for i := 0; i < 3; i++ {
+		instances = append(instances, running.InstanceCtx{
+			AppName:       "app",
+			InstName:      fmt.Sprintf("hung%d", i),
+			ConsoleSocket: hungSocket,
+		})
+	}
+
+	prober := newProber(instances)
+	defer prober.close()
+	// Timed out evaluations do not block next probes.
+	for probe := 0; probe < 2; probe++ {
+		start := time.Now()
+		results := prober.probe(200 * time.Millisecond)
+		// Instances are probed concurrently.
+		assert.Less(t, time.Since(start), time.Second)
+
+		require.Len(t, results, len(instances))
+		assert.Error(t, results[0].connectErr)
+		for i, result := range results[1:] {
+			assert.NoError(t, result.connectErr)
+			assert.Nil(t, result.state)
+			assert.Equal(t, fmt.Sprintf("Timeout while getting state of instance app:hung%d: "+
+				"no response in 200ms", i), result.alert)
+		}
+	}
+}
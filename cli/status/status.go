@@ -3,14 +3,13 @@ package status
 import (
 	_ "embed"
 	"fmt"
-	"os"
+	"sort"
 	"strings"
+	"time"
 
 	"github.com/fatih/color"
 	"github.com/jedib0t/go-pretty/v6/table"
 	"github.com/jedib0t/go-pretty/v6/text"
-	"github.com/mitchellh/mapstructure"
-	"github.com/tarantool/tt/cli/connector"
 	"github.com/tarantool/tt/cli/process_utils"
 	"github.com/tarantool/tt/cli/running"
 )
@@ -38,6 +37,19 @@ type StatusOpts struct {
 	Pretty bool
 	// Option for detailed alerts output for each instance, such as warnings and errors.
 	Details bool
+	// Timeout to get a state of an instance. DefaultTimeout is used if it is
+	// not positive.
+	Timeout time.Duration
+	// Format is an output format: table (default), json or prometheus.
+	Format string
+}
+
+// timeout returns the timeout to get a state of an instance.
+func (opts StatusOpts) timeout() time.Duration {
+	if opts.Timeout <= 0 {
+		return DefaultTimeout
+	}
+	return opts.Timeout
 }
 
 type alert struct {
@@ -69,27 +81,67 @@ type instanceState struct {
 	UUID            string            `mapstructure:"uuid"`
 }
 
-func newInstanceStatusMap() map[string]interface{} {
-	return map[string]interface{}{
-		"STATUS":   "",
-		"PID":      nil,
-		"MODE":     "",
-		"CONFIG":   defaultModuleStatus,
-		"BOX":      defaultModuleStatus,
-		"UPSTREAM": defaultModuleStatus,
+// statusAlert is an alert about an instance status.
+type statusAlert struct {
+	// Source is a subsystem of the alert: "config", "upstream" or empty for
+	// errors of getting the instance state.
+	Source string `json:"source,omitempty"`
+	// Type is "error" or "warning".
+	Type    string `json:"type"`
+	Message string `json:"message"`
+}
+
+// String returns the alert as it is printed with --details.
+func (a statusAlert) String() string {
+	msg := a.Message
+	if a.Source != "" {
+		msg = fmt.Sprintf("[%s][%s]: %s", a.Source, a.Type, a.Message)
+	}
+	if a.Type == "error" {
+		return printRed(msg)
 	}
+	return printYellow(msg)
+}
+
+// instanceStatus is a status of an instance. Fields of the instance state are
+// empty if the state is not received.
+type instanceStatus struct {
+	Instance string        `json:"instance"`
+	Status   string        `json:"status"`
+	PID      int           `json:"pid,omitempty"`
+	Mode     string        `json:"mode,omitempty"`
+	Config   string        `json:"config,omitempty"`
+	Box      string        `json:"box,omitempty"`
+	Upstream string        `json:"upstream,omitempty"`
+	Alerts   []statusAlert `json:"alerts"`
+
+	procState process_utils.ProcessState
+}
+
+// running returns true if the instance process is running.
+func (s *instanceStatus) running() bool {
+	return s.procState.Code == process_utils.ProcessRunningCode
 }
 
-var instances = map[string]map[string]interface{}{}
-var instancesAlerts = map[string][]string{}
-var uuid2name = map[string]string{}
+// addAlert adds an alert to the instance status.
+func (s *instanceStatus) addAlert(source, alertType, msg string) {
+	s.Alerts = append(s.Alerts, statusAlert{Source: source, Type: alertType, Message: msg})
+}
+
+// report is a status of instances prepared for output.
+type report struct {
+	// instances contains statuses of instances by names.
+	instances map[string]*instanceStatus
+	// uuid2name maps UUIDs of instances to their names.
+	uuid2name map[string]string
+}
 
 var printYellow = color.New(color.FgYellow).SprintFunc()
 var printRed = color.New(color.FgRed).SprintFunc()
 
-func processReplicationInfo(fullInstanceName string, instanceState instanceState) {
+func (r *report) processReplicationInfo(fullInstanceName string, instanceState instanceState) {
 	for _, repl := range instanceState.ReplicationInfo {
-		fullInstanceUpstreamName, ok := uuid2name[repl.UUID]
+		fullInstanceUpstreamName, ok := r.uuid2name[repl.UUID]
 		// Use repl.Name if available, otherwise fallback to repl.UUID
 		if !ok {
 			if repl.Name != nil {
@@ -101,7 +153,7 @@ func processReplicationInfo(fullInstanceName string, instanceState instanceState
 		if repl.Upstream.Status == "follow" || len(repl.Upstream.Message) == 0 {
 			continue
 		}
-		instances[fullInstanceName]["UPSTREAM"] = repl.Upstream.Status
+		r.instances[fullInstanceName].Upstream = repl.Upstream.Status
 
 		var upstreamInstanceDesc string
 		if ok || repl.Name != nil {
@@ -111,136 +163,127 @@ func processReplicationInfo(fullInstanceName string, instanceState instanceState
 			upstreamInstanceDesc = fmt.Sprintf("instance with UUID %s",
 				fullInstanceUpstreamName)
 		}
-		instancesAlerts[fullInstanceName] = append(instancesAlerts[fullInstanceName],
-			printYellow(fmt.Sprintf(
-				"[upstream][warning]: replication from %s is in %q status: %q",
-				upstreamInstanceDesc, repl.Upstream.Status,
-				repl.Upstream.Message)))
+		r.instances[fullInstanceName].addAlert("upstream", "warning", fmt.Sprintf(
+			"replication from %s is in %q status: %q",
+			upstreamInstanceDesc, repl.Upstream.Status, repl.Upstream.Message))
 	}
 }
 
-func processConfigInfo(fullInstanceName string, instanceState instanceState) {
-	if len(instanceState.ConfigInfo.Alerts) == 0 {
-		return
-	}
+func (r *report) processConfigInfo(fullInstanceName string, instanceState instanceState) {
 	for _, alert := range instanceState.ConfigInfo.Alerts {
-		msg := ""
+		alertType := "warning"
 		if alert.Type == "error" {
-			msg = printRed(fmt.Sprintf("[config][error]: %s", alert.Message))
-		} else {
-			msg = printYellow(fmt.Sprintf("[config][warning]: %s", alert.Message))
+			alertType = "error"
 		}
-		instancesAlerts[fullInstanceName] = append(instancesAlerts[fullInstanceName], msg)
+		r.instances[fullInstanceName].addAlert("config", alertType, alert.Message)
 	}
 }
 
-// Status writes the status as a table.
-func Status(runningCtx running.RunningCtx, opts StatusOpts) error {
-	ts := table.NewWriter()
-	ts.SetOutputMirror(os.Stdout)
-	ts.AppendHeader(
-		table.Row{"INSTANCE", "STATUS", "PID", "MODE", "CONFIG", "BOX", "UPSTREAM"})
-
+// newReport merges results of probing the instances into a report.
+func newReport(runs []running.InstanceCtx, results []probeResult) *report {
+	r := &report{
+		instances: map[string]*instanceStatus{},
+		uuid2name: map[string]string{},
+	}
 	instanceRawState := map[string]instanceState{}
 
-	for _, run := range runningCtx.Instances {
+	for i, run := range runs {
 		fullInstanceName := running.GetAppInstanceName(run)
-		procStatus := running.Status(&run)
-		instances[fullInstanceName] = newInstanceStatusMap()
-		instances[fullInstanceName]["STATUS"] = procStatus.ColorSprint(procStatus.Status)
-
-		if procStatus.Code == process_utils.ProcessRunningCode {
-			instances[fullInstanceName]["PID"] = procStatus.PID
+		result := results[i]
+		status := &instanceStatus{
+			Instance:  fullInstanceName,
+			Status:    result.procStatus.Status,
+			Alerts:    []statusAlert{},
+			procState: result.procStatus,
 		}
+		r.instances[fullInstanceName] = status
 
-		conn, err := connector.Connect(connector.ConnectOpts{
-			Network: "unix",
-			Address: run.ConsoleSocket,
-		})
-
-		if err != nil && procStatus.Code == process_utils.ProcessRunningCode {
-			instancesAlerts[fullInstanceName] = append(
-				instancesAlerts[fullInstanceName],
-				printRed(fmt.Sprintf(
-					"Error while connecting to instance %s via socket %s: %v",
-					fullInstanceName, run.ConsoleSocket, err)))
-			continue
-		} else if err != nil {
-			continue
+		if status.running() {
+			status.PID = result.procStatus.PID
 		}
 
-		var instanceState instanceState
-		res, err := conn.Eval(filterComments(instanceInfoLuaScript), []any{},
-			connector.RequestOpts{})
-
-		if err != nil {
-			instancesAlerts[fullInstanceName] = append(
-				instancesAlerts[fullInstanceName],
-				printRed(fmt.Sprintf(
-					"Error while executing Lua script on instance %s: %v",
-					fullInstanceName, err)))
-			continue
-		}
-
-		if len(res) == 0 {
-			instancesAlerts[fullInstanceName] = append(
-				instancesAlerts[fullInstanceName],
-				printRed(fmt.Sprintf(
-					"No data returned from Lua script on instance %s",
-					fullInstanceName)))
+		if result.connectErr != nil {
+			if status.running() {
+				status.addAlert("", "error", fmt.Sprintf(
+					"Error while connecting to instance %s via socket %s: %v",
+					fullInstanceName, run.ConsoleSocket, result.connectErr))
+			}
 			continue
 		}
-
-		err = mapstructure.Decode(res[0], &instanceState)
-		if err != nil {
-			instancesAlerts[fullInstanceName] = append(
-				instancesAlerts[fullInstanceName],
-				printRed(fmt.Sprintf("Error while decoding data from "+
-					"instance %s: %v", fullInstanceName, err)))
+		if result.state == nil {
+			status.addAlert("", "error", result.alert)
 			continue
 		}
+		instanceState := *result.state
 
 		// Since Tarantool 2.x doesn't support instance names, only UUIDs are available.
 		// To make the alerts more readable, we map the UUIDs to instance names.
-		uuid2name[instanceState.UUID] = fullInstanceName
+		r.uuid2name[instanceState.UUID] = fullInstanceName
 
 		instanceRawState[fullInstanceName] = instanceState
-		instances[fullInstanceName]["MODE"] = instanceState.ReadOnly
-		instances[fullInstanceName]["CONFIG"] = instanceState.ConfigInfo.Status
-		instances[fullInstanceName]["BOX"] = instanceState.BoxStatus
+		status.Mode = instanceState.ReadOnly
+		status.Config = instanceState.ConfigInfo.Status
+		status.Box = instanceState.BoxStatus
 	}
 
 	// Alert handling placed later because we need to know the mapping of instance UUIDs
 	// to their names for a more user-friendly output.
 	for fullInstanceName, instanceState := range instanceRawState {
-		processReplicationInfo(fullInstanceName, instanceState)
-		processConfigInfo(fullInstanceName, instanceState)
+		r.processReplicationInfo(fullInstanceName, instanceState)
+		r.processConfigInfo(fullInstanceName, instanceState)
 	}
+	return r
+}
 
-	for instName, instData := range instances {
-		row := []interface{}{}
-		row = append(row, instName)
-		row = append(row, instData["STATUS"])
-		if instData["PID"] == nil {
-			ts.AppendRow(row)
-			continue
+// sorted returns statuses of the instances sorted by names.
+func (r *report) sorted() []*instanceStatus {
+	statuses := make([]*instanceStatus, 0, len(r.instances))
+	for _, status := range r.instances {
+		statuses = append(statuses, status)
+	}
+	sort.Slice(statuses, func(i, j int) bool {
+		return statuses[i].Instance < statuses[j].Instance
+	})
+	return statuses
+}
+
+// orDefault returns the value or the default module status if it is empty.
+func orDefault(value string) string {
+	if value == "" {
+		return defaultModuleStatus
+	}
+	return value
+}
+
+// renderTable returns the report as a table with alerts.
+func (r *report) renderTable(opts StatusOpts) (string, error) {
+	ts := table.NewWriter()
+	ts.AppendHeader(
+		table.Row{"INSTANCE", "STATUS", "PID", "MODE", "CONFIG", "BOX", "UPSTREAM"})
+
+	statuses := r.sorted()
+	hasAlerts := false
+	for _, status := range statuses {
+		hasAlerts = hasAlerts || len(status.Alerts) > 0
+		row := table.Row{status.Instance, status.procState.ColorSprint(status.Status)}
+		if status.running() {
+			row = append(row, status.PID, status.Mode, orDefault(status.Config),
+				orDefault(status.Box), orDefault(status.Upstream))
 		}
-		row = append(row, instData["PID"])
-		row = append(row, instData["MODE"])
-		row = append(row, instData["CONFIG"])
-		row = append(row, instData["BOX"])
-		row = append(row, instData["UPSTREAM"])
 		ts.AppendRow(row)
 	}
-	ts.SortBy([]table.SortBy{{Name: "INSTANCE", Mode: table.Asc}})
 
+	out := strings.Builder{}
 	if opts.Details {
-		for instance, alerts := range instancesAlerts {
-			fmt.Printf("Alerts for %s:\n", instance)
-			for _, alert := range alerts {
-				fmt.Printf("  • %s\n", alert)
+		for _, status := range statuses {
+			if len(status.Alerts) == 0 {
+				continue
+			}
+			fmt.Fprintf(&out, "Alerts for %s:\n", status.Instance)
+			for _, alert := range status.Alerts {
+				fmt.Fprintf(&out, "  • %s\n", alert)
 			}
-			fmt.Println()
+			out.WriteString("\n")
 		}
 	}
 	if opts.Pretty {
@@ -256,19 +299,30 @@ func Status(runningCtx running.RunningCtx, opts StatusOpts) error {
 		{Number: 3, Align: text.AlignLeft, AlignHeader: text.AlignLeft},
 		{Number: 4, Align: text.AlignLeft, AlignHeader: text.AlignLeft},
 	})
-	ts.Render()
+	out.WriteString(ts.Render())
+	out.WriteString("\n")
 
-	if !opts.Details {
-		msg := "\nThe status of some instances requires attention.\n" +
+	if !opts.Details && hasAlerts {
+		out.WriteString("\nThe status of some instances requires attention.\n" +
 			"Please rerun the command with the --details flag to see " +
-			"more information"
-		for _, alerts := range instancesAlerts {
-			if len(alerts) > 0 {
-				fmt.Println(msg)
-				break
-			}
-		}
+			"more information\n")
 	}
+	return out.String(), nil
+}
 
-	return nil
+// Status writes the status of instances.
+func Status(runningCtx running.RunningCtx, opts StatusOpts) error {
+	formatter, err := opts.formatter()
+	if err != nil {
+		return err
+	}
+	prober := newProber(runningCtx.Instances)
+	defer prober.close()
+	results := prober.probe(opts.timeout())
+	out, err := formatter(newReport(runningCtx.Instances, results), opts)
+	if err != nil {
+		return err
+	}
+	_, err = fmt.Print(out)
+	return err
 }
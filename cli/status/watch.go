@@ -0,0 +1,98 @@
+package status
+
+import (
+	"bytes"
+	"context"
+	"fmt"
+	"io"
+	"os"
+	"strings"
+	"time"
+
+	"github.com/mattn/go-isatty"
+	"github.com/tarantool/tt/cli/running"
+)
+
+// DefaultWatchInterval is a default interval between refreshes of the status.
+const DefaultWatchInterval = 2 * time.Second
+
+// watchFrame returns lines of the refreshed status with a header.
+func watchFrame(status string, interval time.Duration, now time.Time) []string {
+	lines := []string{
+		fmt.Sprintf("Every %s: tt status    %s", interval, now.Format(time.DateTime)),
+		"",
+	}
+	return append(lines, strings.Split(strings.TrimSuffix(status, "\n"), "\n")...)
+}
+
+// redraw replaces previously written lines of a terminal with new ones.
+// Unchanged lines are skipped, lines left from the previous output are
+// cleared.
+func redraw(w io.Writer, prev, lines []string) error {
+	var buf bytes.Buffer
+	if len(prev) > 0 {
+		// Move the cursor to the first previously written line.
+		fmt.Fprintf(&buf, "\x1b[%dA", len(prev))
+	}
+	for i, line := range lines {
+		if i < len(prev) && prev[i] == line {
+			buf.WriteString("\x1b[1B")
+			continue
+		}
+		buf.WriteString("\r\x1b[2K")
+		buf.WriteString(line)
+		buf.WriteString("\n")
+	}
+	if len(lines) < len(prev) {
+		buf.WriteString("\r\x1b[J")
+	}
+	_, err := w.Write(buf.Bytes())
+	return err
+}
+
+// Watch writes the status of instances every interval until the context is
+// done. Connections to the instances are kept open between refreshes. If
+// the table is written to a terminal, only changed lines are redrawn.
+// Machine-readable formats are written as is on each refresh.
+func Watch(ctx context.Context, runningCtx running.RunningCtx, opts StatusOpts,
+	interval time.Duration) error {
+	formatter, err := opts.formatter()
+	if err != nil {
+		return err
+	}
+	prober := newProber(runningCtx.Instances)
+	defer prober.close()
+
+	table := opts.Format == "" || opts.Format == "table"
+	tty := table && isatty.IsTerminal(os.Stdout.Fd())
+	ticker := time.NewTicker(interval)
+	defer ticker.Stop()
+	var prev []string
+	for {
+		results := prober.probe(opts.timeout())
+		if ctx.Err() != nil {
+			return nil
+		}
+		out, err := formatter(newReport(runningCtx.Instances, results), opts)
+		if err != nil {
+			return err
+		}
+		if !table {
+			_, err = fmt.Print(out)
+		} else if frame := watchFrame(out, interval, time.Now()); tty {
+			err = redraw(os.Stdout, prev, frame)
+			prev = frame
+		} else {
+			_, err = fmt.Println(strings.Join(frame, "\n") + "\n")
+		}
+		if err != nil {
+			return err
+		}
+
+		select {
+		case <-ctx.Done():
+			return nil
+		case <-ticker.C:
+		}
+	}
+}
@@ -0,0 +1,60 @@
+package status
+
+import (
+	"bytes"
+	"testing"
+	"time"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
+
+func TestWatchFrame(t *testing.T) {
+	now := time.Date(2024, 5, 13, 12, 0, 0, 0, time.UTC)
+	assert.Equal(t, []string{
+		"Every 2s: tt status    2024-05-13 12:00:00",
+		"",
+		"INSTANCE  STATUS",
+		"app:inst  RUNNING",
+	}, watchFrame("INSTANCE  STATUS\napp:inst  RUNNING\n", 2*time.Second, now))
+}
+
+func TestRedraw(t *testing.T) {
+	tests := []struct {
+		name     string
+		prev     []string
+		lines    []string
+		expected string
+	}{
+		{
+			name:     "first output",
+			lines:    []string{"a", "b"},
+			expected: "\r\x1b[2Ka\n\r\x1b[2Kb\n",
+		},
+		{
+			name:     "changed line",
+			prev:     []string{"a", "b", "c"},
+			lines:    []string{"a", "B", "c"},
+			expected: "\x1b[3A\x1b[1B\r\x1b[2KB\n\x1b[1B",
+		},
+		{
+			name:     "more lines",
+			prev:     []string{"a"},
+			lines:    []string{"a", "b"},
+			expected: "\x1b[1A\x1b[1B\r\x1b[2Kb\n",
+		},
+		{
+			name:     "less lines",
+			prev:     []string{"a", "b"},
+			lines:    []string{"a"},
+			expected: "\x1b[2A\x1b[1B\r\x1b[J",
+		},
+	}
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			var buf bytes.Buffer
+			require.NoError(t, redraw(&buf, tt.prev, tt.lines))
+			assert.Equal(t, tt.expected, buf.String())
+		})
+	}
+}
@@ -0,0 +1,452 @@
+package tail
+
+import (
+	"bufio"
+	"bytes"
+	"context"
+	"fmt"
+	"io"
+	"regexp"
+	"strings"
+	"time"
+)
+
+// logLevels contains tarantool log levels ordered by severity. Indexes are
+// numbers of the levels.
+var logLevels = []struct {
+	name string
+	// char is a level character of a log line in the plain format.
+	char byte
+	// jsonName is a level name of a log line in the JSON format.
+	jsonName string
+}{
+	{"fatal", 'F', "FATAL"},
+	{"syserror", '!', "SYSERROR"},
+	{"error", 'E', "ERROR"},
+	{"crit", 'C', "CRIT"},
+	{"warn", 'W', "WARN"},
+	{"info", 'I', "INFO"},
+	{"verbose", 'V', "VERBOSE"},
+	{"debug", 'D', "DEBUG"},
+}
+
+// jsonLevelPrefix precedes a level name of a log line in the JSON format.
+var jsonLevelPrefix = []byte(`"level": "`)
+
+// logTimePrefixLen is a length of a line prefix containing a timestamp in any
+// log format.
+const logTimePrefixLen = 64
+
+// timeLayouts are layouts of time values accepted by ParseTime.
+var timeLayouts = []string{
+	"2006-01-02 15:04:05.000",
+	"2006-01-02 15:04:05",
+	"2006-01-02T15:04:05",
+	"2006-01-02 15:04",
+	"2006-01-02",
+}
+
+// ParseTime parses a time value of log filters. It is a timestamp in the
+// RFC 3339 format, in the tarantool log format or a duration before now.
+func ParseTime(value string, now time.Time) (time.Time, error) {
+	if duration, err := time.ParseDuration(value); err == nil {
+		return now.Add(-duration), nil
+	}
+	if ts, err := time.Parse(time.RFC3339Nano, value); err == nil {
+		return ts, nil
+	}
+	for _, layout := range timeLayouts {
+		if ts, err := time.ParseInLocation(layout, value, time.Local); err == nil {
+			return ts, nil
+		}
+	}
+	return time.Time{}, fmt.Errorf("invalid time %q, a timestamp like %q or a duration "+
+		"like \"2h\" is expected", value, timeLayouts[1])
+}
+
+// FilterOpts contains options of a log lines filter.
+type FilterOpts struct {
+	// Grep is a regular expression lines must match.
+	Grep string
+	// Level is the least severe level of printed log messages.
+	Level string
+	// Since is a time of the first printed log message, if set.
+	Since time.Time
+	// Until is a time of the last printed log message, if set.
+	Until time.Time
+}
+
+// Filter selects log lines. A log message starts with a line with a timestamp,
+// lines without a timestamp belong to the previous message. Levels and time
+// bounds are checked for messages, the regular expression is matched to lines.
+type Filter struct {
+	grep *regexp.Regexp
+	// maxLevel is a number of the least severe selected level, if hasLevel.
+	maxLevel int
+	hasLevel bool
+	since    time.Time
+	until    time.Time
+}
+
+// NewFilter creates a filter of log lines. Nil filter is returned if all lines
+// are selected.
+func NewFilter(opts FilterOpts) (*Filter, error) {
+	filter := Filter{since: opts.Since, until: opts.Until}
+	if opts.Grep != "" {
+		grep, err := regexp.Compile(opts.Grep)
+		if err != nil {
+			return nil, fmt.Errorf("invalid regular expression: %w", err)
+		}
+		filter.grep = grep
+	}
+	if opts.Level != "" {
+		found := false
+		for i, level := range logLevels {
+			if strings.EqualFold(opts.Level, level.name) {
+				filter.maxLevel, filter.hasLevel, found = i, true, true
+				break
+			}
+		}
+		if !found {
+			names := make([]string, 0, len(logLevels))
+			for _, level := range logLevels {
+				names = append(names, level.name)
+			}
+			return nil, fmt.Errorf("unknown log level %q, expected one of: %s", opts.Level,
+				strings.Join(names, ", "))
+		}
+	}
+	if !filter.since.IsZero() && !filter.until.IsZero() && filter.until.Before(filter.since) {
+		return nil, fmt.Errorf("the until time is before the since time")
+	}
+	if filter.grep == nil && !filter.hasLevel && !filter.hasTimeBounds() {
+		return nil, nil
+	}
+	return &filter, nil
+}
+
+// hasTimeBounds returns true if messages are filtered by time.
+func (f *Filter) hasTimeBounds() bool {
+	return f != nil && (!f.since.IsZero() || !f.until.IsZero())
+}
+
+// checksMessages returns true if messages are filtered by levels or time.
+func (f *Filter) checksMessages() bool {
+	return f != nil && (f.hasLevel || f.hasTimeBounds())
+}
+
+// lineTime parses a timestamp of the line.
+func lineTime(line []byte) (time.Time, bool) {
+	if len(line) == 0 || (line[0] != '{' && (line[0] < '0' || line[0] > '9')) {
+		return time.Time{}, false
+	}
+	return parseLogTime(string(line[:min(len(line), logTimePrefixLen)]))
+}
+
+// lineLevel returns a number of the level of the first line of a message.
+func lineLevel(line []byte) (int, bool) {
+	if start := bytes.Index(line, jsonLevelPrefix); start >= 0 {
+		name := line[start+len(jsonLevelPrefix):]
+		if end := bytes.IndexByte(name, '"'); end >= 0 {
+			for i, level := range logLevels {
+				if string(name[:end]) == level.jsonName {
+					return i, true
+				}
+			}
+		}
+		return 0, false
+	}
+	// The level character is followed by "> " in the plain format:
+	// "2024-01-01 00:00:00.000 [1] main/103/init.lua I> message".
+	if end := bytes.Index(line, []byte("> ")); end >= 2 && line[end-2] == ' ' {
+		for i, level := range logLevels {
+			if line[end-1] == level.char {
+				return i, true
+			}
+		}
+	}
+	return 0, false
+}
+
+// message checks the line if it starts a message. Returns true as the first
+// value if the line starts a message, the second value is true if
+// the message is selected.
+func (f *Filter) message(line []byte) (bool, bool) {
+	ts, ok := lineTime(line)
+	if !ok {
+		return false, false
+	}
+	if (!f.since.IsZero() && ts.Before(f.since)) || (!f.until.IsZero() && ts.After(f.until)) {
+		return true, false
+	}
+	if f.hasLevel {
+		level, ok := lineLevel(line)
+		return true, ok && level <= f.maxLevel
+	}
+	return true, true
+}
+
+// matchLine returns true if the line matches the regular expression.
+func (f *Filter) matchLine(line []byte) bool {
+	return f == nil || f.grep == nil || f.grep.Match(line)
+}
+
+// lineMatcher applies the filter to sequential lines of a log.
+type lineMatcher struct {
+	filter *Filter
+	// selected is true if the current message is selected.
+	selected bool
+}
+
+// newLineMatcher creates a matcher of lines with the filter. Lines before
+// the first message are treated as a part of a selected message.
+func newLineMatcher(filter *Filter) lineMatcher {
+	return lineMatcher{filter: filter, selected: true}
+}
+
+// match returns true if the next line is selected.
+func (m *lineMatcher) match(line []byte) bool {
+	if m.filter == nil {
+		return true
+	}
+	if m.filter.checksMessages() {
+		if isMessage, selected := m.filter.message(line); isMessage {
+			m.selected = selected
+		}
+		if !m.selected {
+			return false
+		}
+	}
+	return m.filter.matchLine(line)
+}
+
+// skipLine reads the rest of the current line. Returns a count of read bytes
+// and false if the line is not terminated.
+func skipLine(reader *bufio.Reader) (int64, bool) {
+	var n int64
+	for {
+		line, err := reader.ReadSlice('\n')
+		n += int64(len(line))
+		if err != bufio.ErrBufferFull {
+			return n, err == nil
+		}
+	}
+}
+
+// findMessage returns the offset of the first message starting at or after
+// the offset and before the limit, for which the predicate returns true.
+// Returns the limit if there is no such message.
+func findMessage(reader io.ReaderAt, offset, limit int64,
+	predicate func(ts time.Time) bool) (int64, time.Time, error) {
+	// skip is true if the offset is not at the start of a line.
+	skip := false
+	if offset > 0 {
+		var prev [1]byte
+		if _, err := reader.ReadAt(prev[:], offset-1); err != nil {
+			return 0, time.Time{}, err
+		}
+		skip = prev[0] != '\n'
+	}
+
+	section := bufio.NewReaderSize(io.NewSectionReader(reader, offset, limit-offset),
+		blockSize)
+	for offset < limit {
+		if !skip {
+			prefix, err := section.Peek(logTimePrefixLen)
+			if err != nil && err != io.EOF {
+				return 0, time.Time{}, err
+			}
+			if ts, ok := lineTime(prefix); ok && predicate(ts) {
+				return offset, ts, nil
+			}
+		}
+		skip = false
+		n, ok := skipLine(section)
+		if !ok {
+			break
+		}
+		offset += n
+	}
+	return limit, time.Time{}, nil
+}
+
+// searchTime returns the offset of the first message of the log with
+// a timestamp for which the predicate returns true. The predicate must be
+// false for earlier timestamps and true for later ones, so the log is
+// searched with a binary search.
+func searchTime(reader io.ReaderAt, size int64, predicate func(ts time.Time) bool) (int64,
+	error) {
+	anyTime := func(time.Time) bool { return true }
+	low, high := int64(0), size
+	for low < high {
+		mid := low + (high-low)/2
+		offset, ts, err := findMessage(reader, mid, high, anyTime)
+		if err != nil {
+			return 0, err
+		}
+		if offset == high {
+			// No messages in the second half.
+			high = mid
+		} else if predicate(ts) {
+			high = offset
+		} else {
+			low = offset + 1
+		}
+	}
+	offset, _, err := findMessage(reader, low, size, predicate)
+	return offset, err
+}
+
+// timeRange returns offsets of the part of the log with messages within
+// the time bounds of the filter.
+func (f *Filter) timeRange(reader io.ReaderAt, size int64) (int64, int64, error) {
+	start, end := int64(0), size
+	if !f.hasTimeBounds() {
+		return start, end, nil
+	}
+	var err error
+	if !f.since.IsZero() {
+		start, err = searchTime(reader, size, func(ts time.Time) bool {
+			return !ts.Before(f.since)
+		})
+		if err != nil {
+			return 0, 0, err
+		}
+	}
+	if !f.until.IsZero() {
+		end, err = searchTime(reader, size, func(ts time.Time) bool {
+			return ts.After(f.until)
+		})
+		if err != nil {
+			return 0, 0, err
+		}
+	}
+	return start, max(start, end), nil
+}
+
+// scanLinesBackward calls the function for lines of the part of the log from
+// the last one to the first one. Scanning is stopped if the function returns
+// false. The line is valid only during the call.
+func scanLinesBackward(ctx context.Context, reader io.ReaderAt, start, end int64,
+	fn func(offset int64, line []byte) bool) error {
+	if start >= end {
+		return nil
+	}
+	var last [1]byte
+	if _, err := reader.ReadAt(last[:], end-1); err != nil {
+		return err
+	}
+	pos := end
+	if last[0] == '\n' {
+		// The last new-line does not start a line.
+		pos--
+	}
+
+	buf := make([]byte, blockSize)
+	// carry is a part of the current line read from the next blocks.
+	var carry []byte
+	for pos > start {
+		select {
+		case <-ctx.Done():
+			return ctx.Err()
+		default:
+		}
+
+		blockStart := max(start, pos-blockSize)
+		block := buf[:pos-blockStart]
+		if _, err := reader.ReadAt(block, blockStart); err != nil && err != io.EOF {
+			return fmt.Errorf("failed to read: %s", err)
+		}
+		lineEnd := len(block)
+		for i := len(block) - 1; i >= 0; i-- {
+			if block[i] != '\n' {
+				continue
+			}
+			line := block[i+1 : lineEnd]
+			if len(carry) > 0 {
+				line = append(append([]byte{}, line...), carry...)
+				carry = carry[:0]
+			}
+			if !fn(blockStart+int64(i)+1, line) {
+				return nil
+			}
+			lineEnd = i
+		}
+		carry = append(append([]byte{}, block[:lineEnd]...), carry...)
+		pos = blockStart
+	}
+	fn(start, carry)
+	return nil
+}
+
+// lastLinesStart returns the offset of the n-th line from the end of the
+// part of the log among lines selected by the filter and the count of selected
+// lines after the offset. It is less than n if there are not enough lines.
+func (f *Filter) lastLinesStart(ctx context.Context, reader io.ReaderAt, start, end int64,
+	n int) (int64, int, error) {
+	if n <= 0 {
+		return end, 0, nil
+	}
+	result := start
+	found := 0
+	// pending contains offsets of lines of the current message matching
+	// the regular expression in the reverse order. The message is checked when
+	// its first line is reached.
+	pending := []int64{}
+	// flush counts pending lines if the message is selected.
+	flush := func(selected bool) bool {
+		if selected {
+			if found+len(pending) >= n {
+				result = pending[n-found-1]
+				found = n
+				return false
+			}
+			found += len(pending)
+		}
+		pending = pending[:0]
+		return true
+	}
+	stopped := false
+	err := scanLinesBackward(ctx, reader, start, end, func(offset int64, line []byte) bool {
+		if f.matchLine(line) {
+			pending = append(pending, offset)
+		}
+		if f.checksMessages() {
+			if isMessage, selected := f.message(line); isMessage {
+				stopped = !flush(selected)
+				return !stopped
+			}
+			return true
+		}
+		stopped = !flush(true)
+		return !stopped
+	})
+	if err != nil {
+		return 0, 0, err
+	}
+	if !stopped {
+		// Lines before the first message are treated as a selected message.
+		flush(true)
+	}
+	return result, found, nil
+}
+
+// sendLines sends lines of the reader selected by the filter to the channel.
+// Returns false if the context is done.
+func sendLines(ctx context.Context, out chan<- string, logFormatter LogFormatter,
+	reader io.Reader, filter *Filter) bool {
+	scanner := bufio.NewScanner(reader)
+	scanner.Buffer(make([]byte, blockSize), maxPartialLine)
+	matcher := newLineMatcher(filter)
+	for scanner.Scan() {
+		if !matcher.match(scanner.Bytes()) {
+			continue
+		}
+		select {
+		case <-ctx.Done():
+			return false
+		case out <- logFormatter(scanner.Text()):
+		}
+	}
+	return true
+}
@@ -0,0 +1,232 @@
+package tail
+
+import (
+	"context"
+	"fmt"
+	"os"
+	"path/filepath"
+	"strings"
+	"sync"
+	"testing"
+	"time"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
+
+const filterTestLog = `2024-05-13 12:00:00.000 [1] main/103/init.lua I> started
+2024-05-13 12:00:01.000 [1] main/103/init.lua W> slow request
+2024-05-13 12:00:02.000 [1] main/104/worker E> request failed
+stack traceback:
+	init.lua:1: in main chunk
+2024-05-13 12:00:03.000 [1] main/103/init.lua I> request done
+{"time": "2024-05-13T12:00:04.000+0000", "level": "ERROR", "message": "json failed"}
+2024-05-13 12:00:05.000 [1] main/103/init.lua D> debug message
+`
+
+func writeFilterTestLog(t *testing.T, text string) string {
+	t.Helper()
+	fileName := filepath.Join(t.TempDir(), "tt.log")
+	require.NoError(t, os.WriteFile(fileName, []byte(text), 0644))
+	return fileName
+}
+
+func localTime(t *testing.T, value string) time.Time {
+	t.Helper()
+	ts, err := time.ParseInLocation("2006-01-02 15:04:05.000", value, time.Local)
+	require.NoError(t, err)
+	return ts
+}
+
+func TestParseTime(t *testing.T) {
+	now := time.Date(2024, 5, 13, 12, 0, 0, 0, time.UTC)
+
+	ts, err := ParseTime("2h", now)
+	require.NoError(t, err)
+	assert.Equal(t, now.Add(-2*time.Hour), ts)
+
+	ts, err = ParseTime("2024-05-13T10:00:00Z", now)
+	require.NoError(t, err)
+	assert.True(t, ts.Equal(now.Add(-2*time.Hour)))
+
+	ts, err = ParseTime("2024-05-13 10:00:00", now)
+	require.NoError(t, err)
+	assert.Equal(t, localTime(t, "2024-05-13 10:00:00.000"), ts)
+
+	_, err = ParseTime("yesterday", now)
+	assert.ErrorContains(t, err, `invalid time "yesterday"`)
+}
+
+func TestNewFilter(t *testing.T) {
+	filter, err := NewFilter(FilterOpts{})
+	require.NoError(t, err)
+	assert.Nil(t, filter)
+
+	_, err = NewFilter(FilterOpts{Level: "warning"})
+	assert.ErrorContains(t, err, `unknown log level "warning"`)
+
+	_, err = NewFilter(FilterOpts{Grep: "("})
+	assert.ErrorContains(t, err, "invalid regular expression")
+
+	since := time.Now()
+	_, err = NewFilter(FilterOpts{Since: since, Until: since.Add(-time.Second)})
+	assert.ErrorContains(t, err, "the until time is before the since time")
+}
+
+func TestLineLevel(t *testing.T) {
+	tests := []struct {
+		line  string
+		level int
+		ok    bool
+	}{
+		{"2024-05-13 12:00:00.000 [1] main/103/init.lua I> started", 5, true},
+		{"2024-05-13 12:00:00.000 [1] main/103/init.lua init.lua:1 !> failed", 1, true},
+		{`{"time": "2024-05-13T12:00:04.000+0000", "level": "WARN"}`, 4, true},
+		{`{"time": "2024-05-13T12:00:04.000+0000", "level": "UNKNOWN"}`, 0, false},
+		{"stack traceback:", 0, false},
+	}
+	for _, tt := range tests {
+		t.Run(tt.line, func(t *testing.T) {
+			level, ok := lineLevel([]byte(tt.line))
+			assert.Equal(t, tt.ok, ok)
+			assert.Equal(t, tt.level, level)
+		})
+	}
+}
+
+func TestTailN_filter(t *testing.T) {
+	fileName := writeFilterTestLog(t, filterTestLog)
+	tests := []struct {
+		name     string
+		opts     FilterOpts
+		n        int
+		expected []string
+	}{
+		{
+			name: "grep",
+			opts: FilterOpts{Grep: "fail"},
+			n:    10,
+			expected: []string{
+				"2024-05-13 12:00:02.000 [1] main/104/worker E> request failed",
+				`{"time": "2024-05-13T12:00:04.000+0000", "level": "ERROR", ` +
+					`"message": "json failed"}`,
+			},
+		},
+		{
+			name: "last matching line",
+			opts: FilterOpts{Grep: "fail"},
+			n:    1,
+			expected: []string{
+				`{"time": "2024-05-13T12:00:04.000+0000", "level": "ERROR", ` +
+					`"message": "json failed"}`,
+			},
+		},
+		{
+			name: "level with continuation lines",
+			opts: FilterOpts{Level: "error"},
+			n:    3,
+			expected: []string{
+				"stack traceback:",
+				"\tinit.lua:1: in main chunk",
+				`{"time": "2024-05-13T12:00:04.000+0000", "level": "ERROR", ` +
+					`"message": "json failed"}`,
+			},
+		},
+		{
+			name: "level and grep",
+			opts: FilterOpts{Level: "WARN", Grep: "request"},
+			n:    10,
+			expected: []string{
+				"2024-05-13 12:00:01.000 [1] main/103/init.lua W> slow request",
+				"2024-05-13 12:00:02.000 [1] main/104/worker E> request failed",
+			},
+		},
+		{
+			name: "time range",
+			opts: FilterOpts{
+				Since: localTime(t, "2024-05-13 12:00:01.500"),
+				Until: localTime(t, "2024-05-13 12:00:03.000"),
+			},
+			n: 10,
+			expected: []string{
+				"2024-05-13 12:00:02.000 [1] main/104/worker E> request failed",
+				"stack traceback:",
+				"\tinit.lua:1: in main chunk",
+				"2024-05-13 12:00:03.000 [1] main/103/init.lua I> request done",
+			},
+		},
+		{
+			name:     "no lines",
+			opts:     FilterOpts{Grep: "fail"},
+			n:        0,
+			expected: []string{},
+		},
+	}
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			filter, err := NewFilter(tt.opts)
+			require.NoError(t, err)
+			in, err := TailN(context.Background(), noFormat, fileName, tt.n, filter)
+			require.NoError(t, err)
+			lines := []string{}
+			for line := range in {
+				lines = append(lines, line)
+			}
+			assert.Equal(t, tt.expected, lines)
+		})
+	}
+}
+
+func TestSearchTime(t *testing.T) {
+	start := localTime(t, "2024-05-13 12:00:00.000")
+	builder := strings.Builder{}
+	offsets := []int64{}
+	for i := 0; i < 2000; i++ {
+		offsets = append(offsets, int64(builder.Len()))
+		ts := start.Add(time.Duration(i/2) * time.Second).Format(plainTimeLayout)
+		fmt.Fprintf(&builder, "%s [1] main I> message %d\n", ts, i)
+		if i%7 == 0 {
+			builder.WriteString("continuation\n")
+		}
+	}
+	text := builder.String()
+	reader := strings.NewReader(text)
+
+	for _, second := range []int{0, 1, 500, 999} {
+		target := start.Add(time.Duration(second) * time.Second)
+		offset, err := searchTime(reader, int64(len(text)), func(ts time.Time) bool {
+			return !ts.Before(target)
+		})
+		require.NoError(t, err)
+		assert.Equal(t, offsets[second*2], offset, "second %d", second)
+	}
+
+	offset, err := searchTime(reader, int64(len(text)), func(ts time.Time) bool {
+		return ts.After(start.Add(time.Hour))
+	})
+	require.NoError(t, err)
+	assert.Equal(t, int64(len(text)), offset)
+}
+
+func TestFollow_filter(t *testing.T) {
+	fileName := writeFilterTestLog(t, filterTestLog)
+	filter, err := NewFilter(FilterOpts{Level: "error"})
+	require.NoError(t, err)
+
+	ctx, cancel := context.WithCancel(context.Background())
+	defer cancel()
+	in := make(chan string)
+	var wg sync.WaitGroup
+	require.NoError(t, Follow(ctx, in, noFormat, fileName, 1, filter, &wg))
+	assert.Equal(t, []string{
+		`{"time": "2024-05-13T12:00:04.000+0000", "level": "ERROR", "message": "json failed"}`,
+	}, receiveLines(t, in, 1))
+
+	appendFile(t, fileName, "2024-05-13 12:00:06.000 [1] main I> skipped\n"+
+		"2024-05-13 12:00:07.000 [1] main !> system error\n")
+	assert.Equal(t, []string{"2024-05-13 12:00:07.000 [1] main !> system error"},
+		receiveLines(t, in, 1))
+
+	cancel()
+	wg.Wait()
+}
@@ -0,0 +1,272 @@
+package tail
+
+import (
+	"bytes"
+	"context"
+	"errors"
+	"io/fs"
+	"os"
+	"path/filepath"
+	"sync"
+	"time"
+
+	"github.com/apex/log"
+	"github.com/fsnotify/fsnotify"
+)
+
+const (
+	// followChunkSize is a size of chunks to read appended data of files.
+	followChunkSize = 64 * 1024
+	// maxPartialLine is a maximum size of a line without a new-line kept to
+	// wait for its end. A longer line is sent as is.
+	maxPartialLine = 1024 * 1024
+	// followPollInterval is an interval to check followed files in case file
+	// system events are missed.
+	followPollInterval = time.Second
+)
+
+// followedFile is a file followed by the follower.
+type followedFile struct {
+	ctx       context.Context
+	path      string
+	dir       string
+	file      *os.File
+	info      os.FileInfo
+	offset    int64
+	partial   []byte
+	matcher   lineMatcher
+	out       chan<- string
+	formatter LogFormatter
+	wg        *sync.WaitGroup
+	// stopWake stops waking up the follower on the context cancellation.
+	stopWake func() bool
+}
+
+// follower reads data appended to many files in a single goroutine. The
+// directories of the files are watched by a single watcher.
+type follower struct {
+	mu      sync.Mutex
+	watcher *fsnotify.Watcher
+	// wake interrupts waiting for file system events of the running loop.
+	wake chan struct{}
+	// pending are the files to start following.
+	pending []*followedFile
+	// dirs contains counts of followed files by watched directories.
+	dirs map[string]int
+}
+
+// defaultFollower follows files of Follow calls.
+var defaultFollower follower
+
+// add starts following the file. The follower loop is started if it is not
+// running.
+func (f *follower) add(file *followedFile) error {
+	f.mu.Lock()
+	defer f.mu.Unlock()
+	if f.watcher == nil {
+		watcher, err := fsnotify.NewWatcher()
+		if err != nil {
+			return err
+		}
+		f.watcher = watcher
+		f.wake = make(chan struct{}, 1)
+		f.dirs = map[string]int{}
+		go f.run(watcher, f.wake)
+	}
+	if f.dirs[file.dir] == 0 {
+		if err := f.watcher.Add(file.dir); err != nil {
+			return err
+		}
+	}
+	f.dirs[file.dir]++
+	file.stopWake = context.AfterFunc(file.ctx, f.signal)
+	f.pending = append(f.pending, file)
+	f.signalLocked()
+	return nil
+}
+
+// signal wakes up the follower loop.
+func (f *follower) signal() {
+	f.mu.Lock()
+	defer f.mu.Unlock()
+	f.signalLocked()
+}
+
+// signalLocked wakes up the follower loop. The mutex must be locked.
+func (f *follower) signalLocked() {
+	select {
+	case f.wake <- struct{}{}:
+	default:
+	}
+}
+
+// remove stops following the file.
+func (f *follower) remove(file *followedFile) {
+	file.stopWake()
+	file.file.Close()
+	file.wg.Done()
+
+	f.mu.Lock()
+	defer f.mu.Unlock()
+	f.dirs[file.dir]--
+	if f.dirs[file.dir] == 0 {
+		delete(f.dirs, file.dir)
+		// The watch is removed automatically if the directory is removed.
+		f.watcher.Remove(file.dir)
+	}
+}
+
+// run is the follower loop. It exits when there are no followed files.
+func (f *follower) run(watcher *fsnotify.Watcher, wake <-chan struct{}) {
+	ticker := time.NewTicker(followPollInterval)
+	defer ticker.Stop()
+	buf := make([]byte, followChunkSize)
+	// files contains followed files by directories.
+	files := map[string][]*followedFile{}
+	count := 0
+	for {
+		f.mu.Lock()
+		pending := f.pending
+		f.pending = nil
+		if len(pending) == 0 && count == 0 {
+			f.watcher = nil
+			f.mu.Unlock()
+			watcher.Close()
+			return
+		}
+		f.mu.Unlock()
+		for _, file := range pending {
+			files[file.dir] = append(files[file.dir], file)
+			count++
+			file.read(buf)
+		}
+
+		// pollDirs contains the directories to check files of. Nil means all.
+		var pollDirs []string
+		select {
+		case <-wake:
+		case event := <-watcher.Events:
+			// The event is about a file in a watched directory or about
+			// the directory itself.
+			pollDirs = []string{filepath.Dir(event.Name), event.Name}
+		case err := <-watcher.Errors:
+			log.Warnf("Failed to watch log files: %s", err)
+		case <-ticker.C:
+		}
+
+		for dir, dirFiles := range files {
+			poll := pollDirs == nil
+			for _, pollDir := range pollDirs {
+				poll = poll || pollDir == dir
+			}
+			kept := dirFiles[:0]
+			for _, file := range dirFiles {
+				ok := file.ctx.Err() == nil
+				if ok && poll {
+					ok = file.poll(buf)
+				}
+				if ok {
+					kept = append(kept, file)
+				} else {
+					f.remove(file)
+					count--
+				}
+			}
+			if len(kept) == 0 {
+				delete(files, dir)
+			} else {
+				files[dir] = kept
+			}
+		}
+	}
+}
+
+// poll reads data appended to the file. The file is reopened if the path
+// points to another file after rotation, and it is read from the beginning
+// if it is truncated. Returns false if the file must not be followed anymore.
+func (file *followedFile) poll(buf []byte) bool {
+	info, err := os.Stat(file.path)
+	if err != nil {
+		if _, dirErr := os.Stat(file.dir); errors.Is(dirErr, fs.ErrNotExist) {
+			// No new file could be created after rotation.
+			file.read(buf)
+			log.Errorf("Failed to detect creation of %q: the directory is removed",
+				file.path)
+			return false
+		}
+	} else if !os.SameFile(info, file.info) {
+		// The file is rotated. Read the rest of the old file before switching.
+		if !file.read(buf) {
+			return false
+		}
+		newFile, err := os.Open(file.path)
+		if err != nil {
+			// The new file is not created completely yet.
+			return true
+		}
+		if info, err = newFile.Stat(); err != nil {
+			newFile.Close()
+			return true
+		}
+		if len(file.partial) > 0 && !file.send(file.partial) {
+			newFile.Close()
+			return false
+		}
+		file.file.Close()
+		file.file, file.info, file.offset, file.partial = newFile, info, 0, nil
+	} else if info.Size() < file.offset {
+		file.offset, file.partial = 0, nil
+	}
+	return file.read(buf)
+}
+
+// read reads data appended to the file by chunks and sends complete lines.
+// Returns false if the context is done.
+func (file *followedFile) read(buf []byte) bool {
+	for {
+		n, err := file.file.ReadAt(buf, file.offset)
+		file.offset += int64(n)
+		data := buf[:n]
+		for len(data) > 0 {
+			end := bytes.IndexByte(data, '\n')
+			if end < 0 {
+				file.partial = append(file.partial, data...)
+				if len(file.partial) > maxPartialLine {
+					if !file.send(file.partial) {
+						return false
+					}
+					file.partial = file.partial[:0]
+				}
+				break
+			}
+			line := data[:end]
+			if len(file.partial) > 0 {
+				file.partial = append(file.partial, line...)
+				line = file.partial
+			}
+			sent := file.send(line)
+			file.partial = file.partial[:0]
+			if !sent {
+				return false
+			}
+			data = data[end+1:]
+		}
+		if err != nil || n < len(buf) {
+			return true
+		}
+	}
+}
+
+// send sends the formatted line if it is selected by the filter. Returns false
+// if the context is done.
+func (file *followedFile) send(line []byte) bool {
+	if !file.matcher.match(line) {
+		return file.ctx.Err() == nil
+	}
+	select {
+	case <-file.ctx.Done():
+		return false
+	case file.out <- file.formatter(string(line)):
+		return true
+	}
+}
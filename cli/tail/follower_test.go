@@ -0,0 +1,121 @@
+package tail
+
+import (
+	"context"
+	"fmt"
+	"os"
+	"path/filepath"
+	"sync"
+	"testing"
+	"time"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
+
+func receiveLines(t *testing.T, in <-chan string, count int) []string {
+	t.Helper()
+	lines := []string{}
+	timeout := time.After(5 * time.Second)
+	for len(lines) < count {
+		select {
+		case line := <-in:
+			lines = append(lines, line)
+		case <-timeout:
+			require.FailNow(t, "timeout", "received lines: %v", lines)
+		}
+	}
+	return lines
+}
+
+func appendFile(t *testing.T, fileName string, text string) {
+	t.Helper()
+	file, err := os.OpenFile(fileName, os.O_APPEND|os.O_CREATE|os.O_WRONLY, 0644)
+	require.NoError(t, err)
+	defer file.Close()
+	_, err = file.WriteString(text)
+	require.NoError(t, err)
+}
+
+func noFormat(str string) string {
+	return str
+}
+
+func TestFollow_rotation(t *testing.T) {
+	fileName := filepath.Join(t.TempDir(), "tt.log")
+	appendFile(t, fileName, "line 1\n")
+
+	ctx, cancel := context.WithCancel(context.Background())
+	defer cancel()
+	in := make(chan string)
+	var wg sync.WaitGroup
+	require.NoError(t, Follow(ctx, in, noFormat, fileName, 0, nil, &wg))
+
+	// A partial line is sent when it is completed.
+	appendFile(t, fileName, "line 2\nline")
+	appendFile(t, fileName, " 3\n")
+	assert.Equal(t, []string{"line 2", "line 3"}, receiveLines(t, in, 2))
+
+	// Lines written to the rotated file and to the new one are sent.
+	require.NoError(t, os.Rename(fileName, fileName+".1"))
+	appendFile(t, fileName+".1", "line 4\n")
+	appendFile(t, fileName, "line 5\n")
+	assert.Equal(t, []string{"line 4", "line 5"}, receiveLines(t, in, 2))
+
+	// A truncated file is read from the beginning.
+	require.NoError(t, os.WriteFile(fileName, []byte("6\n"), 0644))
+	assert.Equal(t, []string{"6"}, receiveLines(t, in, 1))
+
+	cancel()
+	wg.Wait()
+}
+
+func TestFollow_manyFiles(t *testing.T) {
+	ctx, cancel := context.WithCancel(context.Background())
+	defer cancel()
+	in := make(chan string)
+	var wg sync.WaitGroup
+	// Some files share directories.
+	dirs := []string{t.TempDir(), t.TempDir(), t.TempDir()}
+	fileNames := []string{}
+	for i := 0; i < 20; i++ {
+		fileName := filepath.Join(dirs[i%len(dirs)], fmt.Sprintf("%d.log", i))
+		appendFile(t, fileName, "")
+		prefix := fmt.Sprintf("%d: ", i)
+		require.NoError(t, Follow(ctx, in, func(str string) string {
+			return prefix + str
+		}, fileName, 0, nil, &wg))
+		fileNames = append(fileNames, fileName)
+	}
+
+	for i, fileName := range fileNames {
+		appendFile(t, fileName, "line\n")
+		assert.Equal(t, []string{fmt.Sprintf("%d: line", i)}, receiveLines(t, in, 1))
+	}
+	cancel()
+	wg.Wait()
+}
+
+func TestFollow_dirRemoved(t *testing.T) {
+	dir := filepath.Join(t.TempDir(), "log")
+	require.NoError(t, os.Mkdir(dir, 0755))
+	fileName := filepath.Join(dir, "tt.log")
+	appendFile(t, fileName, "line 1\n")
+
+	in := make(chan string)
+	var wg sync.WaitGroup
+	require.NoError(t, Follow(context.Background(), in, noFormat, fileName, 1, nil, &wg))
+	assert.Equal(t, []string{"line 1"}, receiveLines(t, in, 1))
+
+	require.NoError(t, os.RemoveAll(dir))
+	done := make(chan struct{})
+	go func() {
+		wg.Wait()
+		close(done)
+	}()
+	select {
+	case <-done:
+	case <-time.After(5 * time.Second):
+		require.FailNow(t, "the file is still followed")
+	}
+}
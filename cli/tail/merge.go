@@ -0,0 +1,231 @@
+package tail
+
+import (
+	"container/heap"
+	"context"
+	"strings"
+	"time"
+)
+
+const (
+	// DefaultReorderWindow is a default time to hold followed lines to put
+	// lines of other streams written at the same time before them.
+	DefaultReorderWindow = 200 * time.Millisecond
+	// maxReorderLines is a maximum count of held followed lines. The oldest
+	// line is sent without waiting when the limit is reached.
+	maxReorderLines = 4096
+
+	// plainTimeLayout is a layout of a timestamp of a tarantool log line in
+	// the plain format.
+	plainTimeLayout = "2006-01-02 15:04:05.000"
+	// jsonTimeLayout is a layout of a timestamp of a tarantool log line in
+	// the JSON format.
+	jsonTimeLayout = "2006-01-02T15:04:05.000-0700"
+	// jsonTimePrefix starts a tarantool log line in the JSON format.
+	jsonTimePrefix = `{"time": "`
+)
+
+// LogStream is a stream of log lines of an instance. Lines are not formatted
+// yet, the formatter is applied after the lines are merged.
+type LogStream struct {
+	Lines     <-chan string
+	Formatter LogFormatter
+}
+
+// parseLogTime parses a timestamp at the beginning of a tarantool log line.
+func parseLogTime(line string) (time.Time, bool) {
+	if len(line) >= len(plainTimeLayout) {
+		ts, err := time.ParseInLocation(plainTimeLayout, line[:len(plainTimeLayout)],
+			time.Local)
+		if err == nil {
+			return ts, true
+		}
+	}
+	if rest, ok := strings.CutPrefix(line, jsonTimePrefix); ok {
+		if end := strings.IndexByte(rest, '"'); end > 0 {
+			if ts, err := time.Parse(jsonTimeLayout, rest[:end]); err == nil {
+				return ts, true
+			}
+		}
+	}
+	return time.Time{}, false
+}
+
+// mergeLine is a log line waiting to be merged.
+type mergeLine struct {
+	ts     time.Time
+	stream int
+	// seq is a number of the line among all received lines. It keeps the order
+	// of lines of a stream with equal timestamps.
+	seq     uint64
+	arrival time.Time
+	text    string
+}
+
+// mergeHeap orders log lines by timestamps. Lines with equal timestamps are
+// ordered by streams, so lines of multiline messages are not mixed with lines
+// of other streams.
+type mergeHeap []mergeLine
+
+func (h mergeHeap) Len() int { return len(h) }
+
+func (h mergeHeap) Less(i, j int) bool {
+	if !h[i].ts.Equal(h[j].ts) {
+		return h[i].ts.Before(h[j].ts)
+	}
+	if h[i].stream != h[j].stream {
+		return h[i].stream < h[j].stream
+	}
+	return h[i].seq < h[j].seq
+}
+
+func (h mergeHeap) Swap(i, j int) { h[i], h[j] = h[j], h[i] }
+
+func (h *mergeHeap) Push(x any) { *h = append(*h, x.(mergeLine)) }
+
+func (h *mergeHeap) Pop() any {
+	old := *h
+	line := old[len(old)-1]
+	*h = old[:len(old)-1]
+	return line
+}
+
+// streamClock assigns timestamps to lines of a stream. Lines without
+// a timestamp, like parts of multiline messages, get the timestamp of
+// the previous line.
+type streamClock struct {
+	last time.Time
+}
+
+// timestamp returns the timestamp of the line.
+func (c *streamClock) timestamp(line string) time.Time {
+	if ts, ok := parseLogTime(line); ok {
+		c.last = ts
+	}
+	return c.last
+}
+
+// MergeN sends lines of the finite streams to the channel ordered by their
+// timestamps. Each stream must be ordered itself, so only the current line of
+// each stream is kept in memory.
+func MergeN(ctx context.Context, streams []LogStream) <-chan string {
+	out := make(chan string, 64)
+	go func() {
+		defer close(out)
+		clocks := make([]streamClock, len(streams))
+		lines := make(mergeHeap, 0, len(streams))
+		var seq uint64
+		// next pushes the next line of the stream to the heap.
+		next := func(i int) bool {
+			select {
+			case <-ctx.Done():
+				return false
+			case line, ok := <-streams[i].Lines:
+				if ok {
+					seq++
+					heap.Push(&lines, mergeLine{
+						ts:     clocks[i].timestamp(line),
+						stream: i,
+						seq:    seq,
+						text:   line,
+					})
+				}
+				return true
+			}
+		}
+		for i := range streams {
+			if !next(i) {
+				return
+			}
+		}
+		for lines.Len() > 0 {
+			line := heap.Pop(&lines).(mergeLine)
+			select {
+			case <-ctx.Done():
+				return
+			case out <- streams[line.stream].Formatter(line.text):
+			}
+			if !next(line.stream) {
+				return
+			}
+		}
+	}()
+	return out
+}
+
+// MergeFollow sends lines of the infinite streams to the channel ordered by
+// their timestamps. Each line is held for the reorder window, so lines of
+// other streams written at the same time could arrive and be sent before it.
+// The channel is closed when all streams are closed or the context is done.
+func MergeFollow(ctx context.Context, streams []LogStream, window time.Duration) <-chan string {
+	// The channel is not buffered, so a stream is reported as done only
+	// after all its lines are received.
+	in := make(chan mergeLine)
+	done := make(chan struct{}, len(streams))
+	for i, stream := range streams {
+		go func(i int, stream LogStream) {
+			defer func() { done <- struct{}{} }()
+			var clock streamClock
+			for text := range stream.Lines {
+				select {
+				case <-ctx.Done():
+					return
+				case in <- mergeLine{ts: clock.timestamp(text), stream: i, text: text}:
+				}
+			}
+		}(i, stream)
+	}
+
+	out := make(chan string, 64)
+	go func() {
+		defer close(out)
+		timer := time.NewTimer(window)
+		if !timer.Stop() {
+			<-timer.C
+		}
+		lines := mergeHeap{}
+		var seq uint64
+		active := len(streams)
+		for active > 0 || lines.Len() > 0 {
+			// Send the lines which were held long enough.
+			now := time.Now()
+			for lines.Len() > 0 && (active == 0 || lines.Len() > maxReorderLines ||
+				!now.Before(lines[0].arrival.Add(window))) {
+				line := heap.Pop(&lines).(mergeLine)
+				select {
+				case <-ctx.Done():
+					return
+				case out <- streams[line.stream].Formatter(line.text):
+				}
+			}
+			if active == 0 {
+				return
+			}
+
+			var wait <-chan time.Time
+			if lines.Len() > 0 {
+				timer.Reset(lines[0].arrival.Add(window).Sub(now))
+				wait = timer.C
+			}
+			select {
+			case <-ctx.Done():
+				return
+			case <-done:
+				active--
+			case line := <-in:
+				seq++
+				line.seq = seq
+				line.arrival = time.Now()
+				heap.Push(&lines, line)
+			case <-wait:
+			}
+			if wait != nil && !timer.Stop() {
+				select {
+				case <-timer.C:
+				default:
+				}
+			}
+		}
+	}()
+	return out
+}
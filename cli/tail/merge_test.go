@@ -0,0 +1,108 @@
+package tail
+
+import (
+	"context"
+	"testing"
+	"time"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
+
+func TestParseLogTime(t *testing.T) {
+	ts, ok := parseLogTime("2024-05-28 12:00:01.123 [1234] main/104/init I> started")
+	require.True(t, ok)
+	assert.Equal(t, time.Date(2024, 5, 28, 12, 0, 1, 123000000, time.Local), ts)
+
+	ts, ok = parseLogTime(`{"time": "2024-05-28T12:00:01.123+0300", "level": "INFO"}`)
+	require.True(t, ok)
+	assert.Equal(t, time.Date(2024, 5, 28, 9, 0, 1, 123000000, time.UTC), ts.UTC())
+
+	_, ok = parseLogTime("stack traceback:")
+	assert.False(t, ok)
+	_, ok = parseLogTime("")
+	assert.False(t, ok)
+}
+
+func newStream(prefix string, lines ...string) LogStream {
+	ch := make(chan string, len(lines))
+	for _, line := range lines {
+		ch <- line
+	}
+	close(ch)
+	return LogStream{
+		Lines:     ch,
+		Formatter: func(str string) string { return prefix + str },
+	}
+}
+
+func collectLines(t *testing.T, in <-chan string) []string {
+	t.Helper()
+	lines := []string{}
+	timeout := time.After(5 * time.Second)
+	for {
+		select {
+		case line, ok := <-in:
+			if !ok {
+				return lines
+			}
+			lines = append(lines, line)
+		case <-timeout:
+			require.FailNow(t, "timeout")
+		}
+	}
+}
+
+func TestMergeN(t *testing.T) {
+	streams := []LogStream{
+		newStream("a: ",
+			"2024-05-28 12:00:01.000 first",
+			"2024-05-28 12:00:03.000 third",
+			"continuation of third",
+		),
+		newStream("b: ",
+			"2024-05-28 12:00:02.000 second",
+			"2024-05-28 12:00:03.000 fourth",
+		),
+		newStream("c: "),
+	}
+	lines := collectLines(t, MergeN(context.Background(), streams))
+	assert.Equal(t, []string{
+		"a: 2024-05-28 12:00:01.000 first",
+		"b: 2024-05-28 12:00:02.000 second",
+		"a: 2024-05-28 12:00:03.000 third",
+		"a: continuation of third",
+		"b: 2024-05-28 12:00:03.000 fourth",
+	}, lines)
+}
+
+func TestMergeFollow(t *testing.T) {
+	a := make(chan string)
+	b := make(chan string)
+	format := func(str string) string { return str }
+	out := MergeFollow(context.Background(), []LogStream{
+		{Lines: a, Formatter: format},
+		{Lines: b, Formatter: format},
+	}, 100*time.Millisecond)
+
+	// The later line arrives first, but it is reordered within the window.
+	b <- "2024-05-28 12:00:02.000 second"
+	a <- "2024-05-28 12:00:01.000 first"
+	assert.Equal(t, "2024-05-28 12:00:01.000 first", <-out)
+	assert.Equal(t, "2024-05-28 12:00:02.000 second", <-out)
+
+	a <- "2024-05-28 12:00:03.000 third"
+	close(a)
+	close(b)
+	assert.Equal(t, []string{"2024-05-28 12:00:03.000 third"}, collectLines(t, out))
+}
+
+func TestMergeFollow_cancel(t *testing.T) {
+	ctx, cancel := context.WithCancel(context.Background())
+	lines := make(chan string)
+	out := MergeFollow(ctx, []LogStream{{Lines: lines, Formatter: func(s string) string {
+		return s
+	}}}, time.Second)
+	cancel()
+	assert.Empty(t, collectLines(t, out))
+}
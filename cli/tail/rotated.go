@@ -0,0 +1,356 @@
+package tail
+
+import (
+	"bufio"
+	"compress/gzip"
+	"context"
+	"fmt"
+	"io"
+	"os"
+	"path/filepath"
+	"regexp"
+	"sort"
+	"strconv"
+	"strings"
+	"time"
+
+	"github.com/apex/log"
+	"github.com/klauspost/compress/zstd"
+)
+
+// rotatedSuffixRe matches a suffix of a rotated log file name without
+// a compression extension: a number or a date of rotation.
+var rotatedSuffixRe = regexp.MustCompile(`^(?:\.(\d+)|-(\d[\d._-]*))$`)
+
+// compressedExts are extensions of compressed rotated log files.
+var compressedExts = []string{".gz", ".zst"}
+
+// rotatedLogs returns rotated files of the log from the newest one to
+// the oldest one. Rotated files are named "<log>.<number>" or "<log>-<date>",
+// optionally with a compression extension.
+func rotatedLogs(fileName string) ([]string, error) {
+	entries, err := os.ReadDir(filepath.Dir(fileName))
+	if err != nil {
+		return nil, err
+	}
+	type rotatedLog struct {
+		name   string
+		number int
+		date   string
+	}
+	base := filepath.Base(fileName)
+	logs := []rotatedLog{}
+	for _, entry := range entries {
+		name := entry.Name()
+		suffix, ok := strings.CutPrefix(name, base)
+		if !ok || entry.IsDir() {
+			continue
+		}
+		for _, ext := range compressedExts {
+			suffix = strings.TrimSuffix(suffix, ext)
+		}
+		match := rotatedSuffixRe.FindStringSubmatch(suffix)
+		if match == nil {
+			continue
+		}
+		rotated := rotatedLog{name: name, number: -1, date: match[2]}
+		if match[1] != "" {
+			if rotated.number, err = strconv.Atoi(match[1]); err != nil {
+				continue
+			}
+		}
+		logs = append(logs, rotated)
+	}
+	// Numbered files are rotated later than dated ones. The less is the number
+	// or the greater is the date, the newer is the file.
+	sort.Slice(logs, func(i, j int) bool {
+		if (logs[i].number < 0) != (logs[j].number < 0) {
+			return logs[i].number >= 0
+		}
+		if logs[i].number != logs[j].number {
+			return logs[i].number < logs[j].number
+		}
+		return logs[i].date > logs[j].date
+	})
+	files := make([]string, 0, len(logs))
+	for _, rotated := range logs {
+		files = append(files, filepath.Join(filepath.Dir(fileName), rotated.name))
+	}
+	return files, nil
+}
+
+// isCompressed returns true if the log file is compressed.
+func isCompressed(fileName string) bool {
+	for _, ext := range compressedExts {
+		if strings.HasSuffix(fileName, ext) {
+			return true
+		}
+	}
+	return false
+}
+
+// decompressedFile is a reader of a decompressed log file.
+type decompressedFile struct {
+	io.Reader
+	file  *os.File
+	close func()
+}
+
+// Close closes the decompressor and the file.
+func (f *decompressedFile) Close() error {
+	f.close()
+	return f.file.Close()
+}
+
+// openCompressed opens the compressed log file for streamed decompression.
+func openCompressed(fileName string) (*decompressedFile, error) {
+	file, err := os.Open(fileName)
+	if err != nil {
+		return nil, fmt.Errorf("cannot open %q: %w", fileName, err)
+	}
+	if strings.HasSuffix(fileName, ".gz") {
+		reader, err := gzip.NewReader(file)
+		if err != nil {
+			file.Close()
+			return nil, fmt.Errorf("cannot decompress %q: %w", fileName, err)
+		}
+		return &decompressedFile{reader, file, func() { reader.Close() }}, nil
+	}
+	reader, err := zstd.NewReader(file, zstd.WithDecoderConcurrency(1))
+	if err != nil {
+		file.Close()
+		return nil, fmt.Errorf("cannot decompress %q: %w", fileName, err)
+	}
+	return &decompressedFile{reader, file, reader.Close}, nil
+}
+
+// scanCompressed calls the function for lines of the compressed log file
+// selected by the filter. Reading is stopped after the until time of
+// the filter or if the function returns false.
+func scanCompressed(ctx context.Context, fileName string, filter *Filter,
+	fn func(line []byte) bool) error {
+	file, err := openCompressed(fileName)
+	if err != nil {
+		return err
+	}
+	defer file.Close()
+
+	scanner := bufio.NewScanner(file)
+	scanner.Buffer(make([]byte, blockSize), maxPartialLine)
+	matcher := newLineMatcher(filter)
+	for scanner.Scan() {
+		if ctx.Err() != nil {
+			return ctx.Err()
+		}
+		line := scanner.Bytes()
+		if filter != nil && !filter.until.IsZero() {
+			if ts, ok := lineTime(line); ok && ts.After(filter.until) {
+				return nil
+			}
+		}
+		if matcher.match(line) && !fn(line) {
+			return nil
+		}
+	}
+	if err := scanner.Err(); err != nil {
+		return fmt.Errorf("cannot read %q: %w", fileName, err)
+	}
+	return nil
+}
+
+// firstMessageTime returns a timestamp of the first message of the log file.
+func firstMessageTime(fileName string) (time.Time, bool, error) {
+	var reader io.Reader
+	if isCompressed(fileName) {
+		file, err := openCompressed(fileName)
+		if err != nil {
+			return time.Time{}, false, err
+		}
+		defer file.Close()
+		reader = file
+	} else {
+		file, err := os.Open(fileName)
+		if err != nil {
+			return time.Time{}, false, fmt.Errorf("cannot open %q: %w", fileName, err)
+		}
+		defer file.Close()
+		reader = file
+	}
+	scanner := bufio.NewScanner(reader)
+	scanner.Buffer(make([]byte, blockSize), maxPartialLine)
+	for scanner.Scan() {
+		if ts, ok := lineTime(scanner.Bytes()); ok {
+			return ts, true, nil
+		}
+	}
+	return time.Time{}, false, scanner.Err()
+}
+
+// logPart is a part of a log file with lines to send. The zero value is
+// an empty part.
+type logPart struct {
+	// file is an open uncompressed log file.
+	file *os.File
+	// start and end are offsets of the part of the uncompressed file.
+	start, end int64
+	// compressed is a name of the compressed log file.
+	compressed string
+	// skip is a count of selected lines of the compressed file to skip.
+	skip int
+}
+
+// close closes the log file of the part.
+func (part *logPart) close() {
+	if part.file != nil {
+		part.file.Close()
+	}
+}
+
+// send sends lines of the part selected by the filter to the channel.
+// Returns false if sending is interrupted.
+func (part *logPart) send(ctx context.Context, out chan<- string, logFormatter LogFormatter,
+	filter *Filter) bool {
+	if part.file != nil {
+		return sendLines(ctx, out, logFormatter,
+			io.NewSectionReader(part.file, part.start, part.end-part.start), filter)
+	}
+	if part.compressed == "" {
+		return true
+	}
+	skip := part.skip
+	sent := true
+	err := scanCompressed(ctx, part.compressed, filter, func(line []byte) bool {
+		if skip > 0 {
+			skip--
+			return true
+		}
+		select {
+		case <-ctx.Done():
+			sent = false
+		case out <- logFormatter(string(line)):
+		}
+		return sent
+	})
+	if err != nil {
+		log.Errorf("%s", err)
+		return false
+	}
+	return sent
+}
+
+// lastPart returns the part of the uncompressed log file with last n lines
+// selected by the filter and the count of the lines.
+func lastPart(ctx context.Context, file *os.File, n int, filter *Filter) (logPart, int,
+	error) {
+	info, err := file.Stat()
+	if err != nil {
+		return logPart{}, 0, err
+	}
+	start, end, err := filter.timeRange(file, info.Size())
+	if err != nil {
+		return logPart{}, 0, err
+	}
+	start, found, err := filter.lastLinesStart(ctx, file, start, end, n)
+	if err != nil {
+		return logPart{}, 0, err
+	}
+	return logPart{file: file, start: start, end: end}, found, nil
+}
+
+// lastCompressedPart returns the part of the compressed log file with last n
+// lines selected by the filter and the count of the lines. The file is read
+// completely to count the lines, it is decompressed again to send them.
+func lastCompressedPart(ctx context.Context, fileName string, n int,
+	filter *Filter) (logPart, int, error) {
+	if filter != nil && !filter.until.IsZero() {
+		// Skip files written completely after the time range.
+		ts, ok, err := firstMessageTime(fileName)
+		if err != nil {
+			return logPart{}, 0, err
+		}
+		if ok && ts.After(filter.until) {
+			return logPart{}, 0, nil
+		}
+	}
+	total := 0
+	err := scanCompressed(ctx, fileName, filter, func([]byte) bool {
+		total++
+		return true
+	})
+	if err != nil {
+		return logPart{}, 0, err
+	}
+	if total == 0 {
+		return logPart{}, 0, nil
+	}
+	found := min(total, n)
+	return logPart{compressed: fileName, skip: total - found}, found, nil
+}
+
+// writtenBefore returns true if the log file starts before the since time of
+// the filter, so older rotated files contain no lines in the time range.
+func writtenBefore(fileName string, filter *Filter) (bool, error) {
+	if filter == nil || filter.since.IsZero() {
+		return false, nil
+	}
+	ts, ok, err := firstMessageTime(fileName)
+	return ok && ts.Before(filter.since), err
+}
+
+// lastLogParts returns parts of the log file and its rotated files with
+// the last n lines selected by the filter, from the newest part to the oldest
+// one. Older rotated files are not read when enough lines are found or newer
+// files start before the time range.
+func lastLogParts(ctx context.Context, fileName string, n int, filter *Filter) ([]logPart,
+	error) {
+	file, err := os.Open(fileName)
+	if err != nil {
+		return nil, fmt.Errorf("cannot open %q: %w", fileName, err)
+	}
+	part, found, err := lastPart(ctx, file, n, filter)
+	if err != nil {
+		file.Close()
+		return nil, err
+	}
+	parts := []logPart{part}
+	closeParts := func() {
+		for _, part := range parts {
+			part.close()
+		}
+	}
+
+	stop, err := writtenBefore(fileName, filter)
+	if err != nil {
+		closeParts()
+		return nil, err
+	}
+	rotated, err := rotatedLogs(fileName)
+	if err != nil {
+		closeParts()
+		return nil, err
+	}
+	for _, name := range rotated {
+		if stop || found >= n {
+			break
+		}
+		var count int
+		if isCompressed(name) {
+			part, count, err = lastCompressedPart(ctx, name, n-found, filter)
+		} else if file, err = os.Open(name); err == nil {
+			part, count, err = lastPart(ctx, file, n-found, filter)
+			if err != nil {
+				file.Close()
+			}
+		}
+		if err == nil {
+			stop, err = writtenBefore(name, filter)
+		}
+		if err != nil {
+			closeParts()
+			return nil, err
+		}
+		parts = append(parts, part)
+		found += count
+	}
+	return parts, nil
+}
@@ -0,0 +1,130 @@
+package tail
+
+import (
+	"compress/gzip"
+	"context"
+	"fmt"
+	"os"
+	"path/filepath"
+	"strings"
+	"testing"
+
+	"github.com/klauspost/compress/zstd"
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
+
+// writeRotatedLog writes log lines with numbers from first to last to the file.
+// The file is compressed according to its extension.
+func writeRotatedLog(t *testing.T, fileName string, first, last int) {
+	t.Helper()
+	text := strings.Builder{}
+	for i := first; i <= last; i++ {
+		fmt.Fprintf(&text, "2024-05-28 12:00:%02d.000 [1] main I> line %d\n", i, i)
+	}
+	file, err := os.Create(fileName)
+	require.NoError(t, err)
+	defer file.Close()
+	switch filepath.Ext(fileName) {
+	case ".gz":
+		writer := gzip.NewWriter(file)
+		_, err = writer.Write([]byte(text.String()))
+		require.NoError(t, err)
+		require.NoError(t, writer.Close())
+	case ".zst":
+		writer, err := zstd.NewWriter(file)
+		require.NoError(t, err)
+		_, err = writer.Write([]byte(text.String()))
+		require.NoError(t, err)
+		require.NoError(t, writer.Close())
+	default:
+		_, err = file.WriteString(text.String())
+		require.NoError(t, err)
+	}
+}
+
+func TestRotatedLogs(t *testing.T) {
+	dir := t.TempDir()
+	for _, name := range []string{"tt.log", "tt.log.1", "tt.log.2.gz", "tt.log.10.zst",
+		"tt.log.3.zst", "tt.log-20240101.gz", "tt.log-20240102", "tt.log.idx",
+		"other.log.1", "tt.log.gz"} {
+		require.NoError(t, os.WriteFile(filepath.Join(dir, name), []byte{}, 0644))
+	}
+
+	files, err := rotatedLogs(filepath.Join(dir, "tt.log"))
+	require.NoError(t, err)
+	expected := []string{}
+	for _, name := range []string{"tt.log.1", "tt.log.2.gz", "tt.log.3.zst", "tt.log.10.zst",
+		"tt.log-20240102", "tt.log-20240101.gz"} {
+		expected = append(expected, filepath.Join(dir, name))
+	}
+	assert.Equal(t, expected, files)
+}
+
+func TestTailN_rotated(t *testing.T) {
+	dir := t.TempDir()
+	fileName := filepath.Join(dir, "tt.log")
+	writeRotatedLog(t, fileName, 7, 8)
+	writeRotatedLog(t, fileName+".1", 5, 6)
+	writeRotatedLog(t, fileName+".2.gz", 3, 4)
+	writeRotatedLog(t, fileName+".3.zst", 1, 2)
+
+	lineNumbers := func(n int, filter *Filter) []string {
+		in, err := TailN(context.Background(), func(str string) string {
+			return str[strings.Index(str, "line"):]
+		}, fileName, n, filter)
+		require.NoError(t, err)
+		lines := []string{}
+		for line := range in {
+			lines = append(lines, line)
+		}
+		return lines
+	}
+
+	assert.Equal(t, []string{"line 7", "line 8"}, lineNumbers(2, nil))
+	assert.Equal(t, []string{"line 4", "line 5", "line 6", "line 7", "line 8"},
+		lineNumbers(5, nil))
+	assert.Equal(t, []string{"line 1", "line 2", "line 3", "line 4", "line 5", "line 6",
+		"line 7", "line 8"}, lineNumbers(100, nil))
+
+	filter, err := NewFilter(FilterOpts{Grep: "line [1357]"})
+	require.NoError(t, err)
+	assert.Equal(t, []string{"line 3", "line 5", "line 7"}, lineNumbers(3, filter))
+
+	filter, err = NewFilter(FilterOpts{
+		Since: localTime(t, "2024-05-28 12:00:02.000"),
+		Until: localTime(t, "2024-05-28 12:00:05.000"),
+	})
+	require.NoError(t, err)
+	assert.Equal(t, []string{"line 2", "line 3", "line 4", "line 5"}, lineNumbers(100, filter))
+}
+
+func TestTailN_rotatedNotRead(t *testing.T) {
+	dir := t.TempDir()
+	fileName := filepath.Join(dir, "tt.log")
+	writeRotatedLog(t, fileName, 7, 8)
+	writeRotatedLog(t, fileName+".1.gz", 4, 6)
+	// Older files must not be read.
+	require.NoError(t, os.WriteFile(fileName+".2.gz", []byte("invalid"), 0644))
+
+	in, err := TailN(context.Background(), noFormat, fileName, 3, nil)
+	require.NoError(t, err)
+	lines := []string{}
+	for line := range in {
+		lines = append(lines, line)
+	}
+	assert.Len(t, lines, 3)
+
+	filter, err := NewFilter(FilterOpts{Since: localTime(t, "2024-05-28 12:00:05.000")})
+	require.NoError(t, err)
+	in, err = TailN(context.Background(), noFormat, fileName, 100, filter)
+	require.NoError(t, err)
+	lines = []string{}
+	for line := range in {
+		lines = append(lines, line)
+	}
+	assert.Len(t, lines, 4)
+
+	_, err = TailN(context.Background(), noFormat, fileName, 100, nil)
+	assert.ErrorContains(t, err, "cannot decompress")
+}
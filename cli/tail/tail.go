@@ -1,18 +1,16 @@
 package tail
 
 import (
-	"bufio"
 	"context"
 	"errors"
 	"fmt"
 	"io"
 	"os"
+	"path/filepath"
 	"strings"
 	"sync"
 
-	"github.com/apex/log"
 	"github.com/fatih/color"
-	"github.com/nxadm/tail"
 )
 
 const blockSize = 8192
@@ -96,90 +94,85 @@ func newTailReader(ctx context.Context, reader io.ReadSeeker, count int) (io.Rea
 	return &io.LimitedReader{R: reader, N: end}, 0, nil
 }
 
-// TailN calls sends last n lines of the file to the channel.
+// TailN calls sends last n lines of the file to the channel. Only lines selected
+// by the filter are counted and sent if it is not nil. Rotated files of the log
+// are read if the file does not contain enough lines, from the oldest one to
+// the newest one.
 func TailN(ctx context.Context, logFormatter LogFormatter, fileName string,
-	n int) (<-chan string, error) {
+	n int, filter *Filter) (<-chan string, error) {
 	if n < 0 {
 		return nil, fmt.Errorf("negative lines count is not supported")
 	}
 
-	file, err := os.Open(fileName)
+	parts, err := lastLogParts(ctx, fileName, n, filter)
 	if err != nil {
-		return nil, fmt.Errorf("cannot open %q: %w", fileName, err)
-	}
-
-	reader, _, err := newTailReader(ctx, file, n)
-	if err != nil {
-		file.Close()
 		return nil, err
 	}
 
-	scanner := bufio.NewScanner(reader)
 	out := make(chan string, 8)
 	go func() {
 		defer close(out)
-		defer file.Close()
-		for scanner.Scan() {
-			select {
-			case <-ctx.Done():
+		defer func() {
+			for _, part := range parts {
+				part.close()
+			}
+		}()
+		for i := len(parts) - 1; i >= 0; i-- {
+			if !parts[i].send(ctx, out, logFormatter, filter) {
 				return
-			case out <- logFormatter(scanner.Text()):
 			}
 		}
 	}()
 	return out, nil
 }
 
-// Follow sends to the channel each new line from the file as it grows.
+// Follow sends to the channel each new line from the file as it grows. All
+// files are followed by a single goroutine watching their directories.
+// The file is reopened if it is rotated. The wait group is done when
+// the file is not followed anymore. Only lines selected by the filter are
+// counted and sent if it is not nil.
 func Follow(ctx context.Context, out chan<- string, logFormatter LogFormatter, fileName string,
-	n int, wg *sync.WaitGroup) error {
+	n int, filter *Filter, wg *sync.WaitGroup) error {
 	file, err := os.Open(fileName)
 	if err != nil {
 		return fmt.Errorf("cannot open %q: %w", fileName, err)
 	}
-	defer file.Close()
 
-	_, startPos, err := newTailReader(ctx, file, n)
+	var startPos int64
+	if filter == nil {
+		_, startPos, err = newTailReader(ctx, file, n)
+	} else {
+		var part logPart
+		part, _, err = lastPart(ctx, file, n, filter)
+		startPos = part.start
+	}
 	if err != nil {
+		file.Close()
 		return err
 	}
-
-	t, err := tail.TailFile(fileName, tail.Config{
-		Location: &tail.SeekInfo{
-			Offset: startPos,
-			Whence: io.SeekStart,
-		},
-		MustExist:     true,
-		Follow:        true,
-		ReOpen:        true,
-		CompleteLines: false,
-		Logger:        tail.DiscardingLogger})
+	info, err := file.Stat()
 	if err != nil {
+		file.Close()
 		return err
 	}
 
 	wg.Add(1)
-	go func() {
-		defer wg.Done()
-		for {
-			select {
-			case <-ctx.Done():
-				t.Stop()
-				t.Wait()
-				return
-			case line, more := <-t.Lines:
-				if !more {
-					err := t.Stop()
-					if err != nil {
-						log.Error(err.Error())
-					} else {
-						log.Errorf("The log file %q is unavailable for reading. Exiting.")
-					}
-					return
-				}
-				out <- logFormatter(line.Text)
-			}
-		}
-	}()
+	err = defaultFollower.add(&followedFile{
+		ctx:       ctx,
+		path:      fileName,
+		dir:       filepath.Dir(fileName),
+		file:      file,
+		info:      info,
+		offset:    startPos,
+		matcher:   newLineMatcher(filter),
+		out:       out,
+		formatter: logFormatter,
+		wg:        wg,
+	})
+	if err != nil {
+		wg.Done()
+		file.Close()
+		return err
+	}
 	return nil
 }
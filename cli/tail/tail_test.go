@@ -219,7 +219,7 @@ five
 
 			in, err := TailN(context.Background(), func(str string) string {
 				return str
-			}, outFile.Name(), tt.args.n)
+			}, outFile.Name(), tt.args.n, nil)
 			assert.NoError(t, err)
 			for line := range in {
 				tt.check(line)
@@ -231,7 +231,7 @@ five
 func TestPrintLastNLinesFileDoesNotExist(t *testing.T) {
 	in, err := TailN(context.Background(), func(str string) string {
 		return str
-	}, "some_file_name", 10)
+	}, "some_file_name", 10, nil)
 	assert.Error(t, err)
 	assert.Nil(t, in)
 }
@@ -300,7 +300,7 @@ func TestFollow(t *testing.T) {
 			defer stop()
 			in := make(chan string)
 			err = Follow(ctx, in,
-				func(str string) string { return str }, outFile.Name(), tt.nLines,
+				func(str string) string { return str }, outFile.Name(), tt.nLines, nil,
 				&sync.WaitGroup{})
 			require.NoError(t, err)
 
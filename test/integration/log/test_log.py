@@ -1,3 +1,4 @@
+import gzip
 import os
 import shutil
 import subprocess
@@ -309,3 +310,95 @@ def test_log_dir_partially_removed_after_follow(tt_cmd, mock_env_dir):
 
     assert process.wait(2) == 0
     assert "Failed to detect creation of" in process.stdout.read()
+
+
+def test_log_merge(tt_cmd, mock_env_dir):
+    for app_n in range(2):
+        log_path = os.path.join(mock_env_dir, 'ie', f'app{app_n}', 'var', 'log', 'inst0',
+                                'tt.log')
+        with open(log_path, 'w') as f:
+            # Seconds of app0 lines are even, seconds of app1 lines are odd.
+            f.writelines([f'2024-05-28 12:00:{2 * i + app_n:02}.000 [1] I> line {i}\n'
+                          for i in range(5)])
+
+    cmd = [tt_cmd, 'log', '--merge', '-n', '3']
+    process = subprocess.Popen(
+        cmd,
+        cwd=mock_env_dir,
+        stderr=subprocess.STDOUT,
+        stdout=subprocess.PIPE,
+        text=True
+    )
+
+    assert process.wait(10) == 0
+    output = [line for line in process.stdout.read().splitlines() if ':inst0: ' in line]
+    assert output == [
+        'app0:inst0: 2024-05-28 12:00:04.000 [1] I> line 2',
+        'app1:inst0: 2024-05-28 12:00:05.000 [1] I> line 2',
+        'app0:inst0: 2024-05-28 12:00:06.000 [1] I> line 3',
+        'app1:inst0: 2024-05-28 12:00:07.000 [1] I> line 3',
+        'app0:inst0: 2024-05-28 12:00:08.000 [1] I> line 4',
+        'app1:inst0: 2024-05-28 12:00:09.000 [1] I> line 4',
+    ]
+
+
+def test_log_filters(tt_cmd, mock_env_dir):
+    log_path = os.path.join(mock_env_dir, 'ie', 'app0', 'var', 'log', 'inst0', 'tt.log')
+    levels = ['I', 'E', 'W', 'E', 'I', 'E']
+    with open(log_path, 'w') as f:
+        f.writelines([f'2024-05-28 12:00:{i:02}.000 [1] {level}> line {i}\n'
+                      for i, level in enumerate(levels)])
+
+    cmd = [tt_cmd, 'log', 'app0:inst0', '--level', 'error', '--grep', 'line [0-3]',
+           '--since', '2024-05-28 12:00:01', '--until', '2024-05-28 12:00:04']
+    process = subprocess.Popen(
+        cmd,
+        cwd=mock_env_dir,
+        stderr=subprocess.STDOUT,
+        stdout=subprocess.PIPE,
+        text=True
+    )
+
+    assert process.wait(10) == 0
+    assert process.stdout.read().splitlines() == [
+        'app0:inst0: 2024-05-28 12:00:01.000 [1] E> line 1',
+        'app0:inst0: 2024-05-28 12:00:03.000 [1] E> line 3',
+    ]
+
+    cmd = [tt_cmd, 'log', 'app0:inst0', '--level', 'unknown']
+    process = subprocess.Popen(
+        cmd,
+        cwd=mock_env_dir,
+        stderr=subprocess.STDOUT,
+        stdout=subprocess.PIPE,
+        text=True
+    )
+
+    assert process.wait(10) != 0
+    assert 'unknown log level "unknown"' in process.stdout.read()
+
+
+def test_log_rotated(tt_cmd, mock_env_dir):
+    log_path = os.path.join(mock_env_dir, 'ie', 'app0', 'var', 'log', 'inst0', 'tt.log')
+    with open(log_path, 'w') as f:
+        f.write('2024-05-28 12:00:03.000 [1] I> line 3\n')
+    with open(log_path + '.1', 'w') as f:
+        f.write('2024-05-28 12:00:02.000 [1] I> line 2\n')
+    with gzip.open(log_path + '.2.gz', 'wt') as f:
+        f.write('2024-05-28 12:00:01.000 [1] I> line 1\n')
+
+    cmd = [tt_cmd, 'log', 'app0:inst0', '-n', '3']
+    process = subprocess.Popen(
+        cmd,
+        cwd=mock_env_dir,
+        stderr=subprocess.STDOUT,
+        stdout=subprocess.PIPE,
+        text=True
+    )
+
+    assert process.wait(10) == 0
+    assert process.stdout.read().splitlines() == [
+        'app0:inst0: 2024-05-28 12:00:01.000 [1] I> line 1',
+        'app0:inst0: 2024-05-28 12:00:02.000 [1] I> line 2',
+        'app0:inst0: 2024-05-28 12:00:03.000 [1] I> line 3',
+    ]
@@ -58,6 +58,10 @@ def test_play_non_existent_uri(tt_cmd, test_instance, tmp_path):
         ("test.xlog", "--timestamp=2024-11-14T14:02:36.abc", "--space=999"),
         'failed to parse a timestamp: parsing time "2024-11-14T14:02:36.abc"',
     ),
+    (
+        ("test.xlog", "--partition-by=abc"),
+        'unknown partition key "abc", expected one of: space, key, replica',
+    ),
 ])
 def test_play_test_remote_instance_timestamp_failed(tt_cmd, test_instance, args, play_error):
     # Play .xlog file to the remote instance.
@@ -111,6 +115,64 @@ def test_play_remote_instance_timestamp_valid(tt_cmd, test_instance,
     assert cmd_output == expected
 
 
+@pytest.mark.parametrize("flags", [
+    ("--inflight=8",),
+    ("--batch-size=4",),
+    ("--batch-size=3", "--inflight=2"),
+    ("--parallel=3",),
+    ("--parallel=2", "--partition-by=key", "--inflight=4"),
+    ("--parallel=2", "--partition-by=replica", "--batch-size=2"),
+])
+def test_play_remote_instance_pipelined(tt_cmd, test_instance, flags):
+    test_dir = os.path.join(os.path.dirname(__file__), "test_file", )
+
+    # Create space and primary index.
+    cmd_space = [tt_cmd, "connect", f"test_user:secret@127.0.0.1:{test_instance.port}",
+                 "-f", f"{test_dir}/create_space.lua", "-"]
+    rc, _ = run_command_and_get_output(cmd_space, cwd=test_instance._tmpdir)
+    assert rc == 0
+
+    # Play .xlog file to the instance.
+    cmd_play = [tt_cmd, "play", f"127.0.0.1:{test_instance.port}",
+                "-u", "test_user", "-p", "secret",
+                f"{test_dir}/timestamp/timestamp.xlog", *flags]
+    rc, _ = run_command_and_get_output(cmd_play, cwd=test_instance._tmpdir)
+    assert rc == 0
+
+    # Get data from the instance.
+    cmd_data = [tt_cmd, "connect", f"test_user:secret@127.0.0.1:{test_instance.port}",
+                "-f", f"{test_dir}/get_data.lua", "-"]
+    rc, cmd_output = run_command_and_get_output(cmd_data, cwd=test_instance._tmpdir)
+    assert rc == 0
+    assert cmd_output == ("---\n- - [1, 0]\n  - [2, 1]\n  - [3, 2]\n  - [4, 3]\n  - [5, 4]\n"
+                          "  - [6, 5]\n  - [7, 6]\n  - [8, 7]\n  - [9, 8]\n  - [10, 9]\n"
+                          "...\n\n")
+
+
+@pytest.mark.parametrize("flags, error", [
+    (("--batch-size=2",), "failed to play the record with LSN 4"),
+    (("--inflight=4",), "failed to play the record with LSN 4"),
+])
+def test_play_remote_instance_pipelined_error(tt_cmd, test_instance, flags, error):
+    test_dir = os.path.join(os.path.dirname(__file__), "test_file", )
+
+    # Create space and primary index, the tuple conflicts with the record LSN 4.
+    cmd_space = [tt_cmd, "connect", f"test_user:secret@127.0.0.1:{test_instance.port}",
+                 "-f", f"{test_dir}/create_space.lua", "-"]
+    rc, _ = run_command_and_get_output(cmd_space, cwd=test_instance._tmpdir)
+    assert rc == 0
+    try_execute_on_instance(tt_cmd, test_instance._tmpdir,
+                            f"test_user:secret@127.0.0.1:{test_instance.port}",
+                            stdin="box.space.test:insert({2, 100})")
+
+    cmd_play = [tt_cmd, "play", f"127.0.0.1:{test_instance.port}",
+                "-u", "test_user", "-p", "secret",
+                f"{test_dir}/timestamp/timestamp.xlog", *flags]
+    rc, output = run_command_and_get_output(cmd_play, cwd=test_instance._tmpdir)
+    assert rc == 1
+    assert error in output
+
+
 @pytest.mark.parametrize(
     "input, expected",
     [
@@ -58,6 +58,43 @@ def test_upgrade_multi_master(tt_cmd, tmpdir_with_cfg):
         stop_application(tt_cmd, app_name, tmpdir, [])
 
 
+@pytest.mark.skipif(
+    tarantool_major_version < 3, reason="skip centralized config test for Tarantool < 3"
+)
+def test_upgrade_parallel_continues_after_error(tt_cmd, tmpdir_with_cfg):
+    tmpdir = tmpdir_with_cfg
+    app_name = "test_ccluster_app"
+    app_path = os.path.join(tmpdir, app_name)
+    shutil.copytree(os.path.join(os.path.dirname(__file__), app_name), app_path)
+    try:
+        # Start a cluster.
+        start_cmd = [tt_cmd, "start", app_name]
+        rc, out = run_command_and_get_output(start_cmd, cwd=tmpdir)
+        assert rc == 0
+
+        for i in range(1, 6):
+            file = wait_file(
+                os.path.join(tmpdir, app_name), f"ready-instance-00{i}", []
+            )
+            assert file != ""
+
+        upgrade_cmd = [tt_cmd, "replicaset", "upgrade", app_name, "--parallel", "2"]
+        rc, out = run_command_and_get_output(upgrade_cmd, cwd=tmpdir)
+        assert rc == 1
+        # A failed replicaset does not stop upgrading of others.
+        upgrade_out = [line for line in out.split("\n") if line.startswith("• ")]
+        assert sorted(upgrade_out) == ["• replicaset-001: ok", "• replicaset-002: error"]
+        assert "replicaset replicaset-002:" in out and "are both masters" in out
+
+        upgrade_cmd = [tt_cmd, "replicaset", "upgrade", app_name, "--parallel", "0"]
+        rc, out = run_command_and_get_output(upgrade_cmd, cwd=tmpdir)
+        assert rc == 1
+        assert "the count of parallel upgrades must be positive" in out
+
+    finally:
+        stop_application(tt_cmd, app_name, tmpdir, [])
+
+
 def test_upgrade_t2_app_dummy_replicaset(tt_cmd):
     app_name = "single-t2-app"
     test_app_path_src = os.path.join(os.path.dirname(__file__), app_name)
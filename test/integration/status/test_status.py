@@ -1,3 +1,4 @@
+import json
 import os
 import re
 import shutil
@@ -158,6 +159,26 @@ def test_t3_instance_names_with_config(tt_cmd, tmpdir_with_cfg):
         # We cannot be certain that the instance bootstrap has completed.
         assert status_info[full_master_inst_name]["UPSTREAM"] in ["--", "loading"]
         assert f"[config][error]: {error_message}" in status_out
+
+        status_cmd = [tt_cmd, "status", full_master_inst_name, "--format", "json"]
+        status_rc, status_out = run_command_and_get_output(status_cmd, cwd=tmpdir)
+        assert status_rc == 0
+        status_json = json.loads(status_out)
+        assert len(status_json) == 1
+        assert status_json[0]["instance"] == full_master_inst_name
+        assert status_json[0]["status"] == "RUNNING"
+        assert status_json[0]["mode"] == "RW"
+        assert status_json[0]["config"] == "check_errors"
+        assert any(alert["source"] == "config" and alert["type"] == "error" and
+                   error_message in alert["message"] for alert in status_json[0]["alerts"])
+
+        status_cmd = [tt_cmd, "status", full_master_inst_name, "--format", "prometheus"]
+        status_rc, status_out = run_command_and_get_output(status_cmd, cwd=tmpdir)
+        assert status_rc == 0
+        assert f'tt_instance_running{{instance="{full_master_inst_name}"}} 1' in status_out
+        assert f'tt_instance_read_only{{instance="{full_master_inst_name}"}} 0' in status_out
+        assert re.search(rf'tt_instance_alerts{{instance="{full_master_inst_name}",'
+                         r'type="error"} [1-9]\d*\n', status_out)
     finally:
         stop_application(tt_cmd, app_name, tmpdir)
 